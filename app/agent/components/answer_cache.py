@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock
+from typing import Any
+
+from app.infrastructure.config import settings
+from app.infrastructure.metrics.answer_cache import answer_cache_metrics_store
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_EDGE_PUNCTUATION = " \t\n\r¿?¡!.,;:\"'"
+
+
+def normalize_query_for_cache(query: str) -> str:
+    text = unicodedata.normalize("NFKC", str(query or "")).casefold()
+    text = _WHITESPACE_RE.sub(" ", text)
+    return text.strip(_EDGE_PUNCTUATION)
+
+
+@dataclass(frozen=True)
+class AnswerCacheKey:
+    query: str
+    tenant_id: str
+    collection_id: str | None
+    profile_id: str
+    profile_version: str
+    mode: str
+    profile_hash: str = ""
+    # Retrieval is ACL-filtered per user, so an answer is only reusable by its own user.
+    user_id: str = ""
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    stored_at: float
+    expires_at: float
+
+
+class AnswerCache:
+    """TTL + LRU cache of orchestrated answers, invalidated per tenant/collection on re-ingest."""
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self._ttl_seconds = max(1.0, float(ttl_seconds))
+        self._max_entries = max(1, int(max_entries))
+        self._lock = Lock()
+        self._entries: OrderedDict[AnswerCacheKey, _CacheEntry] = OrderedDict()
+
+    def get(self, key: AnswerCacheKey) -> tuple[Any, float] | None:
+        """Return (value, age_seconds) on a fresh hit."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                answer_cache_metrics_store.record_miss(key.tenant_id)
+                return None
+            if entry.expires_at <= now:
+                del self._entries[key]
+                answer_cache_metrics_store.record_miss(key.tenant_id)
+                return None
+            self._entries.move_to_end(key)
+            answer_cache_metrics_store.record_hit(key.tenant_id)
+            return entry.value, now - entry.stored_at
+
+    def put(self, key: AnswerCacheKey, value: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = _CacheEntry(
+                value=value, stored_at=now, expires_at=now + self._ttl_seconds
+            )
+            self._entries.move_to_end(key)
+            answer_cache_metrics_store.record_store(key.tenant_id)
+            while len(self._entries) > self._max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                answer_cache_metrics_store.record_eviction(evicted.tenant_id)
+
+    def invalidate(self, tenant_id: str, collection_id: str | None = None) -> int:
+        """Drop a tenant's answers; with a collection, also tenant-wide (collection-less) ones."""
+        tenant = str(tenant_id or "").strip()
+        collection = str(collection_id or "").strip() or None
+        with self._lock:
+            doomed = [
+                key
+                for key in self._entries
+                if key.tenant_id == tenant
+                and (
+                    collection is None
+                    or key.collection_id is None
+                    or key.collection_id == collection
+                )
+            ]
+            for key in doomed:
+                del self._entries[key]
+        answer_cache_metrics_store.record_invalidation(tenant, removed=len(doomed))
+        return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+@lru_cache(maxsize=1)
+def get_answer_cache() -> AnswerCache:
+    return AnswerCache(
+        ttl_seconds=float(getattr(settings, "ORCH_ANSWER_CACHE_TTL_SECONDS", 900) or 900),
+        max_entries=int(getattr(settings, "ORCH_ANSWER_CACHE_MAX_ENTRIES", 512) or 512),
+    )
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class AnswerStreamSink:
+    """Collects live orchestrator events (stage transitions, answer tokens) for SSE delivery."""
+
+    queue: asyncio.Queue[tuple[str, dict[str, Any]]] = field(default_factory=asyncio.Queue)
+    tokens_emitted: int = 0
+
+    def emit(self, event: str, payload: dict[str, Any]) -> None:
+        try:
+            self.queue.put_nowait((event, payload))
+        except Exception:
+            logger.warning("answer_stream_emit_failed", stream_event=event, exc_info=True)
+
+    def emit_token(self, delta: str) -> None:
+        if not delta:
+            return
+        self.tokens_emitted += 1
+        self.emit("token", {"delta": delta, "index": self.tokens_emitted})
+
+    def reset_tokens(self, reason: str) -> None:
+        """Tell the client to discard the tokens streamed so far; a new draft follows."""
+        self.emit("token_reset", {"reason": reason, "discarded": self.tokens_emitted})
+
+    def emit_stage(self, stage: str, status: str, elapsed_ms: float | None = None) -> None:
+        payload: dict[str, Any] = {"stage": stage, "status": status}
+        if elapsed_ms is not None:
+            payload["elapsed_ms"] = round(float(elapsed_ms), 2)
+        self.emit("stage", payload)
+
+
+_CURRENT_SINK: ContextVar[AnswerStreamSink | None] = ContextVar("answer_stream_sink", default=None)
+_TOKENS_ENABLED: ContextVar[bool] = ContextVar("answer_stream_tokens_enabled", default=False)
+
+
+def current_answer_stream() -> AnswerStreamSink | None:
+    return _CURRENT_SINK.get()
+
+
+def active_token_sink() -> AnswerStreamSink | None:
+    """Sink for answer tokens, only inside the final synthesis step of a streamed request."""
+    if not _TOKENS_ENABLED.get():
+        return None
+    return _CURRENT_SINK.get()
+
+
+@contextmanager
+def bind_answer_stream(sink: AnswerStreamSink) -> Iterator[AnswerStreamSink]:
+    token = _CURRENT_SINK.set(sink)
+    try:
+        yield sink
+    finally:
+        _CURRENT_SINK.reset(token)
+
+
+@contextmanager
+def stream_answer_tokens() -> Iterator[None]:
+    # Subquery summaries reuse the same answer generator; only the final synthesis streams.
+    token = _TOKENS_ENABLED.set(True)
+    try:
+        yield
+    finally:
+        _TOKENS_ENABLED.reset(token)
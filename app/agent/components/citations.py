@@ -165,8 +165,12 @@ def build_citation_bundle(
         metadata = getattr(item, "metadata", None)
         row_meta = _merge_metadata(metadata)
 
-        standard = _extract_standard(row_meta, content)
-        clause_id = _extract_clause(row_meta, content)
+        signature = getattr(item, "signature", None)
+        if signature is not None:
+            standard, clause_id = signature.citation_standard, signature.citation_clause
+        else:
+            standard = _extract_standard(row_meta, content)
+            clause_id = _extract_clause(row_meta, content)
         snippet = _compact_text(content)
         noise = _is_noise(content, row_meta, noise_filters)
 
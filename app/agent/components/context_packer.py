@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import re
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from app.agent.types.models import EvidenceItem
+from app.infrastructure.config import settings
+
+_WORD_RE = re.compile(r"[a-zA-Z0-9áéíóúñüÁÉÍÓÚÑÜ]+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.;:!?])\s+|\n+")
+_SHINGLE_WORDS = 5
+# Below this many tokens a trimmed chunk carries too little to be worth its label.
+_MIN_TRIMMED_TOKENS = 48
+# Before packing, synthesis got the first `max_items` chunks clipped at this many characters;
+# savings are reported against that baseline.
+_BASELINE_CLIP_CHARS = 900
+
+Selector = Callable[[list[EvidenceItem], int], list[EvidenceItem]]
+
+
+@dataclass
+class PackedContext:
+    items: list[EvidenceItem] = field(default_factory=list)
+    texts: list[str] = field(default_factory=list)
+    stats: dict[str, Any] = field(default_factory=dict)
+
+
+def estimate_tokens(text: str) -> int:
+    """Provider-agnostic estimate (~4 characters per token), as used for LLM budgets."""
+    return (len(text) + 3) // 4 if text else 0
+
+
+def _shingles(text: str) -> frozenset[int]:
+    words = _WORD_RE.findall(text.lower())
+    if len(words) <= _SHINGLE_WORDS:
+        return frozenset((zlib.crc32(" ".join(words).encode()),)) if words else frozenset()
+    return frozenset(
+        zlib.crc32(" ".join(words[i : i + _SHINGLE_WORDS]).encode())
+        for i in range(len(words) - _SHINGLE_WORDS + 1)
+    )
+
+
+def _resemblance(left: frozenset[int], right: frozenset[int]) -> float:
+    """Jaccard over shingles, or containment when one chunk is a slice of the other."""
+    if not left or not right:
+        return 0.0
+    overlap = len(left & right)
+    return max(overlap / len(left | right), overlap / min(len(left), len(right)))
+
+
+def drop_near_duplicates(
+    items: list[EvidenceItem],
+    *,
+    threshold: float,
+    group: Callable[[EvidenceItem], str] | None = None,
+) -> tuple[list[EvidenceItem], list[EvidenceItem]]:
+    """Keep the first of each set of near-identical chunks; return ``(kept, dropped)``.
+
+    Only chunks in the same `group` (e.g. the same requested scope) are compared, so text
+    shared by two standards still evidences both. Retrieval returns a few dozen chunks at
+    most, so exact shingle sets compared pairwise are cheaper than MinHash signatures.
+    """
+    kept: list[EvidenceItem] = []
+    seen: dict[str, list[frozenset[int]]] = {}
+    dropped: list[EvidenceItem] = []
+    for item in items:
+        shingles = _shingles(item.content or "")
+        previous = seen.setdefault(group(item) if group is not None else "", [])
+        if shingles and any(_resemblance(shingles, other) >= threshold for other in previous):
+            dropped.append(item)
+            continue
+        kept.append(item)
+        previous.append(shingles)
+    return kept, dropped
+
+
+def trim_to_sentences(text: str, *, query: str, max_tokens: int) -> str:
+    """Shorten `text` to `max_tokens`, keeping the sentences that best match `query`."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    sentences = [part.strip() for part in _SENTENCE_SPLIT_RE.split(text) if part.strip()]
+    query_words = {word for word in _WORD_RE.findall(query.lower()) if len(word) >= 3}
+
+    def _score(index: int) -> tuple[int, int]:
+        words = set(_WORD_RE.findall(sentences[index].lower()))
+        return (len(words & query_words), -index)
+
+    chosen: set[int] = set()
+    used = 0
+    for index in sorted(range(len(sentences)), key=_score, reverse=True):
+        cost = estimate_tokens(sentences[index]) + 1
+        if used + cost > max_tokens:
+            continue
+        chosen.add(index)
+        used += cost
+    if not chosen:
+        return text[: max(0, max_tokens * 4)].rstrip() + "..."
+
+    parts: list[str] = []
+    previous = -1
+    for index in sorted(chosen):
+        if parts and index != previous + 1:
+            parts.append("...")
+        parts.append(sentences[index])
+        previous = index
+    if previous != len(sentences) - 1:
+        parts.append("...")
+    return " ".join(parts)
+
+
+def pack_context(
+    items: list[EvidenceItem],
+    *,
+    query: str,
+    budget_tokens: int,
+    max_items: int,
+    select: Selector | None = None,
+    group: Callable[[EvidenceItem], str] | None = None,
+) -> PackedContext:
+    """Deduplicate, select and fit evidence into `budget_tokens` of labelled prompt text.
+
+    `select` picks up to `max_items` from the deduplicated candidates (e.g. the scope
+    balancer); the budget is then filled in that order, so the selection's balance holds.
+    `group` limits deduplication to chunks of the same group.
+    """
+    threshold = float(getattr(settings, "ORCH_CONTEXT_DEDUPE_THRESHOLD", 0.8) or 0.8)
+    chunk_max_tokens = max(
+        _MIN_TRIMMED_TOKENS, int(getattr(settings, "ORCH_CONTEXT_CHUNK_MAX_TOKENS", 225) or 225)
+    )
+    budget = max(_MIN_TRIMMED_TOKENS, int(budget_tokens))
+
+    candidates = [item for item in items if (item.content or "").strip()]
+    unique, duplicates = drop_near_duplicates(candidates, threshold=threshold, group=group)
+    limit = max(1, int(max_items))
+    selected = select(unique, limit) if select is not None else unique[:limit]
+
+    def _label(item: EvidenceItem) -> str:
+        return f"[{(item.source or '').strip() or 'unknown-source'}] "
+
+    packed = PackedContext()
+    used = 0
+    trimmed = 0
+    for item in selected:
+        content = (item.content or "").strip()
+        label = _label(item)
+        allowance = min(chunk_max_tokens, budget - used - estimate_tokens(label))
+        if allowance < min(_MIN_TRIMMED_TOKENS, estimate_tokens(content)):
+            continue
+        text = trim_to_sentences(content, query=query, max_tokens=allowance)
+        if text != content:
+            trimmed += 1
+        line = label + text
+        packed.items.append(item)
+        packed.texts.append(line)
+        used += estimate_tokens(line)
+
+    def _baseline_tokens(chosen: list[EvidenceItem]) -> int:
+        total = 0
+        for item in chosen:
+            content = (item.content or "").strip()
+            if len(content) > _BASELINE_CLIP_CHARS:
+                content = content[:_BASELINE_CLIP_CHARS].rstrip() + "..."
+            total += estimate_tokens(_label(item) + content)
+        return total
+
+    baseline = select(candidates, limit) if select is not None else candidates[:limit]
+    tokens_in = _baseline_tokens(baseline)
+    # What the same selection costs once duplicates are gone but before trimming.
+    tokens_deduped = _baseline_tokens(selected)
+    packed.stats = {
+        "budget_tokens": budget,
+        "candidates": len(candidates),
+        "duplicates_removed": len(duplicates),
+        "trimmed": trimmed,
+        "dropped_for_budget": len(selected) - len(packed.items),
+        "kept": len(packed.items),
+        "tokens_in": tokens_in,
+        "tokens_out": used,
+        "tokens_saved": max(0, tokens_in - used),
+        "tokens_saved_dedupe": max(0, tokens_in - tokens_deduped),
+        "tokens_saved_trim": max(0, tokens_deduped - used),
+    }
+    return packed
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from app.agent.components.citations import _extract_clause, _extract_standard, _merge_metadata
+
+if TYPE_CHECKING:
+    from app.agent.types.models import EvidenceItem
+
+
+_DOTTED_REF_RE = re.compile(r"\b\d+(?:\.\d+)+\b")
+_NUMERIC_REF_RE = re.compile(r"\d+(?:\.\d+)+")
+_CLAUSE_META_KEYS = ("clause_id", "clause_ref", "clause", "clause_anchor")
+
+
+def clause_ref_matches(requested: str, candidate: str) -> bool:
+    req = str(requested or "").strip()
+    cand = str(candidate or "").strip()
+    if not req or not cand:
+        return False
+    return cand == req or cand.startswith(f"{req}.")
+
+
+def row_standard(row: dict[str, Any]) -> str:
+    meta_raw = row.get("metadata")
+    metadata: dict[str, Any] = meta_raw if isinstance(meta_raw, dict) else {}
+    candidates = [
+        metadata.get("source_standard"),
+        metadata.get("standard"),
+        metadata.get("scope"),
+        metadata.get("norma"),
+        row.get("source_standard"),
+    ]
+    for value in candidates:
+        if isinstance(value, str) and value.strip():
+            return value.strip().upper()
+    return ""
+
+
+def row_clause_refs(row: dict[str, Any]) -> set[str]:
+    meta_raw = row.get("metadata")
+    meta: dict[str, Any] = meta_raw if isinstance(meta_raw, dict) else {}
+    refs: set[str] = set()
+    for key in _CLAUSE_META_KEYS:
+        value = str(meta.get(key) or "").strip()
+        if value:
+            refs.add(value)
+    refs_raw = meta.get("clause_refs")
+    if isinstance(refs_raw, list):
+        refs.update(str(v).strip() for v in refs_raw if isinstance(v, str) and str(v).strip())
+    return refs
+
+
+def _content_clause_runs(text: str) -> frozenset[str]:
+    """Every dotted reference `\\bREF(?:\\.\\d+)*\\b` could match in `text`.
+
+    A regex hit for ``9.2`` starts at a component boundary of some dotted number and may stop
+    at any later component, so all contiguous runs of two or more components are collected.
+    """
+    runs: set[str] = set()
+    for match in _DOTTED_REF_RE.findall(text or ""):
+        parts = match.split(".")
+        for start in range(len(parts) - 1):
+            for end in range(start + 2, len(parts) + 1):
+                runs.add(".".join(parts[start:end]))
+    return frozenset(runs)
+
+
+@dataclass(frozen=True, slots=True)
+class EvidenceSignature:
+    """Per-evidence text features computed once and shared by validation, scope balancing,
+    citations and expectation coverage.
+
+    Matching runs against one folded copy of the clause text; the lowercased view used for
+    keywords and markers reuses that buffer whenever lowercasing and casefolding agree (all
+    but a handful of scripts), and the item text reuses the row text when they are the same.
+    """
+
+    has_row: bool
+    content: str  # row text used for clause matching
+    folded: str  # casefolded row text
+    folded_meta: str  # casefolded row metadata JSON ("" without a row)
+    lowered: str  # lowercased row text (usually the same object as `folded`)
+    lowered_item: str  # lowercased item text (usually the same object as `lowered`)
+    keyword_tail: str  # lowercased clause title and clause refs
+    standard: str
+    clause_refs: frozenset[str]
+    content_clause_runs: frozenset[str]
+    similarity: float
+    citation_standard: str
+    citation_clause: str
+
+    def mentions_clause(self, ref: str) -> bool:
+        """Same result as `re.search(rf"\\b{re.escape(ref)}(?:\\.\\d+)*\\b", content)`."""
+        value = str(ref or "").strip()
+        if not value:
+            return False
+        if _NUMERIC_REF_RE.fullmatch(value):
+            return value in self.content_clause_runs
+        return bool(re.search(rf"\b{re.escape(value)}(?:\.\d+)*\b", self.content))
+
+    def matches_clause(self, ref: str) -> bool:
+        return self.mentions_clause(ref) or any(
+            clause_ref_matches(ref, candidate) for candidate in self.clause_refs
+        )
+
+    def mentions_scope(self, key: str) -> bool:
+        needle = str(key or "").strip().casefold()
+        if not needle or not self.has_row:
+            return False
+        return needle in self.folded or needle in self.folded_meta
+
+    def mentions_keyword(self, keyword: str) -> bool:
+        return bool(keyword) and (keyword in self.lowered or keyword in self.keyword_tail)
+
+    def contains_marker(self, marker: str) -> bool:
+        """Whether `marker` occurs in the whitespace-collapsed, lowercased item text.
+
+        Words of a multi-word marker may be separated by any whitespace run in the stored
+        text, which is what collapsing the text first would have allowed.
+        """
+        value = str(marker or "").strip().lower()
+        if not value:
+            return False
+        words = value.split(" ")
+        if len(words) == 1:
+            return not any(ch.isspace() for ch in value) and value in self.lowered_item
+        if any(not word or any(ch.isspace() for ch in word) for word in words):
+            # Collapsed text never holds doubled or non-space whitespace.
+            return False
+        pattern = r"\s+".join(re.escape(word) for word in words)
+        return re.search(pattern, self.lowered_item) is not None
+
+
+def build_evidence_signature(content: str, metadata: Any) -> EvidenceSignature:
+    row = metadata.get("row") if isinstance(metadata, dict) else None
+    has_row = isinstance(row, dict)
+    row_dict: dict[str, Any] = row if has_row else {"content": content, "metadata": {}}
+    row_content = str(row_dict.get("content") or "")
+    meta_raw = row_dict.get("metadata")
+    meta: dict[str, Any] = meta_raw if isinstance(meta_raw, dict) else {}
+
+    try:
+        similarity = float(row_dict.get("similarity") or 0.0)
+    except (TypeError, ValueError):
+        similarity = 0.0
+    refs = row_clause_refs(row_dict)
+    clause_title = str(meta.get("clause_title") or "")
+    merged_meta = _merge_metadata(metadata)
+    item_text = str(content or "")
+    folded = row_content.casefold()
+    lowered = row_content.lower()
+    if lowered == folded:
+        lowered = folded
+    lowered_item = lowered if item_text == row_content else item_text.lower()
+    return EvidenceSignature(
+        has_row=has_row,
+        content=row_content,
+        folded=folded,
+        folded_meta=json.dumps(meta, default=str, ensure_ascii=True).casefold() if has_row else "",
+        lowered=lowered,
+        lowered_item=lowered_item,
+        keyword_tail=f"{clause_title}\n{' '.join(sorted(refs))}".lower(),
+        standard=row_standard(row_dict),
+        clause_refs=frozenset(refs),
+        content_clause_runs=_content_clause_runs(row_content),
+        similarity=similarity,
+        citation_standard=_extract_standard(merged_meta, item_text),
+        citation_clause=_extract_clause(merged_meta, item_text),
+    )
+
+
+def evidence_signature(item: "EvidenceItem") -> EvidenceSignature:
+    """Signature attached at conversion time, or built (and memoized) on first use."""
+    signature = item.signature
+    if signature is None:
+        signature = build_evidence_signature(item.content, item.metadata)
+        # EvidenceItem is frozen; the signature is derived data, so memoizing it is safe.
+        object.__setattr__(item, "signature", signature)
+    return signature
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
-from openai import AsyncOpenAI
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator
+
 import structlog
 
+from app.agent.components.model_cascade import current_synthesis_model
+from app.agent.components.output_budget import current_output_budget
 from app.profiles.models import AgentProfile
+from app.infrastructure.clients.llm_gateway import LLMGateway, get_llm_gateway
 from app.infrastructure.config import settings
+from app.infrastructure.observability.tracing import start_span
 
 logger = structlog.get_logger(__name__)
 
+_DEGRADATIONS: ContextVar[list[str] | None] = ContextVar("synthesis_degradations", default=None)
+
 
 _DEFAULT_FALLBACK_MESSAGE = "Insufficient context evidence to answer."
 _DEFAULT_EMPTY_QUERY_MESSAGE = "No question provided."
@@ -39,15 +48,8 @@ _DEFAULT_USER_PROMPT_TEMPLATE = "QUESTION:\n{query}\n\nCONTEXT:\n{context}\n\n{s
 
 
 class GroundedAnswerService:
-    def __init__(self) -> None:
-        self._client = (
-            AsyncOpenAI(
-                api_key=settings.GROQ_API_KEY,
-                base_url="https://api.groq.com/openai/v1",
-            )
-            if settings.GROQ_API_KEY
-            else None
-        )
+    def __init__(self, gateway: LLMGateway | None = None) -> None:
+        self._gateway = gateway or get_llm_gateway()
 
     async def generate_answer(
         self,
@@ -59,6 +61,8 @@ class GroundedAnswerService:
         require_literal_evidence: bool = False,
         structured_context: str | None = None,
         max_chunks: int = 10,
+        stream: bool = False,
+        on_token: Callable[[str], None] | None = None,
     ) -> str:
         profile_fallback = (
             str(agent_profile.validation.fallback_message).strip()
@@ -74,7 +78,8 @@ class GroundedAnswerService:
         context = "\n\n".join(context_chunks[: max(1, max_chunks)]).strip()
         if structured_context:
             context = f"{context}\n\n[STRUCTURED_CONTEXT]\n{structured_context}".strip()
-        if not self._client:
+        if not self._gateway.available:
+            _report_degraded("model_unavailable")
             return context_chunks[0][:500]
 
         strict = bool(require_literal_evidence)
@@ -171,6 +176,14 @@ class GroundedAnswerService:
                 int(agent_profile.validation.min_citations_per_inference),
             )
 
+        output_budget = current_output_budget()
+        if output_budget is not None:
+            # A short complete answer beats a long one cut off by the request deadline.
+            max_sections = output_budget.max_sections(len(response_contract))
+            if max_sections < len(response_contract):
+                _report_degraded("sections_trimmed")
+            response_contract = response_contract[:max_sections]
+
         contract_lines = [f"- {section}" for section in response_contract]
         section_format = "\n".join(f"## {section}\n-" for section in response_contract)
         style_guide_text = "\n".join(
@@ -244,6 +257,11 @@ class GroundedAnswerService:
 
         style = f"{style}\n\n{response_contract_block}\n\n{inference_policy_block}".strip()
         style = f"{style}\n\nRequired citation format: {citation_format}".strip()
+        if output_budget is not None:
+            style = (
+                f"{style}\n\nLength limit: at most about {output_budget.max_tokens * 3 // 4} "
+                "words; the answer is cut off beyond that."
+            )
         user_prompt_template = (
             str(synthesis.user_prompt_template).strip()
             if synthesis is not None and synthesis.user_prompt_template
@@ -251,24 +269,97 @@ class GroundedAnswerService:
         )
         user_prompt = user_prompt_template.format(query=query, context=context, style=style)
 
+        messages = [
+            {
+                "role": "system",
+                "content": system,
+            },
+            {
+                "role": "user",
+                "content": user_prompt,
+            },
+        ]
+        model = current_synthesis_model() or settings.GROQ_MODEL_CHAT
+        limits: dict[str, Any] = (
+            {"max_tokens": output_budget.max_tokens} if output_budget is not None else {}
+        )
         try:
-            completion = await self._client.chat.completions.create(
-                model=settings.GROQ_MODEL_CHAT,
-                temperature=0.12 if strict else 0.3,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": system,
-                    },
-                    {
-                        "role": "user",
-                        "content": user_prompt,
-                    },
-                ],
-            )
-            text = (completion.choices[0].message.content or "").strip()
-            return text or profile_fallback
+            with start_span("llm.chat_completion", model=str(model), stream=stream):
+                if stream:
+                    text = await self._stream_completion(
+                        model=model,
+                        messages=messages,
+                        temperature=0.12 if strict else 0.3,
+                        on_token=on_token,
+                        **limits,
+                    )
+                    return text or profile_fallback
+                completion = await self._gateway.chat_completion(
+                    model=model,
+                    messages=messages,
+                    purpose="synthesis",
+                    priority="synthesis",
+                    temperature=0.12 if strict else 0.3,
+                    **limits,
+                )
+                choice = completion.choices[0]
+                if getattr(choice, "finish_reason", None) == "length":
+                    _report_degraded("truncated")
+                    logger.warning("grounded_answer_truncated", model=model, **limits)
+                text = (choice.message.content or "").strip()
+                return text or profile_fallback
         except Exception as exc:
             logger.warning("grounded_answer_model_fallback", error=str(exc))
             # Fallback defensivo: no bloquear el flujo por fallas de proveedor/modelo.
+            _report_degraded("model_fallback")
             return context_chunks[0][:500]
+
+    async def _stream_completion(
+        self,
+        *,
+        model: str,
+        messages: list[dict[str, str]],
+        temperature: float,
+        on_token: Callable[[str], None] | None,
+        **limits: Any,
+    ) -> str:
+        parts: list[str] = []
+        async with self._gateway.stream_chat_completion(
+            model=model,
+            messages=messages,
+            purpose="synthesis",
+            priority="synthesis",
+            temperature=temperature,
+            **limits,
+        ) as response:
+            async for chunk in response:
+                choices = getattr(chunk, "choices", None) or []
+                if not choices:
+                    continue
+                if getattr(choices[0], "finish_reason", None) == "length":
+                    _report_degraded("truncated")
+                    logger.warning("grounded_answer_truncated", model=model, **limits)
+                delta = getattr(getattr(choices[0], "delta", None), "content", None)
+                if not delta:
+                    continue
+                parts.append(delta)
+                if on_token is not None:
+                    on_token(delta)
+        return "".join(parts).strip()
+
+
+@contextmanager
+def collect_synthesis_degradations() -> Iterator[list[str]]:
+    """Collect why synthesis in this block fell short (fallback text, truncation, ...)."""
+    degradations: list[str] = []
+    token = _DEGRADATIONS.set(degradations)
+    try:
+        yield degradations
+    finally:
+        _DEGRADATIONS.reset(token)
+
+
+def _report_degraded(reason: str) -> None:
+    degradations = _DEGRADATIONS.get()
+    if degradations is not None and reason not in degradations:
+        degradations.append(reason)
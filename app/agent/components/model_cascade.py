@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Literal
+
+from app.agent.types.models import ReasoningPlan, RetrievalPlan
+from app.infrastructure.config import settings
+from app.profiles.models import AgentProfile
+
+SynthesisRoute = Literal["lightweight", "heavy"]
+
+_SYNTHESIS_MODEL: ContextVar[str | None] = ContextVar("synthesis_model", default=None)
+
+
+@dataclass(frozen=True)
+class SynthesisRouteDecision:
+    route: SynthesisRoute
+    model: str
+    reason: str
+
+    @property
+    def can_escalate(self) -> bool:
+        return self.route == "lightweight" and self.model != heavy_synthesis_model()
+
+
+def heavy_synthesis_model() -> str:
+    return str(getattr(settings, "GROQ_MODEL_CHAT", "") or "")
+
+
+def lightweight_synthesis_model() -> str:
+    return str(getattr(settings, "GROQ_MODEL_LIGHTWEIGHT", "") or "") or heavy_synthesis_model()
+
+
+def model_for_route(route: SynthesisRoute) -> str:
+    return lightweight_synthesis_model() if route == "lightweight" else heavy_synthesis_model()
+
+
+def select_synthesis_route(
+    *,
+    plan: RetrievalPlan,
+    reasoning_plan: ReasoningPlan | None,
+    agent_profile: AgentProfile | None,
+    evidence_count: int,
+    has_partial_answers: bool,
+) -> SynthesisRouteDecision:
+    """Pick the synthesis model: lightweight for simple lookups, heavy for real synthesis.
+
+    A query mode may pin its route with ``synthesis_model``; ``auto`` modes go heavy for
+    complex plans, cross-scope comparisons, map-reduce partials or large evidence sets.
+    """
+
+    def _decide(route: SynthesisRoute, reason: str) -> SynthesisRouteDecision:
+        return SynthesisRouteDecision(route=route, model=model_for_route(route), reason=reason)
+
+    if not bool(getattr(settings, "ORCH_MODEL_CASCADE_ENABLED", True)):
+        return _decide("heavy", "cascade_disabled")
+
+    mode_cfg = (
+        agent_profile.query_modes.modes.get(str(plan.mode or "").strip())
+        if agent_profile is not None
+        else None
+    )
+    pinned = str(getattr(mode_cfg, "synthesis_model", "auto") or "auto")
+    if pinned in ("lightweight", "heavy"):
+        return _decide(pinned, "mode_policy")  # type: ignore[arg-type]
+
+    if reasoning_plan is not None and reasoning_plan.complexity == "complex":
+        return _decide("heavy", "complex_plan")
+    if len(plan.requested_standards) >= 2 and not plan.require_literal_evidence:
+        return _decide("heavy", "cross_scope")
+    if has_partial_answers:
+        return _decide("heavy", "map_reduce")
+    max_evidence = max(1, int(getattr(settings, "ORCH_MODEL_CASCADE_LIGHT_MAX_EVIDENCE", 8) or 8))
+    if evidence_count > max_evidence:
+        return _decide("heavy", "large_context")
+    return _decide("lightweight", "literal" if plan.require_literal_evidence else "simple")
+
+
+def current_synthesis_model() -> str | None:
+    return _SYNTHESIS_MODEL.get()
+
+
+@contextmanager
+def use_synthesis_model(model: str) -> Iterator[None]:
+    """Final synthesis calls in this block use `model` instead of ``GROQ_MODEL_CHAT``."""
+    token = _SYNTHESIS_MODEL.set(model)
+    try:
+        yield
+    finally:
+        _SYNTHESIS_MODEL.reset(token)
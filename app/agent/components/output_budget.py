@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator
+
+from app.infrastructure.clients.llm_gateway import get_llm_gateway
+from app.infrastructure.config import settings
+
+_OUTPUT_BUDGET: ContextVar[OutputBudget | None] = ContextVar("synthesis_output_budget", default=None)
+
+
+@dataclass(frozen=True)
+class OutputBudget:
+    max_tokens: int
+    tokens_per_second: float
+    estimated: bool
+
+    def max_sections(self, requested: int) -> int:
+        """How many response-contract sections fit; the first one always stays."""
+        per_section = max(1, int(getattr(settings, "ORCH_SYNTHESIS_TOKENS_PER_SECTION", 200) or 200))
+        return max(1, min(int(requested), self.max_tokens // per_section))
+
+
+def compute_output_budget(model: str, remaining_ms: float) -> OutputBudget:
+    """Cap completion tokens so `model` can finish within `remaining_ms`.
+
+    Uses the gateway's observed tokens/second for the model (a configured default until
+    the first sample) and keeps a safety margin for queueing and time-to-first-token.
+    """
+    observed = get_llm_gateway().output_tokens_per_second(model)
+    rate = observed or float(
+        getattr(settings, "ORCH_LLM_DEFAULT_OUTPUT_TOKENS_PER_SECOND", 150.0) or 150.0
+    )
+    safety = min(1.0, max(0.1, float(getattr(settings, "ORCH_SYNTHESIS_OUTPUT_SAFETY", 0.8))))
+    floor = max(1, int(getattr(settings, "ORCH_SYNTHESIS_MIN_OUTPUT_TOKENS", 256) or 256))
+    ceiling = max(floor, int(getattr(settings, "ORCH_SYNTHESIS_MAX_OUTPUT_TOKENS", 4096) or 4096))
+    fits = int(rate * max(0.0, float(remaining_ms)) / 1000.0 * safety)
+    return OutputBudget(
+        max_tokens=min(ceiling, max(floor, fits)),
+        tokens_per_second=rate,
+        estimated=observed is not None,
+    )
+
+
+def current_output_budget() -> OutputBudget | None:
+    return _OUTPUT_BUDGET.get()
+
+
+@contextmanager
+def bind_output_budget(budget: OutputBudget) -> Iterator[None]:
+    token = _OUTPUT_BUDGET.set(budget)
+    try:
+        yield
+    finally:
+        _OUTPUT_BUDGET.reset(token)
@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-import asyncio
 import json
 from dataclasses import dataclass
 from typing import Any
 
 import structlog
-from openai import AsyncOpenAI
 from pydantic import BaseModel, Field
 
 from app.agent.types.interfaces import SubqueryPlanningContext, SubqueryPlanner
 from app.agent.retrieval.retrieval_planner import build_deterministic_subqueries, extract_clause_refs
+from app.infrastructure.clients.llm_gateway import get_llm_gateway
 from app.infrastructure.config import settings
 from ..types.rag_schemas import SubQueryRequest
 
@@ -135,17 +134,10 @@ class LLMSubqueryPlanner(SubqueryPlanner):
     timeout_ms: int = 600
 
     def __post_init__(self) -> None:
-        self._client = (
-            AsyncOpenAI(
-                api_key=settings.GROQ_API_KEY,
-                base_url="https://api.groq.com/openai/v1",
-            )
-            if settings.GROQ_API_KEY
-            else None
-        )
+        self._gateway = get_llm_gateway()
 
     async def plan(self, context: SubqueryPlanningContext) -> list[dict[str, Any]]:
-        if self._client is None:
+        if not self._gateway.available:
             logger.warning("light_planner_disabled_missing_key")
             return []
 
@@ -178,17 +170,16 @@ class LLMSubqueryPlanner(SubqueryPlanner):
 
         try:
             timeout = max(0.1, float(self.timeout_ms) / 1000.0)
-            completion = await asyncio.wait_for(
-                self._client.chat.completions.create(
-                    model=model,
-                    temperature=0.0,
-                    response_format={"type": "json_object"},
-                    messages=[
-                        {"role": "system", "content": system},
-                        {"role": "user", "content": user},
-                    ],
-                ),
-                timeout=timeout,
+            completion = await self._gateway.chat_completion(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system},
+                    {"role": "user", "content": user},
+                ],
+                purpose="subquery_planner",
+                timeout_s=timeout,
+                temperature=0.0,
+                response_format={"type": "json_object"},
             )
             raw = (completion.choices[0].message.content or "").strip()
             payload = SubqueryPlanPayload.model_validate(json.loads(raw))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any, Protocol
 
 import structlog
@@ -15,6 +15,12 @@ from app.agent.types.models import (
     RetrievalPlan,
     ValidationResult,
 )
+from app.agent.components.answer_cache import (
+    AnswerCache,
+    AnswerCacheKey,
+    normalize_query_for_cache,
+)
+from app.infrastructure.metrics.answer_cache import answer_cache_metrics_store
 from app.profiles.models import AgentProfile
 from app.agent.policies import (  # compatibility exports for existing tests/imports
     build_retrieval_plan,
@@ -123,10 +129,12 @@ class HandleQuestionUseCase:
         retriever: RetrieverPort,
         answer_generator: AnswerGeneratorPort,
         validator: ValidatorPort,
+        answer_cache: AnswerCache | None = None,
     ):
         self._retriever = retriever
         self._answer_generator = answer_generator
         self._validator = validator
+        self._answer_cache = answer_cache
         self._orchestrator: Any | None = None
 
     def _get_orchestrator(self) -> Any:
@@ -144,6 +152,60 @@ class HandleQuestionUseCase:
             )
         return self._orchestrator
 
+    def warm_up(self) -> None:
+        """Compile the reasoning graph and tool registry ahead of the first request."""
+        self._get_orchestrator()
+
+    def _answer_cache_key(self, cmd: HandleQuestionCommand) -> AnswerCacheKey | None:
+        if self._answer_cache is None or cmd.clarification_context:
+            return None
+        query = normalize_query_for_cache(cmd.query)
+        if not query:
+            return None
+        profile = cmd.agent_profile
+        return AnswerCacheKey(
+            query=query,
+            tenant_id=str(cmd.tenant_id or "").strip(),
+            collection_id=str(cmd.collection_id or "").strip() or None,
+            profile_id=profile.profile_id if profile is not None else "",
+            profile_version=profile.version if profile is not None else "",
+            mode=str(classify_intent(cmd.query, profile=profile).mode),
+            profile_hash=str((cmd.profile_resolution or {}).get("content_hash") or ""),
+            user_id=str(cmd.user_id or "").strip(),
+        )
+
     async def execute(self, cmd: HandleQuestionCommand) -> HandleQuestionResult:
+        cache_key = self._answer_cache_key(cmd)
+        if cache_key is not None and self._answer_cache is not None:
+            cached = self._answer_cache.get(cache_key)
+            if cached is not None:
+                result, age_seconds = cached
+                return _with_answer_cache_trace(
+                    result, status="hit", age_ms=round(age_seconds * 1000.0, 2)
+                )
+
         runner = self._get_orchestrator()
-        return await runner.execute(cmd)
+        result = await runner.execute(cmd)
+        if cache_key is None or self._answer_cache is None:
+            return result
+        # Clarifications depend on the conversation; rejected and degraded answers (model
+        # fallback text, deadline truncation) must be retried rather than replayed.
+        if (
+            result.clarification is not None
+            or not bool(result.validation.accepted)
+            or result.answer.degraded
+        ):
+            answer_cache_metrics_store.record_skip(cache_key.tenant_id)
+            return _with_answer_cache_trace(result, status="skipped")
+        self._answer_cache.put(cache_key, result)
+        return _with_answer_cache_trace(result, status="miss")
+
+
+def _with_answer_cache_trace(
+    result: HandleQuestionResult, *, status: str, age_ms: float | None = None
+) -> HandleQuestionResult:
+    cache_trace: dict[str, Any] = {"status": status}
+    if age_ms is not None:
+        cache_trace["age_ms"] = age_ms
+    trace = {**dict(result.retrieval.trace or {}), "answer_cache": cache_trace}
+    return replace(result, retrieval=replace(result.retrieval, trace=trace))
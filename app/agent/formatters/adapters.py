@@ -7,6 +7,12 @@ from dataclasses import dataclass
 from typing import Any
 
 from app.profiles.models import AgentProfile
+from app.agent.components.evidence_signature import (
+    EvidenceSignature,
+    evidence_signature,
+    row_clause_refs as _extract_metadata_clause_refs,
+    row_standard as _extract_row_standard,
+)
 from app.agent.types.models import AnswerDraft, EvidenceItem, RetrievalPlan, ValidationResult
 from app.agent.policies import extract_requested_scopes
 from app.infrastructure.config import settings
@@ -44,80 +50,28 @@ def _extract_clause_refs(query: str) -> set[str]:
     return set(re.findall(r"\b\d+(?:\.\d+)+\b", (query or "")))
 
 
-def _clause_ref_matches(requested: str, candidate: str) -> bool:
-    req = str(requested or "").strip()
-    cand = str(candidate or "").strip()
-    if not req or not cand:
-        return False
-    return cand == req or cand.startswith(f"{req}.")
-
-
-def _extract_metadata_clause_refs(row: dict[str, Any]) -> set[str]:
-    meta_raw = row.get("metadata")
-    meta: dict[str, Any] = meta_raw if isinstance(meta_raw, dict) else {}
-    refs_raw = meta.get("clause_refs")
-    refs = {
-        str(value).strip()
-        for value in (refs_raw if isinstance(refs_raw, list) else [])
-        if isinstance(value, str) and value.strip()
-    }
-    clause_anchor = str(meta.get("clause_anchor") or "").strip()
-    if clause_anchor:
-        refs.add(clause_anchor)
-    for key in ("clause_id", "clause_ref", "clause"):
-        value = str(meta.get(key) or "").strip()
-        if value:
-            refs.add(value)
-    return refs
-
-
 def _semantic_clause_match(
     *,
-    query: str,
-    row: dict[str, Any],
+    query_keywords: set[str],
+    signature: EvidenceSignature,
     requested_upper: set[str],
 ) -> bool:
     if not settings.QA_LITERAL_SEMANTIC_FALLBACK_ENABLED:
         return False
 
-    row_scope = _extract_row_standard(row)
+    row_scope = signature.standard
     if requested_upper and row_scope and not any(target in row_scope for target in requested_upper):
         return False
 
-    content = str(row.get("content") or "")
-    similarity = float(row.get("similarity") or 0.0)
-    refs = _extract_metadata_clause_refs(row)
-    meta_raw = row.get("metadata")
-    meta: dict[str, Any] = meta_raw if isinstance(meta_raw, dict) else {}
-    clause_title = str(meta.get("clause_title") or "")
-
-    query_keywords = _extract_keywords(query)
     if not query_keywords:
         return False
 
-    evidence_text = f"{content}\n{clause_title}\n{' '.join(refs)}".lower()
-    overlap = sum(1 for kw in query_keywords if kw in evidence_text)
+    overlap = sum(1 for kw in query_keywords if signature.mentions_keyword(kw))
 
     if overlap < max(1, int(settings.QA_LITERAL_SEMANTIC_MIN_KEYWORD_OVERLAP)):
         return False
 
-    return similarity >= float(settings.QA_LITERAL_SEMANTIC_MIN_SIMILARITY)
-
-
-def _extract_row_standard(row: dict[str, Any]) -> str:
-    meta_raw = row.get("metadata")
-    metadata: dict[str, Any] = meta_raw if isinstance(meta_raw, dict) else {}
-    candidates = [
-        metadata.get("source_standard"),
-        metadata.get("standard"),
-        metadata.get("scope"),
-        metadata.get("norma"),
-        row.get("source_standard"),
-    ]
-    for value in candidates:
-        if isinstance(value, str) and value.strip():
-            return value.strip().upper()
-    return ""
+    return signature.similarity >= float(settings.QA_LITERAL_SEMANTIC_MIN_SIMILARITY)
 
 
 def _row_matches_standards(row: dict[str, Any], standards: list[str]) -> bool:
@@ -445,11 +399,13 @@ class LiteralEvidenceValidator:
             covered_requested: set[str] = set()
             query_clause_refs = sorted(_extract_clause_refs(query)) if enforce_clause_refs else []
             matched_clause_refs: set[str] = set()
-            for ev in draft.evidence:
-                row = ev.metadata.get("row") if isinstance(ev.metadata, dict) else {}
-                if not isinstance(row, dict):
-                    continue
-                row_scope = _extract_row_standard(row)
+            signatures = [
+                signature
+                for signature in (evidence_signature(ev) for ev in draft.evidence)
+                if signature.has_row
+            ]
+            for signature in signatures:
+                row_scope = signature.standard
                 if not row_scope:
                     continue
                 total_with_scope += 1
@@ -461,14 +417,9 @@ class LiteralEvidenceValidator:
                 if not matched_scope:
                     mismatched += 1
 
-                if query_clause_refs:
-                    content = str(row.get("content") or "")
-                    meta_refs = _extract_metadata_clause_refs(row)
-                    for ref in query_clause_refs:
-                        in_content = bool(re.search(rf"\b{re.escape(ref)}(?:\.\d+)*\b", content))
-                        in_meta = any(_clause_ref_matches(ref, meta_ref) for meta_ref in meta_refs)
-                        if in_content or in_meta:
-                            matched_clause_refs.add(ref)
+                for ref in query_clause_refs:
+                    if ref not in matched_clause_refs and signature.matches_clause(ref):
+                        matched_clause_refs.add(ref)
 
             if total_with_scope > 0 and mismatched > 0:
                 warnings.append(
@@ -485,19 +436,22 @@ class LiteralEvidenceValidator:
                         + ", ".join(missing_scope_coverage)
                     )
 
+            semantic_hits = 0
+            if query_clause_refs and not matched_clause_refs:
+                query_keywords = _extract_keywords(query)
+                semantic_hits = sum(
+                    1
+                    for signature in signatures
+                    if _semantic_clause_match(
+                        query_keywords=query_keywords,
+                        signature=signature,
+                        requested_upper=requested_upper,
+                    )
+                )
+
             if query_clause_refs:
                 requested_count = len(query_clause_refs)
                 matched_count = len(matched_clause_refs)
-                semantic_hits = 0
-                if matched_count == 0:
-                    for ev in draft.evidence:
-                        row = ev.metadata.get("row") if isinstance(ev.metadata, dict) else {}
-                        if not isinstance(row, dict):
-                            continue
-                        if _semantic_clause_match(
-                            query=query, row=row, requested_upper=requested_upper
-                        ):
-                            semantic_hits += 1
                 if requested_count <= 2:
                     required_matches = requested_count
                 else:
@@ -525,21 +479,10 @@ class LiteralEvidenceValidator:
                         f"(required {required_matches}, ratio={coverage_ratio})."
                     )
 
-            if query_clause_refs and not matched_clause_refs:
-                semantic_hits = 0
-                for ev in draft.evidence:
-                    row = ev.metadata.get("row") if isinstance(ev.metadata, dict) else {}
-                    if not isinstance(row, dict):
-                        continue
-                    if _semantic_clause_match(
-                        query=query, row=row, requested_upper=requested_upper
-                    ):
-                        semantic_hits += 1
-
-                if semantic_hits == 0:
-                    _add_issue(
-                        "Literal clause mismatch: no evidence chunk contains the requested clause reference."
-                    )
+            if query_clause_refs and not matched_clause_refs and semantic_hits == 0:
+                _add_issue(
+                    "Literal clause mismatch: no evidence chunk contains the requested clause reference."
+                )
 
         return ValidationResult(
             accepted=not blocking_issues,
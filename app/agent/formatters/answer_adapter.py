@@ -5,17 +5,18 @@ import re
 from datetime import datetime
 from typing import Any
 
-from app.agent.components.grounded_answer_service import GroundedAnswerService
+from app.agent.components.answer_stream import active_token_sink
+from app.agent.components.context_packer import pack_context
+from app.agent.components.evidence_signature import evidence_signature
+from app.agent.components.grounded_answer_service import (
+    GroundedAnswerService,
+    collect_synthesis_degradations,
+)
 from app.agent.types.models import AnswerDraft, EvidenceItem, RetrievalPlan
 from app.profiles.models import AgentProfile
 from app.infrastructure.config import settings
 
 
-def _clip(text: str, limit: int) -> str:
-    t = (text or "").strip()
-    return t if len(t) <= limit else t[:limit].rstrip() + "..."
-
-
 def _get_row_content_and_meta(item: EvidenceItem) -> tuple[str, dict[str, Any]]:
     row = item.metadata.get("row") if isinstance(item.metadata, dict) else None
     if not isinstance(row, dict):
@@ -42,16 +43,10 @@ def _extract_scope_labels(text: str, candidates: list[str]) -> list[str]:
 
 
 def _row_mentions_scopes(item: EvidenceItem, scope_labels: list[str]) -> set[str]:
-    content, meta = _get_row_content_and_meta(item)
-    if not content and not meta:
+    signature = evidence_signature(item)
+    if not signature.has_row:
         return set()
-    blob = (content + "\n" + json.dumps(meta, default=str, ensure_ascii=True)).lower()
-    present: set[str] = set()
-    for label in scope_labels:
-        key = (label or "").strip().lower()
-        if key and key in blob:
-            present.add(label)
-    return present
+    return {label for label in scope_labels if signature.mentions_scope(label)}
 
 
 def _extract_clause_refs(text: str) -> list[str]:
@@ -66,35 +61,13 @@ def _extract_clause_refs(text: str) -> list[str]:
     return ordered
 
 
-def _clause_match(requested: str, candidate: str) -> bool:
-    req = str(requested or "").strip()
-    cand = str(candidate or "").strip()
-    return bool(req and cand and (cand == req or cand.startswith(f"{req}.")))
-
-
 def _row_matches_clause(item: EvidenceItem, clause_refs: list[str]) -> bool:
     if not clause_refs:
         return False
-    content, meta = _get_row_content_and_meta(item)
-    if not content and not meta:
+    signature = evidence_signature(item)
+    if not signature.has_row:
         return False
-
-    values: list[str] = []
-    for key in ("clause_id", "clause_ref", "clause", "clause_anchor"):
-        val = str(meta.get(key) or "").strip()
-        if val:
-            values.append(val)
-
-    refs_raw = meta.get("clause_refs")
-    if isinstance(refs_raw, list):
-        values.extend(str(v).strip() for v in refs_raw if isinstance(v, str) and str(v).strip())
-
-    for ref in clause_refs:
-        if re.search(rf"\b{re.escape(ref)}(?:\.\d+)*\b", content):
-            return True
-        if any(_clause_match(ref, candidate) for candidate in values):
-            return True
-    return False
+    return any(signature.matches_clause(ref) for ref in clause_refs)
 
 
 def _snippet(text: str, limit: int = 240) -> str:
@@ -208,21 +181,8 @@ def _item_matches_scope(item: EvidenceItem, scope: str) -> bool:
     aliases = _scope_aliases(scope)
     if not aliases:
         return False
-    content, meta = _get_row_content_and_meta(item)
-    blob = "\n".join(
-        part
-        for part in [
-            str(content or ""),
-            json.dumps(meta or {}, default=str, ensure_ascii=True),
-        ]
-        if part
-    ).casefold()
-    if not blob:
-        return False
-    for alias in aliases:
-        if alias in blob:
-            return True
-    return False
+    signature = evidence_signature(item)
+    return any(signature.mentions_scope(alias) for alias in aliases)
 
 
 def _balance_evidence_by_scope(
@@ -295,6 +255,23 @@ def _balance_evidence_by_scope(
     return selected[: max(1, max_items)]
 
 
+def _context_token_budget(
+    plan: RetrievalPlan, agent_profile: AgentProfile | None, cross_scope_mode: bool
+) -> int:
+    mode_cfg = (
+        agent_profile.query_modes.modes.get(str(plan.mode or "").strip())
+        if agent_profile is not None
+        else None
+    )
+    if mode_cfg is not None and mode_cfg.context_token_budget:
+        return int(mode_cfg.context_token_budget)
+    if cross_scope_mode:
+        return int(getattr(settings, "ORCH_CONTEXT_TOKEN_BUDGET_CROSS_SCOPE", 6400) or 6400)
+    if plan.require_literal_evidence:
+        return int(getattr(settings, "ORCH_CONTEXT_TOKEN_BUDGET_LITERAL", 3200) or 3200)
+    return int(getattr(settings, "ORCH_CONTEXT_TOKEN_BUDGET_DEFAULT", 4000) or 4000)
+
+
 class GroundedAnswerAdapter:
     def __init__(self, service: GroundedAnswerService):
         self.service = service
@@ -409,22 +386,31 @@ class GroundedAnswerAdapter:
             ordered_items = sorted(ordered_items, key=_recency_key, reverse=True)
 
         max_ctx = 28 if cross_scope_mode else (14 if plan.require_literal_evidence else 18)
-        generation_items = (
-            _balance_evidence_by_scope(
-                items=ordered_items,
-                requested_scopes=tuple(plan.requested_standards or ()),
-                max_items=max_ctx,
+        requested_scopes = tuple(plan.requested_standards or ())
+
+        def _scope_group(item: EvidenceItem) -> str:
+            return next(
+                (scope for scope in requested_scopes if _item_matches_scope(item, scope)), ""
             )
-            if cross_scope_mode
-            else ordered_items[: max(1, max_ctx)]
-        )
 
-        labeled: list[str] = []
-        for item in generation_items:
-            content = (item.content or "").strip()
-            if content:
-                source = (item.source or "").strip() or "unknown-source"
-                labeled.append(f"[{source}] {_clip(content, 900)}")
+        packed = pack_context(
+            ordered_items,
+            query=query,
+            budget_tokens=_context_token_budget(plan, agent_profile, cross_scope_mode),
+            max_items=max_ctx,
+            select=(
+                (
+                    lambda items, limit: _balance_evidence_by_scope(
+                        items=items, requested_scopes=requested_scopes, max_items=limit
+                    )
+                )
+                if cross_scope_mode
+                else None
+            ),
+            group=_scope_group if len(requested_scopes) >= 2 else None,
+        )
+        generation_items = packed.items
+        labeled = packed.texts
 
         clause_refs = _extract_clause_refs(query)
         clause_items = [item for item in generation_items if _row_matches_clause(item, clause_refs)]
@@ -445,18 +431,30 @@ class GroundedAnswerAdapter:
             "\n\n".join(structured_context_parts) if structured_context_parts else None
         )
 
-        text = await self.service.generate_answer(
-            query=query_for_generation,
-            context_chunks=labeled,
-            agent_profile=agent_profile,
-            mode=plan.mode,
-            require_literal_evidence=bool(plan.require_literal_evidence),
-            structured_context=structured_context,
-            max_chunks=max_ctx,
-        )
+        token_sink = active_token_sink()
+        streamed: list[str] = []
+        stream_kwargs: dict[str, Any] = {}
+        if token_sink is not None:
+
+            def _on_token(delta: str) -> None:
+                streamed.append(delta)
+                token_sink.emit_token(delta)
+
+            stream_kwargs = {"stream": True, "on_token": _on_token}
+        with collect_synthesis_degradations() as degraded:
+            generated = await self.service.generate_answer(
+                query=query_for_generation,
+                context_chunks=labeled,
+                agent_profile=agent_profile,
+                mode=plan.mode,
+                require_literal_evidence=bool(plan.require_literal_evidence),
+                structured_context=structured_context,
+                max_chunks=max_ctx,
+                **stream_kwargs,
+            )
 
         text = self._apply_post_generation_guardrails(
-            text=text,
+            text=generated,
             ordered_items=generation_items,
             plan=plan,
             agent_profile=agent_profile,
@@ -465,5 +463,20 @@ class GroundedAnswerAdapter:
             literal_min_items=literal_min_items,
             clause_refs_count=len(clause_refs),
         )
+        if token_sink is not None and streamed:
+            # The client renders the streamed tokens as the answer, so any later rewrite
+            # (model fallback or guardrails) replaces them instead of silently diverging.
+            streamed_text = "".join(streamed).strip()
+            if text.strip() != streamed_text:
+                token_sink.reset_tokens(
+                    "generation_fallback" if generated.strip() != streamed_text else "guardrails"
+                )
+                token_sink.emit_token(text)
 
-        return AnswerDraft(text=text, mode=plan.mode, evidence=generation_items)
+        return AnswerDraft(
+            text=text,
+            mode=plan.mode,
+            evidence=generation_items,
+            context_stats=packed.stats,
+            degraded=tuple(degraded),
+        )
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import re
+from threading import Lock
 from typing import Any
 
 from app.profiles.models import AgentProfile
+from app.agent.policies.scope_index import ScopeIndex
 from app.agent.types.models import QueryIntent, RetrievalPlan
 
 
@@ -215,31 +217,6 @@ def _looks_like_scope_label(value: str) -> bool:
     return bool(compact.isupper() and len(compact) <= 12)
 
 
-def _edit_distance(a: str, b: str) -> int:
-    left = str(a or "")
-    right = str(b or "")
-    if left == right:
-        return 0
-    if not left:
-        return len(right)
-    if not right:
-        return len(left)
-    prev = list(range(len(right) + 1))
-    for i, ch_left in enumerate(left, start=1):
-        curr = [i]
-        for j, ch_right in enumerate(right, start=1):
-            cost = 0 if ch_left == ch_right else 1
-            curr.append(
-                min(
-                    prev[j] + 1,
-                    curr[j - 1] + 1,
-                    prev[j - 1] + cost,
-                )
-            )
-        prev = curr
-    return prev[-1]
-
-
 def _canonical_scope_value(raw: str) -> str:
     value = str(raw or "").strip()
     if not value:
@@ -287,38 +264,31 @@ def _extract_digit_candidates(text: str) -> list[str]:
     return candidates
 
 
-def _best_scope_from_token(
-    token: str,
-    catalog: dict[str, set[str]],
-    fuzzy_enabled: bool,
-) -> tuple[str, float] | None:
-    text = str(token or "").strip().lower()
-    if not text:
-        return None
-    best_scope = ""
-    best_score = 0.0
-    for canonical, aliases in catalog.items():
-        alias_set = set(aliases)
-        alias_set.add(canonical.lower())
-        if text in alias_set:
-            return canonical, 1.0
-        if not fuzzy_enabled:
-            continue
-        local_best = 0.0
-        for alias in alias_set:
-            if not alias:
-                continue
-            dist = _edit_distance(text, alias)
-            max_len = max(len(text), len(alias), 1)
-            score = 1.0 - (dist / max_len)
-            if score > local_best:
-                local_best = score
-        if local_best > best_score:
-            best_scope = canonical
-            best_score = local_best
-    if best_scope:
-        return best_scope, max(0.0, min(1.0, best_score))
-    return None
+_SCOPE_INDEX_MAX_PROFILES = 64
+_scope_indexes: dict[int, tuple[AgentProfile, ScopeIndex]] = {}
+_scope_indexes_lock = Lock()
+
+
+def _scope_index(profile: AgentProfile) -> ScopeIndex:
+    """Compiled scope index for `profile`, built on first use and reused while it lives."""
+    cached = _scope_indexes.get(id(profile))
+    if cached is not None and cached[0] is profile:
+        return cached[1]
+    resolution = profile.scope_resolution
+    index = ScopeIndex(
+        _scope_catalog(profile),
+        fuzzy_enabled=bool(resolution.fuzzy_enabled),
+        min_score=min(
+            float(resolution.min_confidence_autoresolve),
+            float(resolution.min_confidence_clarify),
+        ),
+    )
+    with _scope_indexes_lock:
+        if len(_scope_indexes) >= _SCOPE_INDEX_MAX_PROFILES:
+            _scope_indexes.pop(next(iter(_scope_indexes)))
+        # Holding the profile keeps its id() from being reused by another object.
+        _scope_indexes[id(profile)] = (profile, index)
+    return index
 
 
 def extract_requested_scopes(query: str, profile: AgentProfile | None = None) -> tuple[str, ...]:
@@ -413,8 +383,7 @@ def extract_requested_scopes(query: str, profile: AgentProfile | None = None) ->
             if any(h.lower() in lower_text for h in hints) and scope_label not in found:
                 _add_scope(scope_label.strip())
 
-    scope_catalog = _scope_catalog(profile)
-    fuzzy_enabled = bool(profile.scope_resolution.fuzzy_enabled) if profile is not None else True
+    scope_index = _scope_index(profile) if profile is not None else None
     min_autoresolve = (
         float(profile.scope_resolution.min_confidence_autoresolve) if profile is not None else 0.85
     )
@@ -429,7 +398,7 @@ def extract_requested_scopes(query: str, profile: AgentProfile | None = None) ->
     token_candidates.extend(re.findall(r"\b[\w\-]{3,}\b", text))
 
     for token in token_candidates:
-        if not scope_catalog:
+        if not scope_index:
             fallback = _canonical_scope_value(token)
             if re.search(r"\d", fallback) and re.search(r"[A-Z]", fallback):
                 _add_scope(fallback)
@@ -437,7 +406,7 @@ def extract_requested_scopes(query: str, profile: AgentProfile | None = None) ->
                 if not re.fullmatch(r"(19|20)\d{2}", fallback):
                     _add_scope(fallback)
             continue
-        match = _best_scope_from_token(token, scope_catalog, fuzzy_enabled=fuzzy_enabled)
+        match = scope_index.best_match(token)
         if not match:
             continue
         scope, score = match
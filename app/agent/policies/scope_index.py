@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Mapping
+
+_MEMO_MAX_ENTRIES = 8192
+
+
+def bounded_edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, or ``limit + 1`` as soon as it provably exceeds ``limit``."""
+    if a == b:
+        return 0
+    cap = limit + 1
+    if abs(len(a) - len(b)) > limit:
+        return cap
+    if len(a) > len(b):
+        a, b = b, a
+    len_a, len_b = len(a), len(b)
+    if len_a == 0:
+        return min(len_b, cap)
+
+    prev = [j if j <= limit else cap for j in range(len_b + 1)]
+    for i in range(1, len_a + 1):
+        ch_a = a[i - 1]
+        curr = [cap] * (len_b + 1)
+        curr[0] = i if i <= limit else cap
+        row_min = curr[0]
+        # Cells further than `limit` off the diagonal cannot lead to a distance <= limit.
+        for j in range(max(1, i - limit), min(len_b, i + limit) + 1):
+            cost = 0 if ch_a == b[j - 1] else 1
+            value = min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + cost, cap)
+            curr[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min >= cap:
+            return cap
+        prev = curr
+    return prev[len_b]
+
+
+class ScopeIndex:
+    """Compiled alias lookup for one profile's scope catalog.
+
+    Exact aliases resolve through a dict; fuzzy candidates are grouped by length so only
+    aliases that could still score ``>= min_score`` are compared, each with a distance bound
+    derived from that score. Results match an exhaustive scan over every alias: the best
+    score wins and ties go to the canonical scope listed first in the catalog.
+    """
+
+    def __init__(
+        self,
+        catalog: Mapping[str, set[str]],
+        *,
+        fuzzy_enabled: bool,
+        min_score: float,
+    ) -> None:
+        self._fuzzy_enabled = fuzzy_enabled
+        self._min_score = float(min_score)
+        self._canonicals: list[str] = list(catalog.keys())
+        self._exact: dict[str, str] = {}
+        self._by_length: dict[int, list[tuple[str, int]]] = {}
+        for rank, canonical in enumerate(self._canonicals):
+            aliases = set(catalog[canonical])
+            aliases.add(canonical.lower())
+            for alias in sorted(aliases):
+                if not alias:
+                    continue
+                self._exact.setdefault(alias, canonical)
+                self._by_length.setdefault(len(alias), []).append((alias, rank))
+        self._memo: dict[str, tuple[str, float] | None] = {}
+        self._memo_lock = Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._canonicals)
+
+    def best_match(self, token: str) -> tuple[str, float] | None:
+        text = str(token or "").strip().lower()
+        if not text:
+            return None
+        exact = self._exact.get(text)
+        if exact is not None:
+            return exact, 1.0
+        if not self._fuzzy_enabled:
+            return None
+        if text in self._memo:
+            return self._memo[text]
+        match = self._best_fuzzy(text)
+        with self._memo_lock:
+            if len(self._memo) >= _MEMO_MAX_ENTRIES:
+                self._memo.clear()
+            self._memo[text] = match
+        return match
+
+    def _distance_limit(self, max_len: int) -> int:
+        """Largest distance whose score `1 - d / max_len` still reaches `min_score`."""
+        limit = max_len
+        while limit >= 0 and 1.0 - (limit / max_len) < self._min_score:
+            limit -= 1
+        return limit
+
+    def _best_fuzzy(self, text: str) -> tuple[str, float] | None:
+        len_text = len(text)
+        best_score = 0.0
+        best_rank = len(self._canonicals)
+        for alias_len, entries in self._by_length.items():
+            max_len = max(len_text, alias_len, 1)
+            limit = self._distance_limit(max_len)
+            if limit < 0 or abs(len_text - alias_len) > limit:
+                continue
+            for alias, rank in entries:
+                dist = bounded_edit_distance(text, alias, limit)
+                if dist > limit:
+                    continue
+                score = 1.0 - (dist / max_len)
+                if score > best_score or (score == best_score and score > 0 and rank < best_rank):
+                    best_score = score
+                    best_rank = rank
+        if best_score <= 0.0 or best_rank >= len(self._canonicals):
+            return None
+        return self._canonicals[best_rank], min(1.0, best_score)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from typing import Any, Iterator
+
+from app.agent.types.models import RetrievalDiagnostics
+from app.profiles.models import AgentProfile
+
+
+@dataclass
+class RetrievalRequestContext:
+    """Mutable per-request retrieval state shared by the graph nodes of one execution."""
+
+    profile: AgentProfile | None = None
+    profile_resolution: dict[str, Any] | None = None
+    validated_filters: dict[str, Any] | None = None
+    validated_scope_payload: dict[str, Any] | None = None
+    last_diagnostics: RetrievalDiagnostics | None = None
+
+    def adopt(self, other: RetrievalRequestContext) -> None:
+        """Take over the retrieval outcome recorded in a forked copy."""
+        self.validated_filters = other.validated_filters
+        self.validated_scope_payload = other.validated_scope_payload
+        self.last_diagnostics = other.last_diagnostics
+
+
+_CURRENT_CONTEXT: ContextVar[RetrievalRequestContext | None] = ContextVar(
+    "retrieval_request_context", default=None
+)
+
+
+def current_retrieval_context() -> RetrievalRequestContext | None:
+    return _CURRENT_CONTEXT.get()
+
+
+@contextmanager
+def bind_retrieval_context(
+    context: RetrievalRequestContext,
+) -> Iterator[RetrievalRequestContext]:
+    # Tasks spawned inside the block (LangGraph nodes, wait_for) copy the contextvar,
+    # so they all share the same mutable context object.
+    token = _CURRENT_CONTEXT.set(context)
+    try:
+        yield context
+    finally:
+        _CURRENT_CONTEXT.reset(token)
+
+
+@contextmanager
+def fork_retrieval_context() -> Iterator[RetrievalRequestContext | None]:
+    """Bind a private copy of the current context for one of several concurrent steps.
+
+    Must be entered inside the step's own task so the binding stays local to it. Yields the
+    copy (None when no context is bound) for the caller to `adopt` afterwards.
+    """
+    parent = current_retrieval_context()
+    if parent is None:
+        yield None
+        return
+    child = replace(parent)
+    token = _CURRENT_CONTEXT.set(child)
+    try:
+        yield child
+    finally:
+        _CURRENT_CONTEXT.reset(token)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import sys
 import time
 from dataclasses import dataclass
 from typing import Any, Callable, TypedDict
@@ -8,6 +9,7 @@ from typing import Any, Callable, TypedDict
 import httpx
 import structlog
 
+from app.agent.components.evidence_signature import build_evidence_signature
 from app.agent.errors import (
     RETRIEVAL_CODE_INVALID_RESPONSE,
     RETRIEVAL_CODE_TIMEOUT,
@@ -491,6 +493,12 @@ class RetrievalFlow:
 
     @staticmethod
     def _to_evidence(items: Any) -> list[EvidenceItem]:
+        """Convert RAG items into slot-based evidence records.
+
+        Each chunk keeps a single text buffer: the legacy ``metadata["row"]`` wrapper and the
+        match signature reference the item's ``content`` instead of copying it, and source
+        ids (``C1``..``Cn``, repeated across requests) are interned.
+        """
         if not isinstance(items, list):
             return []
         out: list[EvidenceItem] = []
@@ -515,10 +523,11 @@ class RetrievalFlow:
 
             out.append(
                 EvidenceItem(
-                    source=str(item.get("source") or "C1"),
+                    source=sys.intern(str(item.get("source") or "C1")),
                     content=content,
                     score=float(item.get("score") or 0.0),
                     metadata=final_metadata,
+                    signature=build_evidence_signature(content, final_metadata),
                 )
             )
         return out
@@ -5,8 +5,8 @@ from dataclasses import dataclass
 from typing import Any
 
 import structlog
-from openai import AsyncOpenAI
 
+from app.infrastructure.clients.llm_gateway import get_llm_gateway
 from app.infrastructure.config import settings
 
 
@@ -26,14 +26,7 @@ class RetrievalSufficiencyEvaluator:
     timeout_seconds: float = 6.0
 
     def __post_init__(self) -> None:
-        self._client = (
-            AsyncOpenAI(
-                api_key=settings.GROQ_API_KEY,
-                base_url="https://api.groq.com/openai/v1",
-            )
-            if settings.GROQ_API_KEY
-            else None
-        )
+        self._gateway = get_llm_gateway()
 
     async def evaluate(
         self,
@@ -46,7 +39,7 @@ class RetrievalSufficiencyEvaluator:
         if len(items) >= max(1, int(min_items)):
             return SufficiencyDecision(sufficient=True, reason="min_items_met")
 
-        if self._client is None:
+        if not self._gateway.available:
             return SufficiencyDecision(sufficient=False, reason="no_provider")
 
         model = (
@@ -87,13 +80,15 @@ class RetrievalSufficiencyEvaluator:
         )
 
         try:
-            completion = await self._client.chat.completions.create(
+            completion = await self._gateway.chat_completion(
                 model=model,
                 temperature=0.0,
                 messages=[
                     {"role": "system", "content": system},
                     {"role": "user", "content": user},
                 ],
+                purpose="sufficiency_evaluator",
+                timeout_s=self.timeout_seconds,
             )
             text = (completion.choices[0].message.content or "").strip()
             start = text.find("{")
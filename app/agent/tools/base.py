@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Mapping, Protocol
 
 from app.agent.engine import AnswerGeneratorPort, RetrieverPort, ValidatorPort
 from app.agent.types.models import ToolResult
@@ -21,6 +21,6 @@ class AgentTool(Protocol):
         self,
         payload: dict[str, object],
         *,
-        state: dict[str, object],
+        state: Mapping[str, object],
         context: ToolRuntimeContext,
     ) -> ToolResult: ...
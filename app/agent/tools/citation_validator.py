@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Mapping
 
 from app.agent.types.models import AnswerDraft, RetrievalPlan, ToolResult
 from app.agent.tools.base import ToolRuntimeContext
@@ -14,7 +15,7 @@ class CitationValidatorTool:
         self,
         payload: dict[str, object],
         *,
-        state: dict[str, object],
+        state: Mapping[str, object],
         context: ToolRuntimeContext,
     ) -> ToolResult:
         draft = state.get("generation")
@@ -1,39 +1,14 @@
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Mapping
 
+from app.agent.components.evidence_signature import EvidenceSignature, evidence_signature
 from app.agent.components.parsing import extract_row_standard
 from app.agent.types.models import RetrievalPlan, ToolResult
 from app.agent.tools.base import ToolRuntimeContext
 
 
-def _clause_ref_matches(requested: str, candidate: str) -> bool:
-    req = str(requested or "").strip()
-    cand = str(candidate or "").strip()
-    if not req or not cand:
-        return False
-    return cand == req or cand.startswith(f"{req}.")
-
-
-def _row_clause_refs(row: dict[str, Any]) -> set[str]:
-    meta_raw = row.get("metadata")
-    meta: dict[str, Any] = meta_raw if isinstance(meta_raw, dict) else {}
-    refs: set[str] = set()
-    for key in ("clause_id", "clause_ref", "clause", "clause_anchor"):
-        value = str(meta.get(key) or "").strip()
-        if value:
-            refs.add(value)
-    clause_refs = meta.get("clause_refs")
-    if isinstance(clause_refs, list):
-        for item in clause_refs:
-            value = str(item or "").strip()
-            if value:
-                refs.add(value)
-    return refs
-
-
 def _standard_allowed(row_standard: str, expected_scopes: list[str]) -> bool:
     if not expected_scopes:
         return True
@@ -43,14 +18,13 @@ def _standard_allowed(row_standard: str, expected_scopes: list[str]) -> bool:
     return any(scope.upper() in row_std for scope in expected_scopes)
 
 
-def _marker_hits(blob: str, markers: list[str]) -> list[str]:
+def _marker_hits(signature: EvidenceSignature, markers: list[str]) -> list[str]:
     hits: list[str] = []
-    lowered = blob.lower()
     for marker in markers:
         value = str(marker or "").strip()
         if not value:
             continue
-        if value.lower() in lowered:
+        if signature.contains_marker(value):
             hits.append(value)
     return hits
 
@@ -63,7 +37,7 @@ class ExpectationCoverageTool:
         self,
         payload: dict[str, object],
         *,
-        state: dict[str, object],
+        state: Mapping[str, object],
         context: ToolRuntimeContext,
     ) -> ToolResult:
         del context
@@ -133,31 +107,22 @@ class ExpectationCoverageTool:
 
             for item in evidence:
                 source = str(getattr(item, "source", "") or "").strip()
-                content = str(getattr(item, "content", "") or "").strip()
-                row = item.metadata.get("row") if isinstance(item.metadata, dict) else None
-                if not isinstance(row, dict):
-                    row = {"content": content, "metadata": {}}
                 row_standard = extract_row_standard(item)
                 if not _standard_allowed(row_standard, scopes):
                     continue
 
-                content_blob = " ".join(content.split())
-                row_clauses = _row_clause_refs(row)
-
+                signature = evidence_signature(item)
                 if expectation_clauses:
                     clause_hit = False
                     for clause in expectation_clauses:
-                        clause_pattern = re.compile(rf"\b{re.escape(clause)}(?:\.\d+)*\b")
-                        if clause_pattern.search(content_blob) or any(
-                            _clause_ref_matches(clause, ref) for ref in row_clauses
-                        ):
+                        if signature.matches_clause(clause):
                             matched_clauses.add(clause)
                             clause_hit = True
                     if not clause_hit:
                         continue
 
-                req_hits = _marker_hits(content_blob, required_markers)
-                opt_hits = _marker_hits(content_blob, optional_markers)
+                req_hits = _marker_hits(signature, required_markers)
+                opt_hits = _marker_hits(signature, optional_markers)
                 matched_required.update(req_hits)
                 matched_optional.update(opt_hits)
                 if source:
@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Mapping
 
 import structlog
 
 from app.agent.components.parsing import extract_row_standard
 from app.agent.types.models import ToolResult
 from app.agent.tools.base import ToolRuntimeContext
+from app.infrastructure.clients.llm_gateway import get_llm_gateway
 from app.infrastructure.config import settings
 
 logger = structlog.get_logger(__name__)
@@ -63,18 +64,8 @@ async def _llm_comparison(
     grouped: dict[str, list[str]],
 ) -> dict[str, object] | None:
     """LLM-powered comparison synthesis. Returns None on failure (graceful degradation)."""
-    api_key = settings.GROQ_API_KEY
-    if not api_key:
-        return None
-
-    try:
-        from openai import AsyncOpenAI
-
-        client = AsyncOpenAI(
-            api_key=api_key,
-            base_url="https://api.groq.com/openai/v1",
-        )
-    except Exception:
+    gateway = get_llm_gateway()
+    if not gateway.available:
         return None
 
     # Build compact context per scope
@@ -102,19 +93,16 @@ async def _llm_comparison(
     )
 
     try:
-        import asyncio
-
-        completion = await asyncio.wait_for(
-            client.chat.completions.create(
-                model=settings.GROQ_MODEL_LIGHTWEIGHT,
-                temperature=0.0,
-                max_tokens=600,
-                messages=[
-                    {"role": "system", "content": _COMPARISON_SYSTEM},
-                    {"role": "user", "content": user_msg},
-                ],
-            ),
-            timeout=timeout_s,
+        completion = await gateway.chat_completion(
+            model=settings.GROQ_MODEL_LIGHTWEIGHT,
+            temperature=0.0,
+            max_tokens=600,
+            messages=[
+                {"role": "system", "content": _COMPARISON_SYSTEM},
+                {"role": "user", "content": user_msg},
+            ],
+            purpose="logical_comparison",
+            timeout_s=timeout_s,
         )
         text = (completion.choices[0].message.content or "").strip()
         start = text.find("{")
@@ -137,7 +125,7 @@ class LogicalComparisonTool:
         self,
         payload: dict[str, object],
         *,
-        state: dict[str, object],
+        state: Mapping[str, object],
         context: ToolRuntimeContext,
     ) -> ToolResult:
         del context
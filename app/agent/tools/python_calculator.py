@@ -3,7 +3,7 @@ from __future__ import annotations
 import ast
 import asyncio
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Mapping
 
 from app.agent.types.models import ToolResult
 from app.agent.tools.base import ToolRuntimeContext
@@ -129,7 +129,7 @@ class PythonCalculatorTool:
         self,
         payload: dict[str, object],
         *,
-        state: dict[str, object],
+        state: Mapping[str, object],
         context: ToolRuntimeContext,
     ) -> ToolResult:
         del context
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import time
 from dataclasses import dataclass
+from typing import Mapping
 
 from app.agent.types.models import EvidenceItem, RetrievalDiagnostics, RetrievalPlan, ToolResult
 from app.agent.tools.base import ToolRuntimeContext
@@ -16,7 +17,7 @@ class SemanticRetrievalTool:
         self,
         payload: dict[str, object],
         *,
-        state: dict[str, object],
+        state: Mapping[str, object],
         context: ToolRuntimeContext,
     ) -> ToolResult:
         query = str(
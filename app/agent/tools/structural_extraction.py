@@ -3,12 +3,13 @@ from __future__ import annotations
 import json
 import re
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Mapping
 
 import structlog
 
 from app.agent.types.models import ToolResult
 from app.agent.tools.base import ToolRuntimeContext
+from app.infrastructure.clients.llm_gateway import get_llm_gateway
 from app.infrastructure.config import settings
 
 logger = structlog.get_logger(__name__)
@@ -57,18 +58,8 @@ async def _llm_extract(
     schema_definition: str,
 ) -> dict[str, Any] | None:
     """LLM-powered structured extraction. Returns None on failure."""
-    api_key = settings.GROQ_API_KEY
-    if not api_key:
-        return None
-
-    try:
-        from openai import AsyncOpenAI
-
-        client = AsyncOpenAI(
-            api_key=api_key,
-            base_url="https://api.groq.com/openai/v1",
-        )
-    except Exception:
+    gateway = get_llm_gateway()
+    if not gateway.available:
         return None
 
     truncated = text[:_EXTRACTION_MAX_CONTEXT_CHARS]
@@ -88,19 +79,16 @@ async def _llm_extract(
     )
 
     try:
-        import asyncio
-
-        completion = await asyncio.wait_for(
-            client.chat.completions.create(
-                model=settings.GROQ_MODEL_LIGHTWEIGHT,
-                temperature=0.0,
-                max_tokens=800,
-                messages=[
-                    {"role": "system", "content": _EXTRACTION_SYSTEM},
-                    {"role": "user", "content": user_msg},
-                ],
-            ),
-            timeout=timeout_s,
+        completion = await gateway.chat_completion(
+            model=settings.GROQ_MODEL_LIGHTWEIGHT,
+            temperature=0.0,
+            max_tokens=800,
+            messages=[
+                {"role": "system", "content": _EXTRACTION_SYSTEM},
+                {"role": "user", "content": user_msg},
+            ],
+            purpose="structural_extraction",
+            timeout_s=timeout_s,
         )
         raw = (completion.choices[0].message.content or "").strip()
         start = raw.find("{")
@@ -115,7 +103,7 @@ async def _llm_extract(
     return None
 
 
-def _resolve_text_content(payload: dict[str, object], state: dict[str, object]) -> str:
+def _resolve_text_content(payload: dict[str, object], state: Mapping[str, object]) -> str:
     """Resolve text_content from payload (direct / piped) or state fallback."""
     text_content = str(payload.get("text_content") or "").strip()
     if not text_content:
@@ -151,7 +139,7 @@ class StructuralExtractionTool:
         self,
         payload: dict[str, object],
         *,
-        state: dict[str, object],
+        state: Mapping[str, object],
         context: ToolRuntimeContext,
     ) -> ToolResult:
         del context
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from app.agent.components.evidence_signature import EvidenceSignature
 
 
 QueryMode = str
@@ -25,12 +28,13 @@ class RetrievalPlan:
     requested_standards: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvidenceItem:
     source: str
     content: str
     score: float = 0.0
     metadata: dict = field(default_factory=dict)
+    signature: EvidenceSignature | None = field(default=None, compare=False, repr=False)
 
 
 @dataclass(frozen=True)
@@ -38,6 +42,9 @@ class AnswerDraft:
     text: str
     mode: QueryMode
     evidence: list[EvidenceItem] = field(default_factory=list)
+    context_stats: dict[str, Any] = field(default_factory=dict)
+    # Why synthesis fell short (e.g. model fallback, truncated); such answers are not cached.
+    degraded: tuple[str, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -71,6 +78,8 @@ class ToolCall:
     tool: str
     input: dict[str, Any] = field(default_factory=dict)
     rationale: str = ""
+    # Indices of earlier plan steps this call needs; None means the previous step.
+    depends_on: tuple[int, ...] | None = None
 
 
 @dataclass(frozen=True)
@@ -101,6 +110,16 @@ class ReasoningPlan:
     steps: list[ToolCall] = field(default_factory=list)
     complexity: Literal["simple", "complex"] = "simple"
 
+    def step_dependencies(self) -> list[tuple[int, ...]]:
+        """Resolved dependencies per step; only earlier steps count, so the plan is a DAG."""
+        resolved: list[tuple[int, ...]] = []
+        for index, call in enumerate(self.steps):
+            if call.depends_on is None:
+                resolved.append((index - 1,) if index > 0 else ())
+                continue
+            resolved.append(tuple(sorted({dep for dep in call.depends_on if 0 <= dep < index})))
+        return resolved
+
 
 @dataclass(frozen=True)
 class ReasoningTrace:
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import httpx
+import structlog
+
+from app.agent.components.answer_cache import get_answer_cache
+from app.agent.components.grounded_answer_service import GroundedAnswerService
+from app.agent.engine import HandleQuestionUseCase
+from app.agent.formatters.adapters import LiteralEvidenceValidator
+from app.agent.formatters.answer_adapter import GroundedAnswerAdapter
+from app.infrastructure.clients.backend_selector import get_rag_backend_selector
+from app.infrastructure.clients.http_adapters import RagEngineRetrieverAdapter
+from app.infrastructure.clients.outbound_pool import OutboundClientRegistry
+from app.infrastructure.clients.retrieval_cache import get_retrieval_response_cache
+from app.infrastructure.config import settings
+from app.infrastructure.observability.logging_utils import compact_error
+
+logger = structlog.get_logger(__name__)
+
+
+def build_handle_question_use_case(
+    http_client: httpx.AsyncClient | None = None,
+    *,
+    outbound_clients: OutboundClientRegistry | None = None,
+) -> HandleQuestionUseCase:
+    retriever = RagEngineRetrieverAdapter(
+        backend_selector=get_rag_backend_selector(),
+        http_client=http_client,
+        provider_http_client=(
+            outbound_clients.get("providers") if outbound_clients is not None else None
+        ),
+        retrieval_cache=(
+            get_retrieval_response_cache()
+            if bool(getattr(settings, "ORCH_RETRIEVAL_CACHE_ENABLED", True))
+            else None
+        ),
+    )
+    # LLM calls share the gateway's client on the "llm" outbound pool.
+    answer_generator = GroundedAnswerAdapter(service=GroundedAnswerService())
+    validator = LiteralEvidenceValidator()
+    return HandleQuestionUseCase(
+        retriever=retriever,
+        answer_generator=answer_generator,
+        validator=validator,
+        answer_cache=(
+            get_answer_cache()
+            if bool(getattr(settings, "ORCH_ANSWER_CACHE_ENABLED", True))
+            else None
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class OrchestratorRegistry:
+    """Process-wide orchestrator built once in the app lifespan.
+
+    The compiled graph, tool registry, retriever adapter and LLM/provider clients are
+    shared; per-request retrieval state is bound by the orchestrator on each execution.
+    """
+
+    use_case: HandleQuestionUseCase
+
+
+def build_orchestrator_registry(
+    http_client: httpx.AsyncClient | None = None,
+    *,
+    outbound_clients: OutboundClientRegistry | None = None,
+) -> OrchestratorRegistry | None:
+    try:
+        use_case = build_handle_question_use_case(
+            http_client, outbound_clients=outbound_clients
+        )
+        use_case.warm_up()
+    except Exception as exc:
+        # Keep the API bootable; request handlers fall back to per-request wiring and
+        # surface the configuration error there.
+        logger.error("orchestrator_registry_init_failed", error=compact_error(exc))
+        return None
+    logger.info("orchestrator_registry_initialized")
+    return OrchestratorRegistry(use_case=use_case)
@@ -4,12 +4,20 @@ from contextlib import asynccontextmanager
 import structlog
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError, ResponseValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.api.v1.api_router import v1_router
 from app.profiles.loader import get_profile_loader
 from app.infrastructure.config import settings
-from app.infrastructure.clients.rag_client import build_rag_http_client
+from app.infrastructure.metrics.exposition import CONTENT_TYPE, render_openmetrics
+from app.infrastructure.observability.tracing import configure_tracing, shutdown_tracing
+from app.infrastructure.clients.backend_selector import get_rag_backend_selector
+from app.infrastructure.security.token_cache import get_jwks_key_store
+from app.infrastructure.clients.outbound_pool import (
+    build_outbound_client_registry,
+    install_outbound_client_registry,
+)
+from app.api.orchestrator_registry import build_orchestrator_registry
 
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO), format="%(message)s"
@@ -27,13 +35,28 @@ logger = structlog.get_logger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     get_profile_loader().validate_profile_files_strict()
-    app.state.rag_http_client = build_rag_http_client()
+    outbound_clients = build_outbound_client_registry()
+    install_outbound_client_registry(outbound_clients)
+    app.state.outbound_clients = outbound_clients
+    app.state.rag_http_client = outbound_clients.get("rag")
+    app.state.orchestrator_registry = build_orchestrator_registry(
+        app.state.rag_http_client, outbound_clients=outbound_clients
+    )
+    rag_backend_selector = get_rag_backend_selector()
+    rag_backend_selector.start_health_probes()
+    jwks_key_store = get_jwks_key_store()
+    if jwks_key_store is not None:
+        jwks_key_store.start()
+    configure_tracing()
     try:
         yield
     finally:
-        rag_http_client = getattr(app.state, "rag_http_client", None)
-        if rag_http_client is not None:
-            await rag_http_client.aclose()
+        shutdown_tracing()
+        await rag_backend_selector.stop_health_probes()
+        if jwks_key_store is not None:
+            await jwks_key_store.stop()
+        install_outbound_client_registry(None)
+        await outbound_clients.aclose()
 
 
 app = FastAPI(
@@ -83,3 +106,8 @@ app.include_router(v1_router)
 @app.get("/health")
 def health_check():
     return {"status": "ok", "service": "qa-orchestrator", "api_v1": "available"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> PlainTextResponse:
+    return PlainTextResponse(render_openmetrics(), media_type=CONTENT_TYPE)
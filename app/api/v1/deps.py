@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from functools import lru_cache
+import time
 from typing import Any
 from uuid import uuid4
 
@@ -11,7 +11,11 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, Field
 
+from app.infrastructure.clients.outbound_pool import outbound_get
 from app.infrastructure.config import settings
+from app.infrastructure.metrics.auth import auth_metrics_store
+from app.infrastructure.metrics.histograms import current_metric_labels, latency_histogram_store
+from app.infrastructure.security.token_cache import get_jwks_key_store, get_verified_claims_cache
 
 
 logger = structlog.get_logger(__name__)
@@ -30,9 +34,15 @@ def _request_id(request: Request) -> str:
     return str(request.headers.get("X-Request-ID") or request.headers.get("X-Correlation-ID") or uuid4())
 
 
-@lru_cache(maxsize=4)
-def _jwks_client(jwks_url: str) -> jwt.PyJWKClient:
-    return jwt.PyJWKClient(jwks_url)
+def _observe_auth(step: str, started_at: float, outcome: str) -> None:
+    latency_histogram_store.observe(
+        "orch_auth_duration_ms",
+        (time.perf_counter() - started_at) * 1000,
+        help="Authentication step duration in milliseconds (JWKS verify, user profile).",
+        step=step,
+        outcome=outcome,
+        **current_metric_labels().as_dict(),
+    )
 
 
 def _as_str_list(value: Any) -> list[str]:
@@ -92,12 +102,14 @@ def _extract_roles(claims: dict[str, Any]) -> list[str]:
 
 
 def _decode_jwt_payload(token: str) -> dict[str, Any]:
-    jwks_url = settings.resolved_supabase_jwks_url
-    if not jwks_url:
+    key_store = get_jwks_key_store()
+    if key_store is None:
         raise RuntimeError("SUPABASE_URL or SUPABASE_JWKS_URL must be configured")
 
-    jwks_client = _jwks_client(jwks_url)
-    signing_key = jwks_client.get_signing_key_from_jwt(token).key
+    # Keys come from the in-memory JWKS; fetching never happens on this (sync) path.
+    signing_key = key_store.signing_key(token)
+    if signing_key is None:
+        raise jwt.InvalidTokenError("unknown_signing_key")
     verify_aud = bool(str(settings.SUPABASE_JWT_AUDIENCE or "").strip())
     payload = jwt.decode(
         token,
@@ -111,7 +123,12 @@ def _decode_jwt_payload(token: str) -> dict[str, Any]:
     return payload
 
 
+class _UserProfileUnavailable(RuntimeError):
+    """Supabase could not say whether the token is valid (transport error or 5xx)."""
+
+
 async def _fetch_supabase_user_profile(token: str) -> dict[str, Any] | None:
+    """Claims for `token` from ``/auth/v1/user``; None when Supabase rejects the token."""
     supabase_url = str(settings.SUPABASE_URL or "").strip()
     anon_key = str(settings.SUPABASE_ANON_KEY or "").strip()
     if not supabase_url or not anon_key:
@@ -123,11 +140,14 @@ async def _fetch_supabase_user_profile(token: str) -> dict[str, Any] | None:
         "Authorization": f"Bearer {token}",
     }
     try:
-        async with httpx.AsyncClient(timeout=4.0) as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-    except Exception:
-        return None
+        response = await outbound_get("supabase", url, timeout=4.0, headers=headers)
+        response.raise_for_status()
+    except httpx.HTTPStatusError as exc:
+        if exc.response.status_code in (401, 403):
+            return None
+        raise _UserProfileUnavailable(f"supabase_user_status_{exc.response.status_code}") from exc
+    except Exception as exc:
+        raise _UserProfileUnavailable(str(exc) or type(exc).__name__) from exc
 
     data = response.json()
     if not isinstance(data, dict):
@@ -193,9 +213,32 @@ async def get_current_user(
             "Invalid bearer token",
         )
 
+    token_cache = get_verified_claims_cache()
+    cached_claims = token_cache.get(token)
+    if cached_claims is not None:
+        auth_metrics_store.record("claims_cache_hits")
+        return _user_context(request, cached_claims)
+    if token_cache.is_rejected(token):
+        auth_metrics_store.record("negative_cache_hits")
+        logger.warning("auth_fail", decision="auth_fail", reason="invalid_jwt_cached")
+        raise _http_error(
+            request,
+            status.HTTP_401_UNAUTHORIZED,
+            "UNAUTHORIZED",
+            "Invalid or expired token",
+        )
+    auth_metrics_store.record("claims_cache_misses")
+
+    verify_started_at = time.perf_counter()
+    key_store = get_jwks_key_store()
+    if key_store is not None:
+        await key_store.ensure_key(token)
     try:
         claims = _decode_jwt_payload(token)
+        _observe_auth("jwt_verify", verify_started_at, "ok")
+        token_cache.store(token, claims, expires_at=claims.get("exp"))
     except RuntimeError:
+        _observe_auth("jwt_verify", verify_started_at, "misconfigured")
         logger.error("auth_fail", decision="auth_fail", reason="jwt_misconfigured")
         raise _http_error(
             request,
@@ -204,8 +247,26 @@ async def get_current_user(
             "JWT validation is misconfigured",
         )
     except jwt.PyJWTError:
-        claims = await _fetch_supabase_user_profile(token)
+        _observe_auth("jwt_verify", verify_started_at, "invalid")
+        auth_metrics_store.record("remote_fallbacks")
+        profile_started_at = time.perf_counter()
+        try:
+            claims = await _fetch_supabase_user_profile(token)
+        except _UserProfileUnavailable as exc:
+            # Not a verdict on the token: do not negative-cache it.
+            _observe_auth("user_profile", profile_started_at, "unavailable")
+            logger.warning(
+                "auth_fail", decision="auth_fail", reason="user_profile_unavailable", error=str(exc)
+            )
+            raise _http_error(
+                request,
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                "AUTH_PROVIDER_UNAVAILABLE",
+                "Token could not be verified right now",
+            ) from None
+        _observe_auth("user_profile", profile_started_at, "ok" if claims else "rejected")
         if not claims:
+            token_cache.reject(token)
             logger.warning("auth_fail", decision="auth_fail", reason="invalid_jwt")
             raise _http_error(
                 request,
@@ -214,7 +275,13 @@ async def get_current_user(
                 "Invalid or expired token",
             )
         logger.info("auth_jwt_fallback", decision="auth_ok", source="supabase_user_profile")
+        fallback_ttl = float(getattr(settings, "ORCH_AUTH_FALLBACK_CLAIMS_TTL_SECONDS", 60.0))
+        token_cache.store(token, claims, expires_at=time.time() + fallback_ttl)
+
+    return _user_context(request, claims)
+
 
+def _user_context(request: Request, claims: dict[str, Any]) -> UserContext:
     user_id = str(claims.get("sub") or "").strip()
     if not user_id:
         logger.warning("auth_fail", decision="auth_fail", reason="missing_sub")
@@ -2,54 +2,56 @@ from __future__ import annotations
 
 import json
 from typing import Any, Dict, List, Optional, Tuple
+from fastapi import HTTPException
+
 from app.agent.engine import HandleQuestionResult
+from app.infrastructure.admission import AdmissionRejected
 from app.profiles.models import AgentProfile
 from app.agent.components import build_citation_bundle
 from app.api.v1.schemas.knowledge_schemas import CollectionItem
 
-THINKING_PHASES: list[dict[str, Any]] = [
-    {
-        "at_seconds": 0.4,
-        "phase": "intent_analysis",
-        "label": "Analizando intencion y alcance",
-    },
-    {
-        "at_seconds": 1.2,
-        "phase": "retrieval",
-        "label": "Recuperando clausulas y evidencia",
-    },
-    {
-        "at_seconds": 2.4,
-        "phase": "graph_reasoning",
-        "label": "Navegando relaciones semanticas",
-    },
-    {
-        "at_seconds": 3.6,
-        "phase": "coverage_validation",
-        "label": "Validando suficiencia de evidencia",
-    },
-    {
-        "at_seconds": 4.6,
-        "phase": "synthesis",
-        "label": "Generando respuesta final",
-    },
-]
+# Idle interval before a `working` keep-alive is emitted on the answer SSE stream.
+STREAM_KEEPALIVE_SECONDS = 0.4
 
 def format_sse_event(event: str, payload: dict[str, Any]) -> bytes:
     return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=True)}\n\n".encode("utf-8")
 
+def format_ndjson_line(payload: dict[str, Any]) -> bytes:
+    return (json.dumps(payload, ensure_ascii=True) + "\n").encode("utf-8")
+
 def classify_orchestrator_error(exc: Exception) -> str:
     text = str(exc or "").strip().lower()
     if "orch_answer_generation_failed" in text:
         return "ORCH_ANSWER_GENERATION_FAILED"
     if "rag retrieval failed" in text:
         return "ORCH_RETRIEVAL_FAILED"
+    if isinstance(exc, AdmissionRejected):
+        return "ORCH_OVERLOADED"
     if isinstance(exc, TimeoutError):
         return "ORCH_TIMEOUT"
     if isinstance(exc, ValueError):
         return "ORCH_INVALID_INPUT"
     return "ORCH_UNHANDLED_ERROR"
 
+def admission_rejected_error(
+    exc: AdmissionRejected,
+    *,
+    request_id: str | None = None,
+    correlation_id: str | None = None,
+) -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail={
+            "code": "ORCH_OVERLOADED",
+            "message": "Orchestrator is at capacity, retry later",
+            "reason": exc.reason,
+            "retry_after_seconds": exc.retry_after_seconds,
+            "request_id": request_id,
+            "correlation_id": correlation_id,
+        },
+        headers={"Retry-After": str(exc.retry_after_seconds)},
+    )
+
 def map_orchestrator_result(
     result: HandleQuestionResult,
     agent_profile: AgentProfile,
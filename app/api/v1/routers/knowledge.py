@@ -7,41 +7,62 @@ import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 
-from app.agent.formatters.adapters import LiteralEvidenceValidator
+from app.agent.components.answer_cache import get_answer_cache
+from app.agent.components.answer_stream import AnswerStreamSink, bind_answer_stream
 from app.agent.engine import HandleQuestionCommand, HandleQuestionUseCase
 from app.agent.errors import ScopeValidationError
-from app.agent.components.grounded_answer_service import GroundedAnswerService
-from app.infrastructure.clients.http_adapters import RagEngineRetrieverAdapter
-from app.agent.formatters.answer_adapter import GroundedAnswerAdapter
+from app.api.orchestrator_registry import OrchestratorRegistry, build_handle_question_use_case
 from app.api.v1.deps import UserContext, get_current_user
 from app.profiles.deps import resolve_agent_profile
 from app.api.v1.schemas.knowledge_schemas import (
     AgentProfileItem,
+    AnswerCacheInvalidateRequest,
     AgentProfileListResponse,
     CollectionListResponse,
     DevTenantCreateRequest,
     DevTenantCreateResponse,
+    BatchQuestionItem,
+    OrchestratorBatchQuestionRequest,
     OrchestratorExplainRequest,
     OrchestratorQuestionRequest,
     OrchestratorValidateScopeRequest,
+    ProfileCacheInvalidateRequest,
     TenantItem,
     TenantListResponse,
     TenantProfileUpdateRequest,
 )
 from app.profiles.loader import get_profile_loader
+from app.infrastructure.admission import (
+    AdmissionRejected,
+    admission_slot,
+    check_admission,
+    get_admission_controller,
+)
 from app.infrastructure.config import settings
 from app.infrastructure.observability.logging_utils import compact_error, emit_event
+from app.infrastructure.observability.tracing import start_span
+from app.infrastructure.metrics.admission import admission_metrics_store
+from app.infrastructure.metrics.answer_cache import answer_cache_metrics_store
+from app.infrastructure.metrics.model_cascade import model_cascade_metrics_store
 from app.infrastructure.metrics.scope import scope_metrics_store
 from app.api.v1.auth_guards import (
     authorize_requested_tenant,
     resolve_allowed_tenants,
 )
 from app.infrastructure.security.membership_repository import fetch_tenant_names
+from app.infrastructure.clients.backend_selector import get_rag_backend_selector
+from app.infrastructure.clients.llm_gateway import get_llm_gateway
 from app.infrastructure.clients.rag_client import RagRetrievalContractClient
+from app.infrastructure.clients.retrieval_cache import (
+    bind_batch_retrieval_cache,
+    new_batch_retrieval_cache,
+)
 from app.infrastructure.supabase.tenant_client import create_dev_tenant as supabase_create_dev_tenant
 from app.api.v1.routers.helpers.knowledge_helpers import (
-    THINKING_PHASES,
+    STREAM_KEEPALIVE_SECONDS,
+    admission_rejected_error,
     classify_orchestrator_error,
+    format_ndjson_line,
     format_sse_event,
     map_collection_items,
     map_orchestrator_result,
@@ -52,15 +73,11 @@ router = APIRouter(tags=["knowledge"])
 
 
 def _build_use_case(http_request: Request) -> HandleQuestionUseCase:
+    registry = getattr(http_request.app.state, "orchestrator_registry", None)
+    if isinstance(registry, OrchestratorRegistry):
+        return registry.use_case
     shared_client = getattr(http_request.app.state, "rag_http_client", None)
-    retriever = RagEngineRetrieverAdapter(http_client=shared_client)
-    answer_generator = GroundedAnswerAdapter(service=GroundedAnswerService())
-    validator = LiteralEvidenceValidator()
-    return HandleQuestionUseCase(
-        retriever=retriever,
-        answer_generator=answer_generator,
-        validator=validator,
-    )
+    return build_handle_question_use_case(shared_client)
 
 
 def _get_rag_client(http_request: Request) -> RagRetrievalContractClient:
@@ -109,7 +126,16 @@ async def answer_with_orchestrator(
             ),
         )
 
-        result = await use_case.execute(command)
+        with start_span(
+            "orch.answer",
+            parent_headers=http_request.headers,
+            tenant_id=authorized_tenant,
+            collection_id=request.collection_id,
+            profile_id=agent_profile.profile_id,
+            request_id=req_id or None,
+        ):
+            async with admission_slot(authorized_tenant, started_at=started):
+                result = await use_case.execute(command)
 
         if result.clarification:
             scope_metrics_store.record_clarification(authorized_tenant)
@@ -179,6 +205,24 @@ async def answer_with_orchestrator(
                 },
             },
         ) from exc
+    except AdmissionRejected as exc:
+        req_id = str(
+            http_request.headers.get("X-Request-ID") or http_request.headers.get("X-Trace-ID") or ""
+        ).strip()
+        corr_id = str(http_request.headers.get("X-Correlation-ID") or "").strip()
+        emit_event(
+            logger,
+            "orchestrator_answer_shed",
+            level="warning",
+            tenant_id=exc.tenant_id,
+            reason=exc.reason,
+            retry_after_seconds=exc.retry_after_seconds,
+            request_id=req_id or None,
+            duration_ms=round((time.perf_counter() - started) * 1000.0, 2),
+        )
+        raise admission_rejected_error(
+            exc, request_id=req_id or None, correlation_id=corr_id or None
+        ) from exc
     except HTTPException:
         raise
     except Exception as exc:
@@ -230,6 +274,12 @@ async def answer_with_orchestrator_stream(
         tenant_id=authorized_tenant, request=http_request
     )
     agent_profile = resolved_profile.profile
+    try:
+        check_admission(authorized_tenant, started_at=started)
+    except AdmissionRejected as exc:
+        raise admission_rejected_error(
+            exc, request_id=req_id or None, correlation_id=corr_id or None
+        ) from exc
 
     command = HandleQuestionCommand(
         query=request.query,
@@ -259,42 +309,59 @@ async def answer_with_orchestrator_stream(
                 "correlation_id": corr_id or None,
             },
         )
-        task = asyncio.create_task(use_case.execute(command))
-        pulse = 0
-        emitted_phase_index = -1
-        while not task.done():
-            pulse += 1
-            elapsed_ms = round((time.perf_counter() - streaming_started) * 1000.0, 2)
-            elapsed_seconds = elapsed_ms / 1000.0
-            
-            # Thinking phases
-            while emitted_phase_index + 1 < len(THINKING_PHASES) and elapsed_seconds >= float(
-                THINKING_PHASES[emitted_phase_index + 1].get("at_seconds") or 0.0
+        sink = AnswerStreamSink()
+
+        async def _execute_streamed():
+            with bind_answer_stream(sink), start_span(
+                "orch.answer",
+                parent_headers=http_request.headers,
+                tenant_id=authorized_tenant,
+                collection_id=request.collection_id,
+                profile_id=agent_profile.profile_id,
+                request_id=req_id or None,
+                stream=True,
             ):
-                emitted_phase_index += 1
-                phase_item = THINKING_PHASES[emitted_phase_index]
+                async with admission_slot(authorized_tenant, started_at=started):
+                    return await use_case.execute(command)
+
+        task = asyncio.create_task(_execute_streamed())
+        pulse = 0
+        getter: asyncio.Future | None = None
+        try:
+            while True:
+                if getter is None:
+                    getter = asyncio.ensure_future(sink.queue.get())
+                done, _ = await asyncio.wait(
+                    {getter, task},
+                    timeout=STREAM_KEEPALIVE_SECONDS,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if getter in done:
+                    stream_event, stream_payload = getter.result()
+                    getter = None
+                    yield format_sse_event(stream_event, stream_payload)
+                    continue
+                if task in done:
+                    break
+                pulse += 1
                 yield format_sse_event(
                     "status",
                     {
-                        "type": "thinking",
-                        "phase": phase_item.get("phase"),
-                        "label": phase_item.get("label"),
-                        "step": emitted_phase_index + 1,
-                        "total_steps": len(THINKING_PHASES),
-                        "elapsed_ms": elapsed_ms,
+                        "type": "working",
+                        "phase": "retrieve_and_synthesize",
+                        "elapsed_ms": round((time.perf_counter() - streaming_started) * 1000.0, 2),
+                        "pulse": pulse,
                     },
                 )
-
-            yield format_sse_event(
-                "status",
-                {
-                    "type": "working",
-                    "phase": "retrieve_and_synthesize",
-                    "elapsed_ms": elapsed_ms,
-                    "pulse": pulse,
-                },
-            )
-            await asyncio.sleep(0.4)
+        finally:
+            if getter is not None:
+                getter.cancel()
+            # Client went away: stop the answer and free its admission slot.
+            if not task.done():
+                task.cancel()
+        while not sink.queue.empty():
+            stream_event, stream_payload = sink.queue.get_nowait()
+            yield format_sse_event(stream_event, stream_payload)
 
         try:
             result = await task
@@ -349,20 +416,190 @@ async def answer_with_orchestrator_stream(
             )
             if bool(settings.ORCH_LOG_EXC_INFO):
                 logger.error("orchestrator_answer_stream_failed_exc", exc_info=True)
-            yield format_sse_event(
-                "error",
-                {
-                    "code": error_code,
-                    "message": "Orchestrator stream failed",
-                    "request_id": req_id or None,
-                    "correlation_id": corr_id or None,
-                },
-            )
+            error_payload: dict[str, Any] = {
+                "code": error_code,
+                "message": "Orchestrator stream failed",
+                "request_id": req_id or None,
+                "correlation_id": corr_id or None,
+            }
+            if isinstance(exc, AdmissionRejected):
+                error_payload["retry_after_seconds"] = exc.retry_after_seconds
+            yield format_sse_event("error", error_payload)
 
     return StreamingResponse(_event_stream(), media_type="text/event-stream")
 
 
 
+@router.post("/answer/batch")
+async def answer_batch_with_orchestrator(
+    http_request: Request,
+    request: OrchestratorBatchQuestionRequest,
+    current_user: UserContext = Depends(get_current_user),
+    use_case: HandleQuestionUseCase = Depends(_build_use_case),
+):
+    """Answer many questions for one tenant/collection, streaming NDJSON lines as items finish.
+
+    Auth and profile resolution run once per batch; identical comprehensive retrieval payloads
+    are fetched once per batch. Item failures are reported on their own line and do not abort
+    the batch.
+    """
+    max_items = max(1, int(getattr(settings, "ORCH_BATCH_MAX_ITEMS", 500) or 500))
+    if len(request.questions) > max_items:
+        raise HTTPException(
+            status_code=413,
+            detail={
+                "code": "BATCH_TOO_LARGE",
+                "message": f"Batch exceeds {max_items} questions",
+                "max_items": max_items,
+            },
+        )
+    authorized_tenant = await authorize_requested_tenant(
+        http_request, current_user, request.tenant_id
+    )
+    req_id = str(
+        http_request.headers.get("X-Request-ID") or http_request.headers.get("X-Trace-ID") or ""
+    ).strip()
+    corr_id = str(http_request.headers.get("X-Correlation-ID") or "").strip()
+    resolved_profile = await resolve_agent_profile(
+        tenant_id=authorized_tenant, request=http_request
+    )
+    agent_profile = resolved_profile.profile
+    profile_resolution = resolved_profile.resolution.model_dump()
+    # Clients may lower the server-side limit, never raise it.
+    concurrency_limit = max(1, int(getattr(settings, "ORCH_BATCH_MAX_CONCURRENCY", 4) or 4))
+    concurrency = min(request.max_concurrency or concurrency_limit, concurrency_limit)
+
+    def _command(index: int, item: BatchQuestionItem) -> HandleQuestionCommand:
+        return HandleQuestionCommand(
+            query=item.query,
+            tenant_id=authorized_tenant,
+            user_id=current_user.user_id,
+            collection_id=request.collection_id,
+            scope_label=f"tenant={authorized_tenant}",
+            agent_profile=agent_profile,
+            profile_resolution=dict(profile_resolution),
+            request_id=f"{req_id}:{index}" if req_id else None,
+            correlation_id=corr_id or None,
+            clarification_context=(
+                dict(item.clarification_context)
+                if isinstance(item.clarification_context, dict)
+                else None
+            ),
+        )
+
+    async def _answer_item(
+        index: int, item: BatchQuestionItem, semaphore: asyncio.Semaphore
+    ) -> dict[str, Any]:
+        async with semaphore:
+            item_started = time.perf_counter()
+            line: dict[str, Any] = {"type": "result", "index": index, "id": item.id}
+            scope_metrics_store.record_request(authorized_tenant)
+            try:
+                with start_span(
+                    "orch.answer",
+                    parent_headers=http_request.headers,
+                    tenant_id=authorized_tenant,
+                    collection_id=request.collection_id,
+                    profile_id=agent_profile.profile_id,
+                    request_id=req_id or None,
+                    batch_index=index,
+                ):
+                    async with admission_slot(authorized_tenant, started_at=item_started):
+                        result = await use_case.execute(_command(index, item))
+                if result.clarification:
+                    scope_metrics_store.record_clarification(authorized_tenant)
+                line["ok"] = True
+                line["response"] = map_orchestrator_result(
+                    result=result,
+                    agent_profile=agent_profile,
+                    profile_resolution=dict(profile_resolution),
+                )
+            except ScopeValidationError as exc:
+                line["ok"] = False
+                line["error"] = {
+                    "code": "SCOPE_VALIDATION_FAILED",
+                    "message": exc.message,
+                    "details": {"violations": exc.violations, "warnings": exc.warnings or []},
+                }
+            except Exception as exc:
+                error_code = classify_orchestrator_error(exc)
+                emit_event(
+                    logger,
+                    "orchestrator_batch_item_failed",
+                    level="error",
+                    error_code=error_code,
+                    error=compact_error(exc),
+                    batch_index=index,
+                    request_id=req_id or None,
+                    correlation_id=corr_id or None,
+                )
+                if bool(settings.ORCH_LOG_EXC_INFO):
+                    logger.error("orchestrator_batch_item_failed_exc", exc_info=True)
+                line["ok"] = False
+                line["error"] = {"code": error_code, "message": "Orchestrator answer failed"}
+                if isinstance(exc, AdmissionRejected):
+                    line["error"]["retry_after_seconds"] = exc.retry_after_seconds
+            line["elapsed_ms"] = round((time.perf_counter() - item_started) * 1000.0, 2)
+            return line
+
+    async def _ndjson_stream():
+        batch_started = time.perf_counter()
+        total = len(request.questions)
+        yield format_ndjson_line(
+            {
+                "type": "accepted",
+                "tenant_id": authorized_tenant,
+                "total": total,
+                "concurrency": concurrency,
+                "request_id": req_id or None,
+                "correlation_id": corr_id or None,
+            }
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+        # Tasks copy the context on creation, so every item sees the batch cache.
+        with bind_batch_retrieval_cache(new_batch_retrieval_cache()):
+            tasks = [
+                asyncio.create_task(_answer_item(index, item, semaphore))
+                for index, item in enumerate(request.questions)
+            ]
+        succeeded = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                line = await next_done
+                succeeded += int(bool(line.get("ok")))
+                yield format_ndjson_line(line)
+        finally:
+            # Client went away mid-batch: stop the remaining items.
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        elapsed_ms = round((time.perf_counter() - batch_started) * 1000.0, 2)
+        emit_event(
+            logger,
+            "orchestrator_batch_summary",
+            user_id=current_user.user_id,
+            tenant_id=authorized_tenant,
+            collection_id=request.collection_id,
+            total=total,
+            succeeded=succeeded,
+            failed=total - succeeded,
+            concurrency=concurrency,
+            agent_profile_id=agent_profile.profile_id,
+            duration_ms=elapsed_ms,
+        )
+        yield format_ndjson_line(
+            {
+                "type": "done",
+                "total": total,
+                "succeeded": succeeded,
+                "failed": total - succeeded,
+                "elapsed_ms": elapsed_ms,
+            }
+        )
+
+    return StreamingResponse(_ndjson_stream(), media_type="application/x-ndjson")
+
+
 @router.get("/tenants", response_model=TenantListResponse)
 async def list_authorized_tenants(
     current_user: UserContext = Depends(get_current_user),
@@ -681,3 +918,97 @@ async def explain_retrieval_proxy(
 async def scope_health(tenant_id: Optional[str] = Query(default=None)):
     return scope_metrics_store.snapshot(tenant_id=tenant_id)
 
+
+@router.get("/rag-backend-health", response_model=Dict[str, Any])
+async def rag_backend_health():
+    return get_rag_backend_selector().snapshot()
+
+
+@router.get("/admission-health", response_model=Dict[str, Any])
+async def admission_health(tenant_id: Optional[str] = Query(default=None)):
+    controller = get_admission_controller()
+    return {
+        "enabled": controller is not None,
+        "controller": controller.snapshot() if controller is not None else None,
+        "metrics": admission_metrics_store.snapshot(tenant_id=tenant_id),
+    }
+
+
+@router.get("/llm-gateway-health", response_model=Dict[str, Any])
+async def llm_gateway_health():
+    return get_llm_gateway().snapshot()
+
+
+@router.get("/model-cascade-health", response_model=Dict[str, Any])
+async def model_cascade_health():
+    return model_cascade_metrics_store.snapshot()
+
+
+@router.get("/answer-cache-health", response_model=Dict[str, Any])
+async def answer_cache_health(tenant_id: Optional[str] = Query(default=None)):
+    return answer_cache_metrics_store.snapshot(tenant_id=tenant_id)
+
+
+@router.post("/answer-cache/invalidate", response_model=Dict[str, Any])
+async def invalidate_answer_cache(
+    http_request: Request,
+    request: AnswerCacheInvalidateRequest,
+    current_user: UserContext = Depends(get_current_user),
+) -> Dict[str, Any]:
+    authorized_tenant = await authorize_requested_tenant(
+        http_request, current_user, request.tenant_id
+    )
+    removed = get_answer_cache().invalidate(authorized_tenant, request.collection_id)
+    emit_event(
+        logger,
+        "orchestrator_answer_cache_invalidated",
+        tenant_id=authorized_tenant,
+        collection_id=request.collection_id,
+        removed=removed,
+    )
+    return {
+        "tenant_id": authorized_tenant,
+        "collection_id": request.collection_id,
+        "removed": removed,
+    }
+
+
+@router.post("/profile-cache/invalidate", response_model=Dict[str, Any])
+async def invalidate_profile_cache(
+    http_request: Request,
+    request: ProfileCacheInvalidateRequest,
+    current_user: UserContext = Depends(get_current_user),
+) -> Dict[str, Any]:
+    authorized_tenant = await authorize_requested_tenant(
+        http_request, current_user, request.tenant_id
+    )
+    loader = get_profile_loader()
+    if request.reload_profiles:
+        reload_roles = {
+            role.strip()
+            for role in str(getattr(settings, "ORCH_PROFILE_RELOAD_ROLES", "") or "").split(",")
+            if role.strip()
+        }
+        if not reload_roles.intersection(current_user.roles or []):
+            raise HTTPException(
+                status_code=403,
+                detail={
+                    "code": "PROFILE_RELOAD_FORBIDDEN",
+                    "message": "Reloading profiles requires an admin or service role",
+                },
+            )
+        removed = loader.reload_profiles()
+    else:
+        removed = loader.invalidate_resolutions(authorized_tenant)
+    emit_event(
+        logger,
+        "orchestrator_profile_cache_invalidated",
+        tenant_id=authorized_tenant,
+        reload_profiles=request.reload_profiles,
+        removed=removed,
+    )
+    return {
+        "tenant_id": authorized_tenant,
+        "reload_profiles": request.reload_profiles,
+        "removed": removed,
+    }
@@ -9,7 +9,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 
 from app.api.v1.deps import UserContext, get_current_user
-from app.infrastructure.clients.backend_selector import RagBackendSelector
+from app.infrastructure.clients.backend_selector import get_rag_backend_selector
+from app.infrastructure.clients.outbound_pool import get_outbound_client
 from app.infrastructure.config import settings
 from app.infrastructure.clients.rag_client import build_rag_http_client
 from app.api.v1.auth_guards import authorize_requested_tenant
@@ -19,17 +20,6 @@ logger = structlog.get_logger(__name__)
 router = APIRouter(tags=["observability"])
 
 
-def _selector() -> RagBackendSelector:
-    return RagBackendSelector(
-        local_url=str(settings.RAG_ENGINE_LOCAL_URL or "http://localhost:8000"),
-        docker_url=str(settings.RAG_ENGINE_DOCKER_URL or "http://localhost:8000"),
-        health_path=str(settings.RAG_ENGINE_HEALTH_PATH or "/health"),
-        probe_timeout_ms=int(settings.RAG_ENGINE_PROBE_TIMEOUT_MS or 300),
-        ttl_seconds=int(settings.RAG_ENGINE_BACKEND_TTL_SECONDS or 20),
-        force_backend=settings.RAG_ENGINE_FORCE_BACKEND,
-    )
-
-
 def _s2s_headers(*, tenant_id: str, user_id: str) -> dict[str, str]:
     return {
         "X-Service-Secret": str(settings.RAG_SERVICE_SECRET or ""),
@@ -52,6 +42,17 @@ async def _rag_http_client_ctx(http_request: Request):
         await client.aclose()
 
 
+@asynccontextmanager
+async def _stream_http_client(timeout: httpx.Timeout):
+    shared_client = get_outbound_client("rag")
+    if shared_client is not None:
+        yield shared_client
+        return
+
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        yield client
+
+
 def _map_upstream_http_error(exc: httpx.HTTPStatusError, *, operation: str) -> HTTPException:
     upstream_status = exc.response.status_code if exc.response is not None else 502
     if upstream_status in {401, 403}:
@@ -86,7 +87,7 @@ async def _proxy_json_get(
     user_id: str,
     operation: str,
 ) -> dict[str, Any]:
-    base_url = await _selector().resolve_base_url()
+    base_url = await get_rag_backend_selector().resolve_untracked_base_url()
     url = f"{base_url.rstrip('/')}{path}"
     try:
         async with _rag_http_client_ctx(http_request) as client:
@@ -183,20 +184,21 @@ async def _proxy_sse(
     cursor: str | None,
     interval_ms: int,
 ) -> AsyncIterator[bytes]:
-    selector = _selector()
-    base_url = await selector.resolve_base_url()
+    selector = get_rag_backend_selector()
+    base_url = await selector.resolve_untracked_base_url()
     url = f"{base_url.rstrip('/')}/api/v1/ingestion/batches/{batch_id}/stream"
     params: dict[str, Any] = {"tenant_id": tenant_id, "interval_ms": interval_ms}
     if cursor:
         params["cursor"] = cursor
 
     timeout = httpx.Timeout(connect=5.0, read=None, write=10.0, pool=5.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
+    async with _stream_http_client(timeout) as client:
         async with client.stream(
             "GET",
             url,
             params=params,
             headers=_s2s_headers(tenant_id=tenant_id, user_id=user_id),
+            timeout=timeout,
         ) as response:
             if response.status_code < 200 or response.status_code >= 300:
                 detail = f'event: error\ndata: {{"type":"error","status":{response.status_code},"message":"upstream stream failed"}}\n\n'
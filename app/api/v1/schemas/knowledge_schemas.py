@@ -1,5 +1,5 @@
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 class OrchestratorQuestionRequest(BaseModel):
     query: str
@@ -7,6 +7,17 @@ class OrchestratorQuestionRequest(BaseModel):
     collection_id: Optional[str] = None
     clarification_context: Optional[Dict[str, Any]] = None
 
+class BatchQuestionItem(BaseModel):
+    query: str
+    id: Optional[str] = None
+    clarification_context: Optional[Dict[str, Any]] = None
+
+class OrchestratorBatchQuestionRequest(BaseModel):
+    questions: List[BatchQuestionItem] = Field(min_length=1)
+    tenant_id: Optional[str] = None
+    collection_id: Optional[str] = None
+    max_concurrency: Optional[int] = Field(default=None, ge=1)
+
 class OrchestratorValidateScopeRequest(BaseModel):
     query: str
     tenant_id: Optional[str] = None
@@ -53,6 +64,14 @@ class TenantProfileUpdateRequest(BaseModel):
     profile_id: Optional[str] = None
     clear: bool = False
 
+class AnswerCacheInvalidateRequest(BaseModel):
+    tenant_id: str
+    collection_id: Optional[str] = None
+
+class ProfileCacheInvalidateRequest(BaseModel):
+    tenant_id: str
+    reload_profiles: bool = False
+
 class DevTenantCreateRequest(BaseModel):
     name: str
 
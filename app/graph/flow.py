@@ -23,17 +23,22 @@ from app.agent.types.models import (
     ValidationResult,
 )
 from app.agent.policies import classify_intent
+from app.agent.retrieval.request_context import RetrievalRequestContext, bind_retrieval_context
 from app.agent.tools import ToolRuntimeContext, create_default_tools
+from app.infrastructure.clients.llm_gateway import bind_llm_deadline
 from app.infrastructure.config import settings
+from app.infrastructure.metrics.histograms import bind_metric_labels
 from app.graph.nodes import (
     aggregate_subqueries_node,
     citation_validate_node,
+    execute_plan_node,
     execute_tool_node,
     generator_node,
     planner_node,
     reflect_node,
 )
 from app.graph.logic.routing import (
+    route_after_execute,
     route_after_planner,
     route_after_reflect,
 )
@@ -61,7 +66,11 @@ class UniversalReasoningOrchestrator:
         async def _planner(state: UniversalState) -> dict[str, object]:
             return await planner_node(state, orch)
 
+        plan_dag_enabled = bool(getattr(settings, "ORCH_PLAN_DAG_ENABLED", True))
+
         async def _execute_tool(state: UniversalState) -> dict[str, object]:
+            if plan_dag_enabled:
+                return await execute_plan_node(state, orch)
             return await execute_tool_node(state, orch)
 
         async def _generator(state: UniversalState) -> dict[str, object]:
@@ -87,7 +96,14 @@ class UniversalReasoningOrchestrator:
             route_after_planner,
             {"execute": "execute_tool", "generate": "aggregate_subqueries", "interrupt": END},
         )
-        graph.add_edge("execute_tool", "reflect")
+        if plan_dag_enabled:
+            graph.add_conditional_edges(
+                "execute_tool",
+                route_after_execute,
+                {"reflect": "reflect", "generate": "aggregate_subqueries"},
+            )
+        else:
+            graph.add_edge("execute_tool", "reflect")
         graph.add_conditional_edges(
             "reflect",
             route_after_reflect,
@@ -110,6 +126,21 @@ class UniversalReasoningOrchestrator:
         )
 
     async def execute(self, cmd: HandleQuestionCommand) -> HandleQuestionResult:
+        # The orchestrator is shared across requests; retrieval state lives in a
+        # request-scoped context so concurrent executions never see each other's scope.
+        request_context = RetrievalRequestContext(
+            profile=cmd.agent_profile,
+            profile_resolution=(
+                cmd.profile_resolution if isinstance(cmd.profile_resolution, dict) else None
+            ),
+        )
+        with bind_retrieval_context(request_context), bind_metric_labels(
+            tenant_id=cmd.tenant_id,
+            profile_id=getattr(cmd.agent_profile, "profile_id", None),
+        ):
+            return await self._execute_bound(cmd)
+
+    async def _execute_bound(self, cmd: HandleQuestionCommand) -> HandleQuestionResult:
         t_total = time.perf_counter()
         set_profile_context = getattr(self.retriever, "set_profile_context", None)
         if callable(set_profile_context):
@@ -152,10 +183,12 @@ class UniversalReasoningOrchestrator:
         }
         total_timeout_ms = max(200, int(getattr(settings, "ORCH_TIMEOUT_TOTAL_MS", 60000) or 60000))
         try:
-            final_state = await asyncio.wait_for(
-                self._graph.ainvoke(initial_state),
-                timeout=total_timeout_ms / 1000.0,
-            )
+            # LLM waits and retries stop at the same deadline as the graph.
+            with bind_llm_deadline(time.monotonic() + total_timeout_ms / 1000.0):
+                final_state = await asyncio.wait_for(
+                    self._graph.ainvoke(initial_state),
+                    timeout=total_timeout_ms / 1000.0,
+                )
         except asyncio.TimeoutError:
             final_state = {
                 **initial_state,
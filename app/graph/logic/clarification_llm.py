@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import asyncio
 import json
 from typing import Any
 
 import structlog
 
+from app.infrastructure.clients.llm_gateway import get_llm_gateway
 from app.infrastructure.config import settings
 
 logger = structlog.get_logger(__name__)
@@ -52,18 +52,11 @@ async def build_clarification_with_llm(
 ) -> dict[str, Any] | None:
     if not bool(getattr(settings, "ORCH_CLARIFICATION_LLM_ENABLED", True)):
         return None
-    api_key = str(getattr(settings, "GROQ_API_KEY", "") or "").strip()
-    if not api_key:
+    gateway = get_llm_gateway()
+    if not gateway.available:
         logger.info("clarification_llm_skipped", reason="missing_groq_api_key")
         return None
 
-    try:
-        from openai import AsyncOpenAI
-
-        client = AsyncOpenAI(api_key=api_key, base_url="https://api.groq.com/openai/v1")
-    except Exception:
-        return None
-
     model = str(getattr(settings, "ORCH_CLARIFICATION_MODEL", "") or "").strip()
     if not model:
         model = str(getattr(settings, "GROQ_MODEL_LIGHTWEIGHT", "") or "").strip()
@@ -88,18 +81,17 @@ async def build_clarification_with_llm(
     }
 
     try:
-        completion = await asyncio.wait_for(
-            client.chat.completions.create(
-                model=model,
-                temperature=0.1,
-                max_tokens=250,
-                messages=[
-                    {"role": "system", "content": _SYSTEM_PROMPT},
-                    {"role": "user", "content": json.dumps(prompt, ensure_ascii=False)},
-                ],
-                response_format={"type": "json_object"},
-            ),
-            timeout=timeout_s,
+        completion = await gateway.chat_completion(
+            model=model,
+            temperature=0.1,
+            max_tokens=250,
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": json.dumps(prompt, ensure_ascii=False)},
+            ],
+            response_format={"type": "json_object"},
+            purpose="clarification",
+            timeout_s=timeout_s,
         )
     except Exception as exc:
         logger.warning("clarification_llm_failed", error=str(exc))
@@ -141,14 +133,8 @@ async def extract_clarification_slots_with_llm(
 ) -> dict[str, list[str]] | None:
     if not bool(getattr(settings, "ORCH_CLARIFICATION_LLM_ENABLED", True)):
         return None
-    api_key = str(getattr(settings, "GROQ_API_KEY", "") or "").strip()
-    if not api_key:
-        return None
-
-    try:
-        from openai import AsyncOpenAI
-        client = AsyncOpenAI(api_key=api_key, base_url="https://api.groq.com/openai/v1")
-    except Exception:
+    gateway = get_llm_gateway()
+    if not gateway.available:
         return None
 
     model = str(getattr(settings, "ORCH_CLARIFICATION_MODEL", "") or "").strip()
@@ -172,18 +158,17 @@ async def extract_clarification_slots_with_llm(
     }
 
     try:
-        completion = await asyncio.wait_for(
-            client.chat.completions.create(
-                model=model,
-                temperature=0.0,
-                max_tokens=250,
-                messages=[
-                    {"role": "system", "content": "Eres un extractor de entidades. DEBES devolver UNICAMENTE un objeto JSON válido, ej: {'scope': ['ISO 9001'], 'target_clauses': ['5.1', '5.2']}. No devuelvas texto adicional ni uses markdown."},
-                    {"role": "user", "content": json.dumps(prompt, ensure_ascii=False)},
-                ],
-                response_format={"type": "json_object"},
-            ),
-            timeout=timeout_s,
+        completion = await gateway.chat_completion(
+            model=model,
+            temperature=0.0,
+            max_tokens=250,
+            messages=[
+                {"role": "system", "content": "Eres un extractor de entidades. DEBES devolver UNICAMENTE un objeto JSON válido, ej: {'scope': ['ISO 9001'], 'target_clauses': ['5.1', '5.2']}. No devuelvas texto adicional ni uses markdown."},
+                {"role": "user", "content": json.dumps(prompt, ensure_ascii=False)},
+            ],
+            response_format={"type": "json_object"},
+            purpose="clarification_slots",
+            timeout_s=timeout_s,
         )
     except Exception as exc:
         logger.warning("clarification_extractor_llm_failed", error=str(exc))
@@ -204,14 +189,8 @@ async def rewrite_plan_with_feedback_llm(
 ) -> dict[str, Any] | None:
     if not bool(getattr(settings, "ORCH_CLARIFICATION_LLM_ENABLED", True)):
         return None
-    api_key = str(getattr(settings, "GROQ_API_KEY", "") or "").strip()
-    if not api_key:
-        return None
-
-    try:
-        from openai import AsyncOpenAI
-        client = AsyncOpenAI(api_key=api_key, base_url="https://api.groq.com/openai/v1")
-    except Exception:
+    gateway = get_llm_gateway()
+    if not gateway.available:
         return None
 
     model = str(getattr(settings, "ORCH_CLARIFICATION_MODEL", "") or "").strip()
@@ -238,23 +217,22 @@ async def rewrite_plan_with_feedback_llm(
     schema_example = '{"new_plan": ["semantic_retrieval", "structural_extraction"], "dynamic_inputs": {"structural_extraction": {"schema_definition": "roles, responsabilidades"}}}'
 
     try:
-        completion = await asyncio.wait_for(
-            client.chat.completions.create(
-                model=model,
-                temperature=0.0,
-                max_tokens=800,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "Eres el planificador L3. DEBES devolver UNICAMENTE un objeto JSON válido con este exacto esquema:\n"
-                                   '{"new_plan": ["...", "..."], "dynamic_inputs": {"herramienta": {"parametro": "valor"}}}\n'
-                                   "No devuelvas ningún texto antes ni después del JSON ni uses bloques markdown."
-                    },
-                    {"role": "user", "content": json.dumps(prompt, ensure_ascii=False)},
-                ],
-                response_format={"type": "json_object"},
-            ),
-            timeout=timeout_s,
+        completion = await gateway.chat_completion(
+            model=model,
+            temperature=0.0,
+            max_tokens=800,
+            messages=[
+                {
+                    "role": "system", 
+                    "content": "Eres el planificador L3. DEBES devolver UNICAMENTE un objeto JSON válido con este exacto esquema:\n"
+                               '{"new_plan": ["...", "..."], "dynamic_inputs": {"herramienta": {"parametro": "valor"}}}\n'
+                               "No devuelvas ningún texto antes ni después del JSON ni uses bloques markdown."
+                },
+                {"role": "user", "content": json.dumps(prompt, ensure_ascii=False)},
+            ],
+            response_format={"type": "json_object"},
+            purpose="replan",
+            timeout_s=timeout_s,
         )
     except Exception as exc:
         logger.warning("replan_llm_failed", error=str(exc))
@@ -16,6 +16,10 @@ from app.profiles.models import AgentProfile, QueryModeConfig
 
 _ARITHMETIC_PATTERN = re.compile(r"\d+\s*[\+\-\*/]\s*\d+")
 _CLAUSE_REFERENCE_PATTERN = re.compile(r"\b\d+(?:\.\d+)+\b")
+# Tools that only read retrieval output, so they can run as soon as retrieval finishes.
+_RETRIEVAL_CONSUMERS = frozenset(
+    {"logical_comparison", "structural_extraction", "expectation_coverage"}
+)
 
 
 @lru_cache(maxsize=64)
@@ -117,19 +121,35 @@ def build_universal_plan(
             mode_cfg = profile.query_modes.modes.get(str(intent.mode)) if profile else None
             policy = dict(mode_cfg.decomposition_policy) if isinstance(mode_cfg, QueryModeConfig) else {}
             if len(scopes) >= 2 and str(policy.get("mode", "auto")) != "disabled":
+                # Per-scope retrievals are independent of each other.
+                group_deps = (len(steps) - 1,) if steps else ()
                 for scope in scopes:
                     base_in = default_tool_input(tool, query, str(intent.mode))
                     base_in["scope_filter"] = scope
-                    steps.append(ToolCall(tool=tool, input=base_in, rationale=f"{rationale}_{scope[:15].replace(' ', '_').lower()}"))
+                    steps.append(
+                        ToolCall(
+                            tool=tool,
+                            input=base_in,
+                            rationale=f"{rationale}_{scope[:15].replace(' ', '_').lower()}",
+                            depends_on=group_deps,
+                        )
+                    )
                 return
 
         if any(item.tool == tool for item in steps):
             return
+        depends_on: tuple[int, ...] | None = None
+        if tool in _RETRIEVAL_CONSUMERS:
+            retrieval_steps = tuple(
+                index for index, item in enumerate(steps) if item.tool == "semantic_retrieval"
+            )
+            depends_on = retrieval_steps or None
         steps.append(
             ToolCall(
                 tool=tool,
                 input=default_tool_input(tool, query, str(intent.mode)),
                 rationale=rationale,
+                depends_on=depends_on,
             )
         )
 
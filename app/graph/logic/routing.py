@@ -11,6 +11,11 @@ def route_after_planner(state: UniversalState) -> str:
     return "execute" if next_action == "execute" else "generate"
 
 
+def route_after_execute(state: UniversalState) -> str:
+    next_action = state_get_str(state, "next_action", "")
+    return "reflect" if next_action == "reflect" else "generate"
+
+
 def route_after_reflect(state: UniversalState) -> str:
     next_action = state_get_str(state, "next_action", "")
     # Hard safety cap: never allow more replans than MAX_PLAN_ATTEMPTS.
@@ -4,7 +4,10 @@ import re
 import time
 from typing import Any
 
+from app.agent.components.answer_stream import current_answer_stream
 from app.infrastructure.config import settings
+from app.infrastructure.metrics.histograms import latency_histogram_store
+from app.infrastructure.observability.tracing import start_span
 from app.graph.state import UniversalState
 
 
@@ -26,28 +29,24 @@ def _non_negative_int(value: object, *, default: int = 0) -> int:
     return default
 
 
-def _append_stage_timing(
-    state: UniversalState | dict[str, object],
-    *,
-    stage: str,
-    elapsed_ms: float,
-) -> dict[str, float]:
-    current = state.get("stage_timings_ms")
-    timings = dict(current) if isinstance(current, dict) else {}
-    timings[stage] = round(float(timings.get(stage, 0.0)) + max(0.0, elapsed_ms), 2)
-    return timings
+def _state_metric_labels(state: UniversalState | dict[str, object]) -> dict[str, str]:
+    profile = state.get("agent_profile")
+    return {
+        "tenant": str(state.get("tenant_id") or "unknown"),
+        "profile": str(getattr(profile, "profile_id", "") or "unknown"),
+    }
 
 
-def _append_tool_timing(
-    state: UniversalState | dict[str, object],
-    *,
-    tool: str,
-    elapsed_ms: float,
-) -> dict[str, float]:
-    current = state.get("tool_timings_ms")
-    timings = dict(current) if isinstance(current, dict) else {}
-    timings[tool] = round(float(timings.get(tool, 0.0)) + max(0.0, elapsed_ms), 2)
-    return timings
+def observe_tool_duration(
+    state: UniversalState | dict[str, object], *, tool: str, elapsed_ms: float
+) -> None:
+    latency_histogram_store.observe(
+        "orch_tool_duration_ms",
+        elapsed_ms,
+        help="Tool execution duration in milliseconds.",
+        tool=tool,
+        **_state_metric_labels(state),
+    )
 
 
 def _timeout_ms_for_stage(stage: str) -> int:
@@ -188,20 +187,31 @@ import functools
 def track_node_timing(stage_name: str):
     """
     Decorator for LangGraph nodes to automatically track their execution time.
-    Instead of manually calling `_append_stage_timing` at every return, this handles it.
+    The elapsed time is returned as a `stage_timings_ms` delta on every update.
     """
     def decorator(func):
         @functools.wraps(func)
         async def async_wrapper(state: UniversalState, *args, **kwargs) -> dict[str, Any]:
+            sink = current_answer_stream()
+            if sink is not None:
+                sink.emit_stage(stage_name, "started")
             t0 = time.perf_counter()
-            result = await func(state, *args, **kwargs)
+            with start_span(f"orch.node.{stage_name}", **_state_metric_labels(state)):
+                result = await func(state, *args, **kwargs)
             elapsed_ms = (time.perf_counter() - t0) * 1000.0
+            if sink is not None:
+                sink.emit_stage(stage_name, "completed", elapsed_ms=elapsed_ms)
+            latency_histogram_store.observe(
+                "orch_stage_duration_ms",
+                elapsed_ms,
+                help="Graph stage duration in milliseconds.",
+                stage=stage_name,
+                **_state_metric_labels(state),
+            )
             
             if isinstance(result, dict):
-                # We inject the stage object
-                result["stage_timings_ms"] = _append_stage_timing(
-                    state, stage=stage_name, elapsed_ms=elapsed_ms
-                )
+                # Only this step's delta; the `add_timings` reducer accumulates per stage.
+                result["stage_timings_ms"] = {stage_name: round(elapsed_ms, 2)}
             return result
         return async_wrapper
     return decorator
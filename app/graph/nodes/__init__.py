@@ -1,4 +1,4 @@
-from .execution import execute_tool_node
+from .execution import execute_plan_node, execute_tool_node
 from .generation import aggregate_subqueries_node, citation_validate_node, generator_node
 from .planning import planner_node
 from .reflection import reflect_node
@@ -6,6 +6,7 @@ from .reflection import reflect_node
 __all__ = [
     "aggregate_subqueries_node",
     "citation_validate_node",
+    "execute_plan_node",
     "execute_tool_node",
     "generator_node",
     "planner_node",
@@ -2,110 +2,113 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections import ChainMap
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
 
 import structlog
 
-from app.agent.types.models import ReasoningPlan, ReasoningStep, RetrievalDiagnostics, ToolResult
+from app.agent.retrieval.request_context import (
+    RetrievalRequestContext,
+    current_retrieval_context,
+    fork_retrieval_context,
+)
+from app.agent.types.models import (
+    ReasoningPlan,
+    ReasoningStep,
+    RetrievalDiagnostics,
+    ToolCall,
+    ToolResult,
+)
 from app.agent.tools import get_tool
+from app.infrastructure.config import settings
 from app.profiles.models import AgentProfile
-from app.graph.logic.logic import _infer_expression_from_query
+from app.graph.logic.logic import (
+    _extract_retry_signal_from_retrieval,
+    _infer_expression_from_query,
+    _is_retryable_reason,
+)
 from app.graph.state import (
     DEFAULT_MAX_STEPS,
     HARD_MAX_STEPS,
     UniversalState,
 )
 from app.graph.logic.utils import (
-    _append_tool_timing,
     _effective_execute_tool_timeout_ms,
     _sanitize_payload,
     get_adaptive_timeout_ms,
+    observe_tool_duration,
     state_get_dict,
     state_get_int,
     state_get_list,
     track_node_timing,
 )
 
+from app.infrastructure.observability.tracing import start_span
+
 from .types import OrchestratorComponents
 
 logger = structlog.get_logger(__name__)
 
 
-@track_node_timing("execute_tool")
-async def execute_tool_node(
-    state: UniversalState, components: OrchestratorComponents
-) -> dict[str, object]:
-    plan = state.get("reasoning_plan")
-    if not isinstance(plan, ReasoningPlan):
-        return {
-            "next_action": "generate",
-            "stop_reason": "missing_plan",
-        }
-
-    cursor = state_get_int(state, "tool_cursor", 0)
-    if cursor >= len(plan.steps):
-        return {
-            "next_action": "generate",
-        }
-
-    max_steps = min(HARD_MAX_STEPS, int(state.get("max_steps") or DEFAULT_MAX_STEPS))
-    tool_results = state_get_list(state, "tool_results")
-    if len(tool_results) >= max_steps:
-        return {
-            "next_action": "generate",
-            "stop_reason": "max_steps_reached",
-        }
-
-    step_call = plan.steps[cursor]
+async def _run_tool_call(
+    state: Mapping[str, Any],
+    components: OrchestratorComponents,
+    step_call: ToolCall,
+    *,
+    previous: ToolResult | None,
+) -> tuple[ToolResult, float]:
+    """Run one plan step; `previous` is the result piped in as `previous_tool_*`."""
     tool_name = str(step_call.tool or "").strip()
     tool = get_tool(components.tools or {}, tool_name)
     tool_elapsed_ms = 0.0
     if tool is None:
-        result = ToolResult(tool=tool_name, ok=False, error="tool_not_registered")
-    else:
-        payload = dict(step_call.input or {})
-        if cursor > 0 and tool_results:
-            prev = tool_results[-1]
-            if isinstance(prev, ToolResult) and prev.ok:
-                if prev.output:
-                    payload.setdefault("previous_tool_output", dict(prev.output))
-                if prev.metadata:
-                    payload.setdefault("previous_tool_metadata", dict(prev.metadata))
-
-        working_memory = dict(state_get_dict(state, "working_memory"))
-        if working_memory:
-            payload["working_memory"] = working_memory
-
-        if tool_name == "python_calculator" and not payload.get("expression"):
-            inferred = _infer_expression_from_query(str(state.get("working_query") or ""))
-            if inferred:
-                payload["expression"] = inferred
-        t_tool = time.perf_counter()
-        tool_timeout_ms = _effective_execute_tool_timeout_ms(tool_name)
-        profile = state.get("agent_profile")
-        if isinstance(profile, AgentProfile):
-            policy = profile.capabilities.tool_policies.get(tool_name)
-            if policy is not None:
-                tool_timeout_ms = max(20, min(5000, int(policy.timeout_ms)))
-
-        tool_timeout_ms = get_adaptive_timeout_ms(
-            state, stage_default_ms=tool_timeout_ms, headroom_ms=2800
-        )
+        return ToolResult(tool=tool_name, ok=False, error="tool_not_registered"), tool_elapsed_ms
+
+    payload = dict(step_call.input or {})
+    if isinstance(previous, ToolResult) and previous.ok:
+        if previous.output:
+            payload.setdefault("previous_tool_output", dict(previous.output))
+        if previous.metadata:
+            payload.setdefault("previous_tool_metadata", dict(previous.metadata))
+
+    working_memory = dict(state_get_dict(state, "working_memory"))
+    if working_memory:
+        payload["working_memory"] = working_memory
 
-        try:
+    if tool_name == "python_calculator" and not payload.get("expression"):
+        inferred = _infer_expression_from_query(str(state.get("working_query") or ""))
+        if inferred:
+            payload["expression"] = inferred
+    t_tool = time.perf_counter()
+    tool_timeout_ms = _effective_execute_tool_timeout_ms(tool_name)
+    profile = state.get("agent_profile")
+    if isinstance(profile, AgentProfile):
+        policy = profile.capabilities.tool_policies.get(tool_name)
+        if policy is not None:
+            tool_timeout_ms = max(20, min(5000, int(policy.timeout_ms)))
+
+    tool_timeout_ms = get_adaptive_timeout_ms(
+        state, stage_default_ms=tool_timeout_ms, headroom_ms=2800
+    )
+
+    try:
+        with start_span(f"orch.tool.{tool_name}", tool=tool_name, timeout_ms=tool_timeout_ms):
             result = await asyncio.wait_for(
                 tool.run(
                     payload,
-                    state=dict(state),
+                    state=MappingProxyType(state),
                     context=components._runtime_context(),
                 ),
                 timeout=tool_timeout_ms / 1000.0,
             )
-        except TimeoutError:
-            result = ToolResult(tool=tool_name, ok=False, error="tool_timeout")
-        except Exception as exc:
-            logger.error("tool_execution_failed", tool=tool_name, error=str(exc))
-            result = ToolResult(tool=tool_name, ok=False, error=f"tool_error: {str(exc)}")
-        tool_elapsed_ms = (time.perf_counter() - t_tool) * 1000.0
+    except TimeoutError:
+        result = ToolResult(tool=tool_name, ok=False, error="tool_timeout")
+    except Exception as exc:
+        logger.error("tool_execution_failed", tool=tool_name, error=str(exc))
+        result = ToolResult(tool=tool_name, ok=False, error=f"tool_error: {str(exc)}")
+    tool_elapsed_ms = (time.perf_counter() - t_tool) * 1000.0
 
     if tool_name == "semantic_retrieval":
         diag_chunks = list(result.metadata.get("chunks") or []) if result.metadata else []
@@ -118,58 +121,235 @@ async def execute_tool_node(
             metadata_keys=list((result.metadata or {}).keys()),
             tool_elapsed_ms=round(tool_elapsed_ms, 2),
         )
+    return result, tool_elapsed_ms
 
-    updated_results = [*tool_results, result]
-    trace_steps = state_get_list(state, "reasoning_steps")
-    trace_steps.append(
-        ReasoningStep(
-            index=len(trace_steps) + 1,
-            type="tool",
-            tool=tool_name,
-            description=step_call.rationale or "tool_execution",
-            input=_sanitize_payload(dict(step_call.input or {})),
-            output={
-                **_sanitize_payload(dict(result.output or {})),
-                "duration_ms": round(tool_elapsed_ms, 2),
-            },
-            ok=bool(result.ok),
-            error=result.error,
-        )
+
+def _tool_trace_step(
+    index: int, step_call: ToolCall, result: ToolResult, elapsed_ms: float
+) -> ReasoningStep:
+    return ReasoningStep(
+        index=index,
+        type="tool",
+        tool=str(step_call.tool or "").strip(),
+        description=step_call.rationale or "tool_execution",
+        input=_sanitize_payload(dict(step_call.input or {})),
+        output={
+            **_sanitize_payload(dict(result.output or {})),
+            "duration_ms": round(elapsed_ms, 2),
+        },
+        ok=bool(result.ok),
+        error=result.error,
     )
 
-    updates: dict[str, object] = {
-        "tool_results": updated_results,
-        "tool_cursor": cursor + 1,
-        "reasoning_steps": trace_steps,
-    }
+
+def _merge_result(
+    updates: dict[str, Any],
+    state: Mapping[str, Any],
+    result: ToolResult,
+    *,
+    tool_name: str,
+    elapsed_ms: float,
+) -> None:
+    """Fold one tool result into `updates` as deltas for the append-only channels."""
     if result.tool == "semantic_retrieval" and result.metadata:
         chunks = list(result.metadata.get("chunks") or [])
         summaries = list(result.metadata.get("summaries") or [])
         subquery_groups = list(result.metadata.get("subquery_groups") or [])
         retrieval = result.metadata.get("retrieval")
 
-        existing_chunks = state_get_list(state, "chunks")
-        existing_summaries = state_get_list(state, "summaries")
-        existing_docs = state_get_list(state, "retrieved_documents")
-        existing_subq = state_get_list(state, "subquery_groups")
-
         if chunks or summaries:
-            updates["chunks"] = [*existing_chunks, *chunks]
-            updates["summaries"] = [*existing_summaries, *summaries]
-            updates["retrieved_documents"] = [*existing_docs, *chunks, *summaries]
+            updates.setdefault("chunks", []).extend(chunks)
+            updates.setdefault("summaries", []).extend(summaries)
+            updates.setdefault("retrieved_documents", []).extend([*chunks, *summaries])
         if subquery_groups:
             valid_groups = [group for group in subquery_groups if isinstance(group, dict)]
-            updates["subquery_groups"] = [*existing_subq, *valid_groups]
+            updates.setdefault("subquery_groups", []).extend(valid_groups)
         if isinstance(retrieval, RetrievalDiagnostics):
             updates["retrieval"] = retrieval
     elif result.ok:
-        memory = dict(state_get_dict(state, "working_memory"))
+        memory = dict(updates.get("working_memory") or state_get_dict(state, "working_memory"))
         memory[result.tool] = dict(result.output or {})
         updates["working_memory"] = memory
     if tool_name:
-        updates["tool_timings_ms"] = _append_tool_timing(
-            state,
-            tool=tool_name,
-            elapsed_ms=tool_elapsed_ms,
+        observe_tool_duration(state, tool=tool_name, elapsed_ms=elapsed_ms)
+        timings = updates.setdefault("tool_timings_ms", {})
+        timings[tool_name] = round(timings.get(tool_name, 0.0) + elapsed_ms, 2)
+
+
+@track_node_timing("execute_tool")
+async def execute_tool_node(
+    state: UniversalState, components: OrchestratorComponents
+) -> dict[str, object]:
+    plan = state.get("reasoning_plan")
+    if not isinstance(plan, ReasoningPlan):
+        return {
+            "next_action": "generate",
+            "stop_reason": "missing_plan",
+        }
+
+    cursor = state_get_int(state, "tool_cursor", 0)
+    if cursor >= len(plan.steps):
+        return {
+            "next_action": "generate",
+        }
+
+    max_steps = min(HARD_MAX_STEPS, int(state.get("max_steps") or DEFAULT_MAX_STEPS))
+    tool_results = state_get_list(state, "tool_results")
+    if len(tool_results) >= max_steps:
+        return {
+            "next_action": "generate",
+            "stop_reason": "max_steps_reached",
+        }
+
+    step_call = plan.steps[cursor]
+    tool_name = str(step_call.tool or "").strip()
+    previous = tool_results[-1] if cursor > 0 and tool_results else None
+    result, tool_elapsed_ms = await _run_tool_call(state, components, step_call, previous=previous)
+
+    step_count = len(state_get_list(state, "reasoning_steps"))
+    # Append-only channels: return just this step's items (see `app.graph.state`).
+    updates: dict[str, Any] = {
+        "tool_results": [result],
+        "tool_cursor": cursor + 1,
+        "reasoning_steps": [_tool_trace_step(step_count + 1, step_call, result, tool_elapsed_ms)],
+    }
+    _merge_result(updates, state, result, tool_name=tool_name, elapsed_ms=tool_elapsed_ms)
+    return updates
+
+
+async def _run_isolated(
+    state: Mapping[str, Any],
+    components: OrchestratorComponents,
+    step_call: ToolCall,
+    *,
+    previous: ToolResult | None,
+) -> tuple[ToolResult, float, RetrievalRequestContext | None]:
+    # Runs in its own task: concurrent retrievals must not share validated scope/diagnostics.
+    with fork_retrieval_context() as forked:
+        result, elapsed_ms = await _run_tool_call(state, components, step_call, previous=previous)
+    return result, elapsed_ms, forked
+
+
+@track_node_timing("execute_tool")
+async def execute_plan_node(
+    state: UniversalState, components: OrchestratorComponents
+) -> dict[str, object]:
+    """Run the remaining plan as a DAG: every step whose dependencies succeeded runs in the
+    same wave, concurrently, each under the budget left at the start of its wave.
+
+    Reflection is only requested when a step fails or retrieval carries a retry signal;
+    otherwise the graph goes straight to generation.
+    """
+    plan = state.get("reasoning_plan")
+    if not isinstance(plan, ReasoningPlan):
+        return {
+            "next_action": "generate",
+            "stop_reason": "missing_plan",
+        }
+
+    cursor = state_get_int(state, "tool_cursor", 0)
+    if cursor >= len(plan.steps):
+        return {
+            "next_action": "generate",
+        }
+
+    max_steps = min(HARD_MAX_STEPS, int(state.get("max_steps") or DEFAULT_MAX_STEPS))
+    max_parallel = max(1, int(getattr(settings, "ORCH_PLAN_MAX_PARALLEL_STEPS", 4) or 1))
+    prior_results = state_get_list(state, "tool_results")
+    dependencies = plan.step_dependencies()
+    results: dict[int, ToolResult] = {}
+    if cursor > 0 and prior_results and isinstance(prior_results[-1], ToolResult):
+        results[cursor - 1] = prior_results[-1]
+    pending = list(range(cursor, len(plan.steps)))
+    step_count = len(state_get_list(state, "reasoning_steps"))
+
+    updates: dict[str, Any] = {"tool_results": [], "reasoning_steps": []}
+    overlay: dict[str, Any] = {}
+    failed = False
+    stop_reason = ""
+    while pending:
+        ready = [
+            index
+            for index in pending
+            if all(
+                dep < cursor or (dep in results and results[dep].ok)
+                for dep in dependencies[index]
+            )
+        ]
+        if not ready:
+            break
+        remaining_steps = max_steps - len(prior_results) - len(updates["tool_results"])
+        if remaining_steps <= 0:
+            stop_reason = "max_steps_reached"
+            break
+        wave = ready[: min(max_parallel, remaining_steps)]
+
+        view = ChainMap(overlay, state)
+        outcomes = await asyncio.gather(
+            *(
+                _run_isolated(
+                    view,
+                    components,
+                    plan.steps[index],
+                    # Piping is only unambiguous with a single upstream step.
+                    previous=(
+                        results.get(dependencies[index][0])
+                        if len(dependencies[index]) == 1
+                        else None
+                    ),
+                )
+                for index in wave
+            )
         )
+
+        parent_context = current_retrieval_context()
+        finished: list[tuple[int, ToolResult, float]] = []
+        for index, (result, elapsed_ms, forked) in zip(wave, outcomes):
+            if parent_context is not None and forked is not None:
+                # Adopted in plan order, so the last step's retrieval state wins as before.
+                parent_context.adopt(forked)
+            results[index] = result
+            pending.remove(index)
+            finished.append((index, result, elapsed_ms))
+        # Failures go last so reflection sees them as the latest result.
+        finished.sort(key=lambda item: (not item[1].ok, item[0]))
+        for index, result, elapsed_ms in finished:
+            step_call = plan.steps[index]
+            updates["tool_results"].append(result)
+            updates["reasoning_steps"].append(
+                _tool_trace_step(
+                    step_count + len(updates["reasoning_steps"]) + 1, step_call, result, elapsed_ms
+                )
+            )
+            _merge_result(
+                updates,
+                state,
+                result,
+                tool_name=str(step_call.tool or "").strip(),
+                elapsed_ms=elapsed_ms,
+            )
+        for key in ("chunks", "summaries", "retrieved_documents"):
+            if key in updates:
+                overlay[key] = [*state_get_list(state, key), *updates[key]]
+        for key in ("retrieval", "working_memory"):
+            if key in updates:
+                overlay[key] = updates[key]
+        if any(not result.ok for _, result, _ in finished):
+            failed = True
+            break
+
+    executed = len(updates["tool_results"])
+    updates["tool_cursor"] = cursor + executed
+    if stop_reason:
+        updates["stop_reason"] = stop_reason
+        updates["next_action"] = "generate"
+    elif failed:
+        updates["next_action"] = "reflect"
+    elif pending:
+        logger.warning("plan_steps_unreachable", pending=[plan.steps[i].tool for i in pending])
+        updates["next_action"] = "generate"
+    else:
+        last = updates["tool_results"][-1] if updates["tool_results"] else None
+        retry_signal = _extract_retry_signal_from_retrieval(ChainMap(overlay, state), last)
+        updates["next_action"] = "reflect" if _is_retryable_reason(retry_signal) else "generate"
     return updates
@@ -1,13 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from types import MappingProxyType
 from typing import Any, cast
 
 import structlog
 
+from app.agent.components.answer_stream import current_answer_stream, stream_answer_tokens
+from app.agent.components.output_budget import (
+    OutputBudget,
+    bind_output_budget,
+    compute_output_budget,
+)
+from app.agent.components.model_cascade import (
+    model_for_route,
+    select_synthesis_route,
+    use_synthesis_model,
+)
 from app.agent.types.models import (
     AnswerDraft,
     EvidenceItem,
+    ReasoningPlan,
     ReasoningStep,
     RetrievalDiagnostics,
     RetrievalPlan,
@@ -16,7 +30,9 @@ from app.agent.types.models import (
 )
 from app.agent.tools import get_tool
 from app.profiles.models import AgentProfile
+from app.infrastructure.clients.llm_gateway import llm_priority
 from app.infrastructure.config import settings
+from app.infrastructure.metrics.model_cascade import model_cascade_metrics_store
 from app.graph.logic.logic import _query_mode_aggregation_mode
 from app.graph.state import ANSWER_PREVIEW_LIMIT, UniversalState
 from app.graph.logic.utils import (
@@ -84,14 +100,16 @@ async def aggregate_subqueries_node(
             summary_k=0,
             require_literal_evidence=False,
         )
-        draft = await comp.answer_generator.generate(
-            query=f"[SUBCONSULTA: {query}]\nResume la respuesta basandote SOLO en los fragmentos proporcionados.",
-            scope_label="",
-            plan=sub_plan,
-            chunks=evidence,
-            summaries=[],
-            agent_profile=profile,
-        )
+        # Partial summaries must not hold up final syntheses of other requests.
+        with llm_priority("auxiliary"):
+            draft = await comp.answer_generator.generate(
+                query=f"[SUBCONSULTA: {query}]\nResume la respuesta basandote SOLO en los fragmentos proporcionados.",
+                scope_label="",
+                plan=sub_plan,
+                chunks=evidence,
+                summaries=[],
+                agent_profile=profile,
+            )
         return draft.text
 
     partial_answers: list[dict[str, Any]] = []
@@ -213,45 +231,132 @@ async def generator_node(
     raw_partials = state.get("partial_answers")
     partial_answers_list: list[Any] = raw_partials if isinstance(raw_partials, list) else []
 
-    try:
+    reasoning_plan = state.get("reasoning_plan")
+    agent_profile = cast(AgentProfile | None, state.get("agent_profile"))
+    decision = select_synthesis_route(
+        plan=plan,
+        reasoning_plan=reasoning_plan if isinstance(reasoning_plan, ReasoningPlan) else None,
+        agent_profile=agent_profile,
+        evidence_count=len(chunks) + len(summaries),
+        has_partial_answers=bool(partial_answers_list),
+    )
+    user_query = state_get_str(state, "user_query", "")
+
+    output_budgets: list[OutputBudget] = []
+
+    async def _synthesize(model: str, headroom_ms: int) -> AnswerDraft:
         generator_timeout_ms = get_adaptive_timeout_ms(
             state,
             stage_default_ms=_timeout_ms_for_stage("generator"),
-            headroom_ms=1000,
-        )
-        answer = await asyncio.wait_for(
-            components.answer_generator.generate(
-                query=state_get_str(state, "user_query", ""),
-                scope_label=state_get_str(state, "scope_label", ""),
-                plan=plan,
-                chunks=chunks,
-                summaries=summaries,
-                working_memory=working_memory,
-                partial_answers=partial_answers_list,
-                agent_profile=state.get("agent_profile"),
-            ),
-            timeout=generator_timeout_ms / 1000.0,
+            headroom_ms=headroom_ms,
         )
+        # Cap the completion so a verbose model finishes before the stage timeout fires.
+        output_budget = compute_output_budget(model, generator_timeout_ms)
+        output_budgets.append(output_budget)
+        with stream_answer_tokens(), use_synthesis_model(model), bind_output_budget(output_budget):
+            return await asyncio.wait_for(
+                components.answer_generator.generate(
+                    query=user_query,
+                    scope_label=state_get_str(state, "scope_label", ""),
+                    plan=plan,
+                    chunks=chunks,
+                    summaries=summaries,
+                    working_memory=working_memory,
+                    partial_answers=partial_answers_list,
+                    agent_profile=agent_profile,
+                ),
+                timeout=generator_timeout_ms / 1000.0,
+            )
+
+    started = time.perf_counter()
+    try:
+        answer = await _synthesize(decision.model, headroom_ms=1000)
     except TimeoutError:
+        model_cascade_metrics_store.record_attempt(
+            decision.route,
+            model=decision.model,
+            outcome="timeout",
+            latency_ms=(time.perf_counter() - started) * 1000.0,
+        )
         return {
             "stop_reason": "generator_timeout",
         }
-    trace_steps = state_get_list(state, "reasoning_steps")
-    trace_steps.append(
-        ReasoningStep(
-            index=len(trace_steps) + 1,
-            type="synthesis",
-            description="synthesis_completed",
-            output={
-                "answer_preview": _clip_text(answer.text, limit=ANSWER_PREVIEW_LIMIT),
-                "evidence_count": len(answer.evidence),
-                "partial_answers_count": len(partial_answers_list),
-            },
+    accepted = bool(components.validator.validate(answer, plan, user_query).accepted)
+    model_cascade_metrics_store.record_attempt(
+        decision.route,
+        model=decision.model,
+        outcome="accepted" if accepted else "rejected",
+        latency_ms=(time.perf_counter() - started) * 1000.0,
+    )
+
+    escalated = False
+    min_escalation_ms = int(getattr(settings, "ORCH_MODEL_CASCADE_ESCALATION_MIN_MS", 3000) or 0)
+    if (
+        not accepted
+        and decision.can_escalate
+        and get_adaptive_timeout_ms(
+            state, stage_default_ms=_timeout_ms_for_stage("generator"), headroom_ms=1000
+        )
+        >= min_escalation_ms
+    ):
+        escalated = True
+        heavy_model = model_for_route("heavy")
+        model_cascade_metrics_store.record_escalation(decision.route)
+        logger.info(
+            "synthesis_model_escalated",
+            from_model=decision.model,
+            to_model=heavy_model,
+            route_reason=decision.reason,
         )
+        sink = current_answer_stream()
+        if sink is not None and sink.tokens_emitted:
+            sink.reset_tokens("model_escalation")
+        tokens_before_heavy = sink.tokens_emitted if sink is not None else 0
+        started = time.perf_counter()
+        try:
+            answer = await _synthesize(heavy_model, headroom_ms=1000)
+        except TimeoutError:
+            # Keep the lightweight draft; validation reports why it was not accepted.
+            if sink is not None and sink.tokens_emitted > tokens_before_heavy:
+                # The client holds partial heavy-model text; put the kept draft back.
+                sink.reset_tokens("escalation_timeout")
+                sink.emit_token(answer.text)
+            model_cascade_metrics_store.record_attempt(
+                "heavy",
+                model=heavy_model,
+                outcome="timeout",
+                latency_ms=(time.perf_counter() - started) * 1000.0,
+                escalation=True,
+            )
+        else:
+            accepted = bool(components.validator.validate(answer, plan, user_query).accepted)
+            model_cascade_metrics_store.record_attempt(
+                "heavy",
+                model=heavy_model,
+                outcome="accepted" if accepted else "rejected",
+                latency_ms=(time.perf_counter() - started) * 1000.0,
+                escalation=True,
+            )
+
+    trace_step = ReasoningStep(
+        index=len(state_get_list(state, "reasoning_steps")) + 1,
+        type="synthesis",
+        description="synthesis_completed",
+        output={
+            "answer_preview": _clip_text(answer.text, limit=ANSWER_PREVIEW_LIMIT),
+            "evidence_count": len(answer.evidence),
+            "partial_answers_count": len(partial_answers_list),
+            "synthesis_route": decision.route,
+            "synthesis_route_reason": decision.reason,
+            "synthesis_escalated": escalated,
+            "context_packing": dict(answer.context_stats),
+            "synthesis_degraded": list(answer.degraded),
+            "output_max_tokens": output_budgets[-1].max_tokens if output_budgets else None,
+        },
     )
     return {
         "generation": answer,
-        "reasoning_steps": trace_steps,
+        "reasoning_steps": [trace_step],
     }
 
 
@@ -278,7 +383,9 @@ async def citation_validate_node(
                     headroom_ms=200,
                 )
                 result = await asyncio.wait_for(
-                    tool.run({}, state=dict(state), context=components._runtime_context()),
+                    tool.run(
+                        {}, state=MappingProxyType(state), context=components._runtime_context()
+                    ),
                     timeout=validation_timeout_ms / 1000.0,
                 )
             except TimeoutError:
@@ -301,22 +408,19 @@ async def citation_validate_node(
     else:
         validation = components.validator.validate(answer, plan, str(state.get("user_query") or ""))
 
-    trace_steps = state_get_list(state, "reasoning_steps")
-    trace_steps.append(
-        ReasoningStep(
-            index=len(trace_steps) + 1,
-            type="validation",
-            tool="citation_validator" if "citation_validator" in allowed else None,
-            description="validation_completed",
-            output={"accepted": bool(validation.accepted), "issues": list(validation.issues)},
-            ok=bool(validation.accepted),
-        )
+    trace_step = ReasoningStep(
+        index=len(state_get_list(state, "reasoning_steps")) + 1,
+        type="validation",
+        tool="citation_validator" if "citation_validator" in allowed else None,
+        description="validation_completed",
+        output={"accepted": bool(validation.accepted), "issues": list(validation.issues)},
+        ok=bool(validation.accepted),
     )
     stop_reason = state_get_str(state, "stop_reason", "")
     if not stop_reason:
         stop_reason = "done" if validation.accepted else "validation_failed"
     return {
         "validation": validation,
-        "reasoning_steps": trace_steps,
+        "reasoning_steps": [trace_step],
         "stop_reason": stop_reason,
     }
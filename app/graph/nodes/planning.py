@@ -14,6 +14,7 @@ from app.graph.state import (
     DEFAULT_MAX_STEPS,
     HARD_MAX_REFLECTIONS,
     HARD_MAX_STEPS,
+    ReplaceList,
     UniversalState,
 )
 from app.graph.logic.utils import (
@@ -160,8 +161,8 @@ async def planner_node(
         "max_steps": max_steps,
         "max_reflections": max_reflections,
         "tool_cursor": 0,
-        "tool_results": [],
-        "reasoning_steps": [*existing_steps, *trace_steps],
+        "tool_results": ReplaceList(),
+        "reasoning_steps": list(trace_steps),
         "next_action": ("execute" if reasoning_plan.steps else "generate"),
         "interaction_level": interaction.level,
         "interaction_metrics": dict(interaction.metrics),
@@ -224,7 +225,6 @@ async def planner_node(
         }
         updates["interaction_interruptions"] = prior_interruptions + 1
         updates["reasoning_steps"] = [
-            *existing_steps,
             *trace_steps,
             ReasoningStep(
                 index=len(existing_steps) + len(trace_steps) + 1,
@@ -39,7 +39,7 @@ async def reflect_node(state: UniversalState) -> dict[str, object]:
     plan_attempts = int(state.get("plan_attempts") or 1)
     tool_results = state_get_list(state, "tool_results")
     last = tool_results[-1] if tool_results else None
-    trace_steps = state_get_list(state, "reasoning_steps")
+    step_count = len(state_get_list(state, "reasoning_steps"))
 
     next_action = "generate"
     stop_reason = state_get_str(state, "stop_reason", "")
@@ -70,21 +70,19 @@ async def reflect_node(state: UniversalState) -> dict[str, object]:
     else:
         next_action = "generate"
 
-    trace_steps.append(
-        ReasoningStep(
-            index=len(trace_steps) + 1,
-            type="reflection",
-            description="reflection_decision",
-            output={
-                "next_action": next_action,
-                "plan_attempts": plan_attempts,
-                "reflections": reflections,
-                "last_tool_ok": bool(last.ok) if isinstance(last, ToolResult) else True,
-                "retryable": retryable,
-                "retry_reason": (retry_reason[:RETRY_REASON_LIMIT] if retry_reason else ""),
-            },
-            ok=True,
-        )
+    trace_step = ReasoningStep(
+        index=step_count + 1,
+        type="reflection",
+        description="reflection_decision",
+        output={
+            "next_action": next_action,
+            "plan_attempts": plan_attempts,
+            "reflections": reflections,
+            "last_tool_ok": bool(last.ok) if isinstance(last, ToolResult) else True,
+            "retryable": retryable,
+            "retry_reason": (retry_reason[:RETRY_REASON_LIMIT] if retry_reason else ""),
+        },
+        ok=True,
     )
 
     logger.warning(
@@ -103,7 +101,7 @@ async def reflect_node(state: UniversalState) -> dict[str, object]:
         "next_action": next_action,
         "plan_attempts": plan_attempts,
         "reflections": reflections,
-        "reasoning_steps": trace_steps,
+        "reasoning_steps": [trace_step],
     }
     if stop_reason:
         updates["stop_reason"] = stop_reason
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, NotRequired, TypedDict
+from typing import Annotated, Any, NotRequired, TypedDict
 
 from app.agent.types.models import (
     AnswerDraft,
@@ -24,6 +24,33 @@ HARD_MAX_STEPS = 12
 HARD_MAX_REFLECTIONS = 6
 
 
+class ReplaceList(list):
+    """Node update that replaces an append-only channel instead of extending it."""
+
+
+def append_items(current: list[Any] | None, update: list[Any] | None) -> list[Any]:
+    """Reducer for append-only lists: nodes return only the new items.
+
+    Must not mutate `current`: conditional edges read state through channel copies that
+    share the stored value, so an in-place extend would be applied twice.
+    """
+    if isinstance(update, ReplaceList):
+        return list(update)
+    if not update:
+        return current if current is not None else []
+    return [*(current or ()), *update]
+
+
+def add_timings(
+    current: dict[str, float] | None, update: dict[str, float] | None
+) -> dict[str, float]:
+    """Reducer for timing dicts: nodes return the elapsed ms of this step per key."""
+    timings = dict(current or {})
+    for key, elapsed_ms in (update or {}).items():
+        timings[key] = round(float(timings.get(key, 0.0)) + max(0.0, float(elapsed_ms)), 2)
+    return timings
+
+
 class UniversalState(TypedDict):
     user_query: str
     working_query: str
@@ -35,16 +62,16 @@ class UniversalState(TypedDict):
     scope_label: str
     agent_profile: AgentProfile | None
     clarification_context: NotRequired[dict[str, Any]]
-    tool_results: list[ToolResult]
+    tool_results: Annotated[list[ToolResult], append_items]
     tool_cursor: int
     plan_attempts: int
     reflections: int
-    reasoning_steps: list[ReasoningStep]
+    reasoning_steps: Annotated[list[ReasoningStep], append_items]
     working_memory: dict[str, object]
-    chunks: list[EvidenceItem]
-    summaries: list[EvidenceItem]
-    retrieved_documents: list[EvidenceItem]
-    subquery_groups: NotRequired[list[dict[str, Any]]]
+    chunks: Annotated[list[EvidenceItem], append_items]
+    summaries: Annotated[list[EvidenceItem], append_items]
+    retrieved_documents: Annotated[list[EvidenceItem], append_items]
+    subquery_groups: Annotated[NotRequired[list[dict[str, Any]]], append_items]
     partial_answers: NotRequired[list[dict[str, Any]]]
     allowed_tools: NotRequired[list[str]]
     intent: NotRequired[object]
@@ -57,8 +84,8 @@ class UniversalState(TypedDict):
     retrieval: NotRequired[RetrievalDiagnostics]
     generation: NotRequired[AnswerDraft]
     validation: NotRequired[ValidationResult]
-    stage_timings_ms: NotRequired[dict[str, float]]
-    tool_timings_ms: NotRequired[dict[str, float]]
+    stage_timings_ms: Annotated[NotRequired[dict[str, float]], add_timings]
+    tool_timings_ms: Annotated[NotRequired[dict[str, float]], add_timings]
     flow_start_pc: NotRequired[float]
     interaction_level: NotRequired[str]
     interaction_metrics: NotRequired[dict[str, Any]]
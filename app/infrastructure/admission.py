@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, AsyncIterator, Literal, Mapping
+
+import structlog
+
+from app.infrastructure.config import settings
+from app.infrastructure.metrics.admission import admission_metrics_store
+
+logger = structlog.get_logger(__name__)
+
+ShedReason = Literal["queue_full", "slo", "timeout"]
+
+
+class AdmissionRejected(Exception):
+    """Request shed by admission control; callers map it to 503 + ``Retry-After``."""
+
+    def __init__(self, reason: ShedReason, *, tenant_id: str, retry_after_seconds: int) -> None:
+        super().__init__(f"admission rejected ({reason}) for tenant {tenant_id}")
+        self.reason = reason
+        self.tenant_id = tenant_id
+        self.retry_after_seconds = retry_after_seconds
+
+
+@dataclass
+class _Waiter:
+    future: asyncio.Future[None]
+    enqueued_at: float
+
+
+@dataclass
+class _TenantState:
+    in_flight: int = 0
+    virtual_time: float = 0.0
+    waiters: deque[_Waiter] = field(default_factory=deque)
+
+
+class AdmissionTicket:
+    __slots__ = ("_controller", "tenant_id", "admitted_at", "_released")
+
+    def __init__(self, controller: AdmissionController, tenant_id: str) -> None:
+        self._controller = controller
+        self.tenant_id = tenant_id
+        self.admitted_at = time.monotonic()
+        self._released = False
+
+    def release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        self._controller._release(
+            self.tenant_id, held_ms=(time.monotonic() - self.admitted_at) * 1000.0
+        )
+
+
+class AdmissionController:
+    """Global and per-tenant concurrency limits with a bounded, weighted-fair wait queue.
+
+    A request runs immediately when both limits have room and its tenant has nobody
+    queued. Otherwise it joins its tenant's FIFO; freed slots go to the eligible tenant
+    with the lowest virtual time, which advances by ``1 / weight`` per admission and is
+    pulled up to the global clock when a tenant becomes active, so idle tenants do not
+    bank credit. A request is shed when the queue is full or when its estimated wait
+    exceeds the time left for queueing: the remaining request budget minus the typical
+    service time. Waiters that outlive that allowance are shed as well.
+
+    State is only touched from the event loop, so no lock is needed.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int,
+        tenant_max_concurrent: int,
+        max_queue: int,
+        tenant_weights: Mapping[str, float] | None = None,
+        ewma_alpha: float = 0.2,
+    ) -> None:
+        self._max_concurrent = max(1, int(max_concurrent))
+        self._tenant_max_concurrent = max(1, int(tenant_max_concurrent))
+        self._max_queue = max(0, int(max_queue))
+        self._weights = {
+            str(tenant): float(weight)
+            for tenant, weight in (tenant_weights or {}).items()
+            if float(weight) > 0
+        }
+        self._ewma_alpha = min(1.0, max(0.01, float(ewma_alpha)))
+        self._tenants: dict[str, _TenantState] = {}
+        self._in_flight = 0
+        self._queued = 0
+        self._virtual_clock = 0.0
+        self._service_ms: float | None = None
+
+    def estimated_wait_ms(self, tenant_id: str) -> float:
+        """Average-rate estimate: requests ahead divided by the slots serving them."""
+        if self._service_ms is None:
+            return 0.0
+        state = self._tenants.get(tenant_id) or _TenantState()
+        global_wait = 0.0
+        if self._in_flight >= self._max_concurrent:
+            global_wait = (self._queued + 1) / self._max_concurrent * self._service_ms
+        tenant_wait = 0.0
+        if state.in_flight >= self._tenant_max_concurrent:
+            tenant_wait = (len(state.waiters) + 1) / self._tenant_max_concurrent * self._service_ms
+        return max(global_wait, tenant_wait)
+
+    def check(self, tenant_id: str, *, budget_ms: float) -> None:
+        """Raise `AdmissionRejected` if a request arriving now would be shed."""
+        if self._can_run_now(tenant_id):
+            return
+        self._shed_reason(tenant_id, budget_ms=budget_ms, record=False)
+
+    async def acquire(self, tenant_id: str, *, budget_ms: float) -> AdmissionTicket:
+        if self._can_run_now(tenant_id):
+            self._admit(tenant_id, waited_ms=0.0)
+            return AdmissionTicket(self, tenant_id)
+
+        max_wait_ms = self._shed_reason(tenant_id, budget_ms=budget_ms, record=True)
+        state = self._tenants.setdefault(tenant_id, _TenantState())
+        if not state.waiters and state.in_flight == 0:
+            state.virtual_time = max(state.virtual_time, self._virtual_clock)
+        waiter = _Waiter(
+            future=asyncio.get_running_loop().create_future(), enqueued_at=time.monotonic()
+        )
+        admission_metrics_store.record_queued(tenant_id, depth=self._queued)
+        state.waiters.append(waiter)
+        self._queued += 1
+        try:
+            await asyncio.wait_for(waiter.future, timeout=max(0.0, max_wait_ms) / 1000.0)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just as we gave up: hand the slot straight back.
+                self._release(tenant_id, held_ms=None)
+            else:
+                self._forget(tenant_id, waiter)
+            if isinstance(exc, asyncio.TimeoutError):
+                waited_ms = (time.monotonic() - waiter.enqueued_at) * 1000.0
+                admission_metrics_store.record_shed(tenant_id, reason="timeout", waited_ms=waited_ms)
+                raise AdmissionRejected(
+                    "timeout",
+                    tenant_id=tenant_id,
+                    retry_after_seconds=self._retry_after(tenant_id),
+                ) from None
+            raise
+        return AdmissionTicket(self, tenant_id)
+
+    @asynccontextmanager
+    async def slot(self, tenant_id: str, *, budget_ms: float) -> AsyncIterator[AdmissionTicket]:
+        ticket = await self.acquire(tenant_id, budget_ms=budget_ms)
+        try:
+            yield ticket
+        finally:
+            ticket.release()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "in_flight": self._in_flight,
+            "queued": self._queued,
+            "max_concurrent": self._max_concurrent,
+            "tenant_max_concurrent": self._tenant_max_concurrent,
+            "max_queue": self._max_queue,
+            "service_time_ms": round(self._service_ms, 2) if self._service_ms is not None else None,
+            "tenants": {
+                tenant: {"in_flight": state.in_flight, "queued": len(state.waiters)}
+                for tenant, state in self._tenants.items()
+            },
+        }
+
+    def _can_run_now(self, tenant_id: str) -> bool:
+        state = self._tenants.get(tenant_id)
+        if state is None:
+            return self._in_flight < self._max_concurrent
+        return (
+            not state.waiters
+            and self._in_flight < self._max_concurrent
+            and state.in_flight < self._tenant_max_concurrent
+        )
+
+    def _shed_reason(self, tenant_id: str, *, budget_ms: float, record: bool) -> float:
+        """Raise if a queued request would be shed; otherwise return its maximum wait."""
+        max_wait_ms = float(budget_ms) - (self._service_ms or 0.0)
+        reason: ShedReason | None = None
+        if self._queued >= self._max_queue:
+            reason = "queue_full"
+        elif self.estimated_wait_ms(tenant_id) > max_wait_ms:
+            reason = "slo"
+        if reason is None:
+            return max_wait_ms
+        if record:
+            admission_metrics_store.record_shed(tenant_id, reason=reason)
+        raise AdmissionRejected(
+            reason, tenant_id=tenant_id, retry_after_seconds=self._retry_after(tenant_id)
+        )
+
+    def _retry_after(self, tenant_id: str) -> int:
+        return max(1, math.ceil(self.estimated_wait_ms(tenant_id) / 1000.0))
+
+    def _admit(self, tenant_id: str, *, waited_ms: float) -> None:
+        state = self._tenants.setdefault(tenant_id, _TenantState())
+        state.in_flight += 1
+        self._in_flight += 1
+        admission_metrics_store.record_admitted(tenant_id, waited_ms=waited_ms)
+
+    def _release(self, tenant_id: str, *, held_ms: float | None) -> None:
+        state = self._tenants.get(tenant_id)
+        if state is not None:
+            state.in_flight = max(0, state.in_flight - 1)
+        self._in_flight = max(0, self._in_flight - 1)
+        admission_metrics_store.record_released(tenant_id)
+        if held_ms is not None:
+            if self._service_ms is None:
+                self._service_ms = held_ms
+            else:
+                self._service_ms += self._ewma_alpha * (held_ms - self._service_ms)
+        self._dispatch()
+        self._drop_if_idle(tenant_id)
+
+    def _forget(self, tenant_id: str, waiter: _Waiter) -> None:
+        state = self._tenants.get(tenant_id)
+        if state is not None and waiter in state.waiters:
+            state.waiters.remove(waiter)
+            self._queued -= 1
+            admission_metrics_store.record_dequeued(tenant_id)
+        self._drop_if_idle(tenant_id)
+
+    def _dispatch(self) -> None:
+        while self._in_flight < self._max_concurrent:
+            tenant_id = self._next_tenant()
+            if tenant_id is None:
+                return
+            state = self._tenants[tenant_id]
+            waiter = state.waiters.popleft()
+            self._queued -= 1
+            admission_metrics_store.record_dequeued(tenant_id)
+            if waiter.future.done():
+                # Cancelled or timed out, but `acquire` has not run its cleanup yet.
+                self._drop_if_idle(tenant_id)
+                continue
+            self._virtual_clock = max(self._virtual_clock, state.virtual_time)
+            state.virtual_time += 1.0 / self._weights.get(tenant_id, 1.0)
+            self._admit(tenant_id, waited_ms=(time.monotonic() - waiter.enqueued_at) * 1000.0)
+            waiter.future.set_result(None)
+
+    def _next_tenant(self) -> str | None:
+        best: tuple[float, float] | None = None
+        chosen: str | None = None
+        for tenant_id, state in self._tenants.items():
+            if not state.waiters or state.in_flight >= self._tenant_max_concurrent:
+                continue
+            rank = (state.virtual_time, state.waiters[0].enqueued_at)
+            if best is None or rank < best:
+                best, chosen = rank, tenant_id
+        return chosen
+
+    def _drop_if_idle(self, tenant_id: str) -> None:
+        state = self._tenants.get(tenant_id)
+        if state is not None and state.in_flight == 0 and not state.waiters:
+            del self._tenants[tenant_id]
+
+
+def remaining_budget_ms(started_at: float) -> float:
+    """What is left of ``ORCH_TIMEOUT_TOTAL_MS`` for a request started at `started_at`."""
+    total_ms = float(getattr(settings, "ORCH_TIMEOUT_TOTAL_MS", 150000) or 150000)
+    return total_ms - (time.perf_counter() - started_at) * 1000.0
+
+
+def _parse_weights(raw: str) -> dict[str, float]:
+    weights: dict[str, float] = {}
+    for item in raw.split(","):
+        tenant, sep, value = item.partition("=")
+        if not sep or not tenant.strip():
+            continue
+        try:
+            weights[tenant.strip()] = float(value)
+        except ValueError:
+            logger.warning("admission_weight_ignored", entry=item.strip())
+    return weights
+
+
+@lru_cache(maxsize=1)
+def get_admission_controller() -> AdmissionController | None:
+    if not bool(getattr(settings, "ORCH_ADMISSION_ENABLED", True)):
+        return None
+    return AdmissionController(
+        max_concurrent=int(getattr(settings, "ORCH_ADMISSION_MAX_CONCURRENT", 32)),
+        tenant_max_concurrent=int(getattr(settings, "ORCH_ADMISSION_TENANT_MAX_CONCURRENT", 8)),
+        max_queue=int(getattr(settings, "ORCH_ADMISSION_MAX_QUEUE", 256)),
+        tenant_weights=_parse_weights(str(getattr(settings, "ORCH_ADMISSION_TENANT_WEIGHTS", ""))),
+    )
+
+
+def check_admission(tenant_id: str, *, started_at: float) -> None:
+    controller = get_admission_controller()
+    if controller is not None:
+        controller.check(tenant_id, budget_ms=remaining_budget_ms(started_at))
+
+
+@asynccontextmanager
+async def admission_slot(tenant_id: str, *, started_at: float) -> AsyncIterator[None]:
+    """Hold one admission slot for `tenant_id` (a no-op when admission control is off)."""
+    controller = get_admission_controller()
+    if controller is None:
+        yield
+        return
+    async with controller.slot(tenant_id, budget_ms=remaining_budget_ms(started_at)):
+        yield
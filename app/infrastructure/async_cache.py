@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+import structlog
+
+from app.infrastructure.metrics.cache import cache_metrics_store
+
+logger = structlog.get_logger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    expires_at: float
+    stale_until: float
+
+
+class AsyncLoadingCache(Generic[K, V]):
+    """Bounded LRU cache for async loaders with single-flight and stale-while-revalidate.
+
+    Positive entries are served fresh for ``ttl_seconds``, then served stale for up to
+    ``stale_seconds`` while one background refresh runs. Negative entries (per
+    ``is_negative``) use the shorter ``negative_ttl_seconds`` and are never served stale.
+    Loader errors are not cached: a miss propagates them, a background refresh keeps the
+    stale value.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        ttl_seconds: float,
+        max_entries: int,
+        stale_seconds: float = 0.0,
+        negative_ttl_seconds: float | None = None,
+        is_negative: Callable[[V], bool] | None = None,
+    ) -> None:
+        self._name = name
+        self._ttl_seconds = max(0.0, float(ttl_seconds))
+        self._stale_seconds = max(0.0, float(stale_seconds))
+        self._negative_ttl_seconds = max(
+            0.0,
+            float(self._ttl_seconds if negative_ttl_seconds is None else negative_ttl_seconds),
+        )
+        self._max_entries = max(1, int(max_entries))
+        self._is_negative = is_negative
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._inflight: dict[K, asyncio.Future[V]] = {}
+
+    async def get(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if now < entry.expires_at:
+                self._entries.move_to_end(key)
+                cache_metrics_store.record(self._name, "hits")
+                return entry.value
+            if now < entry.stale_until:
+                self._entries.move_to_end(key)
+                cache_metrics_store.record(self._name, "stale_hits")
+                if key not in self._inflight:
+                    cache_metrics_store.record(self._name, "refreshes")
+                    self._start_load(key, loader, background=True)
+                return entry.value
+            self._entries.pop(key, None)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            cache_metrics_store.record(self._name, "coalesced")
+            return await asyncio.shield(inflight)
+        cache_metrics_store.record(self._name, "misses")
+        return await asyncio.shield(self._start_load(key, loader, background=False))
+
+    def invalidate(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _start_load(
+        self, key: K, loader: Callable[[], Awaitable[V]], *, background: bool
+    ) -> asyncio.Future[V]:
+        task = asyncio.ensure_future(self._load(key, loader, background=background))
+        # Background refreshes have no awaiter; retrieve their outcome to avoid loop warnings.
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._inflight[key] = task
+        return task
+
+    async def _load(self, key: K, loader: Callable[[], Awaitable[V]], *, background: bool) -> V:
+        try:
+            value = await loader()
+        except Exception as exc:
+            cache_metrics_store.record(self._name, "load_failures")
+            logger.warning(
+                "async_cache_load_failed",
+                cache=self._name,
+                background=background,
+                error=str(exc),
+            )
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        self._store(key, value)
+        return value
+
+    def _store(self, key: K, value: V) -> None:
+        now = time.monotonic()
+        negative = bool(self._is_negative(value)) if self._is_negative is not None else False
+        ttl = self._negative_ttl_seconds if negative else self._ttl_seconds
+        self._entries[key] = _Entry(
+            value=value,
+            expires_at=now + ttl,
+            stale_until=now + ttl + (0.0 if negative else self._stale_seconds),
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            cache_metrics_store.record(self._name, "evictions")
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from time import monotonic
+import asyncio
+import random
+from dataclasses import dataclass, field
+from functools import lru_cache
+from time import monotonic, perf_counter
+from typing import Any, Mapping
 
 import httpx
 import structlog
 
 from app.agent.types.interfaces import EmbeddingProvider, RerankingProvider
+from app.infrastructure.clients.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+from app.infrastructure.clients.outbound_pool import outbound_get
 from app.infrastructure.config import settings
 from app.infrastructure.providers.cohere_adapter import CohereAdapter
 from app.infrastructure.providers.jina_adapter import JinaAdapter
@@ -17,39 +23,106 @@ logger = structlog.get_logger(__name__)
 BackendName = str
 
 
-@dataclass(frozen=True)
-class BackendEndpoints:
-    local_url: str
-    docker_url: str
+def parse_backend_endpoints(raw: str | None) -> dict[BackendName, str]:
+    """Parse ``name=url,name=url`` (order = preference, last = fallback of last resort)."""
+    endpoints: dict[BackendName, str] = {}
+    for chunk in str(raw or "").split(","):
+        name, sep, url = chunk.partition("=")
+        name, url = name.strip().lower(), url.strip()
+        if sep and name and url:
+            endpoints[name] = url.rstrip("/")
+    return endpoints
+
+
+@dataclass
+class _BackendState:
+    name: BackendName
+    url: str
+    breaker: CircuitBreaker
+    healthy: bool | None = None
+    probed_at: float = 0.0
+    probe_latency_ms: float | None = None
+    last_breaker_state: str = field(default="closed", repr=False)
 
 
 class RagBackendSelector:
+    """Routes across N RAG endpoints using health probes, circuit breakers and p95 latency.
+
+    Health probes run in a background task once ``start_health_probes`` is called (app
+    lifespan); without it, the selector re-probes inline at most once per ``ttl_seconds``.
+    """
+
     def __init__(
         self,
         *,
-        local_url: str,
-        docker_url: str,
+        local_url: str | None = None,
+        docker_url: str | None = None,
+        endpoints: Mapping[BackendName, str] | None = None,
         health_path: str = "/health",
         probe_timeout_ms: int = 300,
         ttl_seconds: int = 20,
         force_backend: str | None = None,
+        breaker_config: CircuitBreakerConfig | None = None,
+        rng: random.Random | None = None,
     ) -> None:
-        self._endpoints = BackendEndpoints(
-            local_url=local_url.rstrip("/"),
-            docker_url=docker_url.rstrip("/"),
-        )
+        configured = dict(endpoints or {})
+        if not configured:
+            configured = {
+                "local": str(local_url or "http://localhost:8000"),
+                "docker": str(docker_url or "http://localhost:8000"),
+            }
+        config = breaker_config or CircuitBreakerConfig()
+        self._backends: dict[BackendName, _BackendState] = {
+            str(name).strip().lower(): _BackendState(
+                name=str(name).strip().lower(),
+                url=str(url).rstrip("/"),
+                breaker=CircuitBreaker(config=config),
+            )
+            for name, url in configured.items()
+        }
         self._health_path = health_path if health_path.startswith("/") else f"/{health_path}"
         self._probe_timeout_seconds = max(0.05, int(probe_timeout_ms) / 1000.0)
         self._ttl_seconds = max(1, int(ttl_seconds))
         self._force_backend = self._normalize_backend(force_backend)
+        self._rng = rng or random.Random()
 
-        self._cached_backend: BackendName | None = None
-        self._cache_expires_at: float = 0.0
+        self._last_probe_at: float | None = None
+        self._probe_task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def from_settings(cls) -> "RagBackendSelector":
+        return cls(
+            local_url=str(settings.RAG_ENGINE_LOCAL_URL or "http://localhost:8000"),
+            docker_url=str(settings.RAG_ENGINE_DOCKER_URL or "http://localhost:8000"),
+            endpoints=parse_backend_endpoints(getattr(settings, "RAG_ENGINE_ENDPOINTS", None)),
+            health_path=str(settings.RAG_ENGINE_HEALTH_PATH or "/health"),
+            probe_timeout_ms=int(settings.RAG_ENGINE_PROBE_TIMEOUT_MS or 300),
+            ttl_seconds=int(settings.RAG_ENGINE_BACKEND_TTL_SECONDS or 20),
+            force_backend=settings.RAG_ENGINE_FORCE_BACKEND,
+            breaker_config=CircuitBreakerConfig(
+                window_seconds=float(getattr(settings, "RAG_ENGINE_BREAKER_WINDOW_SECONDS", 30.0)),
+                min_requests=int(getattr(settings, "RAG_ENGINE_BREAKER_MIN_REQUESTS", 5)),
+                error_rate_threshold=float(
+                    getattr(settings, "RAG_ENGINE_BREAKER_ERROR_RATE", 0.5)
+                ),
+                slow_call_ms=float(getattr(settings, "RAG_ENGINE_BREAKER_SLOW_CALL_MS", 8000.0)),
+                open_seconds=float(getattr(settings, "RAG_ENGINE_BREAKER_OPEN_SECONDS", 15.0)),
+            ),
+        )
 
     async def resolve_base_url(self) -> str:
         backend = await self._resolve_backend()
         return self._url_for(backend)
 
+    async def resolve_untracked_base_url(self) -> str:
+        """Base URL for calls that never report back via ``record_result``.
+
+        Takes no breaker trial, so a half-open backend is not held by a call that cannot
+        close it.
+        """
+        backend = await self._resolve_backend(acquire=False)
+        return self._url_for(backend)
+
     async def current_backend(self) -> BackendName:
         return await self._resolve_backend()
 
@@ -59,73 +132,172 @@ class RagBackendSelector:
     def force_backend(self) -> BackendName | None:
         return self._force_backend
 
-    def alternate_backend(self, backend: BackendName) -> BackendName:
-        return "docker" if backend == "local" else "local"
-
-    def set_backend(self, backend: BackendName) -> None:
-        normalized = self._normalize_backend(backend)
-        if normalized is None:
-            return
-        self._cached_backend = normalized
-        self._cache_expires_at = monotonic() + self._ttl_seconds
+    def alternate_backend(self, backend: BackendName) -> BackendName | None:
+        """Best routable backend other than ``backend``; None when every other one is down."""
+        state = self._route(exclude={backend})
+        if state is None:
+            return None
+        state.breaker.acquire()
+        return state.name
 
     def base_url_for(self, backend: BackendName) -> str:
         return self._url_for(backend)
 
-    async def _resolve_backend(self) -> BackendName:
+    def record_result(self, backend: BackendName, *, ok: bool, latency_ms: float) -> None:
+        state = self._backends.get(backend)
+        if state is None:
+            return
+        state.breaker.record(ok=ok, latency_ms=latency_ms)
+        if state.breaker.state != state.last_breaker_state:
+            logger.warning(
+                "rag_backend_circuit_state_changed",
+                backend=backend,
+                from_state=state.last_breaker_state,
+                to_state=state.breaker.state,
+            )
+            state.last_breaker_state = state.breaker.state
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "forced_backend": self._force_backend,
+            "background_probes": self._probe_task is not None and not self._probe_task.done(),
+            "backends": {
+                name: {
+                    "url": state.url,
+                    "healthy": state.healthy,
+                    "probe_latency_ms": state.probe_latency_ms,
+                    **state.breaker.snapshot(),
+                }
+                for name, state in self._backends.items()
+            },
+        }
+
+    def start_health_probes(self) -> None:
+        if self._force_backend or (self._probe_task is not None and not self._probe_task.done()):
+            return
+        self._probe_task = asyncio.create_task(self._probe_loop())
+
+    async def stop_health_probes(self) -> None:
+        task, self._probe_task = self._probe_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def probe_all(self) -> None:
+        await asyncio.gather(*(self._probe(state) for state in self._backends.values()))
+        self._last_probe_at = monotonic()
+
+    async def _probe_loop(self) -> None:
+        while True:
+            try:
+                await self.probe_all()
+            except Exception as exc:  # pragma: no cover - defensive, keeps the loop alive
+                logger.warning("rag_backend_probe_loop_error", error=str(exc))
+            await asyncio.sleep(self._ttl_seconds)
+
+    async def _resolve_backend(self, *, acquire: bool = True) -> BackendName:
         if self._force_backend:
             return self._force_backend
 
-        now = monotonic()
-        if self._cached_backend and now < self._cache_expires_at:
-            return self._cached_backend
+        probes_running = self._probe_task is not None and not self._probe_task.done()
+        if not probes_running and (
+            self._last_probe_at is None or monotonic() - self._last_probe_at >= self._ttl_seconds
+        ):
+            await self._detect_backend()
+
+        state = self._route()
+        if state is None:
+            state = list(self._backends.values())[-1]
+            logger.warning("rag_backend_all_unavailable", fallback_backend=state.name)
+        if acquire:
+            state.breaker.acquire()
+        return state.name
+
+    async def _detect_backend(self) -> None:
+        """Inline probe in preference order, stopping at the first healthy backend."""
+        for state in self._backends.values():
+            if await self._probe(state):
+                break
+        self._last_probe_at = monotonic()
 
-        backend = await self._detect_backend()
-        if backend != self._cached_backend:
-            logger.info("rag_backend_selected", backend=backend)
+    def _route(
+        self, exclude: frozenset[BackendName] | set[BackendName] = frozenset()
+    ) -> _BackendState | None:
+        candidates = [
+            state
+            for state in self._backends.values()
+            if state.name not in exclude and state.breaker.is_available()
+        ]
+        healthy = [state for state in candidates if state.healthy is True]
+        if healthy:
+            return self._pick_weighted(healthy)
+        unknown = [state for state in candidates if state.healthy is None]
+        return unknown[0] if unknown else None
 
-        self._cached_backend = backend
-        self._cache_expires_at = now + self._ttl_seconds
-        return backend
+    def _pick_weighted(self, states: list[_BackendState]) -> _BackendState:
+        if len(states) == 1:
+            return states[0]
+        p95s = [state.breaker.p95_latency_ms() for state in states]
+        known = [value for value in p95s if value is not None]
+        # Backends without samples get the best observed latency so they still earn traffic.
+        default = min(known) if known else 1.0
+        weights = [1.0 / max(1.0, value if value is not None else default) for value in p95s]
+        return self._rng.choices(states, weights=weights, k=1)[0]
 
-    async def _detect_backend(self) -> BackendName:
-        probe_url = self._endpoints.local_url + self._health_path
+    async def _probe(self, state: _BackendState) -> bool:
+        probe_url = state.url + self._health_path
         timeout = httpx.Timeout(self._probe_timeout_seconds, connect=self._probe_timeout_seconds)
+        started_at = perf_counter()
+        healthy = False
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(probe_url)
-                if response.status_code == 200:
-                    return "local"
+            response = await outbound_get("rag", probe_url, timeout=timeout)
+            healthy = response.status_code == 200
+            if not healthy:
                 logger.warning(
                     "rag_backend_probe_failed",
-                    backend="local",
+                    backend=state.name,
                     url=probe_url,
                     status_code=response.status_code,
                 )
         except httpx.RequestError as exc:
             logger.warning(
                 "rag_backend_probe_failed",
-                backend="local",
+                backend=state.name,
                 url=probe_url,
                 error=str(exc),
             )
-        return "docker"
+        if healthy != state.healthy:
+            logger.info("rag_backend_health_changed", backend=state.name, healthy=healthy)
+        state.healthy = healthy
+        state.probed_at = monotonic()
+        state.probe_latency_ms = round((perf_counter() - started_at) * 1000, 2)
+        return healthy
 
     def _url_for(self, backend: BackendName) -> str:
-        if backend == "local":
-            return self._endpoints.local_url
-        return self._endpoints.docker_url
+        state = self._backends.get(backend)
+        if state is not None:
+            return state.url
+        return list(self._backends.values())[-1].url
 
-    @staticmethod
-    def _normalize_backend(value: str | None) -> BackendName | None:
+    def _normalize_backend(self, value: str | None) -> BackendName | None:
         if not value:
             return None
         normalized = str(value).strip().lower()
-        if normalized in {"local", "docker"}:
+        if normalized in self._backends:
             return normalized
         return None
 
 
+@lru_cache(maxsize=1)
+def get_rag_backend_selector() -> RagBackendSelector:
+    """Process-wide selector so breaker state and probe results are shared by all clients."""
+    return RagBackendSelector.from_settings()
+
+
 class RagProviderFactory:
     @staticmethod
     def create_embedding_provider(
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from threading import Lock
+from time import monotonic
+from typing import Any, Literal
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    window_seconds: float = 30.0
+    min_requests: int = 5
+    error_rate_threshold: float = 0.5
+    slow_call_ms: float = 8000.0
+    open_seconds: float = 15.0
+
+
+@dataclass
+class _Outcome:
+    at: float
+    ok: bool
+    latency_ms: float
+
+
+@dataclass
+class CircuitBreaker:
+    """Rolling-window breaker: slow calls count as errors; half-open admits one trial call."""
+
+    config: CircuitBreakerConfig = field(default_factory=CircuitBreakerConfig)
+    state: BreakerState = "closed"
+    _outcomes: deque[_Outcome] = field(default_factory=deque, repr=False)
+    _opened_at: float = 0.0
+    _trial_started_at: float | None = None
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    def is_available(self) -> bool:
+        """Whether a request may be routed here (no side effects)."""
+        with self._lock:
+            return self._available(monotonic())
+
+    def acquire(self) -> bool:
+        """Reserve a routed request; moves open -> half_open once the cooldown elapsed."""
+        now = monotonic()
+        with self._lock:
+            if not self._available(now):
+                return False
+            if self.state == "open":
+                self.state = "half_open"
+            if self.state == "half_open":
+                self._trial_started_at = now
+            return True
+
+    def record(self, *, ok: bool, latency_ms: float) -> None:
+        now = monotonic()
+        healthy = ok and latency_ms < self.config.slow_call_ms
+        with self._lock:
+            self._outcomes.append(_Outcome(at=now, ok=healthy, latency_ms=float(latency_ms)))
+            self._prune(now)
+            if self.state == "half_open":
+                self._trial_started_at = None
+                if healthy:
+                    self.state = "closed"
+                    self._outcomes.clear()
+                else:
+                    self._trip(now)
+                return
+            if self.state == "closed" and self._error_rate() >= self.config.error_rate_threshold:
+                if len(self._outcomes) >= self.config.min_requests:
+                    self._trip(now)
+
+    def p95_latency_ms(self) -> float | None:
+        with self._lock:
+            self._prune(monotonic())
+            samples = sorted(item.latency_ms for item in self._outcomes if item.ok)
+        if not samples:
+            return None
+        index = max(0, math.ceil(0.95 * len(samples)) - 1)
+        return samples[index]
+
+    def snapshot(self) -> dict[str, Any]:
+        p95 = self.p95_latency_ms()
+        with self._lock:
+            return {
+                "state": self.state,
+                "window_requests": len(self._outcomes),
+                "error_rate": round(self._error_rate(), 4),
+                "p95_latency_ms": round(p95, 2) if p95 is not None else None,
+            }
+
+    def _available(self, now: float) -> bool:
+        if self.state == "closed":
+            return True
+        if self.state == "open":
+            return now - self._opened_at >= self.config.open_seconds
+        # half_open: one trial at a time; a trial that never reported back expires.
+        return (
+            self._trial_started_at is None
+            or now - self._trial_started_at >= self.config.open_seconds
+        )
+
+    def _trip(self, now: float) -> None:
+        self.state = "open"
+        self._opened_at = now
+        self._trial_started_at = None
+
+    def _prune(self, now: float) -> None:
+        horizon = now - self.config.window_seconds
+        while self._outcomes and self._outcomes[0].at < horizon:
+            self._outcomes.popleft()
+
+    def _error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        failures = sum(1 for item in self._outcomes if not item.ok)
+        return failures / len(self._outcomes)
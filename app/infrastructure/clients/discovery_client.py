@@ -162,3 +162,30 @@ async def create_dev_tenant(
     if not tenant_id:
         raise OrchestratorDiscoveryError("Tenant creation response missing tenant_id")
     return TenantCreateResult(id=tenant_id, name=created_name)
+
+
+async def invalidate_answer_cache(
+    base_url: str,
+    token: str,
+    *,
+    tenant_id: str,
+    collection_id: str | None = None,
+    timeout_seconds: float = 4.0,
+) -> int:
+    url = f"{base_url.rstrip('/')}/api/v1/knowledge/answer-cache/invalidate"
+    payload: dict[str, Any] = {"tenant_id": tenant_id}
+    if collection_id:
+        payload["collection_id"] = collection_id
+    async with httpx.AsyncClient(timeout=httpx.Timeout(timeout_seconds, connect=2.5)) as client:
+        try:
+            response = await client.post(url, json=payload, headers=_headers(token))
+        except httpx.RequestError as exc:
+            detail = f"{type(exc).__name__}: {exc!r}"
+            raise OrchestratorDiscoveryError(
+                f"Discovery request failed (network) POST {url}: {detail}",
+                status_code=None,
+            ) from exc
+    _raise_for_status(response)
+
+    body: Any = response.json() if response.text else {}
+    return int(body.get("removed") or 0) if isinstance(body, dict) else 0
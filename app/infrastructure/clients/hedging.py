@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import math
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from threading import Lock
+
+from app.infrastructure.config import settings
+
+
+@dataclass
+class _EndpointHedgeState:
+    latencies_ms: deque[float]
+    tokens: float = 0.0
+
+
+@dataclass
+class HedgePolicy:
+    """Decides when to hedge a RAG call and enforces the per-endpoint hedge budget.
+
+    The hedge delay is the rolling p90 latency of the endpoint. The budget is a token
+    bucket: every request earns ``max_ratio`` tokens (capped at ``burst``) and every
+    hedge spends one, so hedges stay below ``max_ratio`` of the endpoint's traffic.
+    """
+
+    endpoints: frozenset[str] = frozenset({"comprehensive"})
+    max_ratio: float = 0.1
+    burst: float = 5.0
+    percentile: float = 0.9
+    min_samples: int = 20
+    min_delay_ms: float = 50.0
+    window: int = 200
+    _state: dict[str, _EndpointHedgeState] = field(init=False, repr=False)
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        self._state = defaultdict(lambda: _EndpointHedgeState(deque(maxlen=max(1, self.window))))
+
+    def applies_to(self, endpoint: str) -> bool:
+        return endpoint in self.endpoints
+
+    def hedge_delay_seconds(self, endpoint: str) -> float | None:
+        """Delay before firing a hedge; None while there are too few samples."""
+        with self._lock:
+            samples = sorted(self._state[endpoint].latencies_ms)
+        if len(samples) < max(1, self.min_samples):
+            return None
+        index = max(0, math.ceil(self.percentile * len(samples)) - 1)
+        return max(self.min_delay_ms, samples[index]) / 1000.0
+
+    def record_request(self, endpoint: str) -> None:
+        with self._lock:
+            state = self._state[endpoint]
+            state.tokens = min(self.burst, state.tokens + self.max_ratio)
+
+    def record_latency(self, endpoint: str, latency_ms: float) -> None:
+        with self._lock:
+            self._state[endpoint].latencies_ms.append(float(latency_ms))
+
+    def try_acquire(self, endpoint: str) -> bool:
+        with self._lock:
+            state = self._state[endpoint]
+            if state.tokens < 1.0:
+                return False
+            state.tokens -= 1.0
+            return True
+
+
+@lru_cache(maxsize=1)
+def get_hedge_policy() -> HedgePolicy:
+    raw_endpoints = str(getattr(settings, "ORCH_RAG_HEDGE_ENDPOINTS", "comprehensive") or "")
+    return HedgePolicy(
+        endpoints=frozenset(item.strip() for item in raw_endpoints.split(",") if item.strip()),
+        max_ratio=float(getattr(settings, "ORCH_RAG_HEDGE_MAX_RATIO", 0.1)),
+        burst=float(getattr(settings, "ORCH_RAG_HEDGE_BURST", 5.0)),
+        percentile=float(getattr(settings, "ORCH_RAG_HEDGE_PERCENTILE", 0.9)),
+        min_samples=int(getattr(settings, "ORCH_RAG_HEDGE_MIN_SAMPLES", 20)),
+        min_delay_ms=float(getattr(settings, "ORCH_RAG_HEDGE_MIN_DELAY_MS", 50.0)),
+    )
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
 import structlog
 from app.infrastructure.clients.backend_selector import RagBackendSelector, RagProviderFactory
 from app.infrastructure.config import settings
+from app.infrastructure.clients.retrieval_cache import RetrievalResponseCache
 from app.infrastructure.clients.rag_client import (
     RagRetrievalContractClient,
 )
 
 # New Strategy Imports
+from app.agent.retrieval.request_context import (
+    RetrievalRequestContext,
+    current_retrieval_context,
+)
 from app.agent.retrieval.retrieval_flow import RetrievalFlow
 from app.agent.types.interfaces import EmbeddingProvider, RerankingProvider, SubqueryPlanner
 from app.agent.components.query_decomposer import HybridSubqueryPlanner
@@ -29,27 +34,21 @@ class RagEngineRetrieverAdapter:
     backend_selector: RagBackendSelector | None = None
     contract_client: RagRetrievalContractClient | None = None
     http_client: httpx.AsyncClient | None = None
+    # Embedding/rerank provider traffic; defaults to http_client when not given.
+    provider_http_client: httpx.AsyncClient | None = None
+    retrieval_cache: RetrievalResponseCache | None = None
     subquery_planner: SubqueryPlanner | None = None
     embedding_provider: EmbeddingProvider | None = None
     reranking_provider: RerankingProvider | None = None
 
-    # last diagnostics are read by the use case (duck typing).
-    last_retrieval_diagnostics: RetrievalDiagnostics | None = None
-    _validated_filters: dict[str, Any] | None = None
-    _validated_scope_payload: dict[str, Any] | None = None
-    _profile_context: AgentProfile | None = None
-    _profile_resolution_context: dict[str, Any] | None = None
+    # Used only when no request context is bound (direct adapter usage outside the graph).
+    _fallback_context: RetrievalRequestContext = field(
+        default_factory=RetrievalRequestContext, repr=False
+    )
 
     def __post_init__(self) -> None:
         if self.backend_selector is None:
-            self.backend_selector = RagBackendSelector(
-                local_url=str(settings.RAG_ENGINE_LOCAL_URL or "http://localhost:8000"),
-                docker_url=str(settings.RAG_ENGINE_DOCKER_URL or "http://localhost:8000"),
-                health_path=str(settings.RAG_ENGINE_HEALTH_PATH or "/health"),
-                probe_timeout_ms=int(settings.RAG_ENGINE_PROBE_TIMEOUT_MS or 300),
-                ttl_seconds=int(settings.RAG_ENGINE_BACKEND_TTL_SECONDS or 20),
-                force_backend=settings.RAG_ENGINE_FORCE_BACKEND,
-            )
+            self.backend_selector = RagBackendSelector.from_settings()
 
         if not settings.RAG_SERVICE_SECRET:
             logger.error("rag_service_secret_missing", status="error")
@@ -60,6 +59,7 @@ class RagEngineRetrieverAdapter:
                 timeout_seconds=self.timeout_seconds,
                 backend_selector=self.backend_selector,
                 http_client=self.http_client,
+                response_cache=self.retrieval_cache,
             )
         if self.subquery_planner is None:
             self.subquery_planner = HybridSubqueryPlanner.from_settings()
@@ -67,7 +67,7 @@ class RagEngineRetrieverAdapter:
         if self.embedding_provider is None:
             try:
                 self.embedding_provider = RagProviderFactory.create_embedding_provider(
-                    http_client=self.http_client
+                    http_client=self.provider_http_client or self.http_client
                 )
             except Exception as exc:
                 logger.warning("embedding_provider_not_initialized", error=str(exc)[:160])
@@ -75,19 +75,49 @@ class RagEngineRetrieverAdapter:
         if self.reranking_provider is None:
             try:
                 self.reranking_provider = RagProviderFactory.create_reranking_provider(
-                    http_client=self.http_client
+                    http_client=self.provider_http_client or self.http_client
                 )
             except Exception as exc:
                 logger.warning("reranking_provider_not_initialized", error=str(exc)[:160])
 
+    def _context(self) -> RetrievalRequestContext:
+        bound = current_retrieval_context()
+        return bound if bound is not None else self._fallback_context
+
+    # last diagnostics are read by the use case (duck typing).
+    @property
+    def last_retrieval_diagnostics(self) -> RetrievalDiagnostics | None:
+        return self._context().last_diagnostics
+
+    @last_retrieval_diagnostics.setter
+    def last_retrieval_diagnostics(self, value: RetrievalDiagnostics | None) -> None:
+        self._context().last_diagnostics = value
+
+    @property
+    def _validated_filters(self) -> dict[str, Any] | None:
+        return self._context().validated_filters
+
+    @_validated_filters.setter
+    def _validated_filters(self, value: dict[str, Any] | None) -> None:
+        self._context().validated_filters = value
+
+    @property
+    def _validated_scope_payload(self) -> dict[str, Any] | None:
+        return self._context().validated_scope_payload
+
+    @_validated_scope_payload.setter
+    def _validated_scope_payload(self, value: dict[str, Any] | None) -> None:
+        self._context().validated_scope_payload = value
+
     def set_profile_context(
         self,
         *,
         profile: AgentProfile | None,
         profile_resolution: dict[str, Any] | None = None,
     ) -> None:
-        self._profile_context = profile
-        self._profile_resolution_context = (
+        context = self._context()
+        context.profile = profile
+        context.profile_resolution = (
             profile_resolution if isinstance(profile_resolution, dict) else None
         )
 
@@ -175,13 +205,14 @@ class RagEngineRetrieverAdapter:
         correlation_id: str | None = None,
     ) -> list[EvidenceItem]:
         assert self.contract_client is not None
+        context = self._context()
         flow = RetrievalFlow(
             contract_client=self.contract_client,
             subquery_planner=self.subquery_planner,
             embedding_provider=self.embedding_provider,
             reranking_provider=self.reranking_provider,
-            profile_context=self._profile_context,
-            profile_resolution_context=self._profile_resolution_context,
+            profile_context=context.profile,
+            profile_resolution_context=context.profile_resolution,
         )
         items = await flow.execute(
             query=query,
@@ -191,8 +222,8 @@ class RagEngineRetrieverAdapter:
             user_id=user_id,
             request_id=request_id,
             correlation_id=correlation_id,
-            validated_filters=self._validated_filters,
-            validated_scope_payload=self._validated_scope_payload,
+            validated_filters=context.validated_filters,
+            validated_scope_payload=context.validated_scope_payload,
         )
-        self.last_retrieval_diagnostics = flow.last_diagnostics
+        context.last_diagnostics = flow.last_diagnostics
         return items
@@ -0,0 +1,609 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterator, Literal, Mapping
+
+import httpx
+import openai
+import structlog
+
+from app.infrastructure.clients.outbound_pool import get_outbound_client
+from app.infrastructure.config import settings
+from app.infrastructure.metrics.histograms import current_metric_labels, latency_histogram_store
+
+logger = structlog.get_logger(__name__)
+
+GROQ_BASE_URL = "https://api.groq.com/openai/v1"
+
+LLMPriority = Literal["synthesis", "auxiliary"]
+_PRIORITY_RANK: dict[str, int] = {"synthesis": 0, "auxiliary": 1}
+
+# Reserved for the completion when the call does not set `max_tokens`.
+_DEFAULT_COMPLETION_TOKENS = 512
+# Shorter completions are dominated by time-to-first-token and say little about throughput.
+_MIN_THROUGHPUT_SAMPLE_TOKENS = 32
+
+_priority_override: ContextVar[LLMPriority | None] = ContextVar(
+    "orch_llm_priority", default=None
+)
+_request_deadline: ContextVar[float | None] = ContextVar("orch_llm_deadline", default=None)
+
+
+class LLMBudgetExhausted(TimeoutError):
+    """No time left in the call or request budget to wait for (or retry) an LLM call."""
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority) -> Iterator[None]:
+    """Run every LLM call in this block at `priority`, whatever its call site asks for."""
+    token = _priority_override.set(priority)
+    try:
+        yield
+    finally:
+        _priority_override.reset(token)
+
+
+@contextmanager
+def bind_llm_deadline(deadline: float) -> Iterator[None]:
+    """Bind the request deadline (``time.monotonic()`` seconds) that bounds waits and retries."""
+    token = _request_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _request_deadline.reset(token)
+
+
+@dataclass(order=True)
+class _Waiter:
+    rank: int
+    seq: int
+    tokens: float = field(compare=False)
+    future: asyncio.Future[None] = field(compare=False)
+    enqueued_at: float = field(compare=False)
+
+
+@dataclass
+class _ModelState:
+    concurrency: int
+    tokens_per_minute: float
+    tokens: float
+    refilled_at: float
+    in_flight: int = 0
+    blocked_until: float = 0.0
+    waiters: list[_Waiter] = field(default_factory=list)
+    wakeup: asyncio.TimerHandle | None = None
+    output_tokens_per_second: float | None = None
+
+
+class LLMGateway:
+    """Single path for chat completions: one shared client plus per-model scheduling.
+
+    Each model has a concurrency cap and an optional tokens-per-minute bucket. Calls
+    reserve their estimated tokens up front and settle against the reported usage.
+    Waiting calls are admitted in priority order (final synthesis before auxiliary
+    calls), FIFO within a priority. A 429 pauses the model for its ``retry-after``;
+    rate limits, connection errors and 5xx responses are retried with backoff only
+    while the wait still fits in the call timeout and the bound request deadline.
+
+    Scheduling state is only touched from the event loop, so no lock is needed.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Any | None = None,
+        api_key: str | None = None,
+        max_concurrency: int = 8,
+        model_concurrency: Mapping[str, int] | None = None,
+        tokens_per_minute: int = 0,
+        model_tokens_per_minute: Mapping[str, int] | None = None,
+        max_retries: int = 3,
+        backoff_base_s: float = 0.25,
+        backoff_max_s: float = 8.0,
+        throughput_alpha: float = 0.2,
+    ) -> None:
+        self._client = client
+        self._client_http: httpx.AsyncClient | None = None
+        self._api_key = str(api_key or "").strip()
+        self._max_concurrency = max(1, int(max_concurrency))
+        self._model_concurrency = dict(model_concurrency or {})
+        self._tokens_per_minute = max(0, int(tokens_per_minute))
+        self._model_tokens_per_minute = dict(model_tokens_per_minute or {})
+        self._max_retries = max(0, int(max_retries))
+        self._backoff_base_s = max(0.0, float(backoff_base_s))
+        self._backoff_max_s = max(self._backoff_base_s, float(backoff_max_s))
+        self._throughput_alpha = min(1.0, max(0.01, float(throughput_alpha)))
+        self._models: dict[str, _ModelState] = {}
+        self._seq = itertools.count()
+
+    @property
+    def available(self) -> bool:
+        return self._client is not None or bool(self._api_key)
+
+    @property
+    def client(self) -> Any:
+        """Shared client on the app's ``llm`` pool; rebuilt when that pool is replaced."""
+        if self._api_key:
+            shared_http = get_outbound_client("llm")
+            if self._client is None or shared_http is not self._client_http:
+                # Retries are owned by the gateway so they can honour the request budget.
+                self._client = openai.AsyncOpenAI(
+                    api_key=self._api_key,
+                    base_url=GROQ_BASE_URL,
+                    http_client=shared_http,
+                    max_retries=0,
+                )
+                self._client_http = shared_http
+        if self._client is None:
+            raise RuntimeError("LLM gateway has no API key configured")
+        return self._client
+
+    async def chat_completion(
+        self,
+        *,
+        model: str,
+        messages: list[dict[str, Any]],
+        purpose: str,
+        priority: LLMPriority = "auxiliary",
+        timeout_s: float | None = None,
+        **params: Any,
+    ) -> Any:
+        """`chat.completions.create` through the model's limits, with budget-aware retries."""
+        effective_priority = _priority_override.get() or priority
+        deadline = self._deadline(timeout_s)
+        estimate = _estimate_tokens(messages, params.get("max_tokens"))
+        attempt = 0
+        while True:
+            await self._acquire(model, effective_priority, estimate, deadline)
+            started_at = time.perf_counter()
+            try:
+                request = self.client.chat.completions.create(
+                    model=model, messages=messages, **params
+                )
+                completion = await _within(request, deadline)
+            except Exception as exc:
+                self._release(model, reserved=estimate, used=None)
+                attempt = await self._after_failure(
+                    exc,
+                    model=model,
+                    purpose=purpose,
+                    priority=effective_priority,
+                    started_at=started_at,
+                    attempt=attempt,
+                    deadline=deadline,
+                    stream=False,
+                )
+                continue
+            usage = getattr(completion, "usage", None)
+            self._release(model, reserved=estimate, used=_total_tokens(usage))
+            self._record_throughput(model, getattr(usage, "completion_tokens", None), started_at)
+            self._observe(
+                model, purpose, effective_priority, started_at, stream=False, outcome="ok", usage=usage
+            )
+            return completion
+
+    @asynccontextmanager
+    async def stream_chat_completion(
+        self,
+        *,
+        model: str,
+        messages: list[dict[str, Any]],
+        purpose: str,
+        priority: LLMPriority = "auxiliary",
+        timeout_s: float | None = None,
+        **params: Any,
+    ) -> AsyncIterator[AsyncIterator[Any]]:
+        """Open a streamed completion; the model slot is held until the block exits."""
+        effective_priority = _priority_override.get() or priority
+        deadline = self._deadline(timeout_s)
+        estimate = _estimate_tokens(messages, params.get("max_tokens"))
+        attempt = 0
+        while True:
+            await self._acquire(model, effective_priority, estimate, deadline)
+            started_at = time.perf_counter()
+            try:
+                request = self.client.chat.completions.create(
+                    model=model, messages=messages, stream=True, **params
+                )
+                response = await _within(request, deadline)
+                break
+            except Exception as exc:
+                self._release(model, reserved=estimate, used=None)
+                attempt = await self._after_failure(
+                    exc,
+                    model=model,
+                    purpose=purpose,
+                    priority=effective_priority,
+                    started_at=started_at,
+                    attempt=attempt,
+                    deadline=deadline,
+                    stream=True,
+                )
+
+        tap = _StreamTap(response)
+        outcome = "error"
+        try:
+            yield tap
+            outcome = "ok"
+        finally:
+            # Without provider usage, one streamed delta approximates one completion token.
+            used = _total_tokens(tap.usage)
+            if used is None and tap.deltas:
+                used = int(estimate - _completion_reserve(params.get("max_tokens"))) + tap.deltas
+            self._release(model, reserved=estimate, used=used)
+            if outcome == "ok":
+                completion_tokens = getattr(tap.usage, "completion_tokens", None)
+                self._record_throughput(
+                    model,
+                    completion_tokens if isinstance(completion_tokens, int) else tap.deltas,
+                    started_at,
+                )
+            self._observe(
+                model,
+                purpose,
+                effective_priority,
+                started_at,
+                stream=True,
+                outcome=outcome,
+                usage=tap.usage,
+                streamed_chunks=tap.deltas,
+            )
+
+    def output_tokens_per_second(self, model: str) -> float | None:
+        """Observed completion throughput for `model` (EWMA), or None before any sample."""
+        state = self._models.get(model)
+        return state.output_tokens_per_second if state is not None else None
+
+    def snapshot(self) -> dict[str, Any]:
+        now = time.monotonic()
+        models: dict[str, Any] = {}
+        for model, state in self._models.items():
+            self._refill(state, now)
+            models[model] = {
+                "in_flight": state.in_flight,
+                "queued": sum(1 for waiter in state.waiters if not waiter.future.done()),
+                "concurrency": state.concurrency,
+                "tokens_per_minute": state.tokens_per_minute or None,
+                "tokens_available": round(state.tokens, 1) if state.tokens_per_minute else None,
+                "blocked_for_ms": round(max(0.0, state.blocked_until - now) * 1000.0, 1),
+                "output_tokens_per_second": (
+                    round(state.output_tokens_per_second, 1)
+                    if state.output_tokens_per_second is not None
+                    else None
+                ),
+            }
+        return {"available": self.available, "models": models}
+
+    # Scheduling -------------------------------------------------------------------------
+
+    def _state(self, model: str) -> _ModelState:
+        state = self._models.get(model)
+        if state is None:
+            tpm = float(self._model_tokens_per_minute.get(model, self._tokens_per_minute) or 0)
+            state = _ModelState(
+                concurrency=max(1, int(self._model_concurrency.get(model, self._max_concurrency))),
+                tokens_per_minute=tpm,
+                tokens=tpm,
+                refilled_at=time.monotonic(),
+            )
+            self._models[model] = state
+        return state
+
+    @staticmethod
+    def _refill(state: _ModelState, now: float) -> None:
+        if state.tokens_per_minute <= 0:
+            return
+        elapsed = max(0.0, now - state.refilled_at)
+        state.tokens = min(
+            state.tokens_per_minute, state.tokens + elapsed * state.tokens_per_minute / 60.0
+        )
+        state.refilled_at = now
+
+    async def _acquire(
+        self, model: str, priority: LLMPriority, tokens: float, deadline: float | None
+    ) -> None:
+        state = self._state(model)
+        waiter = _Waiter(
+            rank=_PRIORITY_RANK.get(priority, 1),
+            seq=next(self._seq),
+            tokens=tokens,
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=time.monotonic(),
+        )
+        heapq.heappush(state.waiters, waiter)
+        self._pump(model)
+        if not waiter.future.done():
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                await asyncio.wait_for(waiter.future, timeout=timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+                if waiter.future.done() and not waiter.future.cancelled():
+                    # Admitted just as we gave up: hand the slot and tokens back.
+                    self._release(model, reserved=tokens, used=0)
+                else:
+                    self._pump(model)
+                if isinstance(exc, asyncio.TimeoutError):
+                    raise LLMBudgetExhausted(f"no LLM capacity for {model} within budget") from None
+                raise
+        latency_histogram_store.observe(
+            "orch_llm_queue_wait_ms",
+            (time.monotonic() - waiter.enqueued_at) * 1000.0,
+            help="Time LLM calls waited for a model slot or token budget, in milliseconds.",
+            model=model,
+            priority=priority,
+        )
+
+    def _pump(self, model: str) -> None:
+        state = self._models.get(model)
+        if state is None:
+            return
+        now = time.monotonic()
+        self._refill(state, now)
+        while state.waiters:
+            head = state.waiters[0]
+            if head.future.done():
+                heapq.heappop(state.waiters)
+                continue
+            if state.in_flight >= state.concurrency:
+                return
+            wait_s = max(0.0, state.blocked_until - now)
+            if state.tokens_per_minute > 0:
+                # A call larger than the whole bucket still runs once the bucket is full.
+                needed = min(head.tokens, state.tokens_per_minute)
+                if state.tokens < needed:
+                    refill_s = (needed - state.tokens) * 60.0 / state.tokens_per_minute
+                    wait_s = max(wait_s, refill_s)
+            if wait_s > 0:
+                self._schedule_pump(model, state, wait_s)
+                return
+            heapq.heappop(state.waiters)
+            state.in_flight += 1
+            if state.tokens_per_minute > 0:
+                state.tokens -= head.tokens
+            head.future.set_result(None)
+
+    def _schedule_pump(self, model: str, state: _ModelState, delay_s: float) -> None:
+        if state.wakeup is not None and not state.wakeup.cancelled():
+            state.wakeup.cancel()
+        loop = asyncio.get_running_loop()
+        state.wakeup = loop.call_later(delay_s, self._pump, model)
+
+    def _release(self, model: str, *, reserved: float, used: int | None) -> None:
+        state = self._models.get(model)
+        if state is None:
+            return
+        state.in_flight = max(0, state.in_flight - 1)
+        if state.tokens_per_minute > 0 and used is not None:
+            # Settle the reservation against actual usage (failed calls keep theirs).
+            state.tokens += reserved - used
+        self._pump(model)
+
+    def _record_throughput(self, model: str, completion_tokens: Any, started_at: float) -> None:
+        if not isinstance(completion_tokens, int) or completion_tokens < _MIN_THROUGHPUT_SAMPLE_TOKENS:
+            return
+        elapsed = time.perf_counter() - started_at
+        if elapsed <= 0:
+            return
+        rate = completion_tokens / elapsed
+        state = self._state(model)
+        if state.output_tokens_per_second is None:
+            state.output_tokens_per_second = rate
+        else:
+            state.output_tokens_per_second += self._throughput_alpha * (
+                rate - state.output_tokens_per_second
+            )
+
+    # Retries ----------------------------------------------------------------------------
+
+    async def _after_failure(
+        self,
+        exc: Exception,
+        *,
+        model: str,
+        purpose: str,
+        priority: LLMPriority,
+        started_at: float,
+        attempt: int,
+        deadline: float | None,
+        stream: bool,
+    ) -> int:
+        """Record the failure and wait out its backoff, or re-raise when it cannot be retried."""
+        rate_limited = isinstance(exc, openai.RateLimitError)
+        outcome = "rate_limited" if rate_limited else "error"
+        if isinstance(exc, (asyncio.TimeoutError, LLMBudgetExhausted)):
+            outcome = "timeout"
+        self._observe(model, purpose, priority, started_at, stream=stream, outcome=outcome)
+
+        delay = self._retry_delay(exc, attempt)
+        if delay is None or attempt >= self._max_retries:
+            raise exc
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            logger.warning(
+                "llm_retry_skipped_budget",
+                model=model,
+                purpose=purpose,
+                retry_after_s=round(delay, 3),
+                remaining_s=round(deadline - time.monotonic(), 3),
+            )
+            raise exc
+        latency_histogram_store.increment(
+            "orch_llm_retries_total",
+            help="LLM calls retried after a rate limit or transient provider error.",
+            model=model,
+            purpose=purpose,
+            reason=outcome,
+        )
+        if rate_limited:
+            # Every caller of this model waits out the provider's window, not just this one.
+            state = self._state(model)
+            state.blocked_until = max(state.blocked_until, time.monotonic() + delay)
+        else:
+            await asyncio.sleep(delay)
+        return attempt + 1
+
+    def _retry_delay(self, exc: Exception, attempt: int) -> float | None:
+        if isinstance(exc, openai.RateLimitError):
+            hinted = _retry_after_seconds(exc)
+            if hinted is not None:
+                return hinted
+        elif not isinstance(exc, (openai.APIConnectionError, openai.InternalServerError)):
+            return None
+        backoff = min(self._backoff_max_s, self._backoff_base_s * (2**attempt))
+        return backoff * random.uniform(0.5, 1.0)
+
+    def _deadline(self, timeout_s: float | None) -> float | None:
+        deadlines = [value for value in (_request_deadline.get(),) if value is not None]
+        if timeout_s is not None:
+            deadlines.append(time.monotonic() + max(0.0, float(timeout_s)))
+        return min(deadlines) if deadlines else None
+
+    # Metrics ----------------------------------------------------------------------------
+
+    @staticmethod
+    def _observe(
+        model: str,
+        purpose: str,
+        priority: LLMPriority,
+        started_at: float,
+        *,
+        stream: bool,
+        outcome: str,
+        usage: Any = None,
+        streamed_chunks: int | None = None,
+    ) -> None:
+        labels = {
+            "model": str(model),
+            "purpose": purpose,
+            "stream": "true" if stream else "false",
+            **current_metric_labels().as_dict(),
+        }
+        latency_histogram_store.observe(
+            "orch_llm_request_duration_ms",
+            (time.perf_counter() - started_at) * 1000,
+            help="LLM chat completion duration in milliseconds.",
+            outcome=outcome,
+            priority=priority,
+            **labels,
+        )
+        prompt_tokens = getattr(usage, "prompt_tokens", None)
+        completion_tokens = getattr(usage, "completion_tokens", None)
+        if completion_tokens is None:
+            completion_tokens = streamed_chunks
+        for kind, count in (("prompt", prompt_tokens), ("completion", completion_tokens)):
+            if isinstance(count, int) and count > 0:
+                latency_histogram_store.increment(
+                    "orch_llm_tokens_total",
+                    count,
+                    help="LLM tokens consumed.",
+                    kind=kind,
+                    **labels,
+                )
+
+
+class _StreamTap:
+    """Pass-through over a streamed completion that counts deltas and keeps the usage."""
+
+    def __init__(self, response: Any) -> None:
+        self._response = response
+        self.deltas = 0
+        self.usage: Any = None
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        async for chunk in self._response:
+            self.usage = getattr(chunk, "usage", None) or self.usage
+            choices = getattr(chunk, "choices", None) or []
+            if choices and getattr(getattr(choices[0], "delta", None), "content", None):
+                self.deltas += 1
+            yield chunk
+
+
+async def _within(awaitable: Any, deadline: float | None) -> Any:
+    if deadline is None:
+        return await awaitable
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise LLMBudgetExhausted("LLM call budget exhausted before the request was sent")
+    return await asyncio.wait_for(awaitable, timeout=remaining)
+
+
+def _completion_reserve(max_tokens: Any) -> int:
+    try:
+        value = int(max_tokens)
+    except (TypeError, ValueError):
+        return _DEFAULT_COMPLETION_TOKENS
+    return value if value > 0 else _DEFAULT_COMPLETION_TOKENS
+
+
+def _estimate_tokens(messages: list[dict[str, Any]], max_tokens: Any) -> float:
+    """Rough prompt size (~4 characters per token) plus the completion reserve."""
+    chars = sum(len(str(message.get("content") or "")) for message in messages)
+    return float(chars // 4 + _completion_reserve(max_tokens))
+
+
+def _total_tokens(usage: Any) -> int | None:
+    total = getattr(usage, "total_tokens", None)
+    if isinstance(total, int):
+        return total
+    prompt = getattr(usage, "prompt_tokens", None)
+    completion = getattr(usage, "completion_tokens", None)
+    if isinstance(prompt, int) and isinstance(completion, int):
+        return prompt + completion
+    return None
+
+
+def _retry_after_seconds(exc: openai.APIStatusError) -> float | None:
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    raw_ms = headers.get("retry-after-ms")
+    if raw_ms:
+        try:
+            return max(0.0, float(raw_ms) / 1000.0)
+        except ValueError:
+            pass
+    raw = headers.get("retry-after")
+    if raw:
+        try:
+            return max(0.0, float(raw))
+        except ValueError:
+            return None
+    return None
+
+
+def _parse_model_limits(raw: str) -> dict[str, int]:
+    limits: dict[str, int] = {}
+    for item in raw.split(","):
+        model, sep, value = item.partition("=")
+        if not sep or not model.strip():
+            continue
+        try:
+            limits[model.strip()] = int(value)
+        except ValueError:
+            logger.warning("llm_model_limit_ignored", entry=item.strip())
+    return limits
+
+
+@lru_cache(maxsize=1)
+def get_llm_gateway() -> LLMGateway:
+    return LLMGateway(
+        api_key=str(getattr(settings, "GROQ_API_KEY", "") or ""),
+        max_concurrency=int(getattr(settings, "ORCH_LLM_MAX_CONCURRENCY_PER_MODEL", 8)),
+        model_concurrency=_parse_model_limits(
+            str(getattr(settings, "ORCH_LLM_MODEL_CONCURRENCY", "") or "")
+        ),
+        tokens_per_minute=int(getattr(settings, "ORCH_LLM_TOKENS_PER_MINUTE", 0) or 0),
+        model_tokens_per_minute=_parse_model_limits(
+            str(getattr(settings, "ORCH_LLM_MODEL_TOKENS_PER_MINUTE", "") or "")
+        ),
+        max_retries=int(getattr(settings, "ORCH_LLM_MAX_RETRIES", 3)),
+        backoff_base_s=float(getattr(settings, "ORCH_LLM_BACKOFF_BASE_MS", 250)) / 1000.0,
+        backoff_max_s=float(getattr(settings, "ORCH_LLM_BACKOFF_MAX_MS", 8000)) / 1000.0,
+    )
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import httpx
+import structlog
+
+from app.infrastructure.config import settings
+from app.infrastructure.metrics.outbound import outbound_pool_metrics_store
+
+logger = structlog.get_logger(__name__)
+
+OutboundPoolName = Literal["supabase", "rag", "llm", "providers"]
+
+
+@dataclass(frozen=True)
+class OutboundPoolConfig:
+    name: OutboundPoolName
+    timeout: httpx.Timeout
+    limits: httpx.Limits
+
+
+class _InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Wraps the pooled transport to feed per-pool latency and status metrics."""
+
+    def __init__(self, pool: str, limits: httpx.Limits) -> None:
+        self._pool_name = pool
+        self._inner = httpx.AsyncHTTPTransport(limits=limits)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        outbound_pool_metrics_store.record_start(self._pool_name)
+        started = time.perf_counter()
+        try:
+            response = await self._inner.handle_async_request(request)
+        except Exception:
+            outbound_pool_metrics_store.record_finish(
+                self._pool_name,
+                elapsed_ms=(time.perf_counter() - started) * 1000.0,
+                failed=True,
+            )
+            raise
+        outbound_pool_metrics_store.record_finish(
+            self._pool_name,
+            elapsed_ms=(time.perf_counter() - started) * 1000.0,
+            status_code=response.status_code,
+            failed=response.status_code >= 500,
+        )
+        return response
+
+    def open_connections(self) -> int | None:
+        pool = getattr(self._inner, "_pool", None)
+        connections = getattr(pool, "connections", None)
+        return len(connections) if connections is not None else None
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+def _pool_config(
+    name: OutboundPoolName, *, timeout_seconds: float, max_connections: int
+) -> OutboundPoolConfig:
+    timeout = max(0.1, float(timeout_seconds))
+    connections = max(1, int(max_connections))
+    return OutboundPoolConfig(
+        name=name,
+        timeout=httpx.Timeout(timeout, connect=min(3.0, timeout)),
+        limits=httpx.Limits(
+            max_connections=connections,
+            max_keepalive_connections=max(1, connections // 2),
+            keepalive_expiry=float(settings.ORCH_HTTP_KEEPALIVE_EXPIRY_SECONDS),
+        ),
+    )
+
+
+def outbound_pool_configs() -> dict[OutboundPoolName, OutboundPoolConfig]:
+    # Local import: rag_client depends on backend_selector, which uses this module.
+    from app.infrastructure.clients.rag_client import _rag_http_limits, _rag_http_timeout
+
+    return {
+        "supabase": _pool_config(
+            "supabase",
+            timeout_seconds=settings.ORCH_HTTP_SUPABASE_TIMEOUT_SECONDS,
+            max_connections=settings.ORCH_HTTP_SUPABASE_MAX_CONNECTIONS,
+        ),
+        # RAG traffic keeps its dedicated RAG_HTTP_* tuning.
+        "rag": OutboundPoolConfig(
+            name="rag", timeout=_rag_http_timeout(), limits=_rag_http_limits()
+        ),
+        "llm": _pool_config(
+            "llm",
+            timeout_seconds=settings.ORCH_HTTP_LLM_TIMEOUT_SECONDS,
+            max_connections=settings.ORCH_HTTP_LLM_MAX_CONNECTIONS,
+        ),
+        "providers": _pool_config(
+            "providers",
+            timeout_seconds=settings.ORCH_HTTP_PROVIDERS_TIMEOUT_SECONDS,
+            max_connections=settings.ORCH_HTTP_PROVIDERS_MAX_CONNECTIONS,
+        ),
+    }
+
+
+class OutboundClientRegistry:
+    """Named, separately tuned outbound httpx pools owned by the app lifespan."""
+
+    def __init__(
+        self,
+        clients: dict[str, httpx.AsyncClient],
+        transports: dict[str, _InstrumentedTransport] | None = None,
+    ) -> None:
+        self._clients = dict(clients)
+        self._transports = dict(transports or {})
+
+    def get(self, pool: OutboundPoolName) -> httpx.AsyncClient | None:
+        return self._clients.get(pool)
+
+    def snapshot(self) -> dict[str, Any]:
+        connections: dict[str, int] = {}
+        for name, transport in self._transports.items():
+            count = transport.open_connections()
+            if count is not None:
+                connections[name] = count
+        return outbound_pool_metrics_store.snapshot(connections=connections)
+
+    async def aclose(self) -> None:
+        for name, client in self._clients.items():
+            try:
+                await client.aclose()
+            except Exception as exc:
+                logger.warning("outbound_pool_close_failed", pool=name, error=str(exc)[:160])
+
+
+def build_outbound_client_registry() -> OutboundClientRegistry:
+    clients: dict[str, httpx.AsyncClient] = {}
+    transports: dict[str, _InstrumentedTransport] = {}
+    for name, config in outbound_pool_configs().items():
+        transport = _InstrumentedTransport(name, config.limits)
+        transports[name] = transport
+        clients[name] = httpx.AsyncClient(timeout=config.timeout, transport=transport)
+    return OutboundClientRegistry(clients, transports)
+
+
+_ACTIVE_REGISTRY: OutboundClientRegistry | None = None
+
+
+def install_outbound_client_registry(registry: OutboundClientRegistry | None) -> None:
+    global _ACTIVE_REGISTRY
+    _ACTIVE_REGISTRY = registry
+
+
+def get_outbound_client_registry() -> OutboundClientRegistry | None:
+    return _ACTIVE_REGISTRY
+
+
+def get_outbound_client(pool: OutboundPoolName) -> httpx.AsyncClient | None:
+    registry = _ACTIVE_REGISTRY
+    return registry.get(pool) if registry is not None else None
+
+
+async def outbound_get(
+    pool: OutboundPoolName,
+    url: str,
+    *,
+    timeout: float | httpx.Timeout,
+    params: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
+) -> httpx.Response:
+    """GET through the named shared pool, or a one-shot client outside the app lifespan."""
+    kwargs: dict[str, Any] = {}
+    if params is not None:
+        kwargs["params"] = params
+    if headers is not None:
+        kwargs["headers"] = headers
+    shared = get_outbound_client(pool)
+    if shared is not None:
+        return await shared.get(url, timeout=timeout, **kwargs)
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        return await client.get(url, **kwargs)
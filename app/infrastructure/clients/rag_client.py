@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from dataclasses import dataclass
@@ -11,8 +12,16 @@ import httpx
 import structlog
 
 from .backend_selector import RagBackendSelector
+from .hedging import HedgePolicy, get_hedge_policy
+from .retrieval_cache import (
+    RetrievalResponseCache,
+    current_batch_retrieval_cache,
+    retrieval_cache_key,
+)
 from app.infrastructure.config import settings
+from app.infrastructure.metrics.histograms import current_metric_labels, latency_histogram_store
 from app.infrastructure.metrics.retrieval import retrieval_metrics_store
+from app.infrastructure.observability.tracing import inject_trace_headers, start_span
 
 
 logger = structlog.get_logger(__name__)
@@ -50,18 +59,13 @@ class RagRetrievalContractClient:
     timeout_seconds: float = 20.0
     backend_selector: RagBackendSelector | None = None
     http_client: httpx.AsyncClient | None = None
+    response_cache: RetrievalResponseCache | None = None
+    hedge_policy: HedgePolicy | None = None
     _owns_http_client: bool = False
 
     def __post_init__(self) -> None:
         if self.backend_selector is None:
-            self.backend_selector = RagBackendSelector(
-                local_url=str(settings.RAG_ENGINE_LOCAL_URL or "http://localhost:8000"),
-                docker_url=str(settings.RAG_ENGINE_DOCKER_URL or "http://localhost:8000"),
-                health_path=str(settings.RAG_ENGINE_HEALTH_PATH or "/health"),
-                probe_timeout_ms=int(settings.RAG_ENGINE_PROBE_TIMEOUT_MS or 300),
-                ttl_seconds=int(settings.RAG_ENGINE_BACKEND_TTL_SECONDS or 20),
-                force_backend=settings.RAG_ENGINE_FORCE_BACKEND,
-            )
+            self.backend_selector = RagBackendSelector.from_settings()
 
         if not settings.RAG_SERVICE_SECRET:
             raise RuntimeError("RAG_SERVICE_SECRET must be configured for production security")
@@ -70,15 +74,19 @@ class RagRetrievalContractClient:
             self.http_client = build_rag_http_client(timeout_seconds=self.timeout_seconds)
             self._owns_http_client = True
 
+        if self.hedge_policy is None and bool(getattr(settings, "ORCH_RAG_HEDGE_ENABLED", False)):
+            self.hedge_policy = get_hedge_policy()
+
     @asynccontextmanager
     async def _record_metrics(self, endpoint: str) -> AsyncIterator[None]:
         retrieval_metrics_store.record_request(endpoint)
-        try:
-            yield
-            retrieval_metrics_store.record_success(endpoint)
-        except Exception:
-            retrieval_metrics_store.record_failure(endpoint)
-            raise
+        with start_span(f"rag.{endpoint}", endpoint=endpoint):
+            try:
+                yield
+                retrieval_metrics_store.record_success(endpoint)
+            except Exception:
+                retrieval_metrics_store.record_failure(endpoint)
+                raise
 
     async def aclose(self) -> None:
         if self._owns_http_client and self.http_client is not None:
@@ -146,7 +154,7 @@ class RagRetrievalContractClient:
             "retrieval_policy": retrieval_policy,
             "retrieval_plan": retrieval_plan,
         }
-        async with self._record_metrics("comprehensive"):
+        async def _load() -> dict[str, Any]:
             return await self._dispatch(
                 "/api/v1/retrieval/comprehensive",
                 payload,
@@ -157,6 +165,37 @@ class RagRetrievalContractClient:
                 correlation_id=correlation_id,
             )
 
+        async with self._record_metrics("comprehensive"):
+            shared_cache = self.response_cache
+            batch_cache = current_batch_retrieval_cache()
+            # `RetrievalResponseCache` defines `__len__`, so an empty cache is falsy.
+            cache = batch_cache if batch_cache is not None else shared_cache
+            if cache is None:
+                return await _load()
+            # Identity is part of the address so RAG-side ACLs can never leak across users.
+            key = retrieval_cache_key("comprehensive", {**payload, "user_id": user_id})
+
+            async def _load_shared() -> dict[str, Any]:
+                # Batch misses still go through the shared cache and its coalescing.
+                assert shared_cache is not None
+                value, _ = await shared_cache.get_or_load(key, _load)
+                return value
+
+            layered = batch_cache is not None and shared_cache is not None
+            result, outcome = await cache.get_or_load(key, _load_shared if layered else _load)
+            if outcome == "hit":
+                retrieval_metrics_store.record_cache_hit("comprehensive")
+            elif outcome == "coalesced":
+                retrieval_metrics_store.record_cache_coalesced("comprehensive")
+            if outcome != "miss":
+                logger.debug(
+                    "rag_retrieval_cache_served",
+                    endpoint="comprehensive",
+                    outcome=outcome,
+                    tenant_id=tenant_id,
+                )
+            return result
+
     async def explain(
         self,
         *,
@@ -205,13 +244,14 @@ class RagRetrievalContractClient:
     ) -> list[dict[str, Any]]:
         selector = self.backend_selector
         assert selector is not None
-        base_url = await selector.resolve_base_url()
+        backend = await selector.current_backend()
         path = "/api/v1/ingestion/collections"
         params = {"tenant_id": tenant_id}
 
         async with self._record_metrics("list_collections"):
             payload = await self._get_once(
-                base_url=base_url,
+                backend=backend,
+                base_url=selector.base_url_for(backend),
                 path=path,
                 params=params,
                 tenant_id=tenant_id,
@@ -236,9 +276,11 @@ class RagRetrievalContractClient:
         assert selector is not None
 
         primary_backend = await selector.current_backend()
-        primary_base_url = await selector.resolve_base_url()
+        primary_base_url = selector.base_url_for(primary_backend)
         try:
-            return await self._post_once(
+            return await self._post_hedged(
+                endpoint=endpoint,
+                backend=primary_backend,
                 base_url=primary_base_url,
                 path=path,
                 payload=payload,
@@ -266,6 +308,97 @@ class RagRetrievalContractClient:
                 tenant_id, user_id, request_id, correlation_id, exc
             )
 
+    async def _post_hedged(
+        self, *, endpoint: str, backend: str, base_url: str, **kwargs: Any
+    ) -> dict[str, Any]:
+        """POST to `backend`; past the endpoint's p90 latency, race a hedge and keep the winner."""
+        policy = self.hedge_policy
+        if policy is None or not policy.applies_to(endpoint):
+            return await self._post_tracked(backend=backend, base_url=base_url, **kwargs)
+
+        policy.record_request(endpoint)
+        started_at = time.perf_counter()
+        delay = policy.hedge_delay_seconds(endpoint)
+        primary = asyncio.create_task(
+            self._post_tracked(backend=backend, base_url=base_url, **kwargs)
+        )
+        tasks = {primary}
+        try:
+            if delay is not None:
+                await asyncio.wait(tasks, timeout=delay)
+            if primary.done() or delay is None:
+                return await primary
+            if not policy.try_acquire(endpoint):
+                retrieval_metrics_store.record_hedge_budget_exhausted(endpoint)
+                return await primary
+
+            selector = self.backend_selector
+            assert selector is not None
+            hedge_backend = selector.alternate_backend(backend) or backend
+            hedge = asyncio.create_task(
+                self._post_tracked(
+                    backend=hedge_backend,
+                    base_url=selector.base_url_for(hedge_backend),
+                    **kwargs,
+                )
+            )
+            tasks.add(hedge)
+            retrieval_metrics_store.record_hedge(endpoint)
+            logger.info(
+                "rag_hedge_fired",
+                endpoint=endpoint,
+                primary_backend=backend,
+                hedge_backend=hedge_backend,
+                delay_ms=round(delay * 1000, 2),
+            )
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is None:
+                    continue
+                if winner is hedge:
+                    retrieval_metrics_store.record_hedge_win(endpoint)
+                else:
+                    retrieval_metrics_store.record_hedge_loss(endpoint)
+                return winner.result()
+            # Both attempts failed: surface the primary error so fallback handling applies.
+            return primary.result()
+        finally:
+            # The delay tracks the primary backend's own latency, not the race's. A primary
+            # still running here is about to be cancelled, so its elapsed time is a lower
+            # bound; a failed primary says nothing about how long a success takes.
+            if not primary.done() or (not primary.cancelled() and primary.exception() is None):
+                policy.record_latency(endpoint, (time.perf_counter() - started_at) * 1000)
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _post_tracked(self, *, backend: str, **kwargs: Any) -> dict[str, Any]:
+        """POST once and feed the outcome into the backend's circuit breaker."""
+        selector = self.backend_selector
+        assert selector is not None
+        started_at = time.perf_counter()
+        ok: bool | None = False
+        try:
+            result = await self._post_once(**kwargs)
+            ok = True
+            return result
+        except httpx.HTTPStatusError as exc:
+            # 4xx means the backend is up and answered; only 5xx counts against it.
+            ok = exc.response is not None and exc.response.status_code < 500
+            raise
+        except asyncio.CancelledError:
+            # A cancelled hedge loser says nothing about the backend's health.
+            ok = None
+            raise
+        finally:
+            if ok is not None:
+                selector.record_result(
+                    backend, ok=ok, latency_ms=(time.perf_counter() - started_at) * 1000
+                )
+
     async def _handle_fallback(
         self,
         primary_backend: str,
@@ -283,6 +416,9 @@ class RagRetrievalContractClient:
         assert selector is not None
         
         alternate_backend = selector.alternate_backend(primary_backend)
+        if alternate_backend is None:
+            # Every other backend is unhealthy or has an open circuit.
+            raise original_exc
         alternate_base_url = selector.base_url_for(alternate_backend)
         retrieval_metrics_store.record_fallback_retry(endpoint)
         
@@ -293,7 +429,8 @@ class RagRetrievalContractClient:
             path=path,
             error=str(original_exc),
         )
-        response = await self._post_once(
+        return await self._post_tracked(
+            backend=alternate_backend,
             base_url=alternate_base_url,
             path=path,
             payload=payload,
@@ -302,8 +439,6 @@ class RagRetrievalContractClient:
             request_id=request_id,
             correlation_id=correlation_id,
         )
-        selector.set_backend(alternate_backend)
-        return response
 
 
     def _build_headers(
@@ -325,7 +460,7 @@ class RagRetrievalContractClient:
             headers["X-Request-ID"] = str(request_id)
         if user_id:
             headers["X-User-ID"] = user_id
-        return headers
+        return inject_trace_headers(headers)
 
     def _log_timeout(self, path: str, base_url: str, started_at: float, client: httpx.AsyncClient) -> None:
         elapsed_ms = int((time.perf_counter() - started_at) * 1000)
@@ -365,18 +500,27 @@ class RagRetrievalContractClient:
             self._owns_http_client = True
 
         started_at = time.perf_counter()
+        status = "error"
         try:
             response = await client.post(url, json=payload, headers=headers)
+            status = str(response.status_code)
             response.raise_for_status()
             data = response.json()
             return data if isinstance(data, dict) else {"items": data}
         except httpx.TimeoutException:
+            status = "timeout"
             self._log_timeout(path, base_url, started_at, client)
             raise
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        finally:
+            self._observe_latency(path, tenant_id, status, started_at)
 
     async def _get_once(
         self,
         *,
+        backend: str,
         base_url: str,
         path: str,
         params: dict[str, Any],
@@ -398,10 +542,41 @@ class RagRetrievalContractClient:
             self._owns_http_client = True
 
         started_at = time.perf_counter()
+        status = "error"
+        ok: bool | None = False
         try:
             response = await client.get(url, params=params, headers=headers)
+            status = str(response.status_code)
             response.raise_for_status()
+            ok = True
             return response.json()
+        except httpx.HTTPStatusError as exc:
+            ok = exc.response is None or exc.response.status_code < 500
+            raise
         except httpx.TimeoutException:
+            status = "timeout"
             self._log_timeout(path, base_url, started_at, client)
             raise
+        except asyncio.CancelledError:
+            status = "cancelled"
+            ok = None
+            raise
+        finally:
+            self._observe_latency(path, tenant_id, status, started_at)
+            if ok is not None and self.backend_selector is not None:
+                self.backend_selector.record_result(
+                    backend, ok=ok, latency_ms=(time.perf_counter() - started_at) * 1000
+                )
+
+    @staticmethod
+    def _observe_latency(path: str, tenant_id: str, status: str, started_at: float) -> None:
+        labels = current_metric_labels()
+        latency_histogram_store.observe(
+            "orch_rag_request_duration_ms",
+            (time.perf_counter() - started_at) * 1000,
+            help="RAG engine request duration in milliseconds.",
+            path=path,
+            status=status,
+            tenant=str(tenant_id or labels.tenant_id),
+            profile=labels.profile_id,
+        )
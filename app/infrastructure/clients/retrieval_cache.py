@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Awaitable, Callable, Iterator, Literal
+
+from app.infrastructure.config import settings
+
+CacheOutcome = Literal["hit", "coalesced", "miss"]
+
+
+def retrieval_cache_key(endpoint: str, payload: dict[str, Any]) -> str:
+    """Content address of a retrieval request: canonical JSON of the payload."""
+    canonical = json.dumps(
+        {"endpoint": endpoint, "payload": payload},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _CacheEntry:
+    value: dict[str, Any]
+    size_bytes: int
+    expires_at: float
+
+
+class RetrievalResponseCache:
+    """Short-TTL, memory-bounded response cache with single-flight request coalescing."""
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int, max_bytes: int) -> None:
+        self._ttl_seconds = max(0.1, float(ttl_seconds))
+        self._max_entries = max(1, int(max_entries))
+        self._max_bytes = max(1, int(max_bytes))
+        self._lock = Lock()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._total_bytes = 0
+        self._inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> tuple[dict[str, Any], CacheOutcome]:
+        while True:
+            cached = self._lookup(key)
+            if cached is not None:
+                return copy.deepcopy(cached), "hit"
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                value = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # The leader was cancelled, not us: retry (and possibly become the leader).
+                if inflight.cancelled():
+                    continue
+                raise
+            return copy.deepcopy(value), "coalesced"
+
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark the exception as retrieved when nobody coalesced onto this call.
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        # Followers and the cache share a private snapshot so the caller may mutate `value`.
+        snapshot = copy.deepcopy(value)
+        if isinstance(snapshot, dict):
+            self._store(key, snapshot)
+        future.set_result(snapshot)
+        return value, "miss"
+
+    def _lookup(self, key: str) -> dict[str, Any] | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= now:
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def _store(self, key: str, value: dict[str, Any]) -> None:
+        size = len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _CacheEntry(
+                value=value,
+                size_bytes=size,
+                expires_at=time.monotonic() + self._ttl_seconds,
+            )
+            self._total_bytes += size
+            while self._entries and (
+                len(self._entries) > self._max_entries or self._total_bytes > self._max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+@lru_cache(maxsize=1)
+def get_retrieval_response_cache() -> RetrievalResponseCache:
+    return RetrievalResponseCache(
+        ttl_seconds=float(getattr(settings, "ORCH_RETRIEVAL_CACHE_TTL_SECONDS", 30) or 30),
+        max_entries=int(getattr(settings, "ORCH_RETRIEVAL_CACHE_MAX_ENTRIES", 128) or 128),
+        max_bytes=int(
+            getattr(settings, "ORCH_RETRIEVAL_CACHE_MAX_BYTES", 32 * 1024 * 1024)
+            or 32 * 1024 * 1024
+        ),
+    )
+
+
+_batch_cache: ContextVar[RetrievalResponseCache | None] = ContextVar(
+    "orch_batch_retrieval_cache", default=None
+)
+
+# Outlives any realistic batch; entries go away with the cache when the batch ends.
+_BATCH_CACHE_TTL_SECONDS = 3600.0
+
+
+def new_batch_retrieval_cache() -> RetrievalResponseCache:
+    """Cache shared by the items of one batch request, independent of the shared TTL."""
+    return RetrievalResponseCache(
+        ttl_seconds=_BATCH_CACHE_TTL_SECONDS,
+        max_entries=int(getattr(settings, "ORCH_BATCH_MAX_ITEMS", 500) or 500) * 4,
+        max_bytes=int(
+            getattr(settings, "ORCH_RETRIEVAL_CACHE_MAX_BYTES", 32 * 1024 * 1024)
+            or 32 * 1024 * 1024
+        ),
+    )
+
+
+def current_batch_retrieval_cache() -> RetrievalResponseCache | None:
+    return _batch_cache.get()
+
+
+@contextmanager
+def bind_batch_retrieval_cache(cache: RetrievalResponseCache) -> Iterator[RetrievalResponseCache]:
+    """Dedupe identical retrieval payloads across every task started inside this block."""
+    token = _batch_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _batch_cache.reset(token)
@@ -30,6 +30,13 @@ class Settings(BaseSettings):
     RAG_ENGINE_PROBE_TIMEOUT_MS: int = 300
     RAG_ENGINE_BACKEND_TTL_SECONDS: int = 20
     RAG_ENGINE_FORCE_BACKEND: str | None = None
+    # Optional "name=url,name=url" list; overrides the local/docker pair when set.
+    RAG_ENGINE_ENDPOINTS: str | None = None
+    RAG_ENGINE_BREAKER_WINDOW_SECONDS: float = 30.0
+    RAG_ENGINE_BREAKER_MIN_REQUESTS: int = 5
+    RAG_ENGINE_BREAKER_ERROR_RATE: float = 0.5
+    RAG_ENGINE_BREAKER_SLOW_CALL_MS: float = 8000.0
+    RAG_ENGINE_BREAKER_OPEN_SECONDS: float = 15.0
     RAG_PROVIDER: str = "jina"  # jina | cohere
     JINA_API_KEY: str | None = None
     JINA_EMBED_URL: str = "https://api.jina.ai/v1/embeddings"
@@ -52,6 +59,15 @@ class Settings(BaseSettings):
     RAG_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 50
     RAG_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
 
+    # Shared outbound pools for Supabase REST/auth, LLM and embedding/rerank providers.
+    ORCH_HTTP_SUPABASE_TIMEOUT_SECONDS: float = 5.0
+    ORCH_HTTP_SUPABASE_MAX_CONNECTIONS: int = 50
+    ORCH_HTTP_LLM_TIMEOUT_SECONDS: float = 60.0
+    ORCH_HTTP_LLM_MAX_CONNECTIONS: int = 100
+    ORCH_HTTP_PROVIDERS_TIMEOUT_SECONDS: float = 20.0
+    ORCH_HTTP_PROVIDERS_MAX_CONNECTIONS: int = 50
+    ORCH_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+
     # Retrieval contract orchestration.
     ORCH_MULTIHOP_FALLBACK: bool = True
     ORCH_SEMANTIC_PLANNER: bool = False
@@ -86,6 +102,11 @@ class Settings(BaseSettings):
     ORCH_TIMEOUT_VALIDATE_MS: int = 5000  # Citation validation: typically <1s
     ORCH_TIMEOUT_TOTAL_MS: int = 150000  # Full pipeline: worst case ~40s + 20s headroom
 
+    # Reasoning-plan execution: steps whose dependencies are met run concurrently in one
+    # graph hop; reflection only runs on failures or retrieval retry signals.
+    ORCH_PLAN_DAG_ENABLED: bool = True
+    ORCH_PLAN_MAX_PARALLEL_STEPS: int = 4
+
     # Retrieval-stage budgets for advanced contract orchestration.
     # These are INNER timeouts within EXECUTE_TOOL, must be < ORCH_TIMEOUT_EXECUTE_TOOL_MS.
     ORCH_TIMEOUT_RETRIEVAL_HYBRID_MS: int = 25000  # Single hybrid call: simple=3s, multihop=18s
@@ -100,6 +121,13 @@ class Settings(BaseSettings):
     ORCH_COVERAGE_REQUIRED: bool = True
     ORCH_SCOPE_BALANCE_FINAL_ENABLED: bool = True
     ORCH_SCOPE_BALANCE_MIN_PER_SCOPE: int = 2
+    # Synthesis context packing: near-duplicate chunks (shingle resemblance) are dropped
+    # and the rest fills a per-mode token budget, long chunks cut to their best sentences.
+    ORCH_CONTEXT_TOKEN_BUDGET_DEFAULT: int = 4000
+    ORCH_CONTEXT_TOKEN_BUDGET_LITERAL: int = 3200
+    ORCH_CONTEXT_TOKEN_BUDGET_CROSS_SCOPE: int = 6400
+    ORCH_CONTEXT_CHUNK_MAX_TOKENS: int = 225
+    ORCH_CONTEXT_DEDUPE_THRESHOLD: float = 0.8
     ORCH_COVERAGE_AUTO_PARTIAL_COMPARATIVA: bool = True
     ORCH_LITERAL_LOCK_ENABLED: bool = True
     ORCH_LITERAL_REF_MIN_COVERAGE_RATIO: float = 0.7
@@ -138,6 +166,7 @@ class Settings(BaseSettings):
     ORCH_AGENT_PROFILE_HEADER: str = "X-Agent-Profile"
     ORCH_DEV_PROFILE_ASSIGNMENTS_ENABLED: bool = True
     ORCH_DEV_PROFILE_ASSIGNMENTS_FILE: str = ".state/tenant_profile_assignments.json"
+    ORCH_DEV_PROFILE_ASSIGNMENTS_RECHECK_SECONDS: float = 2.0
 
     # Optional DB-backed profile override (tenant private profiles)
     ORCH_PROFILE_DB_ENABLED: bool = False
@@ -150,6 +179,67 @@ class Settings(BaseSettings):
     ORCH_PROFILE_DB_UPDATED_COLUMN: str = "updated_at"
     ORCH_PROFILE_DB_TIMEOUT_SECONDS: float = 1.8
     ORCH_PROFILE_DB_CACHE_TTL_SECONDS: int = 60
+    ORCH_PROFILE_DB_CACHE_STALE_SECONDS: float = 300.0
+    ORCH_PROFILE_DB_CACHE_NEGATIVE_TTL_SECONDS: float = 30.0
+    ORCH_PROFILE_DB_CACHE_MAX_ENTRIES: int = 1024
+    # Resolved profiles keyed by (tenant, requested X-Agent-Profile); LRU-bounded.
+    ORCH_PROFILE_RESOLUTION_CACHE_MAX_ENTRIES: int = 4096
+    # Roles allowed to reload profile YAML, which drops cached resolutions of every tenant.
+    ORCH_PROFILE_RELOAD_ROLES: str = "admin,service_role"
+
+    # Tenant membership cache (LRU, single-flight, stale-while-revalidate).
+    ORCH_MEMBERSHIP_CACHE_TTL_SECONDS: float = 300.0
+    ORCH_MEMBERSHIP_CACHE_STALE_SECONDS: float = 120.0
+    ORCH_MEMBERSHIP_CACHE_NEGATIVE_TTL_SECONDS: float = 15.0
+    ORCH_MEMBERSHIP_CACHE_MAX_ENTRIES: int = 4096
+
+    # Verified JWT claims cache and background JWKS refresh for get_current_user.
+    ORCH_AUTH_CLAIMS_CACHE_MAX_ENTRIES: int = 10000
+    ORCH_AUTH_NEGATIVE_TTL_SECONDS: float = 30.0
+    ORCH_AUTH_FALLBACK_CLAIMS_TTL_SECONDS: float = 60.0
+    ORCH_AUTH_JWKS_REFRESH_SECONDS: float = 600.0
+    ORCH_AUTH_JWKS_MIN_REFRESH_INTERVAL_SECONDS: float = 30.0
+    # An unknown kid never waits for a new fetch; it only waits this long for one already in flight.
+    ORCH_AUTH_JWKS_UNKNOWN_KID_WAIT_MS: int = 50
+
+    # Orchestrated answer cache (invalidated per tenant/collection on re-ingest).
+    ORCH_ANSWER_CACHE_ENABLED: bool = True
+    ORCH_ANSWER_CACHE_TTL_SECONDS: int = 900
+    ORCH_ANSWER_CACHE_MAX_ENTRIES: int = 512
+
+    # Short-lived comprehensive retrieval cache with single-flight coalescing.
+    ORCH_RETRIEVAL_CACHE_ENABLED: bool = True
+    ORCH_RETRIEVAL_CACHE_TTL_SECONDS: float = 30.0
+    ORCH_RETRIEVAL_CACHE_MAX_ENTRIES: int = 128
+    ORCH_RETRIEVAL_CACHE_MAX_BYTES: int = 33554432
+
+    # Admission control in front of the answer use case: global and per-tenant concurrency,
+    # a bounded weighted-fair queue (weights as "tenant=2,other=0.5") and queue-time shedding.
+    ORCH_ADMISSION_ENABLED: bool = True
+    ORCH_ADMISSION_MAX_CONCURRENT: int = 32
+    ORCH_ADMISSION_TENANT_MAX_CONCURRENT: int = 8
+    ORCH_ADMISSION_MAX_QUEUE: int = 256
+    ORCH_ADMISSION_TENANT_WEIGHTS: str = ""
+
+    # Batch QA endpoint: questions answered concurrently per batch, and the item cap
+    # (nightly audit checklists run 200-500 questions in a single batch).
+    ORCH_BATCH_MAX_CONCURRENCY: int = 4
+    ORCH_BATCH_MAX_ITEMS: int = 500
+
+    # Hedged RAG requests: race a second call once the first exceeds the rolling p90.
+    ORCH_RAG_HEDGE_ENABLED: bool = False
+    ORCH_RAG_HEDGE_ENDPOINTS: str = "comprehensive"
+    ORCH_RAG_HEDGE_MAX_RATIO: float = 0.1
+    ORCH_RAG_HEDGE_BURST: float = 5.0
+    ORCH_RAG_HEDGE_PERCENTILE: float = 0.9
+    ORCH_RAG_HEDGE_MIN_SAMPLES: int = 20
+    ORCH_RAG_HEDGE_MIN_DELAY_MS: float = 50.0
+
+    # OpenTelemetry tracing (requires the opentelemetry SDK packages).
+    ORCH_OTEL_ENABLED: bool = False
+    ORCH_OTEL_EXPORTER: str = "otlp"  # otlp | console | memory
+    ORCH_OTEL_EXPORTER_ENDPOINT: str | None = None
+    ORCH_OTEL_SERVICE_NAME: str = "cire-orch"
 
     QA_LITERAL_SEMANTIC_FALLBACK_ENABLED: bool = True
     QA_LITERAL_SEMANTIC_MIN_KEYWORD_OVERLAP: int = 2
@@ -168,6 +258,30 @@ class Settings(BaseSettings):
     GROQ_MODEL_ORCHESTRATION: str = "openai/gpt-oss-20b"
     GROQ_MODEL_SUMMARIZATION: str = "openai/gpt-oss-120b"
 
+    # LLM gateway: per-model concurrency and tokens-per-minute (0 = unlimited), with
+    # overrides as "model=value,other=value"; retries honour retry-after and the budget.
+    ORCH_LLM_MAX_CONCURRENCY_PER_MODEL: int = 8
+    ORCH_LLM_MODEL_CONCURRENCY: str = ""
+    ORCH_LLM_TOKENS_PER_MINUTE: int = 0
+    ORCH_LLM_MODEL_TOKENS_PER_MINUTE: str = ""
+    ORCH_LLM_MAX_RETRIES: int = 3
+    ORCH_LLM_BACKOFF_BASE_MS: int = 250
+    ORCH_LLM_BACKOFF_MAX_MS: int = 8000
+
+    # Synthesis model cascade: simple/literal queries use GROQ_MODEL_LIGHTWEIGHT and are
+    # regenerated with GROQ_MODEL_CHAT when validation rejects the draft and time allows.
+    ORCH_MODEL_CASCADE_ENABLED: bool = True
+    ORCH_MODEL_CASCADE_LIGHT_MAX_EVIDENCE: int = 8
+    ORCH_MODEL_CASCADE_ESCALATION_MIN_MS: int = 3000
+
+    # Output-token budget for final synthesis: max_tokens follows the time left and the
+    # model's observed tokens/second; tight budgets also drop trailing contract sections.
+    ORCH_LLM_DEFAULT_OUTPUT_TOKENS_PER_SECOND: float = 150.0
+    ORCH_SYNTHESIS_OUTPUT_SAFETY: float = 0.8
+    ORCH_SYNTHESIS_MIN_OUTPUT_TOKENS: int = 256
+    ORCH_SYNTHESIS_MAX_OUTPUT_TOKENS: int = 4096
+    ORCH_SYNTHESIS_TOKENS_PER_SECTION: int = 200
+
     RAG_SERVICE_SECRET: str | None = Field(default=None, validation_alias="RAG_SERVICE_SECRET")
     ORCH_AUTH_REQUIRED: bool = True
     ORCH_DEV_TENANT_CREATE_ENABLED: bool = False
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from threading import Lock
+from typing import Any
+
+from app.infrastructure.metrics.histograms import latency_histogram_store
+
+QUEUE_DEPTH_BUCKETS: tuple[float, ...] = (0, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+
+@dataclass
+class _TenantAdmissionMetrics:
+    admitted_total: int = 0
+    queued_total: int = 0
+    shed_queue_full_total: int = 0
+    shed_slo_total: int = 0
+    shed_timeout_total: int = 0
+    in_flight: int = 0
+    queue_depth: int = 0
+
+
+class AdmissionMetricsStore:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._metrics: dict[str, _TenantAdmissionMetrics] = defaultdict(_TenantAdmissionMetrics)
+
+    @staticmethod
+    def _tenant(tenant_id: str | None) -> str:
+        return str(tenant_id or "unknown")
+
+    def record_queued(self, tenant_id: str | None, *, depth: int) -> None:
+        """`depth` is the global queue depth the request found when it joined."""
+        tenant = self._tenant(tenant_id)
+        with self._lock:
+            item = self._metrics[tenant]
+            item.queued_total += 1
+            item.queue_depth += 1
+        latency_histogram_store.observe(
+            "orch_admission_queue_depth",
+            depth,
+            help="Admission queue depth seen by requests that had to wait.",
+            buckets=QUEUE_DEPTH_BUCKETS,
+            tenant=tenant,
+        )
+
+    def record_dequeued(self, tenant_id: str | None) -> None:
+        with self._lock:
+            item = self._metrics[self._tenant(tenant_id)]
+            item.queue_depth = max(0, item.queue_depth - 1)
+
+    def record_admitted(self, tenant_id: str | None, *, waited_ms: float) -> None:
+        tenant = self._tenant(tenant_id)
+        with self._lock:
+            item = self._metrics[tenant]
+            item.admitted_total += 1
+            item.in_flight += 1
+        self._observe_wait(tenant, waited_ms, outcome="admitted")
+
+    def record_released(self, tenant_id: str | None) -> None:
+        with self._lock:
+            item = self._metrics[self._tenant(tenant_id)]
+            item.in_flight = max(0, item.in_flight - 1)
+
+    def record_shed(self, tenant_id: str | None, *, reason: str, waited_ms: float = 0.0) -> None:
+        tenant = self._tenant(tenant_id)
+        field_name = f"shed_{reason}_total"
+        with self._lock:
+            item = self._metrics[tenant]
+            setattr(item, field_name, getattr(item, field_name) + 1)
+        self._observe_wait(tenant, waited_ms, outcome=f"shed_{reason}")
+
+    @staticmethod
+    def _observe_wait(tenant: str, waited_ms: float, *, outcome: str) -> None:
+        latency_histogram_store.observe(
+            "orch_admission_wait_ms",
+            waited_ms,
+            help="Time spent in the admission queue in milliseconds.",
+            tenant=tenant,
+            outcome=outcome,
+        )
+
+    def snapshot(self, tenant_id: str | None = None) -> dict[str, Any]:
+        with self._lock:
+            if tenant_id:
+                key = self._tenant(tenant_id)
+                return {"tenant_id": key, **asdict(self._metrics.get(key, _TenantAdmissionMetrics()))}
+            return {"tenants": {key: asdict(value) for key, value in self._metrics.items()}}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics.clear()
+
+
+admission_metrics_store = AdmissionMetricsStore()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+
+@dataclass
+class _TenantAnswerCacheMetrics:
+    hits_total: int = 0
+    misses_total: int = 0
+    stores_total: int = 0
+    skipped_total: int = 0
+    evictions_total: int = 0
+    invalidations_total: int = 0
+    invalidated_entries_total: int = 0
+
+
+class AnswerCacheMetricsStore:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._metrics: dict[str, _TenantAnswerCacheMetrics] = defaultdict(
+            _TenantAnswerCacheMetrics
+        )
+
+    @staticmethod
+    def _tenant(tenant_id: str | None) -> str:
+        return str(tenant_id or "unknown")
+
+    def record_hit(self, tenant_id: str | None) -> None:
+        with self._lock:
+            self._metrics[self._tenant(tenant_id)].hits_total += 1
+
+    def record_miss(self, tenant_id: str | None) -> None:
+        with self._lock:
+            self._metrics[self._tenant(tenant_id)].misses_total += 1
+
+    def record_store(self, tenant_id: str | None) -> None:
+        with self._lock:
+            self._metrics[self._tenant(tenant_id)].stores_total += 1
+
+    def record_skip(self, tenant_id: str | None) -> None:
+        with self._lock:
+            self._metrics[self._tenant(tenant_id)].skipped_total += 1
+
+    def record_eviction(self, tenant_id: str | None) -> None:
+        with self._lock:
+            self._metrics[self._tenant(tenant_id)].evictions_total += 1
+
+    def record_invalidation(self, tenant_id: str | None, *, removed: int) -> None:
+        with self._lock:
+            item = self._metrics[self._tenant(tenant_id)]
+            item.invalidations_total += 1
+            item.invalidated_entries_total += max(0, int(removed))
+
+    def snapshot(self, tenant_id: str | None = None) -> dict[str, Any]:
+        with self._lock:
+            if tenant_id:
+                key = self._tenant(tenant_id)
+                item = self._metrics.get(key, _TenantAnswerCacheMetrics())
+                return {"tenant_id": key, **self._serialize(item)}
+
+            return {
+                "tenants": {key: self._serialize(value) for key, value in self._metrics.items()}
+            }
+
+    @staticmethod
+    def _serialize(item: _TenantAnswerCacheMetrics) -> dict[str, Any]:
+        lookups = item.hits_total + item.misses_total
+        return {
+            "hits_total": item.hits_total,
+            "misses_total": item.misses_total,
+            "stores_total": item.stores_total,
+            "skipped_total": item.skipped_total,
+            "evictions_total": item.evictions_total,
+            "invalidations_total": item.invalidations_total,
+            "invalidated_entries_total": item.invalidated_entries_total,
+            "hit_ratio": round(item.hits_total / lookups, 4) if lookups else 0.0,
+        }
+
+
+answer_cache_metrics_store = AnswerCacheMetricsStore()
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from threading import Lock
+from typing import Any
+
+
+@dataclass
+class _AuthMetrics:
+    claims_cache_hits_total: int = 0
+    claims_cache_misses_total: int = 0
+    negative_cache_hits_total: int = 0
+    remote_fallbacks_total: int = 0
+    jwks_refreshes_total: int = 0
+    jwks_refresh_failures_total: int = 0
+
+
+class AuthMetricsStore:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._metrics = _AuthMetrics()
+
+    def record(self, event: str) -> None:
+        field_name = f"{event}_total"
+        with self._lock:
+            setattr(self._metrics, field_name, getattr(self._metrics, field_name) + 1)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return asdict(self._metrics)
+
+
+auth_metrics_store = AuthMetricsStore()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+
+@dataclass
+class _CacheMetrics:
+    hits_total: int = 0
+    stale_hits_total: int = 0
+    misses_total: int = 0
+    coalesced_total: int = 0
+    refreshes_total: int = 0
+    load_failures_total: int = 0
+    evictions_total: int = 0
+
+
+class CacheMetricsStore:
+    """Counters for the in-process async loading caches, keyed by cache name."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._metrics: dict[str, _CacheMetrics] = defaultdict(_CacheMetrics)
+
+    def record(self, cache: str, event: str) -> None:
+        field_name = f"{event}_total"
+        with self._lock:
+            item = self._metrics[cache]
+            setattr(item, field_name, getattr(item, field_name) + 1)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "caches": {
+                    key: {
+                        "hits_total": value.hits_total,
+                        "stale_hits_total": value.stale_hits_total,
+                        "misses_total": value.misses_total,
+                        "coalesced_total": value.coalesced_total,
+                        "refreshes_total": value.refreshes_total,
+                        "load_failures_total": value.load_failures_total,
+                        "evictions_total": value.evictions_total,
+                    }
+                    for key, value in self._metrics.items()
+                }
+            }
+
+
+cache_metrics_store = CacheMetricsStore()
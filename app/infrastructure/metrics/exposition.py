@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from app.infrastructure.metrics.admission import admission_metrics_store
+from app.infrastructure.metrics.answer_cache import answer_cache_metrics_store
+from app.infrastructure.metrics.auth import auth_metrics_store
+from app.infrastructure.metrics.cache import cache_metrics_store
+from app.infrastructure.metrics.histograms import format_labels, latency_histogram_store
+from app.infrastructure.metrics.model_cascade import model_cascade_metrics_store
+from app.infrastructure.metrics.outbound import outbound_pool_metrics_store
+from app.infrastructure.metrics.retrieval import retrieval_metrics_store
+from app.infrastructure.metrics.scope import scope_metrics_store
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _counter_lines(
+    prefix: str,
+    label: str,
+    groups: dict[str, dict[str, Any]],
+    *,
+    skip: Iterable[str] = (),
+) -> list[str]:
+    """Flatten a `{group: {field_total: n}}` snapshot into one counter family per field."""
+    skipped = set(skip)
+    families: dict[str, list[str]] = {}
+    for group, values in sorted(groups.items()):
+        for field_name, value in sorted(values.items()):
+            if field_name in skipped or isinstance(value, bool):
+                continue
+            if not isinstance(value, (int, float)):
+                continue
+            name = f"{prefix}_{field_name}"
+            families.setdefault(name, []).append(
+                f"{name}{format_labels(((label, str(group)),))} {value}"
+            )
+    lines: list[str] = []
+    for name, samples in families.items():
+        kind = "counter" if name.endswith("_total") else "gauge"
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(samples)
+    return lines
+
+
+def render_openmetrics() -> str:
+    """Prometheus text exposition of histograms plus the existing counter stores."""
+    lines = latency_histogram_store.render()
+    lines.extend(
+        _counter_lines(
+            "orch_retrieval", "endpoint", retrieval_metrics_store.snapshot()["endpoints"]
+        )
+    )
+    lines.extend(
+        _counter_lines(
+            "orch_outbound_pool",
+            "pool",
+            outbound_pool_metrics_store.snapshot()["pools"],
+            skip=("latency_ms_avg", "latency_ms_max"),
+        )
+    )
+    lines.extend(
+        _counter_lines("orch_scope", "tenant", scope_metrics_store.snapshot()["tenants"])
+    )
+    lines.extend(
+        _counter_lines(
+            "orch_answer_cache", "tenant", answer_cache_metrics_store.snapshot()["tenants"]
+        )
+    )
+    lines.extend(
+        _counter_lines("orch_admission", "tenant", admission_metrics_store.snapshot()["tenants"])
+    )
+    lines.extend(
+        _counter_lines(
+            "orch_synthesis_route",
+            "route",
+            model_cascade_metrics_store.snapshot()["routes"],
+            skip=("latency_ms_avg", "acceptance_rate"),
+        )
+    )
+    lines.extend(_counter_lines("orch_cache", "cache", cache_metrics_store.snapshot()["caches"]))
+    lines.extend(_counter_lines("orch_auth", "source", {"supabase": auth_metrics_store.snapshot()}))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import bisect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Iterator
+
+# Upper bounds in milliseconds; +Inf is implicit.
+DEFAULT_LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 20000, 30000, 60000,
+)
+
+LabelSet = tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True)
+class MetricLabels:
+    tenant_id: str = "unknown"
+    profile_id: str = "unknown"
+
+    def as_dict(self) -> dict[str, str]:
+        return {"tenant": self.tenant_id, "profile": self.profile_id}
+
+
+_CURRENT_LABELS: ContextVar[MetricLabels | None] = ContextVar("metric_labels", default=None)
+
+
+def current_metric_labels() -> MetricLabels:
+    return _CURRENT_LABELS.get() or MetricLabels()
+
+
+@contextmanager
+def bind_metric_labels(
+    *, tenant_id: str | None, profile_id: str | None
+) -> Iterator[MetricLabels]:
+    labels = MetricLabels(
+        tenant_id=str(tenant_id or "").strip() or "unknown",
+        profile_id=str(profile_id or "").strip() or "unknown",
+    )
+    token = _CURRENT_LABELS.set(labels)
+    try:
+        yield labels
+    finally:
+        _CURRENT_LABELS.reset(token)
+
+
+@dataclass
+class _HistogramSeries:
+    bucket_counts: list[int]
+    count: int = 0
+    total: float = 0.0
+
+
+@dataclass
+class _Family:
+    kind: str
+    help: str
+    buckets: tuple[float, ...] = ()
+    series: dict[LabelSet, Any] = field(default_factory=dict)
+
+
+class LatencyHistogramStore:
+    """Server-side latency histograms and counters, rendered in Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._families: dict[str, _Family] = {}
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        *,
+        help: str = "",
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_MS,
+        **labels: Any,
+    ) -> None:
+        key = self._labels(labels)
+        with self._lock:
+            family = self._families.setdefault(
+                name, _Family(kind="histogram", help=help, buckets=tuple(buckets))
+            )
+            series = family.series.get(key)
+            if series is None:
+                series = _HistogramSeries(bucket_counts=[0] * len(family.buckets))
+                family.series[key] = series
+            index = bisect.bisect_left(family.buckets, float(value))
+            if index < len(series.bucket_counts):
+                series.bucket_counts[index] += 1
+            series.count += 1
+            series.total += float(value)
+
+    def increment(self, name: str, amount: float = 1, *, help: str = "", **labels: Any) -> None:
+        key = self._labels(labels)
+        with self._lock:
+            family = self._families.setdefault(name, _Family(kind="counter", help=help))
+            family.series[key] = float(family.series.get(key, 0.0)) + float(amount)
+
+    def render(self) -> list[str]:
+        lines: list[str] = []
+        with self._lock:
+            for name, family in sorted(self._families.items()):
+                if family.help:
+                    lines.append(f"# HELP {name} {family.help}")
+                lines.append(f"# TYPE {name} {family.kind}")
+                for labels, series in sorted(family.series.items()):
+                    if family.kind == "counter":
+                        lines.append(f"{name}{format_labels(labels)} {_number(series)}")
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(family.buckets, series.bucket_counts):
+                        cumulative += count
+                        bucket_labels = (*labels, ("le", _number(bound)))
+                        lines.append(f"{name}_bucket{format_labels(bucket_labels)} {cumulative}")
+                    inf_labels = (*labels, ("le", "+Inf"))
+                    lines.append(f"{name}_bucket{format_labels(inf_labels)} {series.count}")
+                    lines.append(f"{name}_sum{format_labels(labels)} {_number(series.total)}")
+                    lines.append(f"{name}_count{format_labels(labels)} {series.count}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._families.clear()
+
+    @staticmethod
+    def _labels(labels: dict[str, Any]) -> LabelSet:
+        return tuple(sorted((str(k), str(v)) for k, v in labels.items() if v is not None))
+
+
+def format_labels(labels: LabelSet) -> str:
+    if not labels:
+        return ""
+    rendered = ",".join(f'{key}="{_escape(value)}"' for key, value in labels)
+    return "{" + rendered + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    as_float = float(value)
+    return str(int(as_float)) if as_float.is_integer() else repr(round(as_float, 6))
+
+
+latency_histogram_store = LatencyHistogramStore()
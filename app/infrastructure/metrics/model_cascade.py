@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from threading import Lock
+from typing import Any
+
+from app.infrastructure.metrics.histograms import current_metric_labels, latency_histogram_store
+
+
+@dataclass
+class _RouteMetrics:
+    attempts_total: int = 0
+    accepted_total: int = 0
+    rejected_total: int = 0
+    timeout_total: int = 0
+    escalated_total: int = 0
+    latency_ms_sum: float = 0.0
+
+
+class ModelCascadeMetricsStore:
+    """Per-route synthesis outcomes, to check the lightweight route pays for its escalations."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._routes: dict[str, _RouteMetrics] = defaultdict(_RouteMetrics)
+
+    def record_attempt(
+        self,
+        route: str,
+        *,
+        model: str,
+        outcome: str,
+        latency_ms: float,
+        escalation: bool = False,
+    ) -> None:
+        """`outcome` is ``accepted``, ``rejected`` or ``timeout``."""
+        with self._lock:
+            item = self._routes[route]
+            item.attempts_total += 1
+            item.latency_ms_sum += float(latency_ms)
+            field_name = f"{outcome}_total"
+            if hasattr(item, field_name):
+                setattr(item, field_name, getattr(item, field_name) + 1)
+        latency_histogram_store.observe(
+            "orch_synthesis_route_duration_ms",
+            latency_ms,
+            help="Final synthesis duration per model route in milliseconds.",
+            route=route,
+            model=model,
+            outcome=outcome,
+            escalation="true" if escalation else "false",
+            **current_metric_labels().as_dict(),
+        )
+
+    def record_escalation(self, route: str) -> None:
+        with self._lock:
+            self._routes[route].escalated_total += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            routes: dict[str, Any] = {}
+            for route, item in self._routes.items():
+                data = asdict(item)
+                latency_sum = data.pop("latency_ms_sum")
+                attempts = item.attempts_total
+                data["latency_ms_avg"] = round(latency_sum / attempts, 2) if attempts else 0.0
+                data["acceptance_rate"] = (
+                    round(item.accepted_total / attempts, 4) if attempts else 0.0
+                )
+                routes[route] = data
+            return {"routes": routes}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+
+model_cascade_metrics_store = ModelCascadeMetricsStore()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+
+@dataclass
+class _PoolMetrics:
+    requests_total: int = 0
+    failures_total: int = 0
+    in_flight: int = 0
+    latency_ms_total: float = 0.0
+    latency_ms_max: float = 0.0
+    status_codes: dict[str, int] | None = None
+
+
+class OutboundPoolMetricsStore:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._metrics: dict[str, _PoolMetrics] = defaultdict(_PoolMetrics)
+
+    def record_start(self, pool: str) -> None:
+        with self._lock:
+            metrics = self._metrics[pool]
+            metrics.requests_total += 1
+            metrics.in_flight += 1
+
+    def record_finish(
+        self,
+        pool: str,
+        *,
+        elapsed_ms: float,
+        status_code: int | None = None,
+        failed: bool = False,
+    ) -> None:
+        with self._lock:
+            metrics = self._metrics[pool]
+            metrics.in_flight = max(0, metrics.in_flight - 1)
+            metrics.latency_ms_total += float(elapsed_ms)
+            metrics.latency_ms_max = max(metrics.latency_ms_max, float(elapsed_ms))
+            if failed:
+                metrics.failures_total += 1
+            if status_code is not None:
+                if metrics.status_codes is None:
+                    metrics.status_codes = {}
+                key = str(int(status_code))
+                metrics.status_codes[key] = metrics.status_codes.get(key, 0) + 1
+
+    def snapshot(self, connections: dict[str, int] | None = None) -> dict[str, Any]:
+        open_connections = connections or {}
+        with self._lock:
+            return {
+                "pools": {
+                    key: {
+                        "requests_total": value.requests_total,
+                        "failures_total": value.failures_total,
+                        "in_flight": value.in_flight,
+                        "latency_ms_avg": (
+                            round(value.latency_ms_total / value.requests_total, 2)
+                            if value.requests_total
+                            else 0.0
+                        ),
+                        "latency_ms_max": round(value.latency_ms_max, 2),
+                        "status_codes": dict(value.status_codes or {}),
+                        "open_connections": open_connections.get(key),
+                    }
+                    for key, value in self._metrics.items()
+                }
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics.clear()
+
+
+outbound_pool_metrics_store = OutboundPoolMetricsStore()
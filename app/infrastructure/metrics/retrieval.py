@@ -13,6 +13,12 @@ class _EndpointMetrics:
     failures_total: int = 0
     fallback_retries_total: int = 0
     degraded_responses_total: int = 0
+    cache_hits_total: int = 0
+    cache_coalesced_total: int = 0
+    hedges_total: int = 0
+    hedge_wins_total: int = 0
+    hedge_losses_total: int = 0
+    hedge_budget_exhausted_total: int = 0
 
 
 class RetrievalMetricsStore:
@@ -40,6 +46,30 @@ class RetrievalMetricsStore:
         with self._lock:
             self._metrics[endpoint].degraded_responses_total += 1
 
+    def record_cache_hit(self, endpoint: str) -> None:
+        with self._lock:
+            self._metrics[endpoint].cache_hits_total += 1
+
+    def record_cache_coalesced(self, endpoint: str) -> None:
+        with self._lock:
+            self._metrics[endpoint].cache_coalesced_total += 1
+
+    def record_hedge(self, endpoint: str) -> None:
+        with self._lock:
+            self._metrics[endpoint].hedges_total += 1
+
+    def record_hedge_win(self, endpoint: str) -> None:
+        with self._lock:
+            self._metrics[endpoint].hedge_wins_total += 1
+
+    def record_hedge_loss(self, endpoint: str) -> None:
+        with self._lock:
+            self._metrics[endpoint].hedge_losses_total += 1
+
+    def record_hedge_budget_exhausted(self, endpoint: str) -> None:
+        with self._lock:
+            self._metrics[endpoint].hedge_budget_exhausted_total += 1
+
     def snapshot(self) -> dict[str, Any]:
         with self._lock:
             return {
@@ -50,6 +80,12 @@ class RetrievalMetricsStore:
                         "failures_total": value.failures_total,
                         "fallback_retries_total": value.fallback_retries_total,
                         "degraded_responses_total": value.degraded_responses_total,
+                        "cache_hits_total": value.cache_hits_total,
+                        "cache_coalesced_total": value.cache_coalesced_total,
+                        "hedges_total": value.hedges_total,
+                        "hedge_wins_total": value.hedge_wins_total,
+                        "hedge_losses_total": value.hedge_losses_total,
+                        "hedge_budget_exhausted_total": value.hedge_budget_exhausted_total,
                     }
                     for key, value in self._metrics.items()
                 }
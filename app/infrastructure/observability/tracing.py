@@ -0,0 +1,123 @@
+"""OpenTelemetry tracing facade.
+
+Spans are no-ops until `configure_tracing` installs a tracer provider, so call sites never
+need to check whether tracing is enabled. The OpenTelemetry SDK is optional at import
+time: without it (or with ``ORCH_OTEL_ENABLED=false``) every helper degrades to a no-op.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Iterator, Mapping
+
+import structlog
+
+from app.infrastructure.config import settings
+
+try:  # pragma: no cover - exercised only when the OTel SDK is installed
+    from opentelemetry import trace as otel_trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+        SimpleSpanProcessor,
+    )
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+except ImportError:  # pragma: no cover - depends on the environment
+    otel_trace = None  # type: ignore[assignment]
+
+logger = structlog.get_logger(__name__)
+
+_PROVIDER: Any = None
+_TRACER: Any = None
+_PROPAGATOR: Any = None
+
+
+def tracing_available() -> bool:
+    return otel_trace is not None
+
+
+def tracing_enabled() -> bool:
+    return _TRACER is not None
+
+
+def configure_tracing(exporter: str | None = None) -> Any:
+    """Install the process tracer provider; returns the span exporter (or None).
+
+    ``exporter`` overrides ``ORCH_OTEL_EXPORTER``: ``otlp`` | ``console`` | ``memory``.
+    The ``memory`` exporter is meant for tests (`exporter.get_finished_spans()`).
+    """
+    global _PROVIDER, _TRACER, _PROPAGATOR
+    kind = str(exporter or getattr(settings, "ORCH_OTEL_EXPORTER", "otlp") or "otlp").lower()
+    if exporter is None and not bool(getattr(settings, "ORCH_OTEL_ENABLED", False)):
+        return None
+    if not tracing_available():
+        logger.warning("otel_tracing_unavailable", reason="opentelemetry_sdk_not_installed")
+        return None
+
+    provider = TracerProvider(
+        resource=Resource.create(
+            {"service.name": str(getattr(settings, "ORCH_OTEL_SERVICE_NAME", "cire-orch"))}
+        )
+    )
+    if kind == "memory":
+        span_exporter: Any = InMemorySpanExporter()
+        provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    elif kind == "console":
+        span_exporter = ConsoleSpanExporter()
+        provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    else:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        endpoint = str(getattr(settings, "ORCH_OTEL_EXPORTER_ENDPOINT", "") or "").strip()
+        span_exporter = OTLPSpanExporter(endpoint=endpoint) if endpoint else OTLPSpanExporter()
+        provider.add_span_processor(BatchSpanProcessor(span_exporter))
+
+    _PROVIDER = provider
+    _TRACER = provider.get_tracer("cire-orch")
+    _PROPAGATOR = TraceContextTextMapPropagator()
+    logger.info("otel_tracing_configured", exporter=kind)
+    return span_exporter
+
+
+def shutdown_tracing() -> None:
+    global _PROVIDER, _TRACER, _PROPAGATOR
+    provider, _PROVIDER, _TRACER, _PROPAGATOR = _PROVIDER, None, None, None
+    if provider is not None:
+        provider.shutdown()
+
+
+@contextmanager
+def start_span(
+    name: str,
+    *,
+    parent_headers: Mapping[str, str] | None = None,
+    **attributes: Any,
+) -> Iterator[Any]:
+    """Start a span as a child of the current one (or of an incoming ``traceparent``)."""
+    if _TRACER is None:
+        yield None
+        return
+    context = _PROPAGATOR.extract(carrier=dict(parent_headers)) if parent_headers else None
+    with _TRACER.start_as_current_span(
+        name, context=context, attributes=_clean_attributes(attributes)
+    ) as span:
+        yield span
+
+
+def inject_trace_headers(headers: dict[str, str]) -> dict[str, str]:
+    """Add W3C ``traceparent``/``tracestate`` for the current span to outbound headers."""
+    if _PROPAGATOR is not None:
+        _PROPAGATOR.inject(carrier=headers)
+    return headers
+
+
+def _clean_attributes(attributes: Mapping[str, Any]) -> dict[str, Any]:
+    clean: dict[str, Any] = {}
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        clean[key] = value if isinstance(value, (str, bool, int, float)) else str(value)
+    return clean
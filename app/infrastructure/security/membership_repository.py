@@ -1,18 +1,32 @@
 from __future__ import annotations
 
-import time
+from functools import lru_cache
 from typing import Any
 from urllib.parse import quote
 
-import httpx
 import structlog
 
+from app.infrastructure.async_cache import AsyncLoadingCache
+from app.infrastructure.clients.outbound_pool import outbound_get
 from app.infrastructure.config import settings
 
 logger = structlog.get_logger(__name__)
 
-_MEMBERSHIP_CACHE: dict[str, tuple[float, list[str]]] = {}
-_MEMBERSHIP_CACHE_TTL = 300  # 5 minutes
+
+@lru_cache(maxsize=1)
+def get_membership_cache() -> AsyncLoadingCache[str, list[str]]:
+    # Empty results expire quickly so newly added members are not locked out.
+    return AsyncLoadingCache(
+        name="tenant_membership",
+        ttl_seconds=float(getattr(settings, "ORCH_MEMBERSHIP_CACHE_TTL_SECONDS", 300)),
+        stale_seconds=float(getattr(settings, "ORCH_MEMBERSHIP_CACHE_STALE_SECONDS", 120)),
+        negative_ttl_seconds=float(
+            getattr(settings, "ORCH_MEMBERSHIP_CACHE_NEGATIVE_TTL_SECONDS", 15)
+        ),
+        max_entries=int(getattr(settings, "ORCH_MEMBERSHIP_CACHE_MAX_ENTRIES", 4096)),
+        is_negative=lambda tenants: not tenants,
+    )
+
 
 def _normalize_tenant(value: str | None) -> str | None:
     normalized = str(value or "").strip()
@@ -42,9 +56,10 @@ async def _query_membership_tenants(user_id: str, table: str, user_col: str, ten
         "Authorization": f"Bearer {service_role}",
     }
     try:
-        async with httpx.AsyncClient(timeout=3.0) as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
+        response = await outbound_get(
+            "supabase", url, timeout=3.0, params=params, headers=headers
+        )
+        response.raise_for_status()
     except Exception as exc:
         logger.warning("tenant_membership_lookup_failed", user_id=user_id, error=str(exc))
         return []
@@ -107,15 +122,10 @@ async def _internal_fetch_membership_tenants(user_id: str) -> list[str]:
     return []
 
 async def fetch_membership_tenants(user_id: str) -> list[str]:
-    now = time.time()
-    if user_id in _MEMBERSHIP_CACHE:
-        timestamp, cached_tenants = _MEMBERSHIP_CACHE[user_id]
-        if now - timestamp < _MEMBERSHIP_CACHE_TTL:
-            return cached_tenants
-
-    tenants = await _internal_fetch_membership_tenants(user_id)
-    _MEMBERSHIP_CACHE[user_id] = (time.time(), tenants)
-    return tenants
+    tenants = await get_membership_cache().get(
+        user_id, lambda: _internal_fetch_membership_tenants(user_id)
+    )
+    return list(tenants)
 
 async def fetch_tenant_names(tenant_ids: list[str]) -> dict[str, str]:
     scoped = _normalize_tenants(tenant_ids)
@@ -135,9 +145,10 @@ async def fetch_tenant_names(tenant_ids: list[str]) -> dict[str, str]:
         "Authorization": f"Bearer {service_role}",
     }
     try:
-        async with httpx.AsyncClient(timeout=3.0) as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
+        response = await outbound_get(
+            "supabase", url, timeout=3.0, params=params, headers=headers
+        )
+        response.raise_for_status()
     except Exception as exc:
         logger.warning("tenant_names_lookup_failed", count=len(scoped), error=str(exc))
         return {}
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Any
+
+import jwt
+import structlog
+
+from app.infrastructure.clients.outbound_pool import outbound_get
+from app.infrastructure.config import settings
+from app.infrastructure.metrics.auth import auth_metrics_store
+
+logger = structlog.get_logger(__name__)
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class VerifiedClaimsCache:
+    """Verified JWT claims keyed by token hash, plus a short-lived rejected-token set."""
+
+    def __init__(self, *, max_entries: int, negative_ttl_seconds: float) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._negative_ttl_seconds = max(0.0, float(negative_ttl_seconds))
+        self._lock = Lock()
+        self._claims: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._rejected: OrderedDict[str, float] = OrderedDict()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        key = _token_key(token)
+        now = time.time()
+        with self._lock:
+            entry = self._claims.get(key)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if expires_at <= now:
+                del self._claims[key]
+                return None
+            self._claims.move_to_end(key)
+            return dict(claims)
+
+    def store(self, token: str, claims: dict[str, Any], *, expires_at: float | None) -> None:
+        """Cache until `expires_at` (epoch seconds); tokens without an expiry are not cached."""
+        if expires_at is None or float(expires_at) <= time.time():
+            return
+        key = _token_key(token)
+        with self._lock:
+            self._claims[key] = (float(expires_at), dict(claims))
+            self._claims.move_to_end(key)
+            self._rejected.pop(key, None)
+            while len(self._claims) > self._max_entries:
+                self._claims.popitem(last=False)
+
+    def is_rejected(self, token: str) -> bool:
+        key = _token_key(token)
+        with self._lock:
+            expires_at = self._rejected.get(key)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._rejected[key]
+                return False
+            return True
+
+    def reject(self, token: str) -> None:
+        if self._negative_ttl_seconds <= 0:
+            return
+        key = _token_key(token)
+        with self._lock:
+            self._rejected[key] = time.monotonic() + self._negative_ttl_seconds
+            self._rejected.move_to_end(key)
+            while len(self._rejected) > self._max_entries:
+                self._rejected.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._claims.clear()
+            self._rejected.clear()
+
+
+class JwksKeyStore:
+    """In-memory JWKS refreshed off the request path.
+
+    A background task re-fetches the key set periodically; an unknown ``kid`` (key
+    rotation) triggers one coalesced refresh in the background, rate-limited so forged
+    ``kid`` values cannot turn into an outbound request per call. The request itself never
+    waits on a new fetch: it falls back right away and only waits, briefly, for a refresh
+    that was already in flight.
+    """
+
+    def __init__(
+        self,
+        *,
+        jwks_url: str,
+        refresh_seconds: float = 600.0,
+        min_refresh_interval_seconds: float = 30.0,
+        timeout_seconds: float = 4.0,
+        unknown_kid_wait_seconds: float = 0.05,
+    ) -> None:
+        self._jwks_url = jwks_url
+        self._refresh_seconds = max(1.0, float(refresh_seconds))
+        self._min_refresh_interval_seconds = max(0.0, float(min_refresh_interval_seconds))
+        self._timeout_seconds = float(timeout_seconds)
+        self._unknown_kid_wait_seconds = max(0.0, float(unknown_kid_wait_seconds))
+        self._keys: dict[str, Any] = {}
+        self._last_refresh_at: float | None = None
+        self._refreshing: asyncio.Future[None] | None = None
+        self._loop_task: asyncio.Task[None] | None = None
+
+    def signing_key(self, token: str) -> Any | None:
+        kid = self._kid(token)
+        return self._keys.get(kid) if kid else None
+
+    async def ensure_key(self, token: str) -> None:
+        kid = self._kid(token)
+        if not kid or kid in self._keys:
+            return
+        refreshing = self._refreshing
+        if refreshing is not None and not refreshing.done():
+            if self._unknown_kid_wait_seconds > 0:
+                await asyncio.wait({refreshing}, timeout=self._unknown_kid_wait_seconds)
+            return
+        if (
+            self._last_refresh_at is not None
+            and time.monotonic() - self._last_refresh_at < self._min_refresh_interval_seconds
+        ):
+            return
+        self._start_refresh()
+
+    async def refresh(self) -> None:
+        await asyncio.shield(self._start_refresh())
+
+    def _start_refresh(self) -> asyncio.Future[None]:
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.ensure_future(self._fetch())
+        return self._refreshing
+
+    def start(self) -> None:
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        task, self._loop_task = self._loop_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self._refresh_seconds)
+
+    async def _fetch(self) -> None:
+        self._last_refresh_at = time.monotonic()
+        try:
+            response = await outbound_get("supabase", self._jwks_url, timeout=self._timeout_seconds)
+            response.raise_for_status()
+            payload = response.json()
+        except Exception as exc:
+            auth_metrics_store.record("jwks_refresh_failures")
+            logger.warning("jwks_refresh_failed", url=self._jwks_url, error=str(exc))
+            return
+
+        items = payload.get("keys") if isinstance(payload, dict) else None
+        keys: dict[str, Any] = {}
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict) or not item.get("kid"):
+                continue
+            try:
+                keys[str(item["kid"])] = jwt.PyJWK(item).key
+            except jwt.PyJWTError as exc:
+                logger.warning("jwks_key_skipped", kid=item.get("kid"), error=str(exc))
+        if keys:
+            # An empty or unusable key set keeps the previous keys instead of locking everyone out.
+            self._keys = keys
+        auth_metrics_store.record("jwks_refreshes")
+        logger.info("jwks_refreshed", key_count=len(keys))
+
+    @staticmethod
+    def _kid(token: str) -> str | None:
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.PyJWTError:
+            return None
+        kid = header.get("kid")
+        return str(kid) if kid else None
+
+
+@lru_cache(maxsize=1)
+def get_verified_claims_cache() -> VerifiedClaimsCache:
+    return VerifiedClaimsCache(
+        max_entries=int(getattr(settings, "ORCH_AUTH_CLAIMS_CACHE_MAX_ENTRIES", 10000)),
+        negative_ttl_seconds=float(getattr(settings, "ORCH_AUTH_NEGATIVE_TTL_SECONDS", 30.0)),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_jwks_key_store() -> JwksKeyStore | None:
+    jwks_url = settings.resolved_supabase_jwks_url
+    if not jwks_url:
+        return None
+    return JwksKeyStore(
+        jwks_url=jwks_url,
+        refresh_seconds=float(getattr(settings, "ORCH_AUTH_JWKS_REFRESH_SECONDS", 600.0)),
+        min_refresh_interval_seconds=float(
+            getattr(settings, "ORCH_AUTH_JWKS_MIN_REFRESH_INTERVAL_SECONDS", 30.0)
+        ),
+        unknown_kid_wait_seconds=int(getattr(settings, "ORCH_AUTH_JWKS_UNKNOWN_KID_WAIT_MS", 50))
+        / 1000.0,
+    )
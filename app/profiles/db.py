@@ -3,9 +3,9 @@ from __future__ import annotations
 import json
 from urllib.parse import quote
 
-import httpx
 import structlog
 
+from app.infrastructure.clients.outbound_pool import outbound_get
 from app.profiles.models import AgentProfile
 from app.infrastructure.config import settings
 
@@ -52,10 +52,11 @@ async def fetch_db_profile_async(tenant_id: str) -> tuple[AgentProfile | None, s
     timeout = float(settings.ORCH_PROFILE_DB_TIMEOUT_SECONDS or 1.8)
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            payload = response.json()
+        response = await outbound_get(
+            "supabase", url, timeout=timeout, params=params, headers=headers
+        )
+        response.raise_for_status()
+        payload = response.json()
     except Exception as exc:
         logger.warning("profile_db_lookup_failed", tenant_id=tenant, error=str(exc))
         return None, "db_lookup_failed"
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+import os
 import threading
+import time
 from functools import lru_cache
 from pathlib import Path
 
@@ -37,19 +39,33 @@ def _normalize_assignments(payload: object) -> dict[str, str]:
 
 
 class DevProfileAssignmentsStore:
-    """Dev-only profile assignment store persisted in a local JSON file."""
+    """Dev-only profile assignment store persisted in a local JSON file.
+
+    Lookups are served from an in-memory snapshot. The file is re-stat'ed at most once per
+    ``ORCH_DEV_PROFILE_ASSIGNMENTS_RECHECK_SECONDS`` and only re-read when its mtime, inode
+    or size changed; writes replace the snapshot in the same step as the file.
+    """
 
     def __init__(self, path: Path | None = None) -> None:
         self._path = path or _resolve_store_path()
         self._lock = threading.RLock()
+        self._assignments: dict[str, str] | None = None
+        self._signature: tuple[int, int, int] | None = None
+        self._checked_at = 0.0
+        self._revision = 0
 
     @property
     def path(self) -> Path:
         return self._path
 
+    def _file_signature(self) -> tuple[int, int, int] | None:
+        try:
+            stat = os.stat(self._path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+
     def _read_assignments(self) -> dict[str, str]:
-        if not bool(settings.ORCH_DEV_PROFILE_ASSIGNMENTS_ENABLED):
-            return {}
         if not self._path.exists():
             return {}
         try:
@@ -63,19 +79,46 @@ class DevProfileAssignmentsStore:
             return {}
         return _normalize_assignments(raw)
 
+    def _current(self, *, force: bool = False) -> dict[str, str]:
+        """Return the snapshot, re-reading the file only if it changed since the last check."""
+        recheck_seconds = float(getattr(settings, "ORCH_DEV_PROFILE_ASSIGNMENTS_RECHECK_SECONDS", 2.0))
+        now = time.monotonic()
+        assignments = self._assignments
+        if not force and assignments is not None and now - self._checked_at < recheck_seconds:
+            return assignments
+        with self._lock:
+            signature = self._file_signature()
+            if self._assignments is None or signature != self._signature:
+                self._assignments = self._read_assignments() if signature is not None else {}
+                self._signature = signature
+                self._revision += 1
+            self._checked_at = now
+            return self._assignments
+
     def _write_assignments(self, assignments: dict[str, str]) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = self._path.with_suffix(self._path.suffix + ".tmp")
         payload = json.dumps(assignments, ensure_ascii=True, indent=2) + "\n"
         tmp_path.write_text(payload, encoding="utf-8")
         tmp_path.replace(self._path)
+        # Readers hold references to the previous dict, so it is replaced, never mutated.
+        self._assignments = assignments
+        self._signature = self._file_signature()
+        self._revision += 1
+        self._checked_at = time.monotonic()
+
+    def revision(self) -> int:
+        """Counter bumped whenever the snapshot changes; lets callers key derived caches on it."""
+        if not bool(settings.ORCH_DEV_PROFILE_ASSIGNMENTS_ENABLED):
+            return 0
+        self._current()
+        return self._revision
 
     def get(self, tenant_id: str | None) -> str | None:
         tenant = str(tenant_id or "").strip()
-        if not tenant:
+        if not tenant or not bool(settings.ORCH_DEV_PROFILE_ASSIGNMENTS_ENABLED):
             return None
-        with self._lock:
-            return self._read_assignments().get(tenant)
+        return self._current().get(tenant)
 
     def set(self, tenant_id: str, profile_id: str) -> None:
         if not bool(settings.ORCH_DEV_PROFILE_ASSIGNMENTS_ENABLED):
@@ -85,7 +128,7 @@ class DevProfileAssignmentsStore:
         if not tenant or not profile:
             raise ValueError("tenant_id and profile_id are required")
         with self._lock:
-            current = self._read_assignments()
+            current = dict(self._current(force=True))
             current[tenant] = profile
             self._write_assignments(current)
 
@@ -94,7 +137,7 @@ class DevProfileAssignmentsStore:
         if not tenant:
             return False
         with self._lock:
-            current = self._read_assignments()
+            current = dict(self._current(force=True))
             existed = tenant in current
             if existed:
                 current.pop(tenant, None)
@@ -102,8 +145,9 @@ class DevProfileAssignmentsStore:
             return existed
 
     def snapshot(self) -> dict[str, str]:
-        with self._lock:
-            return dict(self._read_assignments())
+        if not bool(settings.ORCH_DEV_PROFILE_ASSIGNMENTS_ENABLED):
+            return {}
+        return dict(self._current())
 
 
 @lru_cache(maxsize=1)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
@@ -12,6 +14,7 @@ from urllib.parse import quote
 import httpx
 import structlog
 
+from app.infrastructure.async_cache import AsyncLoadingCache
 from app.profiles.db import fetch_db_profile_async
 from app.profiles.dev_assignments import get_dev_profile_assignments_store
 from app.profiles.models import AgentProfile, ProfileResolution, ResolvedAgentProfile
@@ -46,6 +49,25 @@ class ProfileChoice:
     requested_profile_id: str | None
 
 
+class _DbLookupFailed(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class _ResolutionEntry:
+    resolved: ResolvedAgentProfile
+    dev_revision: int
+    expires_at: float | None
+
+
+def profile_content_hash(profile: AgentProfile) -> str:
+    """Stable hash of the effective profile content, for keying downstream caches."""
+    canonical = json.dumps(
+        profile.model_dump(mode="json"), sort_keys=True, ensure_ascii=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
 def _default_profiles_dir() -> Path:
     configured = str(settings.ORCH_PROFILES_DIR or "").strip()
     if configured:
@@ -163,8 +185,27 @@ class ProfileLoader:
     def __init__(self, profiles_dir: Path | None = None) -> None:
         self._profiles_dir = profiles_dir or _default_profiles_dir()
         self._profile_cache: dict[str, AgentProfile] = {}
-        self._tenant_db_cache: dict[str, tuple[float, AgentProfile]] = {}
+        self._tenant_db_cache: AsyncLoadingCache[str, tuple[AgentProfile | None, str]] = (
+            AsyncLoadingCache(
+                name="profile_db",
+                ttl_seconds=max(1, int(settings.ORCH_PROFILE_DB_CACHE_TTL_SECONDS or 60)),
+                stale_seconds=float(getattr(settings, "ORCH_PROFILE_DB_CACHE_STALE_SECONDS", 300.0)),
+                negative_ttl_seconds=float(
+                    getattr(settings, "ORCH_PROFILE_DB_CACHE_NEGATIVE_TTL_SECONDS", 30.0)
+                ),
+                max_entries=int(getattr(settings, "ORCH_PROFILE_DB_CACHE_MAX_ENTRIES", 1024)),
+                is_negative=lambda value: value[0] is None,
+            )
+        )
         self._last_db_resolution_reason: str = "db_not_checked"
+        # Keyed by the raw requested profile id (a client header), hence LRU-bounded.
+        self._resolution_table: OrderedDict[tuple[str, str | None], _ResolutionEntry] = (
+            OrderedDict()
+        )
+        self._resolution_max_entries = max(
+            1, int(getattr(settings, "ORCH_PROFILE_RESOLUTION_CACHE_MAX_ENTRIES", 4096) or 4096)
+        )
+        self._resolution_generation = 0
 
     @property
     def profiles_dir(self) -> Path:
@@ -234,35 +275,80 @@ class ProfileLoader:
         if not self.profile_exists(normalized_profile):
             raise ValueError(f"profile_not_found:{normalized_profile}")
         get_dev_profile_assignments_store().set(tenant_id=tenant_id, profile_id=normalized_profile)
+        self.invalidate_resolutions(tenant_id)
 
     def clear_dev_profile_override(self, *, tenant_id: str) -> bool:
         if not self.dev_profile_assignments_enabled():
             return False
-        return get_dev_profile_assignments_store().clear(tenant_id)
+        cleared = get_dev_profile_assignments_store().clear(tenant_id)
+        self.invalidate_resolutions(tenant_id)
+        return cleared
 
     def snapshot_dev_profile_overrides(self) -> dict[str, str]:
         if not self.dev_profile_assignments_enabled():
             return {}
         return get_dev_profile_assignments_store().snapshot()
 
+    def invalidate_resolutions(self, tenant_id: str | None = None) -> int:
+        """Drop cached resolutions for one tenant (or all) and its DB profile entry."""
+        tenant = str(tenant_id or "").strip()
+        self._resolution_generation += 1
+        if not tenant:
+            removed = len(self._resolution_table)
+            self._resolution_table = OrderedDict()
+            self._tenant_db_cache.clear()
+            return removed
+        stale_keys = [key for key in self._resolution_table if key[0] == tenant]
+        for key in stale_keys:
+            self._resolution_table.pop(key, None)
+        self._tenant_db_cache.invalidate(tenant)
+        return len(stale_keys)
+
+    def reload_profiles(self) -> int:
+        """Forget parsed YAML profiles (after editing them) and every resolution built on them."""
+        self._profile_cache.clear()
+        return self.invalidate_resolutions()
+
+    def _cached_resolution(self, key: tuple[str, str | None]) -> ResolvedAgentProfile | None:
+        entry = self._resolution_table.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._resolution_table.pop(key, None)
+            return None
+        if entry.dev_revision != self._dev_revision():
+            self._resolution_table.pop(key, None)
+            return None
+        self._resolution_table.move_to_end(key)
+        return entry.resolved
+
+    def _dev_revision(self) -> int:
+        if not self.dev_profile_assignments_enabled():
+            return 0
+        return get_dev_profile_assignments_store().revision()
+
     async def _fetch_db_profile_async(self, tenant_id: str) -> AgentProfile | None:
         tenant = str(tenant_id or "").strip()
         if not tenant:
             self._last_db_resolution_reason = "empty_tenant_id"
             return None
 
-        ttl = int(settings.ORCH_PROFILE_DB_CACHE_TTL_SECONDS or 60)
-        now = time.time()
-        cached = self._tenant_db_cache.get(tenant)
-        if cached and (now - cached[0]) < max(1, ttl):
-            self._last_db_resolution_reason = "db_profile_cache_hit"
-            return cached[1]
+        if not bool(settings.ORCH_PROFILE_DB_ENABLED):
+            self._last_db_resolution_reason = "db_override_disabled"
+            return None
+
+        async def _load() -> tuple[AgentProfile | None, str]:
+            result = await fetch_db_profile_async(tenant)
+            if result[1] == "db_lookup_failed":
+                # Transient: keep serving the stale entry instead of caching the failure.
+                raise _DbLookupFailed(tenant)
+            return result
 
-        profile, reason = await fetch_db_profile_async(tenant)
+        try:
+            profile, reason = await self._tenant_db_cache.get(tenant, _load)
+        except _DbLookupFailed:
+            profile, reason = None, "db_lookup_failed"
         self._last_db_resolution_reason = reason
-        
-        if profile is not None:
-            self._tenant_db_cache[tenant] = (now, profile)
         return profile
 
     def _resolve_profile_choice(
@@ -394,20 +480,10 @@ class ProfileLoader:
         tenant_id: str | None,
         explicit_profile_id: str | None = None,
     ) -> AgentProfile:
-        tenant = str(tenant_id or "").strip()
-
-        # Paso 1: DB privada por tenant (si esta habilitada)
-        profile_from_db = await self._fetch_db_profile_async(tenant)
-        if profile_from_db is not None:
-            return profile_from_db
-
-        # Paso 2..6: explicit/dev_map/map/filesystem/default
-        profile_id = await asyncio.to_thread(
-            self.resolve_profile_id,
-            tenant_id=tenant,
-            explicit_profile_id=explicit_profile_id
+        resolved = await self.resolve_for_tenant_async(
+            tenant_id=tenant_id, explicit_profile_id=explicit_profile_id
         )
-        return await asyncio.to_thread(self.load, profile_id)
+        return resolved.profile
 
     async def resolve_for_tenant_async(
         self,
@@ -418,14 +494,45 @@ class ProfileLoader:
         tenant = str(tenant_id or "").strip()
         requested = str(explicit_profile_id or "").strip() or None
 
+        # Hits are served inline: no thread hop, no filesystem or DB lookups.
+        table_key = (tenant, requested)
+        cached = self._cached_resolution(table_key)
+        if cached is not None:
+            return cached
+
+        generation = self._resolution_generation
+        dev_revision = self._dev_revision()
+        resolved, db_reason = await self._resolve_uncached(tenant=tenant, requested=requested)
+        # A failed DB lookup fell back to YAML/base; caching that would pin a tenant with a
+        # private DB profile to the wrong profile for the whole TTL.
+        if generation == self._resolution_generation and db_reason != "db_lookup_failed":
+            expires_at: float | None = None
+            if bool(settings.ORCH_PROFILE_DB_ENABLED):
+                # Tenants may gain or lose a DB profile; re-check once the DB cache TTL lapses.
+                ttl = max(1, int(settings.ORCH_PROFILE_DB_CACHE_TTL_SECONDS or 60))
+                expires_at = time.monotonic() + ttl
+            self._resolution_table[table_key] = _ResolutionEntry(
+                resolved=resolved, dev_revision=dev_revision, expires_at=expires_at
+            )
+            self._resolution_table.move_to_end(table_key)
+            while len(self._resolution_table) > self._resolution_max_entries:
+                self._resolution_table.popitem(last=False)
+        return resolved
+
+    async def _resolve_uncached(
+        self, *, tenant: str, requested: str | None
+    ) -> tuple[ResolvedAgentProfile, str]:
+        """Resolve without the table; also returns the DB lookup reason for this call."""
         self._last_db_resolution_reason = "db_not_checked"
         profile_from_db = await self._fetch_db_profile_async(tenant)
+        db_reason = self._last_db_resolution_reason
         if profile_from_db is not None:
             resolution = ProfileResolution(
                 source="db",
                 requested_profile_id=requested,
                 applied_profile_id=profile_from_db.profile_id,
-                decision_reason=self._last_db_resolution_reason or "db_profile_applied",
+                decision_reason=db_reason or "db_profile_applied",
+                content_hash=profile_content_hash(profile_from_db),
             )
             logger.info(
                 "profile_resolution_decision",
@@ -435,12 +542,12 @@ class ProfileLoader:
                 applied_profile_id=resolution.applied_profile_id,
                 decision_reason=resolution.decision_reason,
             )
-            return ResolvedAgentProfile(profile=profile_from_db, resolution=resolution)
+            return ResolvedAgentProfile(profile=profile_from_db, resolution=resolution), db_reason
 
         choice = await asyncio.to_thread(
             self._resolve_profile_choice,
             tenant_id=tenant,
-            explicit_profile_id=explicit_profile_id,
+            explicit_profile_id=requested,
         )
         profile = await asyncio.to_thread(self.load, choice.candidate_id)
         resolved_source = choice.source
@@ -454,6 +561,7 @@ class ProfileLoader:
             requested_profile_id=choice.requested_profile_id,
             applied_profile_id=profile.profile_id,
             decision_reason=resolved_reason,
+            content_hash=profile_content_hash(profile),
         )
         logger.info(
             "profile_resolution_decision",
@@ -462,9 +570,9 @@ class ProfileLoader:
             requested_profile_id=resolution.requested_profile_id,
             applied_profile_id=resolution.applied_profile_id,
             decision_reason=resolution.decision_reason,
-            db_reason=self._last_db_resolution_reason,
+            db_reason=db_reason,
         )
-        return ResolvedAgentProfile(profile=profile, resolution=resolution)
+        return ResolvedAgentProfile(profile=profile, resolution=resolution), db_reason
 
 
 
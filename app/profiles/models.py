@@ -48,6 +48,8 @@ class QueryModeConfig(BaseModel):
     coverage_requirements: dict[str, Any] = Field(default_factory=dict)
     decomposition_policy: dict[str, Any] = Field(default_factory=dict)
     response_contract: str | None = None
+    synthesis_model: Literal["auto", "lightweight", "heavy"] = "auto"
+    context_token_budget: int | None = Field(default=None, ge=256)
 
 
 class QueryModesPolicy(BaseModel):
@@ -241,6 +243,7 @@ class ProfileResolution(BaseModel):
     requested_profile_id: str | None = None
     applied_profile_id: str
     decision_reason: str
+    content_hash: str | None = None
 
 
 class AgentProfile(BaseModel):
@@ -204,6 +204,26 @@ async def _upload_files_to_batch(
         )
 
 
+async def _invalidate_orchestrator_answer_cache(
+    runtime: IngestionRuntime, *, collection_id: str | None
+) -> None:
+    from app.infrastructure.clients.discovery_client import invalidate_answer_cache
+
+    orchestrator_url = str(getattr(runtime.args, "orchestrator_url", "") or "").strip()
+    if not orchestrator_url:
+        return
+    try:
+        removed = await invalidate_answer_cache(
+            orchestrator_url,
+            runtime.access_token,
+            tenant_id=runtime.tenant_id,
+            collection_id=collection_id,
+        )
+        print(f"🧹 Cache de respuestas invalidado ({removed} entradas).")
+    except Exception as exc:
+        print(f"⚠️ No se pudo invalidar el cache de respuestas del orquestador: {exc}")
+
+
 async def _run_ingest_operation(*, client: AsyncCireRagClient, runtime: IngestionRuntime) -> None:
     collection_id = await resolve_collection(runtime.args, runtime.tenant_id, runtime.access_token)
     files_to_upload = _collect_files_from_args(runtime.args)
@@ -238,6 +258,7 @@ async def _run_ingest_operation(*, client: AsyncCireRagClient, runtime: Ingestio
     print("🔗 Sellando batch...")
     await client.seal_ingestion_batch(batch_id)
     print("✅ Batch sellado.")
+    await _invalidate_orchestrator_answer_cache(runtime, collection_id=collection_id)
     if not runtime.args.no_wait:
         await run_batch_monitoring(client, batch_id, poll_seconds=runtime.args.job_poll_seconds)
 
@@ -313,6 +334,7 @@ async def _delete_collection_flow(*, client: AsyncCireRagClient, runtime: Ingest
         graph = result.get("graph_artifacts_deleted", 0)
         raptor = result.get("raptor_nodes_deleted", 0)
         print(f"✅ Colección eliminada: {docs} docs, {chunks} chunks, {graph} graph links, {raptor} RAPTOR nodes")
+        await _invalidate_orchestrator_answer_cache(runtime, collection_id=str(picked.id))
     except Exception as e:
         print(f"❌ Error al eliminar colección: {e}")
 
@@ -353,5 +375,6 @@ async def _delete_document_flow(*, client: AsyncCireRagClient, runtime: Ingestio
     try:
         result = await client.delete_document(doc_id, purge_chunks=True)
         print(f"✅ Documento eliminado: {result.get('status', 'ok')}")
+        await _invalidate_orchestrator_answer_cache(runtime, collection_id=None)
     except Exception as e:
         print(f"❌ Error al eliminar documento: {e}")
@@ -0,0 +1,87 @@
+"""Measure per-request memory held by converted evidence on a cross-standard retrieval.
+
+Simulates a ``chunk_fetch_k=120`` comprehensive response (long ISO clauses across three
+standards), converts it with ``RetrievalFlow._to_evidence`` and fans the result out into the
+state lists ``execute_tool_node`` keeps (``chunks``, ``retrieved_documents``). Reports the
+bytes still allocated once the raw payload is dropped, against the raw clause text itself.
+
+Usage: python scripts/bench_evidence_memory.py [--chunks 120] [--clause-bytes 4000]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.agent.components.evidence_signature import evidence_signature  # noqa: E402
+from app.agent.retrieval.retrieval_flow import RetrievalFlow  # noqa: E402
+
+STANDARDS = ("ISO 9001", "ISO 14001", "ISO 45001")
+CLAUSE_PARAGRAPH = (
+    "La organización debe planificar, establecer, implementar y mantener uno o varios "
+    "programas de auditoría que incluyan la frecuencia, los métodos, las responsabilidades,\n"
+    "los requisitos de planificación y la elaboración de informes, que deben tener en "
+    "consideración la importancia de los procesos involucrados (véase 9.2.2 y 10.2.1).\n"
+)
+
+
+def _payload(chunks: int, clause_bytes: int) -> str:
+    body = (CLAUSE_PARAGRAPH * (clause_bytes // len(CLAUSE_PARAGRAPH) + 1))[:clause_bytes]
+    items = []
+    for index in range(chunks):
+        standard = STANDARDS[index % len(STANDARDS)]
+        clause = f"{4 + index % 7}.{1 + index % 3}"
+        items.append(
+            {
+                "source": f"C{index + 1}",
+                "content": f"{standard} cláusula {clause}\n{body}\n",
+                "score": 0.9 - index / 1000.0,
+                "metadata": {
+                    "source_standard": standard,
+                    "clause_id": clause,
+                    "clause_title": "Auditoría interna",
+                    "document_id": f"doc-{index % len(STANDARDS)}",
+                    "chunk_id": f"chunk-{index}",
+                },
+            }
+        )
+    return json.dumps({"items": items})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", type=int, default=120)
+    parser.add_argument("--clause-bytes", type=int, default=4000)
+    args = parser.parse_args()
+
+    raw = _payload(args.chunks, args.clause_bytes)
+    gc.collect()
+    tracemalloc.start()
+    items = json.loads(raw)["items"]
+    text_bytes = sum(sys.getsizeof(item["content"]) for item in items)
+    evidence = RetrievalFlow._to_evidence(items)
+    chunks = list(evidence)
+    retrieved_documents = [*chunks]
+    for item in evidence:
+        # Touch every derived feature the validator, scope balancing and coverage tools read.
+        signature = evidence_signature(item)
+        signature.mentions_scope("iso 9001")
+        signature.mentions_keyword("auditoría")
+        signature.contains_marker("programa de auditoría")
+    del items
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"chunks={len(chunks)} documents={len(retrieved_documents)}")
+    print(f"clause_text_kib={text_bytes / 1024:.1f}")
+    print(f"retained_kib={retained / 1024:.1f} peak_kib={peak / 1024:.1f}")
+    print(f"retained_per_text_byte={retained / max(text_bytes, 1):.2f}")
+
+
+if __name__ == "__main__":
+    main()
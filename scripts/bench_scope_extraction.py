@@ -0,0 +1,95 @@
+"""Benchmark scope extraction on long answers: compiled ScopeIndex vs exhaustive alias scan.
+
+Usage: python scripts/bench_scope_extraction.py [--profile iso_auditor] [--iterations 50]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.agent import policies  # noqa: E402
+from app.profiles.loader import ProfileLoader  # noqa: E402
+
+ANSWER_PARAGRAPH = (
+    "Según la cláusula 9.2 de ISO 9001, la organización debe realizar auditorías internas a "
+    "intervalos planificados para proporcionar información acerca de si el sistema de gestión "
+    "de la calidad es conforme. ISO 45001 exige consultar a los trabajadores sobre la seguridad "
+    "y salud en el trabajo, mientras que ISO 14001 trata los aspectos ambientales y el "
+    "cumplimiento legal [a1b2c3d4-0000-4000-8000-000000000001]. "
+)
+
+
+def _edit_distance(a: str, b: str) -> int:
+    prev = list(range(len(b) + 1))
+    for i, ch_a in enumerate(a, start=1):
+        curr = [i]
+        for j, ch_b in enumerate(b, start=1):
+            curr.append(min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + (ch_a != ch_b)))
+        prev = curr
+    return prev[-1]
+
+
+class _ExhaustiveScan:
+    """The pre-index behaviour: every token against every alias, full distance each time."""
+
+    def __init__(self, profile) -> None:
+        self._catalog = policies._scope_catalog(profile)
+        self._fuzzy = bool(profile.scope_resolution.fuzzy_enabled)
+
+    def __bool__(self) -> bool:
+        return bool(self._catalog)
+
+    def best_match(self, token: str):
+        text = token.strip().lower()
+        best_scope, best_score = "", 0.0
+        for canonical, aliases in self._catalog.items():
+            alias_set = set(aliases) | {canonical.lower()}
+            if text in alias_set:
+                return canonical, 1.0
+            if not self._fuzzy:
+                continue
+            for alias in alias_set:
+                score = 1.0 - _edit_distance(text, alias) / max(len(text), len(alias), 1)
+                if score > best_score:
+                    best_scope, best_score = canonical, score
+        return (best_scope, best_score) if best_scope else None
+
+
+def _time(profile, answer: str, iterations: int) -> tuple[float, tuple[str, ...]]:
+    result = policies.extract_requested_scopes(answer, profile=profile)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        policies.extract_requested_scopes(answer, profile=profile)
+    return (time.perf_counter() - started) * 1000.0 / iterations, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile", default="iso_auditor")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--answer-bytes", type=int, default=4096)
+    args = parser.parse_args()
+
+    profile = ProfileLoader().load(args.profile)
+    answer = (ANSWER_PARAGRAPH * (args.answer_bytes // len(ANSWER_PARAGRAPH) + 1))[: args.answer_bytes]
+
+    indexed_ms, indexed = _time(profile, answer, args.iterations)
+    compiled = policies._scope_index
+    policies._scope_index = _ExhaustiveScan
+    try:
+        legacy_ms, legacy = _time(profile, answer, args.iterations)
+    finally:
+        policies._scope_index = compiled
+
+    print(f"profile={args.profile} answer_bytes={len(answer)} iterations={args.iterations}")
+    print(f"exhaustive_scan_ms={legacy_ms:.2f}")
+    print(f"compiled_index_ms={indexed_ms:.2f}")
+    print(f"speedup={legacy_ms / max(indexed_ms, 1e-9):.1f}x")
+    print(f"same_result={indexed == legacy} scopes={list(indexed)}")
+
+
+if __name__ == "__main__":
+    main()
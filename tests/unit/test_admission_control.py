@@ -0,0 +1,259 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.infrastructure.admission import AdmissionController, AdmissionRejected
+from app.infrastructure.metrics.admission import admission_metrics_store
+
+
+def _controller(**overrides) -> AdmissionController:
+    params = {"max_concurrent": 2, "tenant_max_concurrent": 2, "max_queue": 8}
+    params.update(overrides)
+    return AdmissionController(**params)
+
+
+async def _hold(controller, tenant, order, release: asyncio.Event, *, budget_ms=60_000):
+    async with controller.slot(tenant, budget_ms=budget_ms):
+        order.append(tenant)
+        await release.wait()
+
+
+def test_tenant_limit_queues_and_other_tenants_go_first():
+    controller = _controller(max_concurrent=3, tenant_max_concurrent=2)
+    order: list[str] = []
+
+    async def _run():
+        release = asyncio.Event()
+        tasks = [asyncio.create_task(_hold(controller, "batch", order, release)) for _ in range(4)]
+        await asyncio.sleep(0)
+        assert controller.snapshot()["tenants"]["batch"] == {"in_flight": 2, "queued": 2}
+        # An interactive tenant is not stuck behind the batch tenant's backlog.
+        interactive = asyncio.create_task(_hold(controller, "interactive", order, release))
+        await asyncio.sleep(0)
+        assert order == ["batch", "batch", "interactive"]
+        release.set()
+        await asyncio.gather(*tasks, interactive)
+
+    asyncio.run(_run())
+
+    assert order.count("batch") == 4
+    assert controller.snapshot() == {**controller.snapshot(), "in_flight": 0, "queued": 0}
+
+
+def test_weighted_fair_share_across_queued_tenants():
+    controller = _controller(max_concurrent=1, tenant_max_concurrent=1, tenant_weights={"a": 2})
+    order: list[str] = []
+
+    async def _run():
+        gate = asyncio.Event()
+        blocker = asyncio.create_task(_hold(controller, "x", [], gate))
+        await asyncio.sleep(0)
+        steps = asyncio.Event()
+        steps.set()
+        tasks = [asyncio.create_task(_hold(controller, t, order, steps)) for t in "aaaabb"]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(blocker, *tasks)
+
+    asyncio.run(_run())
+
+    # Tenant "a" has twice the weight of "b": two admissions for each of b's, interleaved.
+    assert order == ["a", "b", "a", "a", "b", "a"]
+
+
+def test_full_queue_sheds_immediately():
+    controller = _controller(max_concurrent=1, max_queue=1)
+    before = admission_metrics_store.snapshot(tenant_id="t-full")["shed_queue_full_total"]
+
+    async def _run():
+        release = asyncio.Event()
+        running = asyncio.create_task(_hold(controller, "t-full", [], release))
+        queued = asyncio.create_task(_hold(controller, "t-full", [], release))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as excinfo:
+            await controller.acquire("t-full", budget_ms=60_000)
+        release.set()
+        await asyncio.gather(running, queued)
+        return excinfo.value
+
+    rejected = asyncio.run(_run())
+
+    assert rejected.reason == "queue_full"
+    assert rejected.retry_after_seconds >= 1
+    after = admission_metrics_store.snapshot(tenant_id="t-full")["shed_queue_full_total"]
+    assert after - before == 1
+
+
+def test_estimated_wait_beyond_budget_sheds_with_retry_after():
+    controller = _controller(max_concurrent=1)
+
+    async def _run():
+        # Teach the controller that requests take ~2 s.
+        ticket = await controller.acquire("t", budget_ms=60_000)
+        ticket.admitted_at -= 2.0
+        ticket.release()
+
+        release = asyncio.Event()
+        running = asyncio.create_task(_hold(controller, "t", [], release))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as excinfo:
+            controller.check("t", budget_ms=3_000)
+        controller.check("t", budget_ms=10_000)
+        release.set()
+        await running
+        return excinfo.value
+
+    rejected = asyncio.run(_run())
+
+    assert rejected.reason == "slo"
+    assert rejected.retry_after_seconds in (2, 3)
+
+
+def test_waiter_timeout_and_cancellation_do_not_leak_slots():
+    controller = _controller(max_concurrent=1)
+
+    async def _run():
+        release = asyncio.Event()
+        running = asyncio.create_task(_hold(controller, "t", [], release))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as excinfo:
+            await controller.acquire("t", budget_ms=20)
+        cancelled = asyncio.create_task(controller.acquire("t", budget_ms=60_000))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        release.set()
+        await running
+        ticket = await asyncio.wait_for(controller.acquire("t", budget_ms=60_000), 1)
+        ticket.release()
+        ticket.release()
+        return excinfo.value
+
+    rejected = asyncio.run(_run())
+
+    assert rejected.reason == "timeout"
+    assert controller.snapshot()["in_flight"] == 0
+    assert controller.snapshot()["queued"] == 0
+    assert controller.snapshot()["tenants"] == {}
+
+
+def test_release_skips_a_waiter_cancelled_before_its_cleanup_ran():
+    controller = _controller(max_concurrent=1)
+
+    async def _run():
+        ticket = await controller.acquire("a", budget_ms=60_000)
+        queued = asyncio.create_task(controller.acquire("b", budget_ms=60_000))
+        await asyncio.sleep(0)
+        queued.cancel()
+        await asyncio.sleep(0)
+        # The waiter future is cancelled, but `acquire` has not dequeued it yet.
+        ticket.release()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        follow_up = await asyncio.wait_for(controller.acquire("c", budget_ms=60_000), 1)
+        follow_up.release()
+
+    asyncio.run(_run())
+
+    assert controller.snapshot()["in_flight"] == 0
+    assert controller.snapshot()["queued"] == 0
+    assert controller.snapshot()["tenants"] == {}
+
+
+def test_answer_returns_503_with_retry_after_when_shed():
+    from app.api.v1.routers.knowledge import _build_use_case, get_current_user
+    from app.api.v1.routers.knowledge import router as knowledge_router
+    from app.profiles.models import AgentProfile, ProfileResolution, ResolvedAgentProfile
+
+    use_case = AsyncMock()
+    use_case.execute = AsyncMock(
+        side_effect=AdmissionRejected("slo", tenant_id="test-tenant", retry_after_seconds=7)
+    )
+    app = FastAPI()
+    app.include_router(knowledge_router, prefix="/api/v1/knowledge")
+    app.dependency_overrides[get_current_user] = lambda: MagicMock(user_id="test-user")
+    app.dependency_overrides[_build_use_case] = lambda: use_case
+
+    # Resolving a real profile would warm the loader's process-wide tenant map caches.
+    resolved = ResolvedAgentProfile(
+        profile=AgentProfile(profile_id="base"),
+        resolution=ProfileResolution(
+            source="base", applied_profile_id="base", decision_reason="test"
+        ),
+    )
+    with patch(
+        "app.api.v1.routers.knowledge.authorize_requested_tenant",
+        AsyncMock(return_value="test-tenant"),
+    ), patch(
+        "app.api.v1.routers.knowledge.resolve_agent_profile",
+        AsyncMock(return_value=resolved),
+    ):
+        response = TestClient(app).post(
+            "/api/v1/knowledge/answer", json={"query": "q", "tenant_id": "test-tenant"}
+        )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "7"
+    assert response.json()["detail"]["code"] == "ORCH_OVERLOADED"
+
+
+def test_disconnected_stream_releases_its_admission_slot(monkeypatch):
+    from types import SimpleNamespace
+
+    from app.api.v1.routers import knowledge
+    from app.api.v1.schemas.knowledge_schemas import OrchestratorQuestionRequest
+    from app.infrastructure import admission
+    from app.profiles.models import AgentProfile, ProfileResolution, ResolvedAgentProfile
+
+    controller = _controller(max_concurrent=1, tenant_max_concurrent=1)
+    monkeypatch.setattr(admission, "get_admission_controller", lambda: controller)
+    monkeypatch.setattr(
+        knowledge, "authorize_requested_tenant", AsyncMock(return_value="test-tenant")
+    )
+    monkeypatch.setattr(
+        knowledge,
+        "resolve_agent_profile",
+        AsyncMock(
+            return_value=ResolvedAgentProfile(
+                profile=AgentProfile(profile_id="base"),
+                resolution=ProfileResolution(
+                    source="base", applied_profile_id="base", decision_reason="test"
+                ),
+            )
+        ),
+    )
+    started = asyncio.Event()
+
+    async def _execute(_command):
+        started.set()
+        await asyncio.sleep(60)
+
+    use_case = MagicMock(execute=_execute)
+
+    async def _run():
+        response = await knowledge.answer_with_orchestrator_stream(
+            SimpleNamespace(headers={}),
+            OrchestratorQuestionRequest(query="q", tenant_id="test-tenant"),
+            MagicMock(user_id="test-user"),
+            use_case,
+        )
+        stream = response.body_iterator
+        await stream.__anext__()
+        pending = asyncio.ensure_future(stream.__anext__())
+        await started.wait()
+        assert controller.snapshot()["in_flight"] == 1
+        # The client disconnects: the server closes the body iterator.
+        pending.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+        await stream.aclose()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        # Checked before asyncio.run tears down leftover tasks.
+        assert controller.snapshot()["in_flight"] == 0
+
+    asyncio.run(_run())
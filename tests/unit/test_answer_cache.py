@@ -0,0 +1,194 @@
+import asyncio
+
+from app.agent.components.answer_cache import (
+    AnswerCache,
+    AnswerCacheKey,
+    normalize_query_for_cache,
+)
+from app.agent.engine import HandleQuestionCommand, HandleQuestionResult, HandleQuestionUseCase
+from app.agent.types.models import (
+    AnswerDraft,
+    ClarificationRequest,
+    QueryIntent,
+    RetrievalDiagnostics,
+    RetrievalPlan,
+    ValidationResult,
+)
+from app.infrastructure.metrics.answer_cache import answer_cache_metrics_store
+from app.profiles.models import AgentProfile
+
+
+class _Runner:
+    def __init__(
+        self, *, accepted: bool = True, clarification: bool = False, degraded: tuple = ()
+    ) -> None:
+        self.calls = 0
+        self._accepted = accepted
+        self._clarification = clarification
+        self._degraded = degraded
+
+    async def execute(self, cmd: HandleQuestionCommand) -> HandleQuestionResult:
+        self.calls += 1
+        return HandleQuestionResult(
+            intent=QueryIntent(mode="literal_normativa"),
+            plan=RetrievalPlan(mode="literal_normativa", chunk_k=10, chunk_fetch_k=40, summary_k=0),
+            answer=AnswerDraft(
+                text=f"respuesta {self.calls}", mode="literal_normativa", degraded=self._degraded
+            ),
+            validation=ValidationResult(accepted=self._accepted, issues=[]),
+            retrieval=RetrievalDiagnostics(contract="advanced", trace={"timings_ms": {}}),
+            clarification=(
+                ClarificationRequest(question="¿Qué norma?") if self._clarification else None
+            ),
+        )
+
+
+def _use_case(runner: _Runner, cache: AnswerCache) -> HandleQuestionUseCase:
+    use_case = HandleQuestionUseCase(
+        retriever=None,  # type: ignore[arg-type]
+        answer_generator=None,  # type: ignore[arg-type]
+        validator=None,  # type: ignore[arg-type]
+        answer_cache=cache,
+    )
+    use_case._orchestrator = runner
+    return use_case
+
+
+def _cmd(
+    query: str,
+    *,
+    tenant_id: str = "tenant-a",
+    collection_id: str | None = "col-1",
+    user_id: str | None = "user-1",
+):
+    return HandleQuestionCommand(
+        query=query,
+        tenant_id=tenant_id,
+        collection_id=collection_id,
+        scope_label=f"tenant={tenant_id}",
+        agent_profile=AgentProfile(profile_id="iso_auditor", version="2.1.0"),
+        user_id=user_id,
+    )
+
+
+def test_normalize_query_for_cache_ignores_case_spacing_and_edge_punctuation():
+    assert normalize_query_for_cache("¿Qué dice  la cláusula 9.2 de ISO 9001?") == (
+        normalize_query_for_cache("qué dice la cláusula 9.2 de iso 9001")
+    )
+
+
+def test_repeated_question_is_served_from_cache_with_trace_marker():
+    runner = _Runner()
+    use_case = _use_case(runner, AnswerCache(ttl_seconds=60, max_entries=8))
+
+    first = asyncio.run(use_case.execute(_cmd("¿Qué dice la cláusula 9.2 de ISO 9001?")))
+    second = asyncio.run(use_case.execute(_cmd("qué dice la cláusula 9.2 de ISO 9001")))
+
+    assert runner.calls == 1
+    assert first.retrieval.trace["answer_cache"] == {"status": "miss"}
+    assert second.retrieval.trace["answer_cache"]["status"] == "hit"
+    assert second.answer.text == first.answer.text
+    stored = next(iter(use_case._answer_cache._entries.values())).value  # type: ignore[union-attr]
+    assert "answer_cache" not in stored.retrieval.trace
+
+
+def test_users_of_the_same_tenant_do_not_share_answers():
+    runner = _Runner()
+    cache = AnswerCache(ttl_seconds=60, max_entries=8)
+    use_case = _use_case(runner, cache)
+
+    first = asyncio.run(use_case.execute(_cmd("cláusula 9.2", user_id="user-1")))
+    second = asyncio.run(use_case.execute(_cmd("cláusula 9.2", user_id="user-2")))
+    repeat = asyncio.run(use_case.execute(_cmd("cláusula 9.2", user_id="user-1")))
+
+    assert runner.calls == 2
+    assert second.retrieval.trace["answer_cache"] == {"status": "miss"}
+    assert second.answer.text != first.answer.text
+    assert repeat.retrieval.trace["answer_cache"]["status"] == "hit"
+    assert repeat.answer.text == first.answer.text
+
+
+def test_clarifications_rejected_and_degraded_answers_are_not_cached():
+    runners = (
+        _Runner(clarification=True),
+        _Runner(accepted=False),
+        _Runner(degraded=("model_fallback",)),
+        _Runner(degraded=("truncated",)),
+    )
+    for runner in runners:
+        cache = AnswerCache(ttl_seconds=60, max_entries=8)
+        use_case = _use_case(runner, cache)
+
+        first = asyncio.run(use_case.execute(_cmd("requisitos de auditoría interna")))
+        asyncio.run(use_case.execute(_cmd("requisitos de auditoría interna")))
+
+        assert runner.calls == 2
+        assert len(cache) == 0
+        assert first.retrieval.trace["answer_cache"] == {"status": "skipped"}
+
+
+def test_clarification_follow_ups_bypass_cache():
+    runner = _Runner()
+    cache = AnswerCache(ttl_seconds=60, max_entries=8)
+    use_case = _use_case(runner, cache)
+    cmd = HandleQuestionCommand(
+        query="ISO 9001",
+        tenant_id="tenant-a",
+        collection_id=None,
+        scope_label="tenant=tenant-a",
+        clarification_context={"selected_option": "ISO 9001"},
+    )
+
+    result = asyncio.run(use_case.execute(cmd))
+
+    assert len(cache) == 0
+    assert "answer_cache" not in result.retrieval.trace
+
+
+def test_reingest_invalidation_drops_collection_and_tenant_wide_entries():
+    runner = _Runner()
+    cache = AnswerCache(ttl_seconds=60, max_entries=8)
+    use_case = _use_case(runner, cache)
+
+    asyncio.run(use_case.execute(_cmd("cláusula 9.2", collection_id="col-1")))
+    asyncio.run(use_case.execute(_cmd("cláusula 9.2", collection_id=None)))
+    asyncio.run(use_case.execute(_cmd("cláusula 9.2", collection_id="col-2")))
+    asyncio.run(use_case.execute(_cmd("cláusula 9.2", tenant_id="tenant-b")))
+
+    removed = cache.invalidate("tenant-a", "col-1")
+    asyncio.run(use_case.execute(_cmd("cláusula 9.2", collection_id="col-1")))
+
+    assert removed == 2
+    assert len(cache) == 3
+    assert runner.calls == 5
+    assert answer_cache_metrics_store.snapshot("tenant-a")["invalidated_entries_total"] >= 2
+
+
+def _key(query: str) -> AnswerCacheKey:
+    return AnswerCacheKey(
+        query=query,
+        tenant_id="t",
+        collection_id=None,
+        profile_id="p",
+        profile_version="1",
+        mode="explicativa",
+    )
+
+
+def test_lru_eviction_and_ttl_expiry(monkeypatch):
+    from app.agent.components import answer_cache as cache_module
+
+    now = {"value": 100.0}
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now["value"])
+    cache = AnswerCache(ttl_seconds=10, max_entries=2)
+
+    cache.put(_key("a"), "A")
+    cache.put(_key("b"), "B")
+    assert cache.get(_key("a")) is not None
+    cache.put(_key("c"), "C")
+
+    assert cache.get(_key("b")) is None
+    assert cache.get(_key("a")) is not None
+
+    now["value"] = 111.0
+    assert cache.get(_key("c")) is None
@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure import async_cache as cache_module
+from app.infrastructure.async_cache import AsyncLoadingCache
+from app.infrastructure.metrics.cache import cache_metrics_store
+from app.infrastructure.security import membership_repository
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.value = 1000.0
+
+    def __call__(self) -> float:
+        return self.value
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    fake = _Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", fake)
+    return fake
+
+
+def _cache(**overrides) -> AsyncLoadingCache:
+    params = {
+        "name": "test",
+        "ttl_seconds": 60,
+        "stale_seconds": 30,
+        "negative_ttl_seconds": 5,
+        "max_entries": 8,
+        "is_negative": lambda value: not value,
+    }
+    params.update(overrides)
+    return AsyncLoadingCache(**params)
+
+
+def test_concurrent_misses_share_one_load():
+    cache = _cache()
+    calls = {"count": 0}
+
+    async def _load():
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        return ["tenant-a"]
+
+    async def _run():
+        return await asyncio.gather(*(cache.get("u1", _load) for _ in range(10)))
+
+    results = asyncio.run(_run())
+
+    assert calls["count"] == 1
+    assert all(result == ["tenant-a"] for result in results)
+
+
+def test_stale_entry_is_served_while_refreshing_in_background(clock):
+    cache = _cache()
+    values = iter([["old"], ["new"]])
+
+    async def _load():
+        return next(values)
+
+    async def _run():
+        await cache.get("u1", _load)
+        clock.value += 70  # past TTL, inside the stale window
+        stale = await cache.get("u1", _load)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        fresh = await cache.get("u1", _load)
+        return stale, fresh
+
+    stale, fresh = asyncio.run(_run())
+
+    assert stale == ["old"]
+    assert fresh == ["new"]
+    assert cache_metrics_store.snapshot()["caches"]["test"]["stale_hits_total"] >= 1
+
+
+def test_negative_results_expire_faster_and_are_never_served_stale(clock):
+    cache = _cache()
+    values = iter([[], ["tenant-a"]])
+
+    async def _load():
+        return next(values)
+
+    assert asyncio.run(cache.get("u1", _load)) == []
+    clock.value += 6
+    assert asyncio.run(cache.get("u1", _load)) == ["tenant-a"]
+
+
+def test_lru_bound_and_failed_loads_are_not_cached():
+    cache = _cache(max_entries=2)
+
+    async def _value(key):
+        async def _load():
+            return [key]
+
+        return await cache.get(key, _load)
+
+    for key in ("a", "b", "a", "c"):
+        asyncio.run(_value(key))
+    assert len(cache) == 2
+    assert "b" not in cache._entries
+
+    async def _boom():
+        raise RuntimeError("supabase down")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(cache.get("d", _boom))
+    assert "d" not in cache._entries
+
+
+def test_fetch_membership_tenants_uses_shared_cache(monkeypatch):
+    membership_repository.get_membership_cache().clear()
+    calls = {"count": 0}
+
+    async def _fake_fetch(user_id: str) -> list[str]:
+        calls["count"] += 1
+        return ["tenant-a"]
+
+    monkeypatch.setattr(membership_repository, "_internal_fetch_membership_tenants", _fake_fetch)
+
+    async def _run():
+        return await asyncio.gather(
+            *(membership_repository.fetch_membership_tenants("cache-user") for _ in range(5))
+        )
+
+    results = asyncio.run(_run())
+    results[0].append("mutated")
+
+    assert calls["count"] == 1
+    assert asyncio.run(membership_repository.fetch_membership_tenants("cache-user")) == [
+        "tenant-a"
+    ]
+    membership_repository.get_membership_cache().clear()
@@ -0,0 +1,187 @@
+import asyncio
+import base64
+import time
+
+import httpx
+import jwt
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.requests import Request
+
+from app.api.v1 import deps
+from app.infrastructure.config import settings
+from app.infrastructure.metrics.auth import auth_metrics_store
+from app.infrastructure.security import token_cache
+from app.infrastructure.security.token_cache import JwksKeyStore, VerifiedClaimsCache
+
+
+def _request() -> Request:
+    return Request({"type": "http", "headers": []})
+
+
+def _creds(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.fixture
+def claims_cache(monkeypatch) -> VerifiedClaimsCache:
+    cache = VerifiedClaimsCache(max_entries=2, negative_ttl_seconds=30)
+    monkeypatch.setattr(deps, "get_verified_claims_cache", lambda: cache)
+    monkeypatch.setattr(deps, "get_jwks_key_store", lambda: None)
+    monkeypatch.setattr(settings, "ORCH_AUTH_REQUIRED", True)
+    return cache
+
+
+def test_verified_claims_are_served_from_cache_until_exp(monkeypatch, claims_cache):
+    calls = {"count": 0}
+    payload = {"sub": "user-1", "exp": time.time() + 60, "tenant_ids": ["tenant-a"]}
+
+    def _decode(_: str):
+        calls["count"] += 1
+        return payload
+
+    monkeypatch.setattr(deps, "_decode_jwt_payload", _decode)
+    before = auth_metrics_store.snapshot()
+
+    first = asyncio.run(deps.get_current_user(_request(), _creds("cached-token")))
+    second = asyncio.run(deps.get_current_user(_request(), _creds("cached-token")))
+
+    assert calls["count"] == 1
+    assert first.user_id == second.user_id == "user-1"
+    assert second.tenant_ids == ["tenant-a"]
+    after = auth_metrics_store.snapshot()
+    assert after["claims_cache_hits_total"] == before["claims_cache_hits_total"] + 1
+    assert after["claims_cache_misses_total"] == before["claims_cache_misses_total"] + 1
+
+
+def test_expired_claims_are_not_cached():
+    cache = VerifiedClaimsCache(max_entries=4, negative_ttl_seconds=30)
+    cache.store("t", {"sub": "u"}, expires_at=time.time() - 1)
+    cache.store("n", {"sub": "u"}, expires_at=None)
+    assert cache.get("t") is None
+    assert cache.get("n") is None
+
+
+def test_rejected_tokens_are_negative_cached(monkeypatch, claims_cache):
+    calls = {"fallback": 0}
+
+    def _raise(_: str):
+        raise jwt.InvalidTokenError("invalid")
+
+    async def _no_profile(_: str):
+        calls["fallback"] += 1
+        return None
+
+    monkeypatch.setattr(deps, "_decode_jwt_payload", _raise)
+    monkeypatch.setattr(deps, "_fetch_supabase_user_profile", _no_profile)
+    before = auth_metrics_store.snapshot()
+
+    for _ in range(3):
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(deps.get_current_user(_request(), _creds("rejected-token")))
+        assert exc.value.status_code == 401
+
+    assert calls["fallback"] == 1
+    after = auth_metrics_store.snapshot()
+    assert after["remote_fallbacks_total"] == before["remote_fallbacks_total"] + 1
+    assert after["negative_cache_hits_total"] == before["negative_cache_hits_total"] + 2
+
+
+def test_only_a_definite_supabase_rejection_is_negative_cached(monkeypatch, claims_cache):
+    def _raise(_: str):
+        raise jwt.InvalidTokenError("invalid")
+
+    outcomes: list[object] = []
+
+    async def _fake_get(pool, url, **_):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(int(outcome), json={}, request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(deps, "_decode_jwt_payload", _raise)
+    monkeypatch.setattr(deps, "outbound_get", _fake_get)
+    monkeypatch.setattr(settings, "SUPABASE_URL", "https://supabase.example")
+    monkeypatch.setattr(settings, "SUPABASE_ANON_KEY", "anon")
+
+    def _status(token: str) -> int:
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(deps.get_current_user(_request(), _creds(token)))
+        return exc.value.status_code
+
+    outcomes.extend([httpx.ConnectError("down"), 503])
+    assert _status("outage-token") == 503
+    assert _status("outage-token") == 503
+    assert not claims_cache.is_rejected("outage-token")
+
+    outcomes.append(401)
+    assert _status("revoked-token") == 401
+    assert claims_cache.is_rejected("revoked-token")
+
+
+def test_jwks_store_refreshes_once_for_unknown_kid(monkeypatch):
+    calls = {"count": 0}
+
+    class _Response:
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self):
+            return {"keys": []}
+
+    async def _fake_get(pool, url, *, timeout, **_):
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        return _Response()
+
+    monkeypatch.setattr(token_cache, "outbound_get", _fake_get)
+    store = JwksKeyStore(jwks_url="https://example/jwks", min_refresh_interval_seconds=60)
+    token = jwt.encode({"sub": "u"}, "secret", algorithm="HS256", headers={"kid": "rotated"})
+
+    async def _run():
+        await asyncio.gather(*(store.ensure_key(token) for _ in range(5)))
+        await store.ensure_key(token)
+
+    asyncio.run(_run())
+
+    assert calls["count"] == 1
+    assert store.signing_key(token) is None
+
+
+def test_unknown_kid_does_not_wait_for_a_new_jwks_fetch(monkeypatch):
+    secret = "rotated-secret-with-enough-bytes!"
+    jwk = {
+        "kty": "oct",
+        "kid": "rotated",
+        "alg": "HS256",
+        "k": base64.urlsafe_b64encode(secret.encode()).rstrip(b"=").decode(),
+    }
+    release = asyncio.Event()
+
+    class _Response:
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self):
+            return {"keys": [jwk]}
+
+    async def _slow_get(pool, url, *, timeout, **_):
+        await release.wait()
+        return _Response()
+
+    monkeypatch.setattr(token_cache, "outbound_get", _slow_get)
+    store = JwksKeyStore(jwks_url="https://example/jwks", unknown_kid_wait_seconds=0.01)
+    token = jwt.encode({"sub": "u"}, secret, algorithm="HS256", headers={"kid": "rotated"})
+
+    async def _run():
+        # Neither the call that starts the refresh nor one that finds it in flight blocks.
+        await asyncio.wait_for(store.ensure_key(token), timeout=0.5)
+        await asyncio.wait_for(store.ensure_key(token), timeout=0.5)
+        assert store.signing_key(token) is None
+        release.set()
+        await store.refresh()
+
+    asyncio.run(_run())
+
+    assert store.signing_key(token) is not None
@@ -128,3 +128,131 @@ def test_selector_cache_ttl_avoids_repeated_probes(monkeypatch):
     assert first == "http://local:8000"
     assert second == "http://local:8000"
     assert calls["get"] == 1
+
+
+def _healthy_client():
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return None
+
+        async def get(self, url):
+            return _Response(200)
+
+    return _Client
+
+
+def test_selector_routes_around_open_circuit_without_reprobing(monkeypatch):
+    from app.infrastructure.clients.circuit_breaker import CircuitBreakerConfig
+
+    monkeypatch.setattr(selector_module.httpx, "AsyncClient", _healthy_client())
+    selector = RagBackendSelector(
+        endpoints={"a": "http://a:8000", "b": "http://b:8000", "c": "http://c:8000"},
+        ttl_seconds=60,
+        breaker_config=CircuitBreakerConfig(min_requests=2, open_seconds=60),
+    )
+    asyncio.run(selector.probe_all())
+
+    for _ in range(2):
+        selector.record_result("a", ok=False, latency_ms=5)
+
+    chosen = {asyncio.run(selector.current_backend()) for _ in range(40)}
+
+    assert chosen == {"b", "c"}
+    assert selector.snapshot()["backends"]["a"]["state"] == "open"
+    assert selector.alternate_backend("b") == "c"
+
+
+def test_selector_weights_traffic_by_p95_latency(monkeypatch):
+    import random
+
+    monkeypatch.setattr(selector_module.httpx, "AsyncClient", _healthy_client())
+    selector = RagBackendSelector(
+        endpoints={"fast": "http://fast:8000", "slow": "http://slow:8000"},
+        rng=random.Random(7),
+    )
+    asyncio.run(selector.probe_all())
+    for _ in range(10):
+        selector.record_result("fast", ok=True, latency_ms=100)
+        selector.record_result("slow", ok=True, latency_ms=900)
+
+    picks = [asyncio.run(selector.current_backend()) for _ in range(200)]
+
+    assert picks.count("fast") > 150
+    assert "slow" in picks
+
+
+def test_half_open_trial_closes_or_reopens_circuit(monkeypatch):
+    from app.infrastructure.clients import circuit_breaker as breaker_module
+    from app.infrastructure.clients.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+
+    now = {"value": 0.0}
+    monkeypatch.setattr(breaker_module, "monotonic", lambda: now["value"])
+    breaker = CircuitBreaker(
+        config=CircuitBreakerConfig(min_requests=3, open_seconds=10, slow_call_ms=1000)
+    )
+    breaker.record(ok=True, latency_ms=5)
+    breaker.record(ok=True, latency_ms=2500)
+    breaker.record(ok=False, latency_ms=5)
+    assert breaker.state == "open"
+    assert breaker.is_available() is False
+
+    now["value"] = 11.0
+    assert breaker.acquire() is True
+    assert breaker.state == "half_open"
+    assert breaker.acquire() is False
+    breaker.record(ok=False, latency_ms=5)
+    assert breaker.state == "open"
+
+    now["value"] = 22.0
+    assert breaker.acquire() is True
+    breaker.record(ok=True, latency_ms=5)
+    assert breaker.state == "closed"
+
+
+def test_all_backends_down_uses_last_resort_and_skips_fallback(monkeypatch):
+    selector = RagBackendSelector(local_url="http://local:8000", docker_url="http://docker:8000")
+    for backend in ("local", "docker"):
+        for _ in range(5):
+            selector.record_result(backend, ok=False, latency_ms=5)
+    selector._last_probe_at = selector_module.monotonic()
+
+    assert asyncio.run(selector.current_backend()) == "docker"
+    assert selector.alternate_backend("docker") is None
+
+
+def test_get_calls_report_their_half_open_trial(monkeypatch):
+    from app.infrastructure.clients import circuit_breaker as breaker_module
+    from app.infrastructure.clients.circuit_breaker import CircuitBreakerConfig
+    from app.infrastructure.clients.rag_client import RagRetrievalContractClient
+    from app.infrastructure.config import settings
+
+    now = {"value": 0.0}
+    monkeypatch.setattr(breaker_module, "monotonic", lambda: now["value"])
+    monkeypatch.setattr(settings, "RAG_SERVICE_SECRET", "secret")
+    selector = RagBackendSelector(
+        endpoints={"a": "http://a:8000"},
+        breaker_config=CircuitBreakerConfig(min_requests=1, open_seconds=10),
+    )
+    selector.record_result("a", ok=False, latency_ms=5)
+    selector._last_probe_at = selector_module.monotonic()
+    now["value"] = 11.0
+
+    # Untracked reads never take the half-open trial they could not close.
+    asyncio.run(selector.resolve_untracked_base_url())
+    assert selector.snapshot()["backends"]["a"]["state"] == "open"
+
+    class _Client:
+        async def get(self, url, params=None, headers=None):
+            return httpx.Response(200, json=[{"name": "c1"}], request=httpx.Request("GET", url))
+
+    client = RagRetrievalContractClient(backend_selector=selector, http_client=_Client())
+    collections = asyncio.run(client.list_collections(tenant_id="t1"))
+
+    assert collections == [{"name": "c1"}]
+    assert selector.snapshot()["backends"]["a"]["state"] == "closed"
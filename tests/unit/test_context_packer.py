@@ -0,0 +1,119 @@
+import asyncio
+
+from app.agent.components.context_packer import (
+    drop_near_duplicates,
+    estimate_tokens,
+    pack_context,
+    trim_to_sentences,
+)
+from app.agent.formatters.answer_adapter import GroundedAnswerAdapter
+from app.agent.types.models import EvidenceItem, RetrievalPlan
+
+_CLAUSE = (
+    "La organizacion debe determinar las cuestiones externas e internas que son pertinentes "
+    "para su proposito y su direccion estrategica y que afectan a su capacidad para lograr "
+    "los resultados previstos de su sistema de gestion."
+)
+
+
+def _item(source: str, content: str, standard: str = "") -> EvidenceItem:
+    metadata = {"row": {"content": content, "metadata": {"source_standard": standard}}}
+    return EvidenceItem(source=source, content=content, score=0.9, metadata=metadata)
+
+
+def test_near_duplicates_are_dropped_within_a_group_only():
+    items = [
+        _item("a", _CLAUSE),
+        _item("b", _CLAUSE.replace("pertinentes", "relevantes")),
+        _item("c", "Texto sin relacion con la clausula anterior sobre auditorias internas."),
+    ]
+
+    kept, dropped = drop_near_duplicates(items, threshold=0.6)
+    assert [item.source for item in kept] == ["a", "c"]
+    assert [item.source for item in dropped] == ["b"]
+
+    by_source = {"a": "ISO 9001", "b": "ISO 14001", "c": "ISO 9001"}
+    kept, dropped = drop_near_duplicates(
+        items, threshold=0.6, group=lambda item: by_source[item.source]
+    )
+    assert [item.source for item in kept] == ["a", "b", "c"]
+    assert dropped == []
+
+
+def test_long_chunks_keep_the_sentences_matching_the_query():
+    text = " ".join(
+        [
+            "Introduccion general del documento sin detalles.",
+            "El alcance describe los limites del sistema.",
+            "La auditoria interna debe planificarse a intervalos planificados.",
+            "Notas editoriales finales.",
+        ]
+        * 3
+    )
+
+    trimmed = trim_to_sentences(text, query="como planificar la auditoria interna", max_tokens=40)
+
+    assert estimate_tokens(trimmed) <= 48
+    assert "auditoria interna" in trimmed
+    assert "..." in trimmed
+    assert trim_to_sentences("Corto.", query="x", max_tokens=40) == "Corto."
+
+
+def test_pack_context_fills_budget_in_selection_order_and_reports_savings():
+    items = [
+        _item(
+            f"c{i}",
+            " ".join(f"Fragmento {i} seccion {j} con requisitos del sistema." for j in range(12)),
+        )
+        for i in range(6)
+    ]
+    items.insert(1, _item("dup", items[0].content))
+
+    packed = pack_context(items, query="fragmento", budget_tokens=500, max_items=4)
+
+    assert [item.source for item in packed.items] == ["c0", "c1", "c2"]
+    assert all(text.startswith(f"[{item.source}] ") for item, text in zip(packed.items, packed.texts))
+    stats = packed.stats
+    assert stats["duplicates_removed"] == 1
+    assert stats["dropped_for_budget"] == 1
+    assert stats["tokens_out"] <= 500
+    # Savings are measured against the unpacked selection, not every retrieved candidate.
+    baseline = sum(estimate_tokens(f"[{item.source}] {item.content}") for item in items[:4])
+    assert stats["tokens_in"] == baseline
+    assert stats["tokens_saved"] == stats["tokens_in"] - stats["tokens_out"] > 0
+    assert stats["tokens_saved"] == stats["tokens_saved_dedupe"] + stats["tokens_saved_trim"]
+
+
+class _RecordingService:
+    def __init__(self) -> None:
+        self.context_chunks: list[str] = []
+
+    async def generate_answer(self, query, context_chunks, **kwargs):
+        self.context_chunks = list(context_chunks)
+        return "Respuesta [a]"
+
+
+def test_adapter_packs_cross_scope_context_without_losing_a_scope():
+    service = _RecordingService()
+    adapter = GroundedAnswerAdapter(service=service)  # type: ignore[arg-type]
+    plan = RetrievalPlan(
+        mode="comparativa",
+        chunk_k=6,
+        chunk_fetch_k=6,
+        summary_k=0,
+        requested_standards=("ISO 9001", "ISO 14001"),
+    )
+    chunks = [
+        _item("a", _CLAUSE, "ISO 9001"),
+        _item("a-copy", _CLAUSE, "ISO 9001"),
+        _item("b", _CLAUSE, "ISO 14001"),
+    ]
+
+    draft = asyncio.run(
+        adapter.generate(query="contexto", scope_label="", plan=plan, chunks=chunks, summaries=[])
+    )
+
+    assert sorted(item.source for item in draft.evidence) == ["a", "b"]
+    assert len(service.context_chunks) == 2
+    assert draft.context_stats["duplicates_removed"] == 1
+    assert draft.context_stats["tokens_saved"] > 0
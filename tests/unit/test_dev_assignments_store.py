@@ -65,3 +65,39 @@ def test_store_thread_safe_writes(monkeypatch, tmp_path):
     snapshot = store.snapshot()
     assert len(snapshot) == 25
     assert snapshot["tenant-0"] == "base"
+
+
+def test_store_serves_lookups_from_memory_until_file_changes(monkeypatch, tmp_path):
+    store = _configure_store(monkeypatch, tmp_path)
+    store.set("tenant-a", "iso_auditor")
+    reads = {"count": 0}
+    original_read = store._read_assignments
+
+    def _counting_read():
+        reads["count"] += 1
+        return original_read()
+
+    monkeypatch.setattr(store, "_read_assignments", _counting_read)
+    monkeypatch.setattr(settings, "ORCH_DEV_PROFILE_ASSIGNMENTS_RECHECK_SECONDS", 0.0)
+
+    for _ in range(10):
+        assert store.get("tenant-a") == "iso_auditor"
+    assert reads["count"] == 0
+
+    store.path.write_text(json.dumps({"tenant-a": "legal_cl", "tenant-b": "base"}), encoding="utf-8")
+
+    assert store.get("tenant-a") == "legal_cl"
+    assert store.get("tenant-b") == "base"
+    assert reads["count"] == 1
+
+
+def test_store_skips_stat_within_recheck_window(monkeypatch, tmp_path):
+    store = _configure_store(monkeypatch, tmp_path)
+    monkeypatch.setattr(settings, "ORCH_DEV_PROFILE_ASSIGNMENTS_RECHECK_SECONDS", 3600.0)
+    assert store.get("tenant-a") is None
+
+    store.path.write_text(json.dumps({"tenant-a": "legal_cl"}), encoding="utf-8")
+    assert store.get("tenant-a") is None
+
+    store.set("tenant-b", "base")
+    assert store.snapshot() == {"tenant-a": "legal_cl", "tenant-b": "base"}
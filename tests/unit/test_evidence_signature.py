@@ -0,0 +1,95 @@
+import random
+import re
+import sys
+
+from app.agent.components.citations import build_citation_bundle
+from app.agent.components.evidence_signature import build_evidence_signature, evidence_signature
+from app.agent.retrieval.retrieval_flow import RetrievalFlow
+from app.agent.types.models import EvidenceItem
+
+
+def test_mentions_clause_matches_word_bounded_regex():
+    rng = random.Random(3)
+    pieces = ["9", "2", "1", "10", ".", ".", " ", "a", "v", "-", "("]
+    refs = ["9.2", "9.2.1", "2.1", "1.9", "10.1", "4", "A.5"]
+    for _ in range(2000):
+        content = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 14)))
+        signature = build_evidence_signature(content, {"row": {"content": content}})
+        for ref in refs:
+            expected = bool(re.search(rf"\b{re.escape(ref)}(?:\.\d+)*\b", content))
+            assert signature.mentions_clause(ref) is expected, (content, ref)
+
+
+def test_signature_precomputes_standard_refs_and_blobs():
+    metadata = {
+        "row": {
+            "content": "Ver cláusula 9.2.1 sobre auditoría interna.",
+            "metadata": {"norma": "iso 9001", "clause_refs": ["8.5"], "clause_title": "Auditoría"},
+            "similarity": 0.8,
+        }
+    }
+    signature = build_evidence_signature("Ver cláusula 9.2.1 sobre  auditoría interna.", metadata)
+
+    assert signature.standard == "ISO 9001"
+    assert signature.matches_clause("9.2") and signature.matches_clause("8")
+    assert not signature.matches_clause("9.3")
+    assert signature.mentions_scope("ISO 9001")
+    assert signature.contains_marker("Sobre Auditoría")
+    assert signature.mentions_keyword("auditoría") and signature.mentions_keyword("8.5")
+    assert signature.similarity == 0.8
+
+
+def test_to_evidence_attaches_signatures_reused_by_citations():
+    items = RetrievalFlow._to_evidence(
+        [
+            {
+                "source": "C1",
+                "content": "ISO 45001 cláusula 6.1.2 identificación de peligros",
+                "metadata": {"clause_id": "6.1.2"},
+                "score": 0.7,
+            }
+        ]
+    )
+
+    assert items[0].signature is not None
+    assert evidence_signature(items[0]) is items[0].signature
+    _, details, _ = build_citation_bundle(answer_text="[C1]", evidence=items, profile=None)
+    assert details[0]["standard"] == "ISO 45001"
+    assert details[0]["clause"] == "6.1.2"
+
+
+def test_signature_is_built_lazily_and_memoized_for_plain_items():
+    item = EvidenceItem(source="C9", content="texto", metadata={"row": {"content": "texto"}})
+    first = evidence_signature(item)
+    assert item.signature is first
+    assert evidence_signature(item) is first
+
+
+def test_contains_marker_matches_collapsed_lowercase_text():
+    rng = random.Random(5)
+    pieces = ["a", "B", "c", " ", "  ", "\n", "\t", "ab"]
+    markers = ["a", "ab", "a b", "b c", "a  b", "ab c a", "a\nb", " c "]
+    for _ in range(2000):
+        content = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+        signature = build_evidence_signature(content, {})
+        collapsed = " ".join(content.split()).lower()
+        for marker in markers:
+            expected = marker.strip().lower() in collapsed
+            assert signature.contains_marker(marker) is expected, (content, marker)
+
+
+def test_to_evidence_keeps_one_text_buffer_per_chunk():
+    content = "ISO 9001 cláusula 9.2 auditoría interna\n  programa de auditoría"
+    source = "".join(["C", "7"])
+    items = RetrievalFlow._to_evidence(
+        [{"source": source, "content": content, "metadata": {}, "score": 0.5}]
+    )
+    item = items[0]
+    signature = evidence_signature(item)
+
+    assert item.metadata["row"]["content"] is item.content
+    assert signature.content is item.content
+    assert signature.lowered is signature.folded
+    assert signature.lowered_item is signature.lowered
+    assert item.source is sys.intern("C7")
+    assert not hasattr(item, "__dict__")
@@ -0,0 +1,120 @@
+import asyncio
+from types import MappingProxyType
+
+from langgraph.channels.binop import BinaryOperatorAggregate
+from langgraph.graph import END, START, StateGraph
+
+from app.agent.types.models import (
+    EvidenceItem,
+    ReasoningPlan,
+    ReasoningStep,
+    ToolCall,
+    ToolResult,
+)
+from app.graph.nodes.execution import execute_tool_node
+from app.graph.state import ReplaceList, UniversalState, add_timings, append_items
+
+
+class _Components:
+    def __init__(self, tools: dict) -> None:
+        self.tools = tools
+
+    def _runtime_context(self):
+        return None
+
+
+class _RetrievalTool:
+    name = "semantic_retrieval"
+
+    def __init__(self) -> None:
+        self.seen_state = None
+
+    async def run(self, payload, *, state, context):
+        del payload, context
+        self.seen_state = state
+        chunk = EvidenceItem(source="C2", content="nuevo")
+        return ToolResult(
+            tool=self.name,
+            ok=True,
+            output={"chunk_count": 1},
+            metadata={"chunks": [chunk], "summaries": [], "subquery_groups": [{"id": "q1"}]},
+        )
+
+
+def test_append_items_appends_without_mutating_and_replace_list_resets():
+    current: list[int] = [1]
+    assert append_items(current, [2, 3]) == [1, 2, 3]
+    assert current == [1]
+    assert append_items(current, []) is current
+    assert append_items(current, ReplaceList()) == []
+    assert append_items(None, [4]) == [4]
+
+
+def test_add_timings_accumulates_per_key():
+    timings = add_timings({}, {"planner": 10.004})
+    timings = add_timings(timings, {"planner": 5.0, "generator": 2.5})
+    assert timings == {"planner": 15.0, "generator": 2.5}
+
+
+def test_universal_state_declares_reducer_channels():
+    channels = StateGraph(UniversalState).channels
+    for key in (
+        "chunks",
+        "summaries",
+        "retrieved_documents",
+        "tool_results",
+        "reasoning_steps",
+        "subquery_groups",
+        "stage_timings_ms",
+        "tool_timings_ms",
+    ):
+        assert isinstance(channels[key], BinaryOperatorAggregate), key
+
+
+def test_deltas_are_applied_once_across_conditional_edges():
+    graph = StateGraph(UniversalState)
+
+    async def _step(state):
+        index = len(state.get("reasoning_steps") or []) + 1
+        return {
+            "reasoning_steps": [ReasoningStep(index=index, type="plan", description="step")],
+            "stage_timings_ms": {"step": 1.0},
+        }
+
+    graph.add_node("first", _step)
+    graph.add_node("second", _step)
+    graph.add_edge(START, "first")
+    graph.add_conditional_edges("first", lambda state: "second", {"second": "second"})
+    graph.add_edge("second", END)
+
+    final = asyncio.run(graph.compile().ainvoke({"reasoning_steps": []}))
+
+    assert [step.index for step in final["reasoning_steps"]] == [1, 2]
+    assert final["stage_timings_ms"] == {"step": 2.0}
+
+
+def test_execute_tool_node_returns_deltas_and_passes_read_only_state():
+    tool = _RetrievalTool()
+    existing = EvidenceItem(source="C1", content="previo")
+    state = {
+        "reasoning_plan": ReasoningPlan(
+            goal="q", steps=[ToolCall(tool="noop"), ToolCall(tool="semantic_retrieval")]
+        ),
+        "tool_cursor": 1,
+        "tool_results": [ToolResult(tool="noop", ok=True)],
+        "reasoning_steps": [],
+        "chunks": [existing],
+        "retrieved_documents": [existing],
+        "working_memory": {},
+    }
+
+    updates = asyncio.run(execute_tool_node(state, _Components({tool.name: tool})))
+
+    assert isinstance(tool.seen_state, MappingProxyType)
+    assert [result.tool for result in updates["tool_results"]] == ["semantic_retrieval"]
+    assert [item.source for item in updates["chunks"]] == ["C2"]
+    assert [item.source for item in updates["retrieved_documents"]] == ["C2"]
+    assert updates["subquery_groups"] == [{"id": "q1"}]
+    assert len(updates["reasoning_steps"]) == 1
+    assert set(updates["tool_timings_ms"]) == {"semantic_retrieval"}
+    assert state["chunks"] == [existing]
@@ -1,5 +1,10 @@
 import asyncio
 
+from app.agent.components.answer_stream import (
+    AnswerStreamSink,
+    bind_answer_stream,
+    stream_answer_tokens,
+)
 from app.agent.formatters.answer_adapter import GroundedAnswerAdapter
 from app.agent.types.models import EvidenceItem, RetrievalPlan
 from app.profiles.models import AgentProfile
@@ -141,3 +146,77 @@ def test_grounded_answer_adapter_balances_cross_scope_context() -> None:
     assert "ISO 9001" in context
     assert "ISO 14001" in context
     assert "ISO 45001" in context
+
+
+class _StreamingService:
+    def __init__(self, streamed: str, returned: str) -> None:
+        self._streamed = streamed
+        self._returned = returned
+
+    async def generate_answer(self, query: str, context_chunks: list[str], **kwargs) -> str:
+        on_token = kwargs.get("on_token")
+        if on_token is not None:
+            on_token(self._streamed)
+        return self._returned
+
+
+def _stream_events(service: _StreamingService, plan: RetrievalPlan) -> tuple[str, list]:
+    adapter = GroundedAnswerAdapter(service=service)  # type: ignore[arg-type]
+    chunks = [
+        EvidenceItem(
+            source=f"C{index}",
+            content=f"{scope} requisito {index}",
+            metadata={"row": {"metadata": {"source_standard": scope}}},
+        )
+        for index, scope in enumerate(plan.requested_standards or ("ISO 9001",))
+    ]
+    sink = AnswerStreamSink()
+
+    async def _run():
+        with bind_answer_stream(sink), stream_answer_tokens():
+            return await adapter.generate(
+                query="q",
+                scope_label="ISO",
+                plan=plan,
+                chunks=chunks,
+                summaries=[],
+                working_memory=None,
+                partial_answers=None,
+                agent_profile=AgentProfile(profile_id="test-profile"),
+            )
+
+    draft = asyncio.run(_run())
+    events = []
+    while not sink.queue.empty():
+        events.append(sink.queue.get_nowait())
+    return draft.text, events
+
+
+def test_streamed_answer_is_reset_when_guardrails_or_fallback_change_it() -> None:
+    literal = RetrievalPlan(
+        mode="literal", chunk_k=4, chunk_fetch_k=4, summary_k=0, require_literal_evidence=True
+    )
+    unchanged = "No hay evidencia literal para esa clausula."
+    text, events = _stream_events(_StreamingService(unchanged, unchanged), literal)
+    assert text == unchanged
+    assert [name for name, _ in events] == ["token"]
+
+    # Model failed mid-stream and the service fell back to raw context.
+    text, events = _stream_events(_StreamingService("Respuesta parc", "ISO 9001 requisito"), literal)
+    assert [name for name, _ in events] == ["token", "token_reset", "token"]
+    assert events[1][1]["reason"] == "generation_fallback"
+    assert events[2][1]["delta"] == text
+
+    cross_scope = RetrievalPlan(
+        mode="cross_scope_analysis",
+        chunk_k=8,
+        chunk_fetch_k=8,
+        summary_k=0,
+        require_literal_evidence=False,
+        requested_standards=("ISO 9001", "ISO 14001"),
+    )
+    text, events = _stream_events(_StreamingService("Hallazgo [C0]", "Hallazgo [C0]"), cross_scope)
+    assert text.startswith("Nota de trazabilidad")
+    assert [name for name, _ in events] == ["token", "token_reset", "token"]
+    assert events[1][1]["reason"] == "guardrails"
+    assert events[2][1]["delta"] == text
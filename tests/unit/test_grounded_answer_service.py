@@ -1,6 +1,11 @@
 import asyncio
 
-from app.agent.components.grounded_answer_service import GroundedAnswerService
+from app.agent.components.grounded_answer_service import (
+    GroundedAnswerService,
+    collect_synthesis_degradations,
+)
+from app.agent.components.output_budget import OutputBudget, bind_output_budget
+from app.infrastructure.clients.llm_gateway import LLMGateway
 from app.profiles.models import AgentProfile, IdentityPolicy, SynthesisPolicy, ValidationPolicy
 
 
@@ -34,9 +39,8 @@ class _FakeClient:
 
 
 def test_grounded_answer_service_uses_profile_templates_and_not_mode_name() -> None:
-    service = GroundedAnswerService()
     fake_completions = _FakeCompletions()
-    service._client = _FakeClient(fake_completions)  # type: ignore[attr-defined]
+    service = GroundedAnswerService(gateway=LLMGateway(client=_FakeClient(fake_completions)))
 
     profile = AgentProfile(
         profile_id="p",
@@ -80,3 +84,87 @@ def test_grounded_answer_service_uses_profile_templates_and_not_mode_name() -> N
     assert "INTERP_STYLE::REF#" in user_message
     assert "## Hechos citados" in user_message
     assert "## Inferencias" in user_message
+
+
+class _FakeStreamChunk:
+    def __init__(self, content: str | None) -> None:
+        delta = type("_Delta", (), {"content": content})()
+        self.choices = [type("_StreamChoice", (), {"delta": delta})()]
+
+
+class _FakeStreamingCompletions:
+    def __init__(self, deltas: list[str | None]) -> None:
+        self.calls: list[dict] = []
+        self._deltas = deltas
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+
+        async def _iter():
+            for delta in self._deltas:
+                yield _FakeStreamChunk(delta)
+
+        return _iter()
+
+
+def test_grounded_answer_service_streams_token_deltas() -> None:
+    fake_completions = _FakeStreamingCompletions(["Hechos ", None, "citados", " [C1]"])
+    service = GroundedAnswerService(
+        gateway=LLMGateway(client=_FakeClient(fake_completions))  # type: ignore[arg-type]
+    )
+    tokens: list[str] = []
+
+    result = asyncio.run(
+        service.generate_answer(
+            query="question",
+            context_chunks=["[C1] ctx"],
+            stream=True,
+            on_token=tokens.append,
+        )
+    )
+
+    assert result == "Hechos citados [C1]"
+    assert tokens == ["Hechos ", "citados", " [C1]"]
+    assert fake_completions.calls[0]["stream"] is True
+
+
+def test_output_budget_caps_tokens_and_trims_response_contract() -> None:
+    fake_completions = _FakeCompletions()
+    service = GroundedAnswerService(gateway=LLMGateway(client=_FakeClient(fake_completions)))
+
+    async def _run():
+        with bind_output_budget(
+            OutputBudget(max_tokens=300, tokens_per_second=50, estimated=True)
+        ), collect_synthesis_degradations() as degraded:
+            text = await service.generate_answer(query="question", context_chunks=["[C1] ctx"])
+        return text, degraded
+
+    text, degraded = asyncio.run(_run())
+    assert text == "ok"
+    assert degraded == ["sections_trimmed"]
+    call = fake_completions.calls[0]
+    assert call["max_tokens"] == 300
+    user_message = call["messages"][1]["content"]
+    assert "## Hechos citados" in user_message
+    assert "## Inferencias" not in user_message
+    assert "at most about 225 words" in user_message
+
+
+def test_model_failure_falls_back_to_context_and_reports_degradation() -> None:
+    class _FailingCompletions:
+        async def create(self, **kwargs):
+            raise RuntimeError("429 rate limited")
+
+    service = GroundedAnswerService(
+        gateway=LLMGateway(client=_FakeClient(_FailingCompletions()))  # type: ignore[arg-type]
+    )
+
+    async def _run():
+        with collect_synthesis_degradations() as degraded:
+            text = await service.generate_answer(query="question", context_chunks=["[C1] ctx"])
+        return text, degraded
+
+    text, degraded = asyncio.run(_run())
+
+    assert text == "[C1] ctx"
+    assert degraded == ["model_fallback"]
@@ -167,3 +167,162 @@ def test_answer_api_passes_clarification_context_to_command(client, mock_use_cas
     assert response.status_code == 200
     assert isinstance(captured.get("context"), dict)
     assert captured["context"].get("requested_scopes") == ["ISO 9001"]
+
+
+def test_answer_stream_forwards_stage_and_token_events(client, mock_use_case):
+    from app.agent.components.answer_stream import current_answer_stream
+
+    async def _execute(cmd):
+        sink = current_answer_stream()
+        assert sink is not None
+        sink.emit_stage("generator", "started")
+        sink.emit_token("Hola")
+        sink.emit_token(" mundo")
+        sink.emit_stage("generator", "completed", elapsed_ms=12.5)
+        return HandleQuestionResult(
+            intent=QueryIntent(mode="explicativa"),
+            answer=AnswerDraft(text="Hola mundo", mode="explicativa", evidence=[]),
+            plan=RetrievalPlan(mode="explicativa", chunk_k=10, chunk_fetch_k=50, summary_k=5),
+            retrieval=RetrievalDiagnostics(contract="advanced", strategy="langgraph_universal_flow"),
+            validation=MagicMock(accepted=True, issues=[]),
+            clarification=None,
+        )
+
+    mock_use_case.execute = _execute
+
+    response = client.post(
+        "/api/v1/knowledge/answer/stream",
+        json={"query": "test query", "tenant_id": "test-tenant"},
+    )
+
+    assert response.status_code == 200
+    body = response.text
+    assert 'event: stage\ndata: {"stage": "generator", "status": "started"}' in body
+    assert 'event: token\ndata: {"delta": "Hola", "index": 1}' in body
+    assert body.index("event: token") < body.index("event: result")
+    assert '"elapsed_ms": 12.5' in body
+
+
+def test_answer_batch_streams_ndjson_with_bounded_concurrency(client, mock_use_case, monkeypatch):
+    import asyncio
+    import json
+
+    from app.infrastructure.clients.retrieval_cache import current_batch_retrieval_cache
+
+    monkeypatch.setattr("app.infrastructure.config.settings.ORCH_BATCH_MAX_CONCURRENCY", 2)
+    state = {"in_flight": 0, "max_in_flight": 0, "caches": set(), "request_ids": []}
+
+    async def _execute(cmd):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        state["caches"].add(id(current_batch_retrieval_cache()))
+        state["request_ids"].append(cmd.request_id)
+        await asyncio.sleep(0.01 if cmd.query != "slow" else 0.05)
+        state["in_flight"] -= 1
+        if cmd.query == "boom":
+            raise RuntimeError("rag retrieval failed")
+        return HandleQuestionResult(
+            intent=QueryIntent(mode="explicativa"),
+            answer=AnswerDraft(text=f"answer {cmd.query}", mode="explicativa", evidence=[]),
+            plan=RetrievalPlan(mode="explicativa", chunk_k=10, chunk_fetch_k=50, summary_k=5),
+            retrieval=RetrievalDiagnostics(contract="advanced"),
+            validation=MagicMock(accepted=True, issues=[]),
+            clarification=None,
+        )
+
+    mock_use_case.execute = _execute
+
+    response = client.post(
+        "/api/v1/knowledge/answer/batch",
+        headers={"X-Request-ID": "req-b"},
+        json={
+            "tenant_id": "test-tenant",
+            "questions": [
+                {"id": "a", "query": "slow"},
+                {"id": "b", "query": "q2"},
+                {"id": "c", "query": "boom"},
+                {"id": "d", "query": "q4"},
+            ],
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0]["type"] == "accepted" and lines[0]["concurrency"] == 2
+    results = [line for line in lines if line["type"] == "result"]
+    # Streamed in completion order: the slow first item is not the first result.
+    assert results[0]["id"] != "a"
+    by_id = {line["id"]: line for line in results}
+    assert by_id["b"]["response"]["answer"] == "answer q2"
+    assert by_id["c"]["ok"] is False
+    assert by_id["c"]["error"]["code"] == "ORCH_RETRIEVAL_FAILED"
+    assert lines[-1] == {**lines[-1], "type": "done", "total": 4, "succeeded": 3, "failed": 1}
+    assert state["max_in_flight"] == 2
+    assert len(state["caches"]) == 1 and id(None) not in state["caches"]
+    assert sorted(state["request_ids"]) == ["req-b:0", "req-b:1", "req-b:2", "req-b:3"]
+
+
+def test_answer_batch_rejects_oversized_batches(client, monkeypatch):
+    monkeypatch.setattr("app.infrastructure.config.settings.ORCH_BATCH_MAX_ITEMS", 2)
+
+    response = client.post(
+        "/api/v1/knowledge/answer/batch",
+        json={"tenant_id": "test-tenant", "questions": [{"query": str(i)} for i in range(3)]},
+    )
+
+    assert response.status_code == 413
+    assert response.json()["detail"]["code"] == "BATCH_TOO_LARGE"
+
+
+def test_answer_batch_accepts_a_full_nightly_checklist(client, mock_use_case):
+    import json
+
+    async def _execute(cmd):
+        return HandleQuestionResult(
+            intent=QueryIntent(mode="explicativa"),
+            answer=AnswerDraft(text="ok", mode="explicativa", evidence=[]),
+            plan=RetrievalPlan(mode="explicativa", chunk_k=10, chunk_fetch_k=50, summary_k=5),
+            retrieval=RetrievalDiagnostics(contract="advanced"),
+            validation=MagicMock(accepted=True, issues=[]),
+            clarification=None,
+        )
+
+    mock_use_case.execute = _execute
+
+    response = client.post(
+        "/api/v1/knowledge/answer/batch",
+        json={"tenant_id": "test-tenant", "questions": [{"query": str(i)} for i in range(500)]},
+    )
+
+    assert response.status_code == 200
+    done = json.loads(response.text.splitlines()[-1])
+    assert done["type"] == "done" and done["succeeded"] == 500
+
+
+def test_profile_reload_requires_admin_role(client):
+    from app.api.v1.routers.knowledge import get_current_user
+
+    loader = MagicMock()
+    loader.reload_profiles.return_value = 3
+    loader.invalidate_resolutions.return_value = 1
+    body = {"tenant_id": "test-tenant", "reload_profiles": True}
+
+    with patch("app.api.v1.routers.knowledge.get_profile_loader", return_value=loader):
+        forbidden = client.post("/api/v1/knowledge/profile-cache/invalidate", json=body)
+        scoped = client.post(
+            "/api/v1/knowledge/profile-cache/invalidate",
+            json={"tenant_id": "test-tenant"},
+        )
+        client.app.dependency_overrides[get_current_user] = lambda: MagicMock(
+            user_id="ops", roles=["admin"]
+        )
+        reloaded = client.post("/api/v1/knowledge/profile-cache/invalidate", json=body)
+
+    assert forbidden.status_code == 403
+    assert forbidden.json()["detail"]["code"] == "PROFILE_RELOAD_FORBIDDEN"
+    assert scoped.json()["removed"] == 1
+    loader.invalidate_resolutions.assert_called_once_with("test-tenant")
+    assert reloaded.status_code == 200
+    assert reloaded.json()["removed"] == 3
+    loader.reload_profiles.assert_called_once()
@@ -0,0 +1,171 @@
+import asyncio
+import time
+
+import httpx
+import openai
+import pytest
+
+from app.infrastructure.clients.llm_gateway import LLMGateway, bind_llm_deadline, llm_priority
+
+
+class _Usage:
+    def __init__(self, prompt_tokens: int, completion_tokens: int) -> None:
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        self.total_tokens = prompt_tokens + completion_tokens
+
+
+class _FakeCompletions:
+    def __init__(self, *, failures: list[Exception] | None = None, delay_s: float = 0.0) -> None:
+        self.calls: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._failures = list(failures or [])
+        self._delay_s = delay_s
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._delay_s)
+            if self._failures:
+                raise self._failures.pop(0)
+            return type("_Resp", (), {"choices": [], "usage": _Usage(10, 5)})()
+        finally:
+            self.in_flight -= 1
+
+
+class _FakeClient:
+    def __init__(self, completions: _FakeCompletions) -> None:
+        self.chat = type("_Chat", (), {"completions": completions})()
+
+
+def _rate_limited(retry_after: str) -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+    response = httpx.Response(429, headers={"retry-after": retry_after}, request=request)
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+def _call(gateway: LLMGateway, purpose: str = "test", **params):
+    return gateway.chat_completion(
+        model="m", messages=[{"role": "user", "content": "hola"}], purpose=purpose, **params
+    )
+
+
+def test_per_model_concurrency_cap():
+    completions = _FakeCompletions(delay_s=0.01)
+    gateway = LLMGateway(
+        client=_FakeClient(completions), max_concurrency=4, model_concurrency={"m": 2}
+    )
+
+    async def _run():
+        await asyncio.gather(*(_call(gateway) for _ in range(5)))
+
+    asyncio.run(_run())
+
+    assert len(completions.calls) == 5
+    assert completions.max_in_flight == 2
+    assert gateway.snapshot()["models"]["m"]["in_flight"] == 0
+
+
+def test_priority_override_and_queue_order():
+    completions = _FakeCompletions(delay_s=0.01)
+    gateway = LLMGateway(client=_FakeClient(completions), max_concurrency=1)
+    order: list[str] = []
+
+    async def _tracked(label: str, **params):
+        await _call(gateway, **params)
+        order.append(label)
+
+    async def _run():
+        first = asyncio.create_task(_tracked("first"))
+        await asyncio.sleep(0)
+        aux = asyncio.create_task(_tracked("aux"))
+        with llm_priority("auxiliary"):
+            demoted = asyncio.create_task(_tracked("demoted", priority="synthesis"))
+        await asyncio.sleep(0)
+        synth = asyncio.create_task(_tracked("synth", priority="synthesis"))
+        await asyncio.gather(first, aux, demoted, synth)
+
+    asyncio.run(_run())
+
+    assert order == ["first", "synth", "aux", "demoted"]
+
+
+def test_rate_limit_honours_retry_after_and_retries():
+    completions = _FakeCompletions(failures=[_rate_limited("0.05")])
+    gateway = LLMGateway(client=_FakeClient(completions))
+
+    started = time.monotonic()
+    result = asyncio.run(_call(gateway))
+    elapsed = time.monotonic() - started
+
+    assert result.usage.total_tokens == 15
+    assert len(completions.calls) == 2
+    assert elapsed >= 0.05
+
+
+def test_retry_is_skipped_when_retry_after_exceeds_budget():
+    completions = _FakeCompletions(failures=[_rate_limited("5")])
+    gateway = LLMGateway(client=_FakeClient(completions))
+
+    async def _run():
+        with bind_llm_deadline(time.monotonic() + 1.0):
+            await _call(gateway)
+
+    with pytest.raises(openai.RateLimitError):
+        asyncio.run(_run())
+    assert len(completions.calls) == 1
+
+
+def test_non_retryable_errors_are_raised_immediately():
+    completions = _FakeCompletions(failures=[ValueError("bad request")])
+    gateway = LLMGateway(client=_FakeClient(completions), max_retries=3)
+
+    with pytest.raises(ValueError):
+        asyncio.run(_call(gateway))
+    assert len(completions.calls) == 1
+
+
+def test_tokens_per_minute_bucket_delays_calls_beyond_budget():
+    completions = _FakeCompletions()
+    # 6000 TPM refills 100 tokens per second; each call reserves ~51 tokens.
+    gateway = LLMGateway(client=_FakeClient(completions), tokens_per_minute=6000)
+
+    async def _run():
+        gateway._state("m").tokens = 60.0
+        started = time.monotonic()
+        await _call(gateway, max_tokens=50)
+        first_done = time.monotonic() - started
+        await _call(gateway, max_tokens=50)
+        return first_done, time.monotonic() - started
+
+    first_done, total = asyncio.run(_run())
+
+    assert first_done < 0.1
+    # The first call settled at 15 tokens, leaving 45; the second waits for ~6 more.
+    assert total >= 0.05
+    snapshot = gateway.snapshot()["models"]["m"]
+    assert snapshot["tokens_per_minute"] == 6000
+
+
+def test_waiting_beyond_the_call_timeout_raises_budget_exhausted():
+    completions = _FakeCompletions(delay_s=0.2)
+    gateway = LLMGateway(client=_FakeClient(completions), max_concurrency=1)
+
+    async def _run():
+        running = asyncio.create_task(_call(gateway))
+        await asyncio.sleep(0)
+        with pytest.raises(TimeoutError):
+            await _call(gateway, timeout_s=0.02)
+        await running
+
+    asyncio.run(_run())
+
+    assert len(completions.calls) == 1
+    assert gateway.snapshot()["models"]["m"] == {
+        **gateway.snapshot()["models"]["m"],
+        "in_flight": 0,
+        "queued": 0,
+    }
@@ -0,0 +1,75 @@
+import asyncio
+
+from app.graph.logic.utils import observe_tool_duration, track_node_timing
+from app.infrastructure.metrics.exposition import render_openmetrics
+from app.infrastructure.metrics.histograms import (
+    LatencyHistogramStore,
+    bind_metric_labels,
+    current_metric_labels,
+    latency_histogram_store,
+)
+from app.profiles.models import AgentProfile
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count():
+    store = LatencyHistogramStore()
+    for value in (3, 40, 40, 700):
+        store.observe(
+            "orch_stage_duration_ms", value, buckets=(10, 50, 1000), stage="planner", tenant="t1"
+        )
+
+    lines = store.render()
+
+    assert "# TYPE orch_stage_duration_ms histogram" in lines
+    assert 'orch_stage_duration_ms_bucket{stage="planner",tenant="t1",le="10"} 1' in lines
+    assert 'orch_stage_duration_ms_bucket{stage="planner",tenant="t1",le="50"} 3' in lines
+    assert 'orch_stage_duration_ms_bucket{stage="planner",tenant="t1",le="+Inf"} 4' in lines
+    assert 'orch_stage_duration_ms_sum{stage="planner",tenant="t1"} 783' in lines
+    assert 'orch_stage_duration_ms_count{stage="planner",tenant="t1"} 4' in lines
+
+
+def test_counter_labels_are_escaped():
+    store = LatencyHistogramStore()
+    store.increment("orch_llm_tokens_total", 12, kind="prompt", model='m"1')
+
+    assert 'orch_llm_tokens_total{kind="prompt",model="m\\"1"} 12' in store.render()
+
+
+def test_stage_and_tool_timings_are_labeled_by_tenant_and_profile():
+    @track_node_timing("reflect")
+    async def _node(state):
+        return {}
+
+    state = {"tenant_id": "tenant-metrics", "agent_profile": AgentProfile(profile_id="auditor")}
+    asyncio.run(_node(state))
+    observe_tool_duration(state, tool="semantic_retrieval", elapsed_ms=120.0)
+
+    text = render_openmetrics()
+
+    assert (
+        'orch_stage_duration_ms_count{profile="auditor",stage="reflect",'
+        'tenant="tenant-metrics"}' in text
+    )
+    assert (
+        'orch_tool_duration_ms_count{profile="auditor",tenant="tenant-metrics",'
+        'tool="semantic_retrieval"} ' in text
+    )
+
+
+def test_metric_labels_are_request_scoped():
+    with bind_metric_labels(tenant_id="t-9", profile_id=None):
+        assert current_metric_labels().as_dict() == {"tenant": "t-9", "profile": "unknown"}
+    assert current_metric_labels().tenant_id == "unknown"
+
+
+def test_metrics_endpoint_serves_prometheus_text():
+    from fastapi.testclient import TestClient
+
+    from app.api.server import app
+
+    latency_histogram_store.observe("orch_auth_duration_ms", 12.0, step="jwt_verify")
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'orch_auth_duration_ms_count{step="jwt_verify"}' in response.text
@@ -0,0 +1,197 @@
+import asyncio
+
+import pytest
+
+from app.agent.components.answer_stream import (
+    AnswerStreamSink,
+    active_token_sink,
+    bind_answer_stream,
+)
+from app.agent.components.model_cascade import current_synthesis_model, select_synthesis_route
+from app.agent.types.models import (
+    AnswerDraft,
+    EvidenceItem,
+    ReasoningPlan,
+    RetrievalPlan,
+    ValidationResult,
+)
+from app.graph.nodes.generation import generator_node
+from app.infrastructure.config import settings
+from app.infrastructure.metrics.model_cascade import model_cascade_metrics_store
+from app.profiles.models import AgentProfile, QueryModeConfig, QueryModesPolicy
+
+LIGHT = "light-model"
+HEAVY = "heavy-model"
+
+
+@pytest.fixture(autouse=True)
+def _models(monkeypatch):
+    monkeypatch.setattr(settings, "GROQ_MODEL_LIGHTWEIGHT", LIGHT)
+    monkeypatch.setattr(settings, "GROQ_MODEL_CHAT", HEAVY)
+    monkeypatch.setattr(settings, "ORCH_MODEL_CASCADE_ENABLED", True)
+    monkeypatch.setattr(settings, "ORCH_MODEL_CASCADE_ESCALATION_MIN_MS", 0)
+    model_cascade_metrics_store.reset()
+
+
+def _plan(**overrides) -> RetrievalPlan:
+    params = {
+        "mode": "literal",
+        "chunk_k": 3,
+        "chunk_fetch_k": 3,
+        "summary_k": 0,
+        "require_literal_evidence": True,
+    }
+    params.update(overrides)
+    return RetrievalPlan(**params)
+
+
+def _route(plan: RetrievalPlan, **overrides):
+    params = {
+        "plan": plan,
+        "reasoning_plan": ReasoningPlan(goal="q"),
+        "agent_profile": None,
+        "evidence_count": 3,
+        "has_partial_answers": False,
+    }
+    params.update(overrides)
+    return select_synthesis_route(**params)
+
+
+def test_simple_and_literal_queries_route_to_lightweight_model():
+    decision = _route(_plan())
+
+    assert (decision.route, decision.model, decision.reason) == ("lightweight", LIGHT, "literal")
+    assert decision.can_escalate
+
+
+def test_complex_cross_scope_and_large_queries_route_to_heavy_model():
+    complex_plan = ReasoningPlan(goal="q", complexity="complex")
+    cross_scope = _plan(require_literal_evidence=False, requested_standards=("A", "B"))
+
+    assert _route(_plan(), reasoning_plan=complex_plan).reason == "complex_plan"
+    assert _route(cross_scope).reason == "cross_scope"
+    assert _route(_plan(), has_partial_answers=True).reason == "map_reduce"
+    assert _route(_plan(), evidence_count=50).reason == "large_context"
+    assert _route(_plan()).route == "lightweight"
+    assert {_route(cross_scope).model, _route(_plan(), evidence_count=50).model} == {HEAVY}
+
+
+def test_profile_mode_pins_route_and_setting_disables_cascade(monkeypatch):
+    profile = AgentProfile(
+        profile_id="p",
+        query_modes=QueryModesPolicy(modes={"literal": QueryModeConfig(synthesis_model="heavy")}),
+    )
+
+    assert _route(_plan(), agent_profile=profile).reason == "mode_policy"
+    assert _route(_plan(), agent_profile=profile).model == HEAVY
+
+    monkeypatch.setattr(settings, "ORCH_MODEL_CASCADE_ENABLED", False)
+    assert _route(_plan()).reason == "cascade_disabled"
+
+
+class _Generator:
+    def __init__(self) -> None:
+        self.models: list[str | None] = []
+
+    async def generate(self, **kwargs):
+        model = current_synthesis_model()
+        self.models.append(model)
+        sink = active_token_sink()
+        if sink is not None:
+            sink.emit_token(f"draft from {model}")
+        return AnswerDraft(text=f"draft from {model}", mode=kwargs["plan"].mode)
+
+
+class _Validator:
+    def __init__(self, accepted_models: set[str]) -> None:
+        self._accepted = accepted_models
+
+    def validate(self, draft, plan, query):
+        accepted = any(model in draft.text for model in self._accepted)
+        return ValidationResult(accepted=accepted, issues=[] if accepted else ["no citations"])
+
+
+class _Components:
+    def __init__(self, accepted_models: set[str]) -> None:
+        self.answer_generator = _Generator()
+        self.validator = _Validator(accepted_models)
+
+
+def _state() -> dict:
+    return {
+        "retrieval_plan": _plan(),
+        "reasoning_plan": ReasoningPlan(goal="q"),
+        "chunks": [EvidenceItem(source="c1", content="text", score=0.9)],
+        "summaries": [],
+        "user_query": "q",
+    }
+
+
+def test_rejected_lightweight_draft_escalates_to_heavy_model():
+    components = _Components(accepted_models={HEAVY})
+    sink = AnswerStreamSink()
+
+    async def _run():
+        with bind_answer_stream(sink):
+            return await generator_node(_state(), components)
+
+    updates = asyncio.run(_run())
+
+    assert components.answer_generator.models == [LIGHT, HEAVY]
+    assert updates["generation"].text == f"draft from {HEAVY}"
+    output = updates["reasoning_steps"][0].output
+    assert output["synthesis_route"] == "lightweight"
+    assert output["synthesis_escalated"] is True
+    events = []
+    while not sink.queue.empty():
+        events.append(sink.queue.get_nowait())
+    token_events = [name for name, _ in events if name != "stage"]
+    assert token_events == ["token", "token_reset", "token"]
+    routes = model_cascade_metrics_store.snapshot()["routes"]
+    assert routes["lightweight"]["rejected_total"] == 1
+    assert routes["lightweight"]["escalated_total"] == 1
+    assert routes["heavy"]["accepted_total"] == 1
+
+
+def test_accepted_lightweight_draft_is_kept():
+    components = _Components(accepted_models={LIGHT})
+
+    updates = asyncio.run(generator_node(_state(), components))
+
+    assert components.answer_generator.models == [LIGHT]
+    assert updates["reasoning_steps"][0].output["synthesis_escalated"] is False
+    routes = model_cascade_metrics_store.snapshot()["routes"]
+    assert routes["lightweight"]["acceptance_rate"] == 1.0
+    assert "heavy" not in routes
+
+
+def test_heavy_timeout_after_streaming_restores_the_lightweight_draft(monkeypatch):
+    from app.graph.nodes import generation
+
+    components = _Components(accepted_models=set())
+    light_generate = components.answer_generator.generate
+
+    async def _generate(**kwargs):
+        if current_synthesis_model() == LIGHT:
+            return await light_generate(**kwargs)
+        active_token_sink().emit_token("partial heavy")
+        raise TimeoutError
+
+    monkeypatch.setattr(components.answer_generator, "generate", _generate)
+    monkeypatch.setattr(generation, "get_adaptive_timeout_ms", lambda *a, **k: 60_000)
+    sink = AnswerStreamSink()
+
+    async def _run():
+        with bind_answer_stream(sink):
+            return await generator_node(_state(), components)
+
+    updates = asyncio.run(_run())
+
+    assert updates["generation"].text == f"draft from {LIGHT}"
+    events = []
+    while not sink.queue.empty():
+        events.append(sink.queue.get_nowait())
+    tokens = [(name, payload) for name, payload in events if name != "stage"]
+    assert [name for name, _ in tokens] == ["token", "token_reset", "token", "token_reset", "token"]
+    assert tokens[3][1]["reason"] == "escalation_timeout"
+    assert tokens[4][1]["delta"] == f"draft from {LIGHT}"
@@ -41,7 +41,7 @@ class _FakeClient:
 
 
 class _FakeSelector:
-    async def resolve_base_url(self) -> str:
+    async def resolve_untracked_base_url(self) -> str:
         return "http://rag:8000"
 
 
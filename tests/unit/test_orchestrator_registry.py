@@ -0,0 +1,68 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.agent.retrieval.request_context import RetrievalRequestContext, bind_retrieval_context
+from app.api import orchestrator_registry as registry_module
+from app.api.orchestrator_registry import OrchestratorRegistry
+from app.api.v1.routers.knowledge import _build_use_case
+from app.infrastructure.clients.http_adapters import RagEngineRetrieverAdapter
+from app.infrastructure.config import settings
+
+
+class _Selector:
+    def is_forced(self) -> bool:
+        return True
+
+
+def _adapter(monkeypatch) -> RagEngineRetrieverAdapter:
+    monkeypatch.setattr(settings, "RAG_SERVICE_SECRET", "test-secret")
+    return RagEngineRetrieverAdapter(
+        backend_selector=_Selector(),  # type: ignore[arg-type]
+        subquery_planner=object(),  # type: ignore[arg-type]
+        embedding_provider=object(),  # type: ignore[arg-type]
+        reranking_provider=object(),  # type: ignore[arg-type]
+    )
+
+
+def test_shared_adapter_isolates_scope_between_concurrent_requests(monkeypatch):
+    adapter = _adapter(monkeypatch)
+    seen: dict[str, object] = {}
+
+    async def _request(name: str, delay: float) -> None:
+        with bind_retrieval_context(RetrievalRequestContext()):
+            adapter.apply_validated_scope({"normalized_scope": {"filters": {"scope": name}}})
+            await asyncio.sleep(delay)
+            seen[name] = adapter._validated_filters
+
+    async def _run() -> None:
+        await asyncio.gather(_request("ISO 9001", 0.02), _request("ISO 14001", 0.0))
+
+    asyncio.run(_run())
+
+    assert seen == {"ISO 9001": {"scope": "ISO 9001"}, "ISO 14001": {"scope": "ISO 14001"}}
+    assert adapter._validated_filters is None
+
+
+def test_adapter_without_bound_context_keeps_instance_state(monkeypatch):
+    adapter = _adapter(monkeypatch)
+    adapter.apply_validated_scope({"normalized_scope": {"filters": {"scope": "ISO 45001"}}})
+
+    assert adapter._validated_filters == {"scope": "ISO 45001"}
+
+
+def test_build_use_case_reuses_lifespan_registry(monkeypatch):
+    sentinel = object()
+    registry = OrchestratorRegistry(use_case=sentinel)  # type: ignore[arg-type]
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(orchestrator_registry=registry)))
+
+    assert _build_use_case(request) is sentinel  # type: ignore[arg-type]
+    assert _build_use_case(request) is sentinel  # type: ignore[arg-type]
+
+
+def test_registry_init_failure_falls_back_to_none(monkeypatch):
+    def _boom(http_client=None):
+        raise RuntimeError("RAG_SERVICE_SECRET must be configured")
+
+    monkeypatch.setattr(registry_module, "build_handle_question_use_case", _boom)
+
+    assert registry_module.build_orchestrator_registry(None) is None
@@ -0,0 +1,95 @@
+import asyncio
+
+import httpx
+
+from app.infrastructure.clients import outbound_pool as pool_module
+from app.infrastructure.clients.outbound_pool import (
+    OutboundClientRegistry,
+    build_outbound_client_registry,
+    install_outbound_client_registry,
+    outbound_get,
+)
+from app.infrastructure.metrics.outbound import outbound_pool_metrics_store
+from app.infrastructure.security.membership_repository import fetch_tenant_names
+from app.infrastructure.config import settings
+
+
+def test_outbound_get_reuses_shared_pool_client(monkeypatch):
+    seen: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        return httpx.Response(200, json=[{"id": "t1", "name": "Tenant Uno"}])
+
+    def _unexpected_client(*args, **kwargs):
+        raise AssertionError("per-call AsyncClient must not be created when a pool is installed")
+
+    shared = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    monkeypatch.setattr(settings, "SUPABASE_URL", "http://supabase.local")
+    monkeypatch.setattr(settings, "SUPABASE_SERVICE_ROLE_KEY", "service-role")
+    install_outbound_client_registry(OutboundClientRegistry({"supabase": shared}))
+    monkeypatch.setattr(pool_module.httpx, "AsyncClient", _unexpected_client)
+    try:
+        names = asyncio.run(fetch_tenant_names(["t1"]))
+        names_again = asyncio.run(fetch_tenant_names(["t1"]))
+    finally:
+        install_outbound_client_registry(None)
+
+    assert names == {"t1": "Tenant Uno"}
+    assert names_again == names
+    assert len(seen) == 2
+    assert seen[0].startswith("http://supabase.local/rest/v1/institutions")
+
+
+def test_outbound_get_falls_back_to_one_shot_client_without_registry(monkeypatch):
+    created: list[dict] = []
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            created.append(kwargs)
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return None
+
+        async def get(self, url):
+            return httpx.Response(204)
+
+    install_outbound_client_registry(None)
+    monkeypatch.setattr(pool_module.httpx, "AsyncClient", _Client)
+
+    response = asyncio.run(outbound_get("rag", "http://rag/health", timeout=0.3))
+
+    assert response.status_code == 204
+    assert created == [{"timeout": 0.3}]
+
+
+def test_registry_pools_record_latency_and_status_metrics():
+    outbound_pool_metrics_store.reset()
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503 if request.url.path == "/down" else 200)
+
+    async def _run() -> dict:
+        registry = build_outbound_client_registry()
+        assert set(registry._clients) == {"supabase", "rag", "llm", "providers"}
+        transport = registry._transports["providers"]
+        await transport._inner.aclose()
+        transport._inner = httpx.MockTransport(_handler)  # type: ignore[assignment]
+        client = registry.get("providers")
+        assert client is not None
+        await client.get("http://provider/ok")
+        await client.get("http://provider/down")
+        snapshot = registry.snapshot()
+        await registry.aclose()
+        return snapshot
+
+    snapshot = asyncio.run(_run())
+    providers = snapshot["pools"]["providers"]
+
+    assert providers["requests_total"] == 2
+    assert providers["failures_total"] == 1
+    assert providers["in_flight"] == 0
+    assert providers["status_codes"] == {"200": 1, "503": 1}
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from app.agent.components import output_budget as output_budget_module
+from app.agent.components.output_budget import (
+    OutputBudget,
+    compute_output_budget,
+    current_output_budget,
+)
+from app.agent.types.models import AnswerDraft, RetrievalPlan, ValidationResult
+from app.graph.nodes.generation import generator_node
+from app.infrastructure.clients.llm_gateway import LLMGateway
+from app.infrastructure.config import settings
+
+
+class _Usage:
+    def __init__(self, completion_tokens: int) -> None:
+        self.prompt_tokens = 10
+        self.completion_tokens = completion_tokens
+        self.total_tokens = 10 + completion_tokens
+
+
+class _Completions:
+    async def create(self, **kwargs):
+        await asyncio.sleep(0.05)
+        return type("_Resp", (), {"choices": [], "usage": _Usage(100)})()
+
+
+class _Client:
+    def __init__(self) -> None:
+        self.chat = type("_Chat", (), {"completions": _Completions()})()
+
+
+@pytest.fixture()
+def gateway(monkeypatch):
+    instance = LLMGateway(client=_Client())
+    monkeypatch.setattr(output_budget_module, "get_llm_gateway", lambda: instance)
+    monkeypatch.setattr(settings, "ORCH_LLM_DEFAULT_OUTPUT_TOKENS_PER_SECOND", 100.0)
+    monkeypatch.setattr(settings, "ORCH_SYNTHESIS_OUTPUT_SAFETY", 0.5)
+    monkeypatch.setattr(settings, "ORCH_SYNTHESIS_MIN_OUTPUT_TOKENS", 64)
+    monkeypatch.setattr(settings, "ORCH_SYNTHESIS_MAX_OUTPUT_TOKENS", 4096)
+    return instance
+
+
+def test_budget_uses_default_rate_until_the_model_is_observed(gateway):
+    before = compute_output_budget("m", remaining_ms=10_000)
+    assert (before.max_tokens, before.estimated) == (500, False)
+
+    asyncio.run(
+        gateway.chat_completion(model="m", messages=[{"role": "user", "content": "q"}], purpose="t")
+    )
+    observed = gateway.output_tokens_per_second("m")
+    after = compute_output_budget("m", remaining_ms=10_000)
+
+    # 100 tokens in ~50 ms: far faster than the configured default.
+    assert observed is not None and observed > 500
+    assert after.estimated is True
+    assert after.max_tokens == min(4096, int(observed * 10 * 0.5))
+
+
+def test_budget_is_clamped_and_sections_shrink_with_it(gateway, monkeypatch):
+    assert compute_output_budget("m", remaining_ms=100).max_tokens == 64
+    assert compute_output_budget("m", remaining_ms=10_000_000).max_tokens == 4096
+
+    monkeypatch.setattr(settings, "ORCH_SYNTHESIS_TOKENS_PER_SECTION", 200)
+    assert OutputBudget(max_tokens=450, tokens_per_second=100, estimated=True).max_sections(5) == 2
+    assert OutputBudget(max_tokens=100, tokens_per_second=100, estimated=True).max_sections(5) == 1
+    assert OutputBudget(max_tokens=4096, tokens_per_second=100, estimated=True).max_sections(5) == 5
+
+
+class _Generator:
+    def __init__(self) -> None:
+        self.budgets: list[OutputBudget | None] = []
+
+    async def generate(self, **kwargs):
+        self.budgets.append(current_output_budget())
+        return AnswerDraft(text="ok", mode=kwargs["plan"].mode)
+
+
+class _Validator:
+    def validate(self, draft, plan, query):
+        return ValidationResult(accepted=True)
+
+
+class _Components:
+    def __init__(self) -> None:
+        self.answer_generator = _Generator()
+        self.validator = _Validator()
+
+
+def test_generator_binds_output_budget_for_synthesis(gateway):
+    components = _Components()
+    state = {
+        "retrieval_plan": RetrievalPlan(mode="default", chunk_k=1, chunk_fetch_k=1, summary_k=0),
+        "chunks": [],
+        "summaries": [],
+        "user_query": "q",
+    }
+
+    updates = asyncio.run(generator_node(state, components))
+
+    budget = components.answer_generator.budgets[0]
+    assert budget is not None
+    assert updates["reasoning_steps"][0].output["output_max_tokens"] == budget.max_tokens
+    assert current_output_budget() is None
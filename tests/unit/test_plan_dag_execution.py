@@ -0,0 +1,133 @@
+import asyncio
+
+from app.agent.retrieval.request_context import (
+    RetrievalRequestContext,
+    bind_retrieval_context,
+    current_retrieval_context,
+)
+from app.agent.types.models import ReasoningPlan, ToolCall, ToolResult
+from app.graph.nodes.execution import execute_plan_node
+
+
+class _Components:
+    def __init__(self, tools: dict) -> None:
+        self.tools = tools
+
+    def _runtime_context(self):
+        return None
+
+
+class _Tracker:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.payloads: dict[str, dict] = {}
+
+
+class _SlowTool:
+    def __init__(self, name: str, tracker: _Tracker, *, ok: bool = True) -> None:
+        self.name = name
+        self._tracker = tracker
+        self._ok = ok
+
+    async def run(self, payload, *, state, context):
+        del state, context
+        tracker = self._tracker
+        tracker.payloads[self.name] = dict(payload)
+        tracker.in_flight += 1
+        tracker.max_in_flight = max(tracker.max_in_flight, tracker.in_flight)
+        scoped = current_retrieval_context()
+        if scoped is not None:
+            scoped.validated_filters = {"tool": self.name}
+        await asyncio.sleep(0.02)
+        tracker.in_flight -= 1
+        if not self._ok:
+            return ToolResult(tool=self.name, ok=False, error="boom")
+        return ToolResult(tool=self.name, ok=True, output={"from": self.name})
+
+
+_TOOL_NAMES = ("retrieve", "compare", "extract", "calculate")
+
+
+def _state(plan: ReasoningPlan) -> dict:
+    return {
+        "reasoning_plan": plan,
+        "tool_cursor": 0,
+        "tool_results": [],
+        "reasoning_steps": [],
+        "working_memory": {},
+    }
+
+
+def _diamond_plan() -> ReasoningPlan:
+    return ReasoningPlan(
+        goal="q",
+        steps=[
+            ToolCall(tool="retrieve"),
+            ToolCall(tool="compare", depends_on=(0,)),
+            ToolCall(tool="extract", depends_on=(0,)),
+            ToolCall(tool="calculate"),
+        ],
+    )
+
+
+def test_step_dependencies_default_to_sequential_and_ignore_forward_refs():
+    plan = ReasoningPlan(
+        goal="q",
+        steps=[
+            ToolCall(tool="a"),
+            ToolCall(tool="b", depends_on=()),
+            ToolCall(tool="c", depends_on=(0, 2, 5)),
+        ],
+    )
+    assert plan.step_dependencies() == [(), (), (0,)]
+    assert _diamond_plan().step_dependencies() == [(), (0,), (0,), (2,)]
+
+
+def test_independent_steps_run_concurrently_and_skip_reflection():
+    tracker = _Tracker()
+    tools = {name: _SlowTool(name, tracker) for name in _TOOL_NAMES}
+
+    updates = asyncio.run(execute_plan_node(_state(_diamond_plan()), _Components(tools)))
+
+    assert tracker.max_in_flight == 2
+    assert [result.tool for result in updates["tool_results"]] == [
+        "retrieve",
+        "compare",
+        "extract",
+        "calculate",
+    ]
+    assert [step.index for step in updates["reasoning_steps"]] == [1, 2, 3, 4]
+    assert updates["tool_cursor"] == 4
+    assert updates["next_action"] == "generate"
+    # Sequential default still pipes the previous step's output.
+    assert tracker.payloads["calculate"]["previous_tool_output"] == {"from": "extract"}
+    assert tracker.payloads["compare"]["previous_tool_output"] == {"from": "retrieve"}
+
+
+def test_failed_step_blocks_dependents_and_requests_reflection():
+    tracker = _Tracker()
+    tools = {name: _SlowTool(name, tracker) for name in ("retrieve", "compare", "calculate")}
+    tools["extract"] = _SlowTool("extract", tracker, ok=False)
+
+    updates = asyncio.run(execute_plan_node(_state(_diamond_plan()), _Components(tools)))
+
+    assert [result.tool for result in updates["tool_results"]] == ["retrieve", "compare", "extract"]
+    assert updates["tool_results"][-1].ok is False
+    assert "calculate" not in tracker.payloads
+    assert updates["next_action"] == "reflect"
+
+
+def test_concurrent_steps_get_private_retrieval_context():
+    tracker = _Tracker()
+    tools = {name: _SlowTool(name, tracker) for name in _TOOL_NAMES}
+    parent = RetrievalRequestContext(validated_filters={"tool": "none"})
+
+    async def _run():
+        with bind_retrieval_context(parent):
+            return await execute_plan_node(_state(_diamond_plan()), _Components(tools))
+
+    asyncio.run(_run())
+
+    # Each step wrote its own copy; the parent adopts the plan-order last one.
+    assert parent.validated_filters == {"tool": "calculate"}
@@ -3,10 +3,25 @@ import asyncio
 import pytest
 
 from app.profiles.dev_assignments import get_dev_profile_assignments_store
-from app.profiles.loader import ProfileLoader, get_profile_loader
+from app.profiles.loader import (
+    ProfileLoader,
+    _tenant_profile_map,
+    _tenant_profile_whitelist,
+    get_profile_loader,
+)
 from app.profiles.models import AgentProfile
 
 
+@pytest.fixture(autouse=True)
+def _fresh_tenant_maps():
+    # Both maps are parsed once from settings; tests patch those settings per test.
+    _tenant_profile_map.cache_clear()
+    _tenant_profile_whitelist.cache_clear()
+    yield
+    _tenant_profile_map.cache_clear()
+    _tenant_profile_whitelist.cache_clear()
+
+
 def test_loader_falls_back_to_base_for_unknown_profile(monkeypatch) -> None:
     from app.infrastructure.config import settings
 
@@ -230,3 +245,156 @@ def test_loader_unauthorized_header_falls_back_to_dev_map(monkeypatch, tmp_path)
     assert resolved.profile.profile_id == "iso_auditor"
     assert resolved.resolution.source == "dev_map"
     assert resolved.resolution.decision_reason == "unauthorized_header_override_fallback_dev_profile_map_match"
+
+
+def test_loader_serves_repeat_resolutions_from_table_without_threads(monkeypatch) -> None:
+    from app.infrastructure.config import settings
+    from app.profiles import loader as loader_module
+
+    get_profile_loader.cache_clear()
+    monkeypatch.setattr(settings, "ORCH_DEV_PROFILE_ASSIGNMENTS_ENABLED", False)
+    monkeypatch.setattr(settings, "ORCH_TENANT_PROFILE_MAP", '{"tenant-iso":"iso_auditor"}')
+    loader = get_profile_loader()
+
+    first = asyncio.run(loader.resolve_for_tenant_async(tenant_id="tenant-iso"))
+
+    async def _no_thread(*_args, **_kwargs):
+        raise AssertionError("table hit must not use the thread pool")
+
+    monkeypatch.setattr(loader_module.asyncio, "to_thread", _no_thread)
+    second = asyncio.run(loader.resolve_for_tenant_async(tenant_id="tenant-iso"))
+
+    assert second is first
+    assert first.resolution.content_hash
+    assert first.resolution.content_hash == loader_module.profile_content_hash(first.profile)
+
+
+def test_loader_dev_override_change_invalidates_resolution_table(monkeypatch, tmp_path) -> None:
+    from app.infrastructure.config import settings
+
+    get_profile_loader.cache_clear()
+    get_dev_profile_assignments_store.cache_clear()
+    monkeypatch.setattr(settings, "ORCH_DEV_PROFILE_ASSIGNMENTS_ENABLED", True)
+    monkeypatch.setattr(settings, "ORCH_DEV_PROFILE_ASSIGNMENTS_FILE", str(tmp_path / "assignments.json"))
+    monkeypatch.setattr(settings, "ORCH_TENANT_PROFILE_MAP", '{"tenant-iso":"base"}')
+    loader = get_profile_loader()
+
+    before = asyncio.run(loader.resolve_for_tenant_async(tenant_id="tenant-iso"))
+    loader.set_dev_profile_override(tenant_id="tenant-iso", profile_id="iso_auditor")
+    after = asyncio.run(loader.resolve_for_tenant_async(tenant_id="tenant-iso"))
+    loader.clear_dev_profile_override(tenant_id="tenant-iso")
+    cleared = asyncio.run(loader.resolve_for_tenant_async(tenant_id="tenant-iso"))
+
+    assert before.profile.profile_id == "base"
+    assert after.profile.profile_id == "iso_auditor"
+    assert after.resolution.content_hash != before.resolution.content_hash
+    assert cleared.profile.profile_id == "base"
+    assert cleared.resolution.content_hash == before.resolution.content_hash
+
+
+def test_loader_resolution_table_is_lru_bounded(monkeypatch) -> None:
+    from app.infrastructure.config import settings
+
+    monkeypatch.setattr(settings, "ORCH_DEV_PROFILE_ASSIGNMENTS_ENABLED", False)
+    monkeypatch.setattr(settings, "ORCH_PROFILE_RESOLUTION_CACHE_MAX_ENTRIES", 2)
+    loader = ProfileLoader()
+
+    async def _resolve(requested: str | None):
+        return await loader.resolve_for_tenant_async(
+            tenant_id="tenant-x", explicit_profile_id=requested
+        )
+
+    async def _run():
+        await _resolve(None)
+        # Arbitrary header values must not grow the table without bound.
+        for index in range(5):
+            await _resolve(f"made-up-{index}")
+        await _resolve(None)
+
+    asyncio.run(_run())
+
+    assert list(loader._resolution_table) == [
+        ("tenant-x", "made-up-4"),
+        ("tenant-x", None),
+    ]
+
+
+def test_loader_db_lookups_are_single_flight_and_negative_cached(monkeypatch) -> None:
+    from app.infrastructure.config import settings
+    from app.profiles import loader as loader_module
+
+    monkeypatch.setattr(settings, "ORCH_PROFILE_DB_ENABLED", True)
+    loader = ProfileLoader()
+    calls = {"count": 0}
+
+    async def _fake_fetch(_tenant_id: str):
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        return None, "db_profile_not_found"
+
+    monkeypatch.setattr(loader_module, "fetch_db_profile_async", _fake_fetch)
+
+    async def _run():
+        results = await asyncio.gather(
+            *(loader._fetch_db_profile_async("tenant-x") for _ in range(5))
+        )
+        results.append(await loader._fetch_db_profile_async("tenant-x"))
+        return results
+
+    results = asyncio.run(_run())
+
+    assert results == [None] * 6
+    assert calls["count"] == 1
+    assert loader._last_db_resolution_reason == "db_profile_not_found"
+
+
+def test_loader_db_lookup_failures_are_not_cached(monkeypatch) -> None:
+    from app.infrastructure.config import settings
+    from app.profiles import loader as loader_module
+
+    monkeypatch.setattr(settings, "ORCH_PROFILE_DB_ENABLED", True)
+    loader = ProfileLoader()
+    outcomes = iter(
+        [
+            (None, "db_lookup_failed"),
+            (AgentProfile(profile_id="tenant-private"), "db_profile_applied"),
+        ]
+    )
+
+    async def _fake_fetch(_tenant_id: str):
+        return next(outcomes)
+
+    monkeypatch.setattr(loader_module, "fetch_db_profile_async", _fake_fetch)
+
+    assert asyncio.run(loader._fetch_db_profile_async("tenant-x")) is None
+    assert loader._last_db_resolution_reason == "db_lookup_failed"
+    profile = asyncio.run(loader._fetch_db_profile_async("tenant-x"))
+    assert profile is not None and profile.profile_id == "tenant-private"
+
+
+def test_loader_does_not_pin_a_fallback_after_a_failed_db_lookup(monkeypatch) -> None:
+    from app.infrastructure.config import settings
+    from app.profiles import loader as loader_module
+
+    monkeypatch.setattr(settings, "ORCH_DEV_PROFILE_ASSIGNMENTS_ENABLED", False)
+    monkeypatch.setattr(settings, "ORCH_PROFILE_DB_ENABLED", True)
+    loader = ProfileLoader()
+    outcomes = iter(
+        [
+            (None, "db_lookup_failed"),
+            (AgentProfile(profile_id="tenant-private"), "db_profile_applied"),
+        ]
+    )
+
+    async def _fake_fetch(_tenant_id: str):
+        return next(outcomes)
+
+    monkeypatch.setattr(loader_module, "fetch_db_profile_async", _fake_fetch)
+
+    fallback = asyncio.run(loader.resolve_for_tenant_async(tenant_id="tenant-x"))
+    assert fallback.profile.profile_id == "base"
+    assert loader._resolution_table == {}
+
+    recovered = asyncio.run(loader.resolve_for_tenant_async(tenant_id="tenant-x"))
+    assert recovered.profile.profile_id == "tenant-private"
+    assert recovered.resolution.source == "db"
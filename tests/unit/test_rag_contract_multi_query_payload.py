@@ -14,6 +14,12 @@ class _FakeSelector:
     def is_forced(self) -> bool:
         return True
 
+    def base_url_for(self, backend: str) -> str:
+        return "http://local:8000"
+
+    def record_result(self, backend: str, *, ok: bool, latency_ms: float) -> None:
+        return None
+
 
 @pytest.mark.asyncio
 async def test_comprehensive_payload_shape(monkeypatch: pytest.MonkeyPatch) -> None:
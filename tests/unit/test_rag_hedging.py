@@ -0,0 +1,148 @@
+import asyncio
+from typing import Any, cast
+
+import pytest
+
+from app.infrastructure.clients.hedging import HedgePolicy
+from app.infrastructure.clients.rag_client import RagRetrievalContractClient
+from app.infrastructure.metrics.retrieval import retrieval_metrics_store
+
+
+class _FakeSelector:
+    def __init__(self) -> None:
+        self.results: list[tuple[str, bool]] = []
+
+    async def current_backend(self) -> str:
+        return "local"
+
+    def is_forced(self) -> bool:
+        return False
+
+    def alternate_backend(self, backend: str) -> str | None:
+        return "docker" if backend == "local" else "local"
+
+    def base_url_for(self, backend: str) -> str:
+        return f"http://{backend}:8000"
+
+    def record_result(self, backend: str, *, ok: bool, latency_ms: float) -> None:
+        self.results.append((backend, ok))
+
+
+def _policy(**overrides) -> HedgePolicy:
+    params: dict[str, Any] = {"max_ratio": 1.0, "burst": 5.0, "min_samples": 3, "min_delay_ms": 1}
+    params.update(overrides)
+    policy = HedgePolicy(**params)
+    for latency in (10.0, 10.0, 10.0):
+        policy.record_latency("comprehensive", latency)
+    return policy
+
+
+def _client(monkeypatch, policy: HedgePolicy, delays: dict[str, float]):
+    monkeypatch.setattr("app.infrastructure.config.settings.RAG_SERVICE_SECRET", "secret")
+    selector = _FakeSelector()
+    client = RagRetrievalContractClient(
+        backend_selector=cast(Any, selector), hedge_policy=policy
+    )
+    calls: list[str] = []
+
+    async def _post_once(*, base_url: str, **kwargs):
+        calls.append(base_url)
+        await asyncio.sleep(delays[base_url])
+        return {"items": [], "trace": {"served_by": base_url}}
+
+    monkeypatch.setattr(client, "_post_once", _post_once)
+    return client, selector, calls
+
+
+def _hedge_counters() -> dict[str, int]:
+    item = retrieval_metrics_store.snapshot()["endpoints"].get("comprehensive", {})
+    return {
+        key: int(item.get(key, 0))
+        for key in ("hedges_total", "hedge_wins_total", "hedge_budget_exhausted_total")
+    }
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_fast_backend_wins(monkeypatch):
+    client, selector, calls = _client(
+        monkeypatch,
+        _policy(),
+        {"http://local:8000": 1.0, "http://docker:8000": 0.0},
+    )
+    before = _hedge_counters()
+
+    result = await client.comprehensive(query="q", tenant_id="t", user_id="u")
+    await client.aclose()
+
+    after = _hedge_counters()
+    assert result["trace"]["served_by"] == "http://docker:8000"
+    assert calls == ["http://local:8000", "http://docker:8000"]
+    assert after["hedges_total"] - before["hedges_total"] == 1
+    assert after["hedge_wins_total"] - before["hedge_wins_total"] == 1
+    # The cancelled primary must not be reported as a backend failure.
+    assert selector.results == [("docker", True)]
+
+
+@pytest.mark.asyncio
+async def test_hedge_delay_learns_from_primary_latency_only(monkeypatch):
+    policy = _policy()
+    client, _, _ = _client(
+        monkeypatch,
+        policy,
+        {},
+    )
+
+    async def _failing_primary(*, backend: str, base_url: str, **kwargs):
+        raise RuntimeError("primary failed")
+
+    monkeypatch.setattr(client, "_post_tracked", _failing_primary)
+    samples = policy._state["comprehensive"].latencies_ms
+
+    # A failed primary says nothing about how long a success takes.
+    with pytest.raises(RuntimeError):
+        await client.comprehensive(query="q", tenant_id="t", user_id="u")
+    assert len(samples) == 3
+
+    async def _slow_primary(*, backend: str, base_url: str, **kwargs):
+        await asyncio.sleep(0.2 if backend == "local" else 0.03)
+        return {"items": []}
+
+    monkeypatch.setattr(client, "_post_tracked", _slow_primary)
+    await client.comprehensive(query="q", tenant_id="t", user_id="u")
+    await client.aclose()
+
+    # The cancelled primary is recorded once, at no less than the time it ran.
+    assert len(samples) == 4
+    assert samples[-1] >= 30.0
+
+
+@pytest.mark.asyncio
+async def test_hedge_budget_caps_hedges(monkeypatch):
+    client, _, calls = _client(
+        monkeypatch,
+        _policy(max_ratio=0.0),
+        {"http://local:8000": 0.05, "http://docker:8000": 0.0},
+    )
+    before = _hedge_counters()
+
+    result = await client.comprehensive(query="q", tenant_id="t", user_id="u")
+    await client.aclose()
+
+    assert result["trace"]["served_by"] == "http://local:8000"
+    assert calls == ["http://local:8000"]
+    after = _hedge_counters()
+    assert after["hedge_budget_exhausted_total"] - before["hedge_budget_exhausted_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_until_enough_latency_samples(monkeypatch):
+    client, _, calls = _client(
+        monkeypatch,
+        HedgePolicy(max_ratio=1.0, min_samples=50),
+        {"http://local:8000": 0.02, "http://docker:8000": 0.0},
+    )
+
+    await client.comprehensive(query="q", tenant_id="t", user_id="u")
+    await client.aclose()
+
+    assert calls == ["http://local:8000"]
@@ -31,8 +31,9 @@ class _FakeSelector:
             return "http://docker:8000"
         return "http://local:8000"
 
-    def set_backend(self, backend: str) -> None:
-        self.updated_to = backend
+    def record_result(self, backend: str, *, ok: bool, latency_ms: float) -> None:
+        if ok:
+            self.updated_to = backend
 
 
 class _FakeResponse:
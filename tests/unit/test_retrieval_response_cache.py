@@ -0,0 +1,170 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.clients import retrieval_cache as cache_module
+from app.infrastructure.clients.rag_client import RagRetrievalContractClient
+from app.infrastructure.clients.retrieval_cache import (
+    RetrievalResponseCache,
+    bind_batch_retrieval_cache,
+    current_batch_retrieval_cache,
+    new_batch_retrieval_cache,
+    retrieval_cache_key,
+)
+from app.infrastructure.metrics.retrieval import retrieval_metrics_store
+
+
+def _cache(**overrides) -> RetrievalResponseCache:
+    params = {"ttl_seconds": 30, "max_entries": 8, "max_bytes": 1_000_000}
+    params.update(overrides)
+    return RetrievalResponseCache(**params)
+
+
+def test_cache_key_is_canonical_over_payload_ordering():
+    left = retrieval_cache_key("comprehensive", {"query": "q", "filters": {"a": 1, "b": 2}})
+    right = retrieval_cache_key("comprehensive", {"filters": {"b": 2, "a": 1}, "query": "q"})
+
+    assert left == right
+    assert left != retrieval_cache_key("comprehensive", {"query": "q", "filters": {"a": 1}})
+
+
+def test_concurrent_identical_requests_share_one_upstream_call():
+    cache = _cache()
+    calls = {"count": 0}
+
+    async def _load():
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        return {"items": [{"id": "c1"}]}
+
+    async def _run():
+        return await asyncio.gather(*(cache.get_or_load("k", _load) for _ in range(5)))
+
+    results = asyncio.run(_run())
+
+    assert calls["count"] == 1
+    assert sorted(outcome for _, outcome in results) == ["coalesced"] * 4 + ["miss"]
+    assert all(value == {"items": [{"id": "c1"}]} for value, _ in results)
+
+
+def test_hits_are_isolated_copies_and_expire(monkeypatch):
+    now = {"value": 10.0}
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now["value"])
+    cache = _cache(ttl_seconds=5)
+    calls = {"count": 0}
+
+    async def _load():
+        calls["count"] += 1
+        return {"items": [{"id": "c1"}]}
+
+    first, _ = asyncio.run(cache.get_or_load("k", _load))
+    first["items"].append({"id": "mutated"})
+    second, outcome = asyncio.run(cache.get_or_load("k", _load))
+
+    assert outcome == "hit"
+    assert second == {"items": [{"id": "c1"}]}
+
+    now["value"] = 16.0
+    _, outcome = asyncio.run(cache.get_or_load("k", _load))
+    assert outcome == "miss"
+    assert calls["count"] == 2
+
+
+def test_failures_propagate_to_followers_and_are_not_cached():
+    cache = _cache()
+    calls = {"count": 0}
+
+    async def _fail():
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    async def _run():
+        return await asyncio.gather(
+            cache.get_or_load("k", _fail),
+            cache.get_or_load("k", _fail),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(_run())
+
+    assert calls["count"] == 1
+    assert all(isinstance(item, RuntimeError) for item in results)
+    assert len(cache) == 0
+
+
+def test_entry_and_byte_bounds_evict_oldest_first():
+    cache = _cache(max_entries=2, max_bytes=60)
+
+    async def _value(payload):
+        async def _load():
+            return payload
+
+        return await cache.get_or_load(str(payload), _load)
+
+    asyncio.run(_value({"n": 1}))
+    asyncio.run(_value({"n": 2}))
+    asyncio.run(_value({"n": 3}))
+    asyncio.run(_value({"blob": "x" * 200}))
+
+    assert len(cache) == 2
+    assert cache._lookup(str({"n": 1})) is None
+    assert cache._lookup(str({"blob": "x" * 200})) is None
+
+
+@pytest.mark.asyncio
+async def test_contract_client_serves_repeated_comprehensive_from_cache(monkeypatch):
+    monkeypatch.setattr("app.infrastructure.config.settings.RAG_SERVICE_SECRET", "secret")
+    client = RagRetrievalContractClient(response_cache=_cache())
+    calls = {"count": 0}
+
+    async def _dispatch(path, payload, **kwargs):
+        calls["count"] += 1
+        return {"items": [{"source": "C1"}], "trace": {}}
+
+    monkeypatch.setattr(client, "_dispatch", _dispatch)
+    before = retrieval_metrics_store.snapshot()["endpoints"].get("comprehensive", {})
+
+    for _ in range(2):
+        await client.comprehensive(
+            query="cláusula 9.2",
+            tenant_id="tenant-x",
+            user_id="user-x",
+            request_id="req-1",
+            filters={"source_standard": "ISO 9001"},
+        )
+    await client.comprehensive(query="cláusula 9.2", tenant_id="tenant-x", user_id="user-y")
+    await client.aclose()
+
+    after = retrieval_metrics_store.snapshot()["endpoints"]["comprehensive"]
+    assert calls["count"] == 2
+    assert after["cache_hits_total"] - before.get("cache_hits_total", 0) == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_cache_dedupes_comprehensive_beyond_shared_ttl(monkeypatch):
+    monkeypatch.setattr("app.infrastructure.config.settings.RAG_SERVICE_SECRET", "secret")
+    shared = _cache()
+    client = RagRetrievalContractClient(response_cache=shared)
+    calls = {"count": 0}
+
+    async def _dispatch(path, payload, **kwargs):
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        return {"items": [{"source": "C1"}], "trace": {}}
+
+    monkeypatch.setattr(client, "_dispatch", _dispatch)
+
+    async def _ask():
+        return await client.comprehensive(query="cláusula 9.2", tenant_id="t", user_id="u")
+
+    with bind_batch_retrieval_cache(new_batch_retrieval_cache()):
+        await asyncio.gather(*(asyncio.create_task(_ask()) for _ in range(3)))
+        shared.clear()  # the shared cache expiring does not cost the batch another call
+        await _ask()
+        assert calls["count"] == 1
+    assert current_batch_retrieval_cache() is None
+    await _ask()
+    await client.aclose()
+
+    assert calls["count"] == 2
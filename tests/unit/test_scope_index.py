@@ -0,0 +1,85 @@
+import random
+
+from app.agent.policies import extract_requested_scopes
+from app.agent.policies.scope_index import ScopeIndex, bounded_edit_distance
+from app.profiles.loader import ProfileLoader
+
+
+def _edit_distance(a: str, b: str) -> int:
+    prev = list(range(len(b) + 1))
+    for i, ch_a in enumerate(a, start=1):
+        curr = [i]
+        for j, ch_b in enumerate(b, start=1):
+            curr.append(min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + (ch_a != ch_b)))
+        prev = curr
+    return prev[-1]
+
+
+def _exhaustive_best(token: str, catalog: dict[str, set[str]]) -> tuple[str, float] | None:
+    """Reference scan: every alias of every canonical scope, first canonical wins ties."""
+    text = token.strip().lower()
+    best_scope, best_score = "", 0.0
+    for canonical, aliases in catalog.items():
+        alias_set = set(aliases) | {canonical.lower()}
+        if text in alias_set:
+            return canonical, 1.0
+        local_best = max(
+            (1.0 - _edit_distance(text, alias) / max(len(text), len(alias), 1) for alias in alias_set),
+            default=0.0,
+        )
+        if local_best > best_score:
+            best_scope, best_score = canonical, local_best
+    return (best_scope, best_score) if best_scope else None
+
+
+def test_bounded_edit_distance_matches_full_distance_within_limit():
+    rng = random.Random(7)
+    alphabet = "abcd90 "
+    for _ in range(500):
+        a = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 9)))
+        b = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 9)))
+        limit = rng.randint(0, 5)
+        full = _edit_distance(a, b)
+        bounded = bounded_edit_distance(a, b, limit)
+        assert bounded == (full if full <= limit else limit + 1)
+
+
+def test_scope_index_matches_exhaustive_scan_above_threshold():
+    catalog = {
+        "ISO 9001": {"iso 9001", "calidad", "cliente"},
+        "ISO 14001": {"iso 14001", "ambiental", "aspecto ambiental"},
+        "ISO 45001": {"iso 45001", "seguridad", "salud"},
+        "CODIGO CIVIL": {"codigo civil", "civil", "contrato"},
+    }
+    rng = random.Random(11)
+    words = [alias for aliases in catalog.values() for alias in aliases]
+    tokens = list(words)
+    for _ in range(400):
+        word = list(rng.choice(words))
+        for _ in range(rng.randint(0, 3)):
+            pos = rng.randrange(len(word))
+            word[pos] = rng.choice("abcdeilosu0149 ")
+        tokens.append("".join(word))
+
+    for threshold in (0.0, 0.6, 0.85):
+        index = ScopeIndex(catalog, fuzzy_enabled=True, min_score=threshold)
+        for token in tokens:
+            expected = _exhaustive_best(token, catalog)
+            if expected is not None and expected[1] < threshold:
+                expected = None
+            assert index.best_match(token) == expected, (token, threshold)
+
+
+def test_extract_requested_scopes_reuses_compiled_index_per_profile():
+    from app.agent import policies
+
+    profile = ProfileLoader().load("iso_auditor")
+    answer = "La organización debe asegurar la calidad del producto y la seguridad. " * 60
+
+    first = extract_requested_scopes(answer, profile=profile)
+    index = policies._scope_index(profile)
+    second = extract_requested_scopes(answer, profile=profile)
+
+    assert first == second
+    assert "ISO 9001" in first and "ISO 45001" in first
+    assert policies._scope_index(profile) is index
@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from app.graph.logic.utils import track_node_timing
+from app.infrastructure.observability import tracing
+
+
+def test_spans_are_noops_until_tracing_is_configured():
+    assert tracing.tracing_enabled() is False
+    with tracing.start_span("orch.node.planner", tenant="t1") as span:
+        assert span is None
+    headers = {"X-Trace-ID": "abc"}
+    assert tracing.inject_trace_headers(headers) == {"X-Trace-ID": "abc"}
+
+
+@pytest.fixture
+def memory_exporter():
+    pytest.importorskip("opentelemetry.sdk")
+    exporter = tracing.configure_tracing("memory")
+    yield exporter
+    tracing.shutdown_tracing()
+
+
+def test_node_and_rag_spans_nest_under_answer_span_and_propagate_traceparent(
+    memory_exporter,
+):
+    @track_node_timing("planner")
+    async def _node(state):
+        with tracing.start_span("rag.comprehensive", endpoint="comprehensive"):
+            return {"headers": tracing.inject_trace_headers({})}
+
+    incoming = {"traceparent": "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"}
+    with tracing.start_span("orch.answer", parent_headers=incoming, tenant_id="t1"):
+        result = asyncio.run(_node({"tenant_id": "t1"}))
+
+    spans = {span.name: span for span in memory_exporter.get_finished_spans()}
+    root, node, rag = spans["orch.answer"], spans["orch.node.planner"], spans["rag.comprehensive"]
+
+    assert format(root.context.trace_id, "032x") == "0af7651916cd43dd8448eb211c80319c"
+    assert node.parent.span_id == root.context.span_id
+    assert rag.parent.span_id == node.context.span_id
+    assert node.attributes["tenant"] == "t1"
+    traceparent = result["headers"]["traceparent"]
+    assert traceparent.split("-")[2] == format(rag.context.span_id, "016x")
@@ -151,3 +151,30 @@ def test_universal_planner_supports_expectation_coverage_tool() -> None:
         "expectation_coverage",
         "citation_validator",
     ]
+
+
+def test_universal_planner_lets_retrieval_consumers_run_in_parallel() -> None:
+    tools = [
+        "semantic_retrieval",
+        "logical_comparison",
+        "structural_extraction",
+        "python_calculator",
+    ]
+    profile = AgentProfile(
+        profile_id="p",
+        query_modes=QueryModesPolicy(
+            default_mode="ops_mode",
+            modes={
+                "ops_mode": QueryModeConfig(
+                    execution_plan=list(tools),
+                    retrieval_profile="explanatory_response",
+                )
+            },
+            intent_rules=[IntentRule(id="ops", mode="ops_mode", any_keywords=["ops"])],
+        ),
+        capabilities=CapabilitiesPolicy(reasoning_level="high", allowed_tools=list(tools)),
+    )
+    _, _, plan, _ = build_universal_plan(query="ops check", profile=profile, allowed_tools=tools)
+
+    assert [step.tool for step in plan.steps] == tools
+    assert plan.step_dependencies() == [(), (0,), (0,), (2,)]